@@ -3,18 +3,20 @@ from tkinter import ttk, filedialog, messagebox
 import os
 import sys
 import subprocess
-import winreg
 import platform
 import json
 from pathlib import Path
 import threading
-import urllib.request
-import zipfile
+import concurrent.futures
 import tempfile
 import shutil
 import time
-import random
-import psutil
+
+from acb_core.net import http_client, DownloadCancelled, first_available_url
+from acb_core.archive import ExtractionCancelled, extract_zip_parallel
+from acb_core.system import get_backend
+from acb_core.sync import sync_tree
+from acb_core.pipeline import PipelineOperations, ProgressReporter, SOURCE_REPOS, MODULE_CATALOGS
 
 # Try to import PIL for image handling
 try:
@@ -23,7 +25,70 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
-class AzerothCoreBuilder:
+# Order in which missing requirements are installed by "Install All Missing".
+# Installers run one at a time in this order; zip archives extract alongside them.
+_DEPENDENCY_INSTALL_ORDER = ("VisualStudio", "Git", "CMake", "OpenSSL", "MySQL", "Boost", "HeidiSQL")
+
+
+class TkProgressReporter(ProgressReporter):
+    """Forwards pipeline progress to a status label and progress bar on the Tk thread"""
+
+    def __init__(self, root, status_label=None, progress_bar=None, cancelled=None):
+        self.root = root
+        self.status_label = status_label
+        self.progress_bar = progress_bar
+        self._cancelled = cancelled
+
+    @property
+    def cancelled(self):
+        return bool(self._cancelled and self._cancelled())
+
+    def _update(self, widget, **options):
+        def apply():
+            try:
+                if widget.winfo_exists():
+                    widget.config(**options)
+            except tk.TclError:
+                # The dialog was closed while the update was queued
+                pass
+        self.root.after(0, apply)
+
+    def status(self, text):
+        if self.status_label is not None:
+            self._update(self.status_label, text=text)
+
+    def progress(self, value):
+        if self.progress_bar is not None:
+            self._update(self.progress_bar, value=value)
+
+
+class TkTreeRowReporter(ProgressReporter):
+    """Forwards pipeline status to one cell of a Treeview row on the Tk thread"""
+
+    def __init__(self, root, tree, item, column="status", prefix="", cancelled=None):
+        self.root = root
+        self.tree = tree
+        self.item = item
+        self.column = column
+        self.prefix = prefix
+        self._cancelled = cancelled
+
+    @property
+    def cancelled(self):
+        return bool(self._cancelled and self._cancelled())
+
+    def status(self, text):
+        def apply():
+            try:
+                if self.tree.winfo_exists():
+                    self.tree.set(self.item, self.column, self.prefix + text)
+            except tk.TclError:
+                # The dialog was closed while the update was queued
+                pass
+        self.root.after(0, apply)
+
+
+class AzerothCoreBuilder(PipelineOperations):
     def __init__(self, root):
         self.root = root
         self.root.title("AzerothCore Builder (ACB)")
@@ -187,9 +252,20 @@ class AzerothCoreBuilder:
         
         # Initialize build process tracking
         self.current_build_process = None
-        self.build_cancelled = False
-        self.current_cmake_process = None
-        self.current_msbuild_process = None
+        
+        # Build, SQL import, config and download cache state shared with the command line
+        self._init_pipeline_state()
+        
+        # Serialize PATH/environment variable updates made by dependency installs
+        self._environment_lock = threading.Lock()
+        
+        # Version check output keyed by detected path + mtime (persisted in the config)
+        self._requirement_version_cache = None
+        self._requirement_version_cache_dirty = False
+        self._requirement_version_lock = threading.Lock()
+        
+        # Serialize console/log writes coming from worker threads
+        self._log_lock = threading.Lock()
         
         # Initialize logging system first (before any console output)
         self._setup_logging()
@@ -216,10 +292,6 @@ class AzerothCoreBuilder:
             print(f"🐍 Running as Python script (development mode)")
             print(f"📁 Application directory: {self.app_dir}")
     
-    def _get_app_dir(self):
-        """Get the application directory (works for both PyInstaller and development)"""
-        return self.app_dir
-    
     def _get_resource_path(self, relative_path):
         """Get the correct path for bundled resources (works for both PyInstaller and development)"""
         if getattr(sys, 'frozen', False):
@@ -419,6 +491,11 @@ class AzerothCoreBuilder:
                                      command=self.scan_system)
         self.scan_button.pack(side=tk.LEFT, padx=(0, 10))
         
+        # Install all missing button
+        self.install_all_button = ttk.Button(button_frame, text="⬇️ Install All Missing", 
+                                            command=self.install_all_missing)
+        self.install_all_button.pack(side=tk.LEFT, padx=(0, 10))
+        
         # Save button
         self.save_button = ttk.Button(button_frame, text="💾 Save Paths", 
                                      command=self.save_paths)
@@ -568,207 +645,10 @@ class AzerothCoreBuilder:
         ttk.Label(parent, text="Build actions", style="Header.TLabel").grid(row=0, column=4, sticky=tk.W)
         
         # Main source repositories
-        self.source_repos = {
-            "azerothcore": {
-                "name": "AzerothCore Standard",
-                "url": "https://github.com/azerothcore/azerothcore-wotlk",
-                "folder": "azerothcore-wotlk"
-            },
-            "npcbots": {
-                "name": "AzerothCore with NPCBots",
-                "url": "https://github.com/trickerer/AzerothCore-wotlk-with-NPCBots",
-                "folder": "azerothcore-wotlk"
-            },
-            "playerbots": {
-                "name": "AzerothCore with PlayerBots",
-                "url": "https://github.com/liyunfan1223/azerothcore-wotlk.git",
-                "folder": "azerothcore-wotlk"
-            },
-            "custom": {
-                "name": "Custom",
-                "url": "",
-                "folder": "azerothcore-wotlk"
-            }
-        }
+        self.source_repos = {key: dict(repo) for key, repo in SOURCE_REPOS.items()}
         
         # Module definitions
-        self.modules = {
-            "azerothcore_modules": {
-                "name": "AzerothCore Modules",
-                "urls": [
-                    "https://github.com/azerothcore/mod-resurrection-scroll",
-                    "https://github.com/azerothcore/mod-progression-system",
-                    "https://github.com/azerothcore/mod-zone-difficulty",
-                    "https://github.com/azerothcore/mod-transmog",
-                    "https://github.com/azerothcore/mod-acore-subscriptions",
-                    "https://github.com/azerothcore/mod-global-chat",
-                    "https://github.com/azerothcore/mod-server-auto-shutdown",
-                    "https://github.com/azerothcore/mod-npc-beastmaster",
-                    "https://github.com/azerothcore/mod-autobalance",
-                    "https://github.com/azerothcore/mod-war-effort",
-                    "https://github.com/azerothcore/mod-instanced-worldbosses",
-                    "https://github.com/azerothcore/mod-starter-guild",
-                    "https://github.com/azerothcore/mod-morphsummon",
-                    "https://github.com/azerothcore/mod-bg-reward",
-                    "https://github.com/azerothcore/mod-npc-morph",
-                    "https://github.com/azerothcore/mod-bg-item-reward",
-                    "https://github.com/azerothcore/mod-ip-tracker",
-                    "https://github.com/azerothcore/mod-dmf-switch",
-                    "https://github.com/azerothcore/mod-buff-command",
-                    "https://github.com/azerothcore/mod-npc-codebox",
-                    "https://github.com/azerothcore/mod-chromie-xp",
-                    "https://github.com/azerothcore/mod-pvp-zones",
-                    "https://github.com/azerothcore/mod-congrats-on-level",
-                    "https://github.com/azerothcore/mod-guild-zone-system",
-                    "https://github.com/azerothcore/mod-pvp-quests",
-                    "https://github.com/azerothcore/mod-cta-switch",
-                    "https://github.com/azerothcore/mod-tic-tac-toe",
-                    "https://github.com/azerothcore/mod-fireworks-on-level",
-                    "https://github.com/azerothcore/mod-notify-muted",
-                    "https://github.com/azerothcore/mod-npc-enchanter",
-                    "https://github.com/azerothcore/mod-chat-transmitter",
-                    "https://github.com/azerothcore/mod-npc-gambler",
-                    "https://github.com/azerothcore/mod-weapon-visual",
-                    "https://github.com/azerothcore/mod-npc-all-mounts",
-                    "https://github.com/azerothcore/mod-racial-trait-swap",
-                    "https://github.com/azerothcore/mod-npc-buffer",
-                    "https://github.com/azerothcore/mod-aoe-loot",
-                    "https://github.com/azerothcore/mod-queue-list-cache",
-                    "https://github.com/azerothcore/mod-pvpstats-announcer",
-                    "https://github.com/azerothcore/mod-pvp-titles",
-                    "https://github.com/azerothcore/mod-rdf-expansion",
-                    "https://github.com/azerothcore/mod-costumes",
-                    "https://github.com/azerothcore/mod-duel-reset",
-                    "https://github.com/azerothcore/mod-desertion-warnings",
-                    "https://github.com/azerothcore/mod-low-level-rbg",
-                    "https://github.com/azerothcore/mod-low-level-arena",
-                    "https://github.com/azerothcore/mod-npc-services",
-                    "https://github.com/azerothcore/mod-azerothshard"
-                ],
-                "folder": "azerothcore-modules"
-            },
-            "community_modules": {
-                "name": "Community Modules",
-                "urls": [
-                    "https://github.com/azerothcore/mod-weekend-xp",
-                    "https://github.com/azerothcore/mod-eluna",
-                    "https://github.com/azerothcore/mod-reward-played-time",
-                    "https://github.com/azerothcore/mod-phased-duels",
-                    "https://github.com/azerothcore/mod-premium",
-                    "https://github.com/azerothcore/mod-item-level-up",
-                    "https://github.com/azerothcore/mod-pocket-portal",
-                    "https://github.com/azerothcore/mod-system-vip",
-                    "https://github.com/azerothcore/mod-spell-regulator",
-                    "https://github.com/azerothcore/mod-ah-bot",
-                    "https://github.com/azerothcore/mod-random-enchants",
-                    "https://github.com/azerothcore/mod-npc-talent-template",
-                    "https://github.com/azerothcore/mod-keep-out",
-                    "https://github.com/azerothcore/mod-who-logged",
-                    "https://github.com/azerothcore/mod-solocraft",
-                    "https://github.com/azerothcore/mod-account-mounts",
-                    "https://github.com/azerothcore/mod-npc-free-professions",
-                    "https://github.com/azerothcore/mod-antifarming",
-                    "https://github.com/azerothcore/mod-promotion-azerothcore",
-                    "https://github.com/azerothcore/mod-arena-replay",
-                    "https://github.com/azerothcore/mod-breaking-news-override",
-                    "https://github.com/azerothcore/mod-instance-reset",
-                    "https://github.com/azerothcore/mod-learn-spells",
-                    "https://github.com/azerothcore/mod-dynamic-xp",
-                    "https://github.com/azerothcore/mod-custom-login",
-                    "https://github.com/azerothcore/mod-npc-titles-tokens",
-                    "https://github.com/azerothcore/mod-skip-dk-starting-area",
-                    "https://github.com/azerothcore/mod-top-arena",
-                    "https://github.com/azerothcore/mod-morph-all-players",
-                    "https://github.com/azerothcore/mod-reward-shop",
-                    "https://github.com/azerothcore/mod-character-tools",
-                    "https://github.com/azerothcore/mod-quick-teleport",
-                    "https://github.com/azerothcore/mod-chat-login",
-                    "https://github.com/azerothcore/mod-learn-highest-talent",
-                    "https://github.com/azerothcore/mod-mall-teleport",
-                    "https://github.com/azerothcore/mod-emblem-transfer",
-                    "https://github.com/azerothcore/mod-auto-revive",
-                    "https://github.com/azerothcore/mod-quest-status",
-                    "https://github.com/azerothcore/mod-detailed-logging",
-                    "https://github.com/azerothcore/mod-solo-lfg",
-                    "https://github.com/azerothcore/mod-boss-announcer",
-                    "https://github.com/azerothcore/mod-gain-honor-guard",
-                    "https://github.com/azerothcore/mod-pvpscript",
-                    "https://github.com/azerothcore/mod-individual-xp",
-                    "https://github.com/azerothcore/mod-guildhouse",
-                    "https://github.com/azerothcore/mod-multi-client-check",
-                    "https://github.com/azerothcore/mod-arena-3v3-solo-queue",
-                    "https://github.com/azerothcore/mod-cfbg",
-                    "https://github.com/azerothcore/mod-1v1-arena",
-                    "https://github.com/azerothcore/mod-world-chat",
-                    "https://github.com/azerothcore/mod-account-achievements",
-                    "https://github.com/azerothcore/mod-anticheat",
-                    "https://github.com/azerothcore/mod-better-item-reloading",
-                    "https://github.com/araxiaonline/mod-mythic-plus",
-                    "https://github.com/araxiaonline/mod-auctionator",
-                    "https://github.com/araxiaonline/mod-money-for-kills",
-                    "https://github.com/araxiaonline/mod-worgoblin",
-                    "https://github.com/araxiaonline/mod-boss-runeworder",
-                    "https://github.com/araxiaonline/mod-sharedrep",
-                    "https://github.com/heyitsbench/mod-arac",
-                    "https://github.com/heyitsbench/mod-chromiecraft-smartstone",
-                    "https://github.com/ZhengPeiRu21/mod-challenge-modes",
-                    "https://github.com/ZhengPeiRu21/mod-reagent-bank",
-                    "https://github.com/ZhengPeiRu21/mod-leech",
-                    "https://github.com/ZhengPeiRu21/mod-bg-set-level",
-                    "https://github.com/talamortis/mod-bg-slaveryvalley",
-                    "https://github.com/sogladev/mod-vanilla-naxxramas",
-                    "https://github.com/sogladev/mod-dbg-tools",
-                    "https://github.com/sogladev/mod-dkp-aio",
-                    "https://github.com/sogladev/mod-individual-spellqueue",
-                    "https://github.com/sogladev/mod-reset-raid-cooldowns",
-                    "https://github.com/sogladev/mod-ghost-speed",
-                    "https://github.com/sogladev/mod-deathroll-aio",
-                    "https://github.com/sogladev/mod-demonic-pact-classic",
-                    "https://github.com/stylo019/SkyWall-HardCore-Mode-3.3.5-WoW",
-                    "https://github.com/pangolp/mod-recruit-friend",
-                    "https://github.com/tbcstar/mod-high-risk-system",
-                    "https://github.com/tbcstar/mod-bounty-hunter",
-                    "https://github.com/pangolp/mod-guildfunds",
-                    "https://github.com/tbcstar/mod-LadyLuck",
-                    "https://github.com/tbcstar/mod-npc-spectator",
-                    "https://github.com/tbcstar/mod-antifarming",
-                    "https://github.com/tbcstar/mod-TimeIsTime",
-                    "https://github.com/pangolp/mod-npc-promotion",
-                    "https://github.com/noisiver/mod-progression",
-                    "https://github.com/noisiver/mod-appreciation",
-                    "https://github.com/noisiver/mod-weekendbonus",
-                    "https://github.com/noisiver/mod-junk-to-gold",
-                    "https://github.com/noisiver/mod-alterac-valley-additions",
-                    "https://github.com/noisiver/mod-groupquests",
-                    "https://github.com/noisiver/mod-accountbound",
-                    "https://github.com/noisiver/mod-assistant",
-                    "https://github.com/Nyeriah/mod-black-portal",
-                    "https://github.com/Nyeriah/mod-save-inventory",
-                    "https://github.com/noisiver/mod-giftvouchers"
-                ],
-                "folder": "community-modules"
-            },
-            "npcbot_modules": {
-                "name": "NPCBot Modules",
-                "urls": [
-                    "https://github.com/trickerer/mod-autobalance",
-                    "https://github.com/trickerer/Trinity-Bots",
-                    "https://github.com/trickerer/mod-solocraft"
-                ],
-                "folder": "npcbot-modules"
-            },
-            "playerbot_modules": {
-                "name": "PlayerBot Modules",
-                "urls": [
-                    "https://github.com/liyunfan1223/mod-playerbots",
-                    "https://github.com/noisiver/mod-player-bot-level-brackets",
-                    "https://github.com/DustinHendrickson/mod-ollama-chat",
-                    "https://github.com/DustinHendrickson/mod-player-bot-reset",
-                    "https://github.com/DustinHendrickson/mod-player-bot-guildhouse"
-                ],
-                "folder": "playerbot-modules"
-            }
-        }
+        self.modules = MODULE_CATALOGS
         
         # Create main source repository rows
         self.source_widgets = {}
@@ -928,6 +808,14 @@ class AzerothCoreBuilder:
                                       command=self.start_world, width=22)
         start_world_button.grid(row=0, column=6, sticky=tk.E)
         
+        # Row 4: run the whole repack sequence as one task graph
+        repack_row4_frame = ttk.Frame(parent)
+        repack_row4_frame.grid(row=len(self.source_repos) + 12, column=0, columnspan=5, sticky=(tk.W, tk.E), pady=(0, 5))
+        
+        full_repack_button = ttk.Button(repack_row4_frame, text="⚡        Full Repack", 
+                                      command=self.run_full_repack, width=22)
+        full_repack_button.grid(row=0, column=0, padx=(0, 7))
+        
         # Set the main progress bar as the build progress bar reference
         self.build_progress_bar = self.build_main_progress
     
@@ -1027,6 +915,11 @@ class AzerothCoreBuilder:
                                         command=self.clean_all_modules)
         clean_modules_button.pack(side=tk.LEFT, padx=(10, 0))
         
+        # Add Update All button (core source and every module)
+        update_all_button = ttk.Button(module_frame, text="🔄    Update All", 
+                                     command=self.update_all_repositories)
+        update_all_button.pack(side=tk.LEFT, padx=(10, 0))
+        
         # Store module buttons for later access
         self.module_widgets = {}
         for key, module in self.modules.items():
@@ -1853,43 +1746,83 @@ class AzerothCoreBuilder:
             self.log_to_console("❌ AzerothCore source not found")
             return
         
-        cloned_count = 0
-        failed_count = 0
-        total_modules = len(selected_modules)
-        
         self.log_to_console(f"🚀 Starting module cloning to AzerothCore...")
         
-        # Ensure modules directory exists
-        os.makedirs(modules_dir, exist_ok=True)
+        # Close the modules window, the clone runs in the background
+        modules_window.destroy()
+        self._start_module_clone(selected_modules, modules_dir, "AzerothCore")
+    
+    def update_all_repositories(self):
+        """Fetch and fast-forward the AzerothCore source and all cloned modules in parallel"""
+        git_source_dir = os.path.join(self._get_app_dir(), "GitSource")
+        azerothcore_dir = os.path.join(git_source_dir, "azerothcore-wotlk")
         
-        for module in selected_modules:
-            try:
-                if self.clone_single_module(module, modules_dir):
-                    cloned_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                self.log_to_console(f"❌ Failed to clone {module['name']}: {str(e)}")
-                failed_count += 1
+        # Check if AzerothCore source exists
+        if not os.path.exists(azerothcore_dir):
+            messagebox.showerror("Error", "AzerothCore source not found. Please clone the main AzerothCore source first.")
+            self.log_to_console("❌ AzerothCore source not found")
+            return
         
-        # Show completion message
-        if cloned_count == total_modules:
-            messagebox.showinfo("Module Cloning Complete", f"Successfully cloned all {cloned_count} modules!")
-            self.log_to_console(f"✅ Successfully cloned all {cloned_count} modules")
-        elif cloned_count > 0:
-            messagebox.showwarning("Module Cloning Partial Success", 
-                                 f"Cloned {cloned_count} out of {total_modules} modules successfully.\n"
-                                 f"Failed: {failed_count} modules.\n\n"
-                                 f"Check the console for details.")
-            self.log_to_console(f"⚠️ Cloned {cloned_count} out of {total_modules} modules ({failed_count} failed)")
-        else:
-            messagebox.showerror("Module Cloning Failed", 
-                               f"Failed to clone all {total_modules} modules.\n\n"
-                               f"Check the console for details.")
-            self.log_to_console(f"❌ Failed to clone all {total_modules} modules")
+        repositories = self._find_git_repositories(azerothcore_dir)
+        if not repositories:
+            messagebox.showinfo("Info", "No Git repositories found to update.")
+            self.log_to_console("ℹ️ No Git repositories found to update")
+            return
         
-        # Close the modules window
-        modules_window.destroy()
+        dialog = self._create_git_progress_dialog("Updating Source and Modules", [name for name, path in repositories])
+        update_thread = threading.Thread(target=self._run_update_all, args=(repositories, dialog))
+        update_thread.daemon = True
+        update_thread.start()
+    
+    def _run_update_all(self, repositories, dialog):
+        """Run the parallel update in background thread"""
+        finished = []
+        
+        def on_status(name, text):
+            if text.startswith(("✅", "🆕", "❌")):
+                finished.append(name)
+            count = len(finished)
+            
+            def update():
+                if dialog.winfo_exists():
+                    dialog.tree.set(name, "status", text)
+                    dialog.progress.config(value=count)
+                    dialog.status_label.config(text=f"{count}/{len(repositories)} finished")
+            self.root.after(0, update)
+        
+        # Git's own progress fills the repository's status cell while it fetches
+        reporter_for = lambda name: TkTreeRowReporter(self.root, dialog.tree, name, prefix="⏳ ",
+                                                      cancelled=lambda: dialog.cancelled)
+        
+        try:
+            results = self._update_repositories(repositories, reporter_for=reporter_for, on_status=on_status,
+                                                cancelled=lambda: dialog.cancelled)
+        except Exception as e:
+            self.root.after(0, lambda: dialog.destroy() if dialog.winfo_exists() else None)
+            error_msg = f"Failed to update repositories:\n\n{str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Update Failed", error_msg))
+            self.log_to_console(f"❌ Update all failed: {str(e)}")
+            return
+        self.root.after(0, lambda: dialog.destroy() if dialog.winfo_exists() else None)
+        
+        changed = [result for result in results if result["changed"]]
+        failed = [result for result in results if not result["ok"]]
+        lines = [f"• {result['name']}: {result['commits']} new commits" for result in changed]
+        lines += [f"• {result['name']}: {result['status']}" for result in failed]
+        summary = "\n".join(lines)
+        if any(result["cmake_changed"] for result in changed):
+            summary += "\n\nCMake files changed, the next build will configure again."
+        
+        if failed:
+            self.root.after(0, lambda: messagebox.showwarning("Update Incomplete", 
+                f"Updated {len(results) - len(failed)} of {len(results)} repositories:\n\n{summary}\n\n"
+                "Check the console for details."))
+        elif changed:
+            self.root.after(0, lambda: messagebox.showinfo("Update Complete", 
+                f"{len(changed)} of {len(results)} repositories had new commits:\n\n{summary}"))
+        else:
+            self.root.after(0, lambda: messagebox.showinfo("Update Complete", 
+                f"All {len(results)} repositories are already up to date."))
     
     def clean_all_modules(self):
         """Remove all cloned modules from the AzerothCore source"""
@@ -2182,48 +2115,19 @@ class AzerothCoreBuilder:
         repo_window.destroy()
         modules_window.destroy()
         
-        # Clone each selected module
-        cloned_count = 0
-        failed_count = 0
-        total_modules = len(selected_modules)
-        
         self.log_to_console(f"🚀 Starting module cloning to {target_repo['name']}...")
         
-        for module in selected_modules:
-            try:
-                if self.clone_single_module(module, modules_dir):
-                    cloned_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                self.log_to_console(f"❌ Failed to clone {module['name']}: {str(e)}")
-                failed_count += 1
-        
-        # Show completion message
-        if cloned_count == total_modules:
-            messagebox.showinfo("Module Cloning Complete", f"Successfully cloned all {cloned_count} modules to {target_repo['name']}!")
-            self.log_to_console(f"✅ Successfully cloned all {cloned_count} modules to {target_repo['name']}")
-        elif cloned_count > 0:
-            messagebox.showwarning("Module Cloning Partial Success", 
-                                 f"Cloned {cloned_count} out of {total_modules} modules successfully to {target_repo['name']}.\n"
-                                 f"Failed: {failed_count} modules.\n\n"
-                                 f"Check the console for details.")
-            self.log_to_console(f"⚠️ Cloned {cloned_count} out of {total_modules} modules to {target_repo['name']} ({failed_count} failed)")
-        else:
-            messagebox.showerror("Module Cloning Failed", 
-                               f"Failed to clone all {total_modules} modules to {target_repo['name']}.\n\n"
-                               f"Check the console for details.")
-            self.log_to_console(f"❌ Failed to clone all {total_modules} modules to {target_repo['name']}")
+        # Existing modules are confirmed here, before the clones start in the background
+        selected_modules = [module for module in selected_modules
+                            if self._confirm_module_reclone(module, modules_dir)]
+        if selected_modules:
+            self._start_module_clone(selected_modules, modules_dir, target_repo['name'])
     
-    def clone_single_module(self, module, modules_dir):
-        """Clone a single module into the modules directory"""
+    def _confirm_module_reclone(self, module, modules_dir):
+        """Ask before replacing an existing module, returns True when the module should be cloned"""
         module_name = module['name']
-        module_url = module['url']
         module_dir = os.path.join(modules_dir, module_name)
         
-        self.log_to_console(f"📥 Cloning module: {module_name}")
-        self.log_to_console(f"📁 Target directory: {module_dir}")
-        
         # Check if module already exists
         if os.path.exists(module_dir):
             if messagebox.askyesno("Module Exists", 
@@ -2237,31 +2141,134 @@ class AzerothCoreBuilder:
                 except Exception as e:
                     self.log_to_console(f"❌ Failed to remove existing {module_name} module: {str(e)}")
                     messagebox.showerror("Error", f"Failed to remove existing module:\n{str(e)}")
-                    return
+                    return False
             else:
                 self.log_to_console(f"❌ Skipping {module_name} - user chose not to re-clone")
-                return
+                return False
+        return True
+    
+    def _start_module_clone(self, selected_modules, modules_dir, target_name):
+        """Clone the selected modules concurrently on a background thread with a progress dialog"""
+        modules = [(module['name'], module['url']) for module in selected_modules]
+        dialog = self._create_git_progress_dialog(f"Cloning Modules to {target_name}",
+                                                  [module_name for module_name, module_url in modules])
         
-        # Clone the module
-        try:
-            result = subprocess.run([
-                "git", "clone", module_url, module_name
-            ], cwd=modules_dir, capture_output=True, text=True, timeout=300)
+        clone_thread = threading.Thread(target=self._run_module_clone, args=(modules, modules_dir, target_name, dialog))
+        clone_thread.daemon = True
+        clone_thread.start()
+    
+    def _create_git_progress_dialog(self, title, names):
+        """Create progress dialog with one status row per repository"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("520x460")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+        
+        # Center dialog
+        dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 200, self.root.winfo_rooty() + 120))
+        
+        # Title
+        title_label = ttk.Label(dialog, text=title, 
+                               font=("Arial", 14, "bold"))
+        title_label.pack(pady=(20, 10))
+        
+        # Status label
+        status_label = ttk.Label(dialog, text=f"0/{len(names)} finished", font=("Arial", 10))
+        status_label.pack(pady=(0, 10))
+        
+        # Progress bar counts finished repositories
+        progress = ttk.Progressbar(dialog, mode='determinate', length=400, style='Green.Horizontal.TProgressbar')
+        progress.pack(pady=(0, 15))
+        progress['maximum'] = len(names)
+        
+        # One row per repository
+        tree_frame = ttk.Frame(dialog)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=20)
+        tree = ttk.Treeview(tree_frame, columns=("status",), height=min(max(len(names), 3), 10))
+        tree.heading("#0", text="Repository")
+        tree.heading("status", text="Status")
+        tree.column("#0", width=200)
+        tree.column("status", width=260)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for name in names:
+            tree.insert("", tk.END, iid=name, text=name, values=("⏸️ Queued",))
+        
+        # Cancel button
+        dialog.cancelled = False
+        cancel_button = ttk.Button(dialog, text="Cancel", 
+                                 command=lambda: setattr(dialog, 'cancelled', True))
+        cancel_button.pack(pady=(15, 15))
+        
+        # Store references
+        dialog.status_label = status_label
+        dialog.progress = progress
+        dialog.tree = tree
+        
+        return dialog
+    
+    def _run_module_clone(self, modules, modules_dir, target_name, dialog):
+        """Run the module clone engine in background thread"""
+        finished = []
+        
+        def set_row(module_name, text):
+            def update():
+                if dialog.winfo_exists():
+                    dialog.tree.set(module_name, "status", text)
+            self.root.after(0, update)
+        
+        def on_status(module_name, text):
+            if text.startswith(("✅", "❌")):
+                finished.append(module_name)
+            count = len(finished)
+            set_row(module_name, text)
             
-            if result.returncode == 0:
-                self.log_to_console(f"✅ Successfully cloned {module_name}")
-                return True
-            else:
-                error_msg = result.stderr if result.stderr else "Unknown error occurred"
-                self.log_to_console(f"❌ Failed to clone {module_name}: {error_msg}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            self.log_to_console(f"⏰ Clone operation timed out for {module_name}")
-            return False
+            def update():
+                if dialog.winfo_exists():
+                    dialog.progress.config(value=count)
+                    dialog.status_label.config(text=f"{count}/{len(modules)} modules finished")
+            self.root.after(0, update)
+        
+        # Git's own progress fills the module's status cell while it clones
+        reporter_for = lambda module_name: TkTreeRowReporter(self.root, dialog.tree, module_name, prefix="⏳ ",
+                                                             cancelled=lambda: dialog.cancelled)
+        
+        try:
+            results = self._clone_modules(modules, modules_dir, reporter_for=reporter_for, on_status=on_status,
+                                          cancelled=lambda: dialog.cancelled)
         except Exception as e:
-            self.log_to_console(f"❌ Error cloning {module_name}: {str(e)}")
-            return False
+            self.root.after(0, lambda: dialog.destroy() if dialog.winfo_exists() else None)
+            error_msg = f"Failed to clone modules:\n\n{str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Module Cloning Failed", error_msg))
+            self.log_to_console(f"❌ Module cloning failed: {str(e)}")
+            return
+        self.root.after(0, lambda: dialog.destroy() if dialog.winfo_exists() else None)
+        
+        total_modules = len(modules)
+        cloned_count = sum(1 for ok in results.values() if ok)
+        failed_count = total_modules - cloned_count
+        failed_names = ", ".join(module_name for module_name, ok in results.items() if not ok)
+        
+        # Show completion message
+        if cloned_count == total_modules:
+            self.root.after(0, lambda: messagebox.showinfo("Module Cloning Complete", 
+                f"Successfully cloned all {cloned_count} modules to {target_name}!"))
+            self.log_to_console(f"✅ Successfully cloned all {cloned_count} modules to {target_name}")
+        elif cloned_count > 0:
+            self.root.after(0, lambda: messagebox.showwarning("Module Cloning Partial Success", 
+                f"Cloned {cloned_count} out of {total_modules} modules successfully to {target_name}.\n"
+                f"Failed: {failed_names}\n\n"
+                f"Check the console for details."))
+            self.log_to_console(f"⚠️ Cloned {cloned_count} out of {total_modules} modules to {target_name} ({failed_count} failed)")
+        else:
+            self.root.after(0, lambda: messagebox.showerror("Module Cloning Failed", 
+                f"Failed to clone all {total_modules} modules to {target_name}.\n\n"
+                f"Check the console for details."))
+            self.log_to_console(f"❌ Failed to clone all {total_modules} modules to {target_name}")
     
     def clone_repository(self, key):
         """Clone a Git repository"""
@@ -2320,24 +2327,11 @@ class AzerothCoreBuilder:
             
             self.log_to_console(f"🔄 Executing Git clone command for {repo['name']}")
             
-            # Start progress simulation
-            self._start_progress_simulation(key)
-            
             # Record start time for actual clone operation
             clone_start_time = time.time()
             
-            # Prepare clone command based on repository type
-            if key == "playerbots":
-                # Clone with Playerbot branch
-                clone_cmd = ["git", "clone", repo["url"], "--branch=Playerbot", repo["folder"]]
-                self.log_to_console(f"🔧 Executing: git clone {repo['url']} --branch=Playerbot {repo['folder']}")
-            else:
-                # Standard clone
-                clone_cmd = ["git", "clone", repo["url"], repo["folder"]]
-                self.log_to_console(f"🔧 Executing: git clone {repo['url']} {repo['folder']}")
-            
-            # Clone the repository
-            result = subprocess.run(clone_cmd, cwd=git_source_dir, capture_output=True, text=True, timeout=300)
+            # Clone the repository, showing git's own progress in the source row
+            result = self._clone_source_repository(key, repo, git_source_dir, self._source_progress_reporter(key))
             
             # Calculate actual clone time
             clone_time = time.time() - clone_start_time
@@ -2345,9 +2339,6 @@ class AzerothCoreBuilder:
             # Log that Git clone operation has completed
             self.log_to_console(f"🔧 Git clone operation completed for {repo['name']} in {clone_time:.1f} seconds")
             
-            # Stop progress simulation
-            self._stop_progress_simulation(key)
-            
             if result.returncode == 0:
                 self.root.after(0, lambda: self.stop_source_progress(key))
                 self.root.after(0, lambda: self.update_source_status(key, "✅", "Cloned"))
@@ -2365,80 +2356,27 @@ class AzerothCoreBuilder:
                 self.root.after(0, lambda: messagebox.showerror("Clone Failed", 
                     f"Failed to clone {repo['name']}:\n\n{error_msg}"))
                 
-        except subprocess.TimeoutExpired:
-            self._stop_progress_simulation(key)
+        except subprocess.TimeoutExpired as e:
+            stalled_for = e.timeout
             self.root.after(0, lambda: self.stop_source_progress(key))
-            self.root.after(0, lambda: self.update_source_status(key, "❌", "Timeout"))
-            self.root.after(0, lambda: self.log_to_console(f"⏰ Clone operation timed out for {repo['name']}"))
+            self.root.after(0, lambda: self.update_source_status(key, "❌", "Stalled"))
+            self.root.after(0, lambda: self.log_to_console(
+                f"⏰ Clone of {repo['name']} stalled: no output from git for {stalled_for}s"))
             self.root.after(0, lambda: messagebox.showerror("Clone Failed", 
-                f"Clone operation timed out for {repo['name']}"))
+                f"Clone of {repo['name']} stalled: git made no progress for {stalled_for} seconds.\n\n"
+                "Check your connection, or raise git_stall_timeout in acb_config.json."))
         except Exception as e:
-            self._stop_progress_simulation(key)
             self.root.after(0, lambda: self.stop_source_progress(key))
             self.root.after(0, lambda: self.update_source_status(key, "❌", "Error"))
             self.root.after(0, lambda: self.log_to_console(f"❌ Error during clone of {repo['name']}: {str(e)}"))
             self.root.after(0, lambda: messagebox.showerror("Clone Failed", 
                 f"Error cloning {repo['name']}:\n\n{str(e)}"))
     
-    def _start_progress_simulation(self, key):
-        """Start progress simulation for cloning operation"""
-        self.progress_simulation_active = True
-        self.progress_simulation_thread = threading.Thread(target=self._simulate_progress, args=(key,))
-        self.progress_simulation_thread.daemon = True
-        self.progress_simulation_thread.start()
-        
-        # Log that progress simulation has started
-        repo_name = self.source_repos[key]["name"]
-        self.log_to_console(f"📊 Starting progress simulation for {repo_name}")
-    
-    def _stop_progress_simulation(self, key):
-        """Stop progress simulation for cloning operation"""
-        self.progress_simulation_active = False
-        
-        # Log that progress simulation has stopped
-        repo_name = self.source_repos[key]["name"]
-        self.log_to_console(f"📊 Progress simulation completed for {repo_name}")
-    
-    def _simulate_progress(self, key):
-        """Simulate progress updates during cloning"""
-        # Estimated clone time (varies by repository size)
-        estimated_time = random.randint(30, 120)  # 30 seconds to 2 minutes
-        start_time = time.time()
-        
-        while self.progress_simulation_active:
-            elapsed = time.time() - start_time
-            if elapsed >= estimated_time:
-                # Instead of breaking, continue with a slower progress rate
-                # This ensures the simulation continues until the actual clone completes
-                progress = min(95 + int((elapsed - estimated_time) / 10), 98)  # Slow progress after estimated time
-            else:
-                # Calculate progress percentage during estimated time
-                progress = min(int((elapsed / estimated_time) * 100), 95)  # Cap at 95% during estimated time
-            
-            # Update progress display
-            self.root.after(0, lambda p=progress: self.update_source_progress(key, p))
-            
-            # Log progress to console (every 10% or every 15 seconds)
-            if progress % 10 == 0 or int(elapsed) % 15 == 0:
-                repo_name = self.source_repos[key]["name"]
-                if elapsed < estimated_time:
-                    remaining_time = estimated_time - elapsed
-                    self.root.after(0, lambda p=progress, name=repo_name, rem=remaining_time: 
-                                  self.log_to_console(f"📥 {name} cloning progress: {p}% (est. {int(rem)}s remaining)"))
-                else:
-                    extra_time = elapsed - estimated_time
-                    self.root.after(0, lambda p=progress, name=repo_name, extra=extra_time: 
-                                  self.log_to_console(f"📥 {name} cloning progress: {p}% (continuing... +{int(extra_time)}s)"))
-            
-            # Wait before next update
-            time.sleep(1)
-        
-        # If simulation stopped naturally, show completion
-        if self.progress_simulation_active:
-            self.root.after(0, lambda: self.update_source_progress(key, 100))
-            repo_name = self.source_repos[key]["name"]
-            self.root.after(0, lambda name=repo_name: 
-                          self.log_to_console(f"📥 {name} cloning progress: 100%"))
+    def _source_progress_reporter(self, key):
+        """TkProgressReporter driving the status text and progress bar of a source row"""
+        widgets = self.source_widgets.get(key, {})
+        return TkProgressReporter(self.root, status_label=widgets.get("status_text"),
+                                  progress_bar=widgets.get("progress_bar"))
     
     def clean_repository(self, key):
         """Clean (delete) a cloned repository"""
@@ -2545,21 +2483,17 @@ class AzerothCoreBuilder:
         """Perform the actual Git update operation"""
         try:
             self.log_to_console(f"🔄 Executing Git pull command for {repo['name']}")
-            
-            # Start progress simulation
-            self._start_progress_simulation(key)
+            reporter = self._source_progress_reporter(key)
             
             # Record start time for actual update operation
             update_start_time = time.time()
             
             # First, fetch the latest changes
-            fetch_cmd = ["git", "fetch", "origin"]
-            self.log_to_console(f"🔧 Executing: git fetch origin")
-            fetch_result = subprocess.run(fetch_cmd, cwd=repo_dir, capture_output=True, text=True, timeout=60)
+            self.log_to_console(f"🔧 Executing: git fetch --progress origin")
+            fetch_result = self._run_git(["fetch", "--progress", "origin"], repo_dir, repo["name"], reporter)
             
             if fetch_result.returncode != 0:
                 error_msg = fetch_result.stderr if fetch_result.stderr else "Unknown error occurred"
-                self._stop_progress_simulation(key)
                 self.root.after(0, lambda: self.stop_source_progress(key))
                 self.root.after(0, lambda: self.update_source_status(key, "❌", "Fetch Failed"))
                 self.root.after(0, lambda: self.log_to_console(f"❌ Failed to fetch updates for {repo['name']}: {error_msg}"))
@@ -2568,9 +2502,8 @@ class AzerothCoreBuilder:
                 return
             
             # Then pull the changes
-            pull_cmd = ["git", "pull", "origin"]
-            self.log_to_console(f"🔧 Executing: git pull origin")
-            pull_result = subprocess.run(pull_cmd, cwd=repo_dir, capture_output=True, text=True, timeout=120)
+            self.log_to_console(f"🔧 Executing: git pull --progress origin")
+            pull_result = self._run_git(["pull", "--progress", "origin"], repo_dir, repo["name"], reporter)
             
             # Calculate actual update time
             update_time = time.time() - update_start_time
@@ -2578,9 +2511,6 @@ class AzerothCoreBuilder:
             # Log that Git update operation has completed
             self.log_to_console(f"🔧 Git update operation completed for {repo['name']} in {update_time:.1f} seconds")
             
-            # Stop progress simulation
-            self._stop_progress_simulation(key)
-            
             if pull_result.returncode == 0:
                 self.root.after(0, lambda: self.stop_source_progress(key))
                 self.root.after(0, lambda: self.update_source_status(key, "✅", "Updated"))
@@ -2601,15 +2531,15 @@ class AzerothCoreBuilder:
                 self.root.after(0, lambda: messagebox.showerror("Update Failed", 
                     f"Failed to update {repo['name']}:\n\n{error_msg}"))
                 
-        except subprocess.TimeoutExpired:
-            self._stop_progress_simulation(key)
+        except subprocess.TimeoutExpired as e:
+            stalled_for = e.timeout
             self.root.after(0, lambda: self.stop_source_progress(key))
-            self.root.after(0, lambda: self.update_source_status(key, "❌", "Timeout"))
-            self.root.after(0, lambda: self.log_to_console(f"⏰ Update operation timed out for {repo['name']}"))
+            self.root.after(0, lambda: self.update_source_status(key, "❌", "Stalled"))
+            self.root.after(0, lambda: self.log_to_console(
+                f"⏰ Update of {repo['name']} stalled: no output from git for {stalled_for}s"))
             self.root.after(0, lambda: messagebox.showerror("Update Failed", 
-                f"Update operation timed out for {repo['name']}"))
+                f"Update of {repo['name']} stalled: git made no progress for {stalled_for} seconds"))
         except Exception as e:
-            self._stop_progress_simulation(key)
             self.root.after(0, lambda: self.stop_source_progress(key))
             self.root.after(0, lambda: self.update_source_status(key, "❌", "Error"))
             self.root.after(0, lambda: self.log_to_console(f"❌ Error during update of {repo['name']}: {str(e)}"))
@@ -3103,57 +3033,6 @@ class AzerothCoreBuilder:
         self.log_to_console(f"🚀 Starting build process for {repo['name']}")
         self._start_build_process_thread(key, repo, repo_dir, build_dir, cmake_path, vs_path)
     
-    def _find_cmake(self):
-        """Find CMake installation path"""
-        # Check common CMake paths
-        cmake_paths = [
-            r"C:\Program Files\CMake\bin\cmake.exe",
-            r"C:\Program Files (x86)\CMake\bin\cmake.exe"
-        ]
-        
-        for path in cmake_paths:
-            if os.path.exists(path):
-                self.log_to_console(f"✅ Found CMake at: {path}")
-                return path
-        
-        # Check PATH environment variable
-        try:
-            result = subprocess.run(["cmake", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                self.log_to_console("✅ Found CMake in PATH")
-                return "cmake"
-        except:
-            pass
-        
-        return None
-    
-    def _find_visual_studio(self):
-        """Find Visual Studio installation path"""
-        try:
-            # Check registry for Visual Studio
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                               r"SOFTWARE\Microsoft\VisualStudio\Setup\VS") as key:
-                install_path, _ = winreg.QueryValueEx(key, "InstallLocation")
-                if install_path and os.path.exists(install_path):
-                    self.log_to_console(f"✅ Found Visual Studio at: {install_path}")
-                    return install_path
-        except:
-            pass
-        
-        # Check common Visual Studio paths
-        vs_paths = [
-            r"C:\Program Files\Microsoft Visual Studio\2022\Community\Common7\IDE\devenv.exe",
-            r"C:\Program Files\Microsoft Visual Studio\2022\Professional\Common7\IDE\devenv.exe",
-            r"C:\Program Files\Microsoft Visual Studio\2022\Enterprise\Common7\IDE\devenv.exe"
-        ]
-        
-        for path in vs_paths:
-            if os.path.exists(path):
-                self.log_to_console(f"✅ Found Visual Studio at: {path}")
-                return path
-        
-        return None
-    
     def _start_build_process_thread(self, key, repo, repo_dir, build_dir, cmake_path, vs_path):
         """Start the automated build process"""
         # Reset build state
@@ -3188,61 +3067,6 @@ class AzerothCoreBuilder:
         else:
             self.log_to_console(f"🔄 User chose to continue build process")
     
-    def _terminate_build_processes(self):
-        """Terminate all running build processes"""
-        try:
-            # Terminate CMake process if running
-            if self.current_cmake_process and self.current_cmake_process.poll() is None:
-                self.log_to_console("🛑 Terminating CMake process...")
-                self.current_cmake_process.terminate()
-                try:
-                    self.current_cmake_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.log_to_console("⚠️ CMake process did not terminate gracefully, forcing kill...")
-                    self.current_cmake_process.kill()
-                self.current_cmake_process = None
-            
-            # Terminate MSBuild process if running
-            if self.current_msbuild_process and self.current_msbuild_process.poll() is None:
-                self.log_to_console("🛑 Terminating MSBuild process...")
-                self.current_msbuild_process.terminate()
-                try:
-                    self.current_msbuild_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.log_to_console("⚠️ MSBuild process did not terminate gracefully, forcing kill...")
-                    self.current_msbuild_process.kill()
-                self.current_msbuild_process = None
-            
-            # Also try to kill any remaining MSBuild processes
-            self._kill_remaining_msbuild_processes()
-            
-            self.log_to_console("✅ All build processes terminated")
-            
-        except Exception as e:
-            self.log_to_console(f"⚠️ Error terminating build processes: {str(e)}")
-    
-    def _kill_remaining_msbuild_processes(self):
-        """Kill any remaining MSBuild processes that might be running"""
-        try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    if proc.info['name'] and 'msbuild' in proc.info['name'].lower():
-                        self.log_to_console(f"🛑 Killing remaining MSBuild process (PID: {proc.info['pid']})")
-                        proc.kill()
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
-        except ImportError:
-            # If psutil is not available, try using taskkill command
-            try:
-                subprocess.run(['taskkill', '/f', '/im', 'msbuild.exe'], 
-                             capture_output=True, timeout=10)
-                self.log_to_console("🛑 Used taskkill to terminate MSBuild processes")
-            except Exception as e:
-                self.log_to_console(f"⚠️ Could not kill remaining MSBuild processes: {str(e)}")
-        except Exception as e:
-            self.log_to_console(f"⚠️ Error killing remaining MSBuild processes: {str(e)}")
-    
     def _finish_build_process(self):
         """Finish the build process and reset UI"""
         self.cancel_build_button.config(state="disabled")
@@ -3255,54 +3079,11 @@ class AzerothCoreBuilder:
     def _perform_build(self, key, repo, repo_dir, build_dir, cmake_path, vs_path):
         """Perform the actual build process"""
         try:
-            # Check if build was cancelled before starting
-            if self.build_cancelled:
-                self.log_to_console("❌ Build process cancelled before starting")
-                return
-            
-            # Step 1: CMake Configuration
-            self.root.after(0, lambda: self.build_status_label.config(text="Configuring CMake project..."))
-            self.log_to_console("🚀 Starting CMake configuration...")
-            
-            # Run CMake configure
-            cmake_config_result = self._run_cmake_configure_new(repo_dir, build_dir, cmake_path)
-            if not cmake_config_result or self.build_cancelled:
-                self.log_to_console("❌ CMake configuration failed")
-                return
-            
-            # Check if cancelled after CMake configure
-            if self.build_cancelled:
-                self.log_to_console("❌ Build cancelled after CMake configuration")
-                return
-            
-            # Step 2: CMake Generation
-            self.root.after(0, lambda: self.build_status_label.config(text="Generating Visual Studio solution..."))
-            self.log_to_console("📋 Generating Visual Studio solution files...")
-            
-            cmake_generate_result = self._run_cmake_generate_new(build_dir)
-            if not cmake_generate_result or self.build_cancelled:
-                self.log_to_console("❌ CMake generation failed")
-                return
-            
-            # Check if cancelled after CMake generate
-            if self.build_cancelled:
-                self.log_to_console("❌ Build cancelled after CMake generation")
+            reporter = TkProgressReporter(self.root, status_label=self.build_status_label,
+                                          cancelled=lambda: self.build_cancelled)
+            if not self._build_source(repo_dir, build_dir, cmake_path, reporter):
                 return
             
-            # Step 3: Visual Studio Build
-            self.root.after(0, lambda: self.build_status_label.config(text="Building with Visual Studio..."))
-            self.log_to_console("🔨 Starting Visual Studio build process...")
-            
-            build_result = self._run_visual_studio_build_new(build_dir)
-            if not build_result or self.build_cancelled:
-                self.log_to_console("❌ Visual Studio build failed")
-                return
-            
-            # Build completed successfully
-            self.root.after(0, lambda: self.build_status_label.config(text="Build completed successfully!"))
-            self.log_to_console("🎉 Build completed successfully!")
-            self.log_to_console(f"📁 Build output location: {build_dir}")
-            
             # Show completion message
             self.root.after(0, lambda: messagebox.showinfo("Build Complete", 
                 f"{key} has been built successfully!\n\n"
@@ -3315,174 +3096,20 @@ class AzerothCoreBuilder:
             self.log_to_console(f"❌ Build process error: {str(e)}")
             self.root.after(0, lambda: self._finish_build_process())
     
-    def _run_cmake_configure_new(self, repo_dir, build_dir, cmake_path):
-        """Run CMake configure step without dialog"""
-        try:
-            self.log_to_console(f"📁 Source directory: {repo_dir}")
-            self.log_to_console(f"📁 Build directory: {build_dir}")
-            
-            # CMake configure command - this generates the Visual Studio solution files
-            cmd = [
-                cmake_path,
-                "-S", repo_dir,
-                "-B", build_dir,
-                "-G", "Visual Studio 17 2022",
-                "-A", "x64",
-                "-DCMAKE_BUILD_TYPE=RelWithDebInfo"
-            ]
-            
-            # Add extractor tools option based on checkbox state
-            if self.generate_extractors_var.get():
-                cmd.append("-DTOOLS_BUILD=all")
-                self.log_to_console("🔧 Including extractor tools (DTOOLS) in build")
-            else:
-                cmd.append("-DTOOLS_BUILD=none")
-                self.log_to_console("⏭️ Skipping extractor tools (DTOOLS) in build")
-            
-            self.log_to_console(f"🔧 Running CMake configure: {' '.join(cmd)}")
-            
-            # Use Popen to allow process termination
-            self.current_cmake_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            
-            # Wait for process to complete or be cancelled
-            try:
-                stdout, stderr = self.current_cmake_process.communicate(timeout=300)
-                result = type('Result', (), {'returncode': self.current_cmake_process.returncode, 'stdout': stdout, 'stderr': stderr})()
-            except subprocess.TimeoutExpired:
-                self.current_cmake_process.kill()
-                stdout, stderr = self.current_cmake_process.communicate()
-                result = type('Result', (), {'returncode': -1, 'stdout': stdout, 'stderr': stderr})()
-            
-            # Check if build was cancelled during CMake
-            if self.build_cancelled:
-                self.log_to_console("❌ Build cancelled during CMake configuration")
-                return False
-            
-            if result.returncode == 0:
-                self.log_to_console("✅ CMake configuration completed successfully")
-                self.log_to_console("📋 Visual Studio solution files generated")
-                # Update build progress - CMake configure is ~30% of total build
-                self.root.after(0, lambda: self.build_main_progress.config(value=30))
-                return True
-            else:
-                self.log_to_console(f"❌ CMake configuration failed:")
-                self.log_to_console(f"STDOUT: {result.stdout}")
-                self.log_to_console(f"STDERR: {result.stderr}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            self.log_to_console("⏰ CMake configuration timed out")
-            return False
-        except Exception as e:
-            self.log_to_console(f"❌ CMake configuration error: {str(e)}")
-            return False
+    def _tools_build_enabled(self):
+        """Whether the extractor tools are built, from the Generate extractors checkbox"""
+        return self.generate_extractors_var.get()
     
-    def _run_cmake_generate_new(self, build_dir):
-        """Run CMake generate step without dialog - this is now just a verification step"""
-        try:
-            self.log_to_console("📋 Verifying generated Visual Studio solution files...")
-            
-            # Check if the solution file was created
-            solution_file = os.path.join(build_dir, "AzerothCore.sln")
-            if os.path.exists(solution_file):
-                self.log_to_console(f"✅ Solution file found: {solution_file}")
-                # Update build progress - CMake generate is ~40% of total build
-                self.root.after(0, lambda: self.build_main_progress.config(value=40))
-                return True
-            else:
-                self.log_to_console(f"❌ Solution file not found: {solution_file}")
-                self.log_to_console("📁 Checking build directory contents:")
-                
-                # List contents of build directory for debugging
-                try:
-                    build_contents = os.listdir(build_dir)
-                    for item in build_contents:
-                        self.log_to_console(f"   - {item}")
-                except Exception as e:
-                    self.log_to_console(f"   Error listing directory: {str(e)}")
-                
-                return False
-                
-        except Exception as e:
-            self.log_to_console(f"❌ CMake generation verification error: {str(e)}")
-            return False
+    def _report_build_progress(self, value):
+        """Show overall build progress in the main build progress bar"""
+        self.root.after(0, lambda: self.build_main_progress.config(value=value))
     
-    def _run_visual_studio_build_new(self, build_dir):
-        """Run Visual Studio build step without dialog"""
-        try:
-            self.log_to_console("🔨 Starting Visual Studio build process...")
-            
-            # Find MSBuild executable
-            msbuild_path = self._find_msbuild()
-            if not msbuild_path:
-                self.log_to_console("❌ MSBuild not found. Please ensure Visual Studio is installed.")
-                return False
-            
-            self.log_to_console(f"🔍 Using MSBuild: {msbuild_path}")
-            
-            # Build the solution using MSBuild
-            solution_file = os.path.join(build_dir, "AzerothCore.sln")
-            if not os.path.exists(solution_file):
-                self.log_to_console(f"❌ Solution file not found: {solution_file}")
-                return False
-            
-            self.log_to_console(f"📁 Building solution: {solution_file}")
-            
-            # Use MSBuild to build the solution with full path
-            msbuild_cmd = [
-                msbuild_path,
-                solution_file,
-                "/p:Configuration=RelWithDebInfo",
-                "/p:Platform=x64",
-                "/p:BuildProjectReferences=false",
-                "/m"
-            ]
-            
-            self.log_to_console(f"🔧 Running MSBuild: {' '.join(msbuild_cmd)}")
-            
-            # Use Popen to allow process termination
-            self.current_msbuild_process = subprocess.Popen(msbuild_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            
-            # Wait for process to complete or be cancelled
-            try:
-                stdout, stderr = self.current_msbuild_process.communicate(timeout=1800)  # 30 minutes timeout
-                result = type('Result', (), {'returncode': self.current_msbuild_process.returncode, 'stdout': stdout, 'stderr': stderr})()
-            except subprocess.TimeoutExpired:
-                self.current_msbuild_process.kill()
-                stdout, stderr = self.current_msbuild_process.communicate()
-                result = type('Result', (), {'returncode': -1, 'stdout': stdout, 'stderr': stderr})()
-            
-            # Check if build was cancelled during MSBuild
-            if self.build_cancelled:
-                self.log_to_console("❌ Build cancelled during MSBuild compilation")
-                return False
-            
-            if result.returncode == 0:
-                self.log_to_console("✅ Visual Studio build completed successfully")
-                self.log_to_console(f"📊 Build output: {result.stdout}")
-                # Update build progress - Visual Studio build is ~100% of total build
-                self.root.after(0, lambda: self.build_main_progress.config(value=100))
-                return True
-            else:
-                self.log_to_console("❌ Visual Studio build failed:")
-                self.log_to_console(f"STDOUT: {result.stdout}")
-                self.log_to_console(f"STDERR: {result.stderr}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            self.log_to_console("⏰ Visual Studio build timed out (30 minutes)")
-            return False
-        except Exception as e:
-            self.log_to_console(f"❌ Visual Studio build error: {str(e)}")
-            return False
-    
-    
-    def update_source_status(self, key, icon, status):
-        """Update the status display for a source repository"""
-        if key in self.source_widgets:
-            widgets = self.source_widgets[key]
-            widgets["status_icon"].config(text=icon)
-            widgets["status_text"].config(text=status)
+    def update_source_status(self, key, icon, status):
+        """Update the status display for a source repository"""
+        if key in self.source_widgets:
+            widgets = self.source_widgets[key]
+            widgets["status_icon"].config(text=icon)
+            widgets["status_text"].config(text=status)
             
             # Update colors based on status
             if icon == "✅":
@@ -3608,19 +3235,20 @@ class AzerothCoreBuilder:
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}\n"
         
-        # Add message to console
-        self.console_text.insert(tk.END, formatted_message)
-        self.console_text.see(tk.END)  # Auto-scroll to bottom
-        
-        # Write to log file if available
-        if hasattr(self, 'log_file_path') and self.log_file_path:
-            try:
-                with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                    f.write(formatted_message)
-                    f.flush()  # Ensure data is written immediately
-            except Exception as e:
-                # If file writing fails, continue without it
-                print(f"Warning: Could not write to log file: {str(e)}")
+        with self._log_lock:
+            # Add message to console
+            self.console_text.insert(tk.END, formatted_message)
+            self.console_text.see(tk.END)  # Auto-scroll to bottom
+            
+            # Write to log file if available
+            if hasattr(self, 'log_file_path') and self.log_file_path:
+                try:
+                    with open(self.log_file_path, 'a', encoding='utf-8') as f:
+                        f.write(formatted_message)
+                        f.flush()  # Ensure data is written immediately
+                except Exception as e:
+                    # If file writing fails, continue without it
+                    print(f"Warning: Could not write to log file: {str(e)}")
         
         # Also print to terminal for debugging
         try:
@@ -3730,36 +3358,55 @@ class AzerothCoreBuilder:
         scan_thread.start()
         
     def _perform_scan(self):
-        """Perform the actual system scan"""
+        """Perform the actual system scan, checking every requirement concurrently"""
         try:
+            start_time = time.time()
             total_requirements = len(self.requirements)
-            for i, (key, req) in enumerate(self.requirements.items(), 1):
-                # Update progress
-                progress_percentage = int((i / total_requirements) * 100)
-                self.root.after(0, lambda p=progress_percentage: self.progress.config(value=p))
-                
-                self.root.after(0, lambda k=key: self.update_status(k, "⏳", "Checking...", ""))
-                self.root.after(0, lambda k=key: self.log_to_console(f"Checking requirement: {req['name']}"))
-                
-                # Check if requirement is detected
-                detected, path, version = self.check_requirement(req)
-                
-                req["detected"] = detected
-                req["path"] = path
-                req["version"] = version
-                
-                # Update UI and log result
-                if detected:
-                    self.root.after(0, lambda k=key, p=path, v=version: 
-                                  self.update_status(k, "✅", "Detected", f"{v}\n{p}"))
-                    self.root.after(0, lambda k=key, p=path, v=version: 
-                                  self.log_to_console(f"✅ {req['name']} detected: {v} at {p}"))
-                else:
-                    self.root.after(0, lambda k=key: 
-                                  self.update_status(k, "❌", "Not Found", ""))
-                    self.root.after(0, lambda k=key: 
-                                  self.log_to_console(f"❌ {req['name']} not found"))
-                
+            
+            # Rows already showing a result keep it until their new result differs
+            for key in self.requirements:
+                if "shown" not in self.req_widgets[key]:
+                    self.root.after(0, lambda k=key: self.update_status(k, "⏳", "Checking...", ""))
+            
+            unchanged = 0
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, total_requirements)) as executor:
+                futures = {executor.submit(self.check_requirement, req): key for key, req in self.requirements.items()}
+                for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                    key = futures[future]
+                    req = self.requirements[key]
+                    
+                    # Update progress
+                    progress_percentage = int((done / total_requirements) * 100)
+                    self.root.after(0, lambda p=progress_percentage: self.progress.config(value=p))
+                    
+                    # Check if requirement is detected
+                    detected, path, version = future.result()
+                    
+                    req["detected"] = detected
+                    req["path"] = path
+                    req["version"] = version
+                    
+                    display = ("✅", "Detected", f"{version}\n{path}") if detected else ("❌", "Not Found", "")
+                    if self.req_widgets[key].get("shown") == display:
+                        unchanged += 1
+                        continue
+                    
+                    # Update UI and log result
+                    if detected:
+                        self.root.after(0, lambda k=key, p=path, v=version: 
+                                      self.update_status(k, "✅", "Detected", f"{v}\n{p}"))
+                        self.root.after(0, lambda n=req['name'], p=path, v=version: 
+                                      self.log_to_console(f"✅ {n} detected: {v} at {p}"))
+                    else:
+                        self.root.after(0, lambda k=key: 
+                                      self.update_status(k, "❌", "Not Found", ""))
+                        self.root.after(0, lambda n=req['name']: 
+                                      self.log_to_console(f"❌ {n} not found"))
+            
+            self._save_requirement_version_cache()
+            elapsed = time.time() - start_time
+            self.root.after(0, lambda: self.log_to_console(
+                f"⏱️ Checked {total_requirements} requirements in {elapsed:.1f}s ({unchanged} unchanged since the last scan)"))
             self.root.after(0, self._scan_complete)
             
         except Exception as e:
@@ -3781,15 +3428,11 @@ class AzerothCoreBuilder:
         # Check registry if not found in common paths
         if not detected and req["registry_keys"]:
             for reg_key in req["registry_keys"]:
-                try:
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_key) as key:
-                        install_path, _ = winreg.QueryValueEx(key, "InstallLocation")
-                        if install_path and os.path.exists(install_path):
-                            detected = True
-                            path = install_path
-                            break
-                except (FileNotFoundError, OSError):
-                    continue
+                install_path = get_backend().read_registry_value("HKLM", reg_key, "InstallLocation")
+                if install_path and os.path.exists(install_path):
+                    detected = True
+                    path = install_path
+                    break
         
         # Check PATH environment variable
         if not detected:
@@ -3804,28 +3447,61 @@ class AzerothCoreBuilder:
         
         # Try to get version if command is available
         if detected and req["version_check"]:
-            try:
-                result = subprocess.run(req["version_check"], shell=True, 
-                                      capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    version = result.stdout.strip()
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                version = "Version check failed"
+            version = self._get_requirement_version(req, path)
         
         # Special handling for Visual Studio
         if req["name"] == "Visual Studio 2022" and detected:
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SOFTWARE\Microsoft\VisualStudio\Setup\VS") as key:
-                    version, _ = winreg.QueryValueEx(key, "Version")
-            except (FileNotFoundError, OSError):
-                version = "2022 (detected)"
+            version = get_backend().read_registry_value("HKLM", r"SOFTWARE\Microsoft\VisualStudio\Setup\VS",
+                                                        "Version") or "2022 (detected)"
         
         return detected, path, version
     
+    def _get_requirement_version(self, req, path):
+        """Run a requirement's version check, cached by the detected path and its modification time"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        cache_key = f"{req['name']}|{os.path.normcase(os.path.abspath(path))}"
+        
+        with self._requirement_version_lock:
+            if self._requirement_version_cache is None:
+                cached = self._load_config_value("requirement_version_cache", {})
+                self._requirement_version_cache = cached if isinstance(cached, dict) else {}
+            entry = self._requirement_version_cache.get(cache_key)
+        if mtime is not None and isinstance(entry, dict) and entry.get("mtime") == mtime:
+            return entry.get("version", "")
+        
+        version = ""
+        try:
+            result = subprocess.run(req["version_check"], shell=True, 
+                                  capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                version = result.stdout.strip()
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            # Failures are not cached so the next scan tries again
+            return "Version check failed"
+        
+        if mtime is not None and version:
+            with self._requirement_version_lock:
+                self._requirement_version_cache[cache_key] = {"mtime": mtime, "version": version}
+                self._requirement_version_cache_dirty = True
+        return version
+    
+    def _save_requirement_version_cache(self):
+        """Persist version check results gathered during a scan"""
+        with self._requirement_version_lock:
+            if not self._requirement_version_cache_dirty:
+                return
+            cache = dict(self._requirement_version_cache)
+            self._requirement_version_cache_dirty = False
+        self._save_config_value("requirement_version_cache", cache)
+    
     def update_status(self, key, icon, status, info):
         """Update the status display for a requirement"""
         widgets = self.req_widgets[key]
+        # Remembered so a rescan only touches rows whose result changed
+        widgets["shown"] = (icon, status, info)
         widgets["status_icon"].config(text=icon)
         widgets["status_text"].config(text=status)
         widgets["version_var"].set(info)
@@ -4191,8 +3867,7 @@ class AzerothCoreBuilder:
     def _test_url(self, key, url):
         """Test if a URL is accessible"""
         try:
-            import urllib.request
-            with urllib.request.urlopen(url, timeout=10) as response:
+            with http_client.get(url, timeout=10) as response:
                 if response.status == 200:
                     file_size = response.headers.get('content-length', 'Unknown')
                     if file_size != 'Unknown':
@@ -4336,185 +4011,385 @@ class AzerothCoreBuilder:
         else:
             self.log_to_console(f"🔄 User chose to continue installation for {dialog.req_key}")
     
+    def install_all_missing(self):
+        """Download every missing requirement concurrently and install them in dependency-safe order"""
+        ordered = [key for key in _DEPENDENCY_INSTALL_ORDER if key in self.requirements]
+        ordered += [key for key in self.requirements if key not in ordered]
+        missing = [key for key in ordered if not self.requirements[key]["detected"]]
+        
+        if not missing:
+            messagebox.showinfo("Install All Missing", "All requirements are already detected.")
+            return
+        
+        names = "\n".join(f"• {self.requirements[key]['name']}" for key in missing)
+        if not messagebox.askyesno("Install All Missing",
+                                   f"The following requirements are not detected:\n\n{names}\n\n"
+                                   "Download them all now and install them one after another?\n\n"
+                                   "Anything already installed is skipped."):
+            self.log_to_console("❌ Batch installation cancelled by user")
+            return
+        
+        self.log_to_console(f"🚀 Starting batch installation of {len(missing)} requirement(s)")
+        dialog = self.create_batch_install_dialog(missing)
+        
+        batch_thread = threading.Thread(target=self._run_batch_install, args=(missing, dialog))
+        batch_thread.daemon = True
+        batch_thread.start()
+    
+    def create_batch_install_dialog(self, keys):
+        """Create the aggregated progress dialog for installing several requirements"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Installing Missing Requirements")
+        dialog.geometry(f"600x{230 + 30 * len(keys)}")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        
+        # Center dialog
+        dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 150, self.root.winfo_rooty() + 100))
+        
+        # Title
+        title_label = ttk.Label(dialog, text="Installing Missing Requirements", font=("Arial", 14, "bold"))
+        title_label.pack(pady=(20, 10))
+        
+        # One row per requirement
+        rows_frame = ttk.Frame(dialog)
+        rows_frame.pack(fill=tk.X, padx=20)
+        rows_frame.columnconfigure(1, weight=1)
+        rows = {}
+        for row, key in enumerate(keys):
+            ttk.Label(rows_frame, text=self.requirements[key]["name"], font=("Arial", 9)).grid(
+                row=row, column=0, sticky=tk.W, padx=(0, 10), pady=2)
+            row_status = ttk.Label(rows_frame, text="Waiting...", font=("Arial", 9))
+            row_status.grid(row=row, column=1, sticky=tk.W, padx=(0, 10), pady=2)
+            row_progress = ttk.Progressbar(rows_frame, mode='determinate', length=150)
+            row_progress.grid(row=row, column=2, sticky=tk.E, pady=2)
+            rows[key] = {"status": row_status, "progress": row_progress}
+        
+        # Overall progress
+        status_label = ttk.Label(dialog, text="Checking installed software...", font=("Arial", 10))
+        status_label.pack(pady=(15, 5))
+        progress = ttk.Progressbar(dialog, mode='determinate', length=540)
+        progress.pack(pady=(0, 15))
+        
+        # Cancel button
+        cancel_button = ttk.Button(dialog, text="Cancel", command=lambda: self.cancel_batch_installation(dialog))
+        cancel_button.pack(pady=(0, 20))
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self.cancel_batch_installation(dialog))
+        
+        # Store dialog references and add cancellation flag
+        dialog.rows = rows
+        dialog.progress = progress
+        dialog.status_label = status_label
+        dialog.cancel_button = cancel_button
+        dialog.cancelled = False
+        return dialog
+    
+    def cancel_batch_installation(self, dialog):
+        """Cancel a running batch installation"""
+        if messagebox.askyesno("Cancel Installation",
+                               "Are you sure you want to cancel the remaining downloads and installations?\n\n"
+                               "Installers that are already running are not stopped."):
+            dialog.cancelled = True
+            self.log_to_console("❌ User cancelled batch installation")
+            dialog.destroy()
+    
+    def _run_batch_install(self, keys, dialog):
+        """Check, download and install several requirements in a background thread"""
+        lock = threading.Lock()
+        state = {key: {"downloaded": 0, "total": None, "installed": False} for key in keys}
+        results = {}
+        last_update = [0.0]
+        start_time = time.time()
+        
+        def cancelled():
+            return dialog.cancelled
+        
+        def set_row(key, text, value=None):
+            def update():
+                dialog.rows[key]["status"].config(text=text)
+                if value is not None:
+                    dialog.rows[key]["progress"].config(value=value)
+            return self._safe_dialog_update(dialog, update)
+        
+        def refresh_overall(force=False):
+            # Downloads weigh 70% of the bar and installs the remaining 30%
+            now = time.time()
+            with lock:
+                if not force and now - last_update[0] < 0.25:
+                    return
+                last_update[0] = now
+                downloaded = sum(item["downloaded"] for item in state.values())
+                total = sum(item["total"] or 0 for item in state.values())
+                installed = sum(1 for item in state.values() if item["installed"])
+            download_fraction = downloaded / total if total else 0
+            value = download_fraction * 70 + (installed / len(keys)) * 30
+            speed = downloaded / max(now - start_time, 0.001) / (1024 * 1024)
+            text = (f"Downloaded {downloaded / (1024 * 1024):,.0f} / {total / (1024 * 1024):,.0f} MB "
+                    f"({speed:.1f} MB/s), {installed}/{len(keys)} installed")
+            self._safe_dialog_update(dialog, lambda: dialog.progress.config(value=value))
+            self._safe_dialog_update(dialog, lambda: dialog.status_label.config(text=text))
+        
+        def finish(key):
+            with lock:
+                state[key]["installed"] = True
+                if state[key]["total"] is None:
+                    state[key]["total"] = state[key]["downloaded"]
+            refresh_overall(force=True)
+        
+        # Skip anything that was installed since the last scan
+        pending = []
+        for key in keys:
+            req = self.requirements[key]
+            detected, path, version = self.check_requirement(req)
+            if detected:
+                req["detected"], req["path"], req["version"] = detected, path, version
+                self.root.after(0, lambda k=key, p=path, v=version: self.update_status(k, "✅", "Detected", f"{v}\n{p}"))
+                set_row(key, "✅ Already installed", 100)
+                results[key] = None
+                finish(key)
+            else:
+                pending.append(key)
+                set_row(key, "Queued for download...")
+        
+        # Download everything at once
+        def download(key):
+            req = self.requirements[key]
+            last_row_update = [0.0]
+            
+            def progress(downloaded, total):
+                with lock:
+                    state[key]["downloaded"] = downloaded
+                    state[key]["total"] = total
+                now = time.time()
+                if total and now - last_row_update[0] >= 0.25:
+                    last_row_update[0] = now
+                    set_row(key, f"Downloading... {downloaded / (1024 * 1024):,.0f} MB", downloaded * 100 / total)
+                refresh_overall()
+            
+            file_path = self._fetch_dependency_file(key, req, progress=progress, cancelled=cancelled,
+                                                    on_status=lambda text: set_row(key, text))
+            set_row(key, "Downloaded, waiting to install...", 100)
+            return file_path
+        
+        workers = self._load_config_value("install_download_workers", 4)
+        try:
+            workers = max(1, int(workers))
+        except (TypeError, ValueError):
+            workers = 4
+        download_pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        downloads = {key: download_pool.submit(download, key) for key in pending}
+        
+        def install(key):
+            req = self.requirements[key]
+            file_path = downloads[key].result()
+            if cancelled():
+                raise DownloadCancelled("Batch installation cancelled")
+            
+            if file_path.lower().endswith('.zip'):
+                set_row(key, "Extracting...", 0)
+                self.log_to_console(f"📦 Extracting {req['name']} to {req['install_path']}")
+            else:
+                set_row(key, "Installer running, complete it to continue...")
+                self.log_to_console(f"🚀 Running {req['name']} installer: {file_path}")
+            
+            last_row_update = [0.0]
+            
+            def extract_progress(files_done, total_files, bytes_done, total_bytes):
+                now = time.time()
+                if now - last_row_update[0] >= 0.25:
+                    last_row_update[0] = now
+                    set_row(key, f"Extracting... {files_done:,}/{total_files:,} files", bytes_done * 100 / max(total_bytes, 1))
+            
+            self._install_dependency_file(key, req, file_path, progress=extract_progress, cancelled=cancelled)
+            
+            detected, path, version = self.check_requirement(req)
+            if not detected and file_path.lower().endswith('.zip'):
+                # Extracted archives live where ACB put them even if no detector finds them
+                detected, path, version = True, req["install_path"], "Installed via ACB"
+            req["detected"], req["path"], req["version"] = detected, path, version
+            if detected:
+                self.root.after(0, lambda k=key, p=path, v=version: self.update_status(k, "✅", "Installed", f"{v}\n{p}"))
+                set_row(key, "✅ Installed", 100)
+            else:
+                set_row(key, "⚠️ Installer finished, not detected yet", 100)
+            self.root.after(5000, lambda: self._cleanup_temp_files(file_path))
+        
+        def run_lane(lane):
+            for key in lane:
+                try:
+                    if cancelled():
+                        raise DownloadCancelled("Batch installation cancelled")
+                    install(key)
+                    results[key] = None
+                except (DownloadCancelled, ExtractionCancelled):
+                    results[key] = "Cancelled"
+                    set_row(key, "Cancelled")
+                except Exception as e:
+                    results[key] = str(e)
+                    set_row(key, f"❌ {str(e)}")
+                    self.log_to_console(f"❌ Failed to install {self.requirements[key]['name']}: {str(e)}")
+                finally:
+                    finish(key)
+        
+        # Installers run one at a time in order, each archive extracts on its own lane
+        installers = [key for key in pending if not self.requirements[key]["download_url"].lower().endswith('.zip')]
+        lanes = [installers] if installers else []
+        lanes += [[key] for key in pending if key not in installers]
+        try:
+            if lanes:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(lanes)) as install_pool:
+                    list(install_pool.map(run_lane, lanes))
+        finally:
+            download_pool.shutdown(wait=False)
+        
+        if dialog.cancelled:
+            self.log_to_console("❌ Batch installation cancelled")
+            return
+        
+        failed = {key: error for key, error in results.items() if error}
+        self.log_to_console(f"✅ Batch installation finished in {time.time() - start_time:.0f}s: "
+                            f"{len(keys) - len(failed)} installed, {len(failed)} failed")
+        
+        summary = f"{len(keys) - len(failed)} of {len(keys)} requirement(s) are installed."
+        if failed:
+            summary += "\n\nFailed:\n" + "\n".join(f"• {self.requirements[key]['name']}: {error}"
+                                                   for key, error in failed.items())
+        summary += "\n\nUse 'Scan System' to refresh detection once all installers have finished."
+        self.root.after(0, lambda: dialog.destroy())
+        if failed:
+            self.root.after(0, lambda: messagebox.showwarning("Installation Finished", summary))
+        else:
+            self.root.after(0, lambda: messagebox.showinfo("Installation Finished", summary))
+    
+    def _install_dependency_file(self, key, req, file_path, progress=None, cancelled=None):
+        """Install a downloaded dependency without prompts, waiting for installers to exit"""
+        filename = os.path.basename(file_path).lower()
+        
+        if filename.endswith('.zip'):
+            install_dir = req["install_path"]
+            os.makedirs(install_dir, exist_ok=True)
+            extract_zip_parallel(file_path, install_dir, progress=progress, cancelled=cancelled)
+            self._setup_dependency_environment(key, install_dir)
+            return
+        
+        if filename.endswith('.exe'):
+            if key == "VisualStudio":
+                # Install the C++ workload unattended
+                cmd = [
+                    file_path,
+                    "--wait",
+                    "--passive",
+                    "--add", "Microsoft.VisualStudio.Workload.NativeDesktop",
+                    "--add", "Microsoft.VisualStudio.Component.VC.Tools.x86.x64",
+                    "--add", "Microsoft.VisualStudio.Component.Windows10SDK.19041"
+                ]
+            else:
+                cmd = [file_path]
+        elif filename.endswith('.msi'):
+            cmd = ['msiexec', '/i', file_path]
+        else:
+            raise Exception(f"Unknown file type: {filename}")
+        
+        result = subprocess.run(cmd)
+        # 3010 means success with a reboot required
+        if result.returncode not in (0, 3010):
+            raise Exception(f"Installer exited with code {result.returncode}")
+    
     def _download_dependency(self, key, req, dialog):
         """Download the dependency file"""
+        # Download with progress
+        def progress_callback(downloaded, total_size):
+            if total_size:
+                percentage = min(int((downloaded * 100) / total_size), 100)
+                self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress.config(value=p))
+                self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress_text.config(text=f"{p}%"))
+        
+        def report_status(text):
+            return self._safe_dialog_update(dialog, lambda t=text: dialog.status_label.config(text=t))
+        
         try:
-            # Try primary URL first
-            url = req["download_url"]
-            filename = os.path.basename(url)
-            
-            self.log_to_console(f"📥 Starting download: {filename} from {url}")
-            
-            # Update status
-            if not self._safe_dialog_update(dialog, lambda: dialog.status_label.config(text=f"Downloading {filename}...")):
-                self.log_to_console(f"❌ Download cancelled for {req['name']} - dialog was closed")
-                return
-            
-            # Create download directory
-            download_dir = os.path.join(self._get_app_dir(), "Downloads")
-            os.makedirs(download_dir, exist_ok=True)
-            self.log_to_console(f"📁 Created download directory: {download_dir}")
-            file_path = os.path.join(download_dir, filename)
-            
-            # Download with progress
-            def progress_callback(block_num, block_size, total_size):
-                if total_size > 0:
-                    downloaded = block_num * block_size
-                    percentage = min(int((downloaded * 100) / total_size), 100)
-                    self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress.config(value=p))
-                    self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress_text.config(text=f"{p}%"))
-            
-            # Download the file with timeout
-            import socket
-            socket.setdefaulttimeout(30)  # 30 second timeout
-            urllib.request.urlretrieve(url, file_path, progress_callback)
-            
-            # Check if cancelled before continuing
-            if hasattr(dialog, 'cancelled') and dialog.cancelled:
-                return
-            
-            # Update status
-            if not self._safe_dialog_update(dialog, lambda: dialog.status_label.config(text="Download completed! Starting installation...")):
-                return
-            if not self._safe_dialog_update(dialog, lambda: dialog.progress.config(value=100)):
-                return
-            if not self._safe_dialog_update(dialog, lambda: dialog.progress_text.config(text="100%")):
-                return
-            
-            # Wait a moment to show completion
-            import time
-            time.sleep(1)
-            
-            # Check if cancelled again before prompting
-            if hasattr(dialog, 'cancelled') and dialog.cancelled:
-                return
-            
-            # Ask user to proceed with installation
-            if not self._safe_dialog_update(dialog, lambda: self._prompt_installation(key, req, file_path, dialog)):
-                return
-            
+            file_path = self._fetch_dependency_file(key, req, progress=progress_callback,
+                                                    cancelled=lambda: getattr(dialog, 'cancelled', False),
+                                                    on_status=report_status)
+        except DownloadCancelled:
+            self.log_to_console(f"❌ Download cancelled for {req['name']}")
+            return
         except Exception as e:
-            # Try to find the latest release dynamically
-            if not self._safe_dialog_update(dialog, lambda: dialog.status_label.config(
-                text="Primary URL failed. Searching for latest release...")):
-                return
-            
-            latest_url = self._find_latest_release(key)
-            if latest_url and latest_url != req["download_url"]:
-                try:
-                    if not self._safe_dialog_update(dialog, lambda: dialog.status_label.config(
-                        text=f"Found latest release: {os.path.basename(latest_url)}")):
-                        return
-                    
-                    filename = os.path.basename(latest_url)
-                    download_dir = os.path.join(self._get_app_dir(), "Downloads")
-                    os.makedirs(download_dir, exist_ok=True)
-                    file_path = os.path.join(download_dir, filename)
-                    
-                    # Download with progress
-                    def progress_callback(block_num, block_size, total_size):
-                        if total_size > 0:
-                            downloaded = block_num * block_size
-                            percentage = min(int((downloaded * 100) / total_size), 100)
-                            self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress.config(value=p))
-                            self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress_text.config(text=f"{p}%"))
-                    
-                    # Set timeout for latest release download
-                    import socket
-                    socket.setdefaulttimeout(30)  # 30 second timeout
-                    urllib.request.urlretrieve(latest_url, file_path, progress_callback)
-                    
-                    # Check if cancelled before continuing
-                    if hasattr(dialog, 'cancelled') and dialog.cancelled:
-                        return
-                    
-                    # Success! Update status and proceed
-                    if not self._safe_dialog_update(dialog, lambda: dialog.status_label.config(text="Download completed! Starting installation...")):
-                        return
-                    if not self._safe_dialog_update(dialog, lambda: dialog.progress.config(value=100)):
-                        return
-                    if not self._safe_dialog_update(dialog, lambda: dialog.progress_text.config(text="100%")):
-                        return
-                    
-                    import time
-                    time.sleep(1)
-                    
-                    if not self._safe_dialog_update(dialog, lambda: self._prompt_installation(key, req, file_path, dialog)):
-                        return
-                    return
-                    
-                except Exception as latest_error:
-                    print(f"Latest release download failed: {latest_error}")
-            
-            # Try alternative URLs if latest release fails
-            if self._try_alternative_downloads(key, req, dialog):
-                return
-            
             # If all alternatives fail, show error
-            if not self._safe_dialog_update(dialog, lambda: self._show_download_error(dialog, str(e))):
-                return
+            self._safe_dialog_update(dialog, lambda: self._show_download_error(dialog, str(e)))
+            return
+        
+        # Update status
+        if not report_status("Download completed! Starting installation..."):
+            return
+        if not self._safe_dialog_update(dialog, lambda: dialog.progress.config(value=100)):
+            return
+        if not self._safe_dialog_update(dialog, lambda: dialog.progress_text.config(text="100%")):
+            return
+        
+        # Wait a moment to show completion
+        time.sleep(1)
+        
+        # Check if cancelled again before prompting
+        if hasattr(dialog, 'cancelled') and dialog.cancelled:
+            return
+        
+        # Ask user to proceed with installation
+        self._safe_dialog_update(dialog, lambda: self._prompt_installation(key, req, file_path, dialog))
     
-    def _try_alternative_downloads(self, key, req, dialog):
-        """Try alternative download URLs if primary fails"""
-        alternative_urls = self._get_alternative_urls(key)
+    def _fetch_dependency_file(self, key, req, progress=None, cancelled=None, on_status=None):
+        """Download a dependency into Downloads from its configured URL, the latest release or an alternative.
         
-        if not alternative_urls:
-            return False
+        on_status(text) receives status messages and may return False to abort. Returns the
+        downloaded file path and raises the primary URL's error when every URL fails.
+        """
+        download_dir = os.path.join(self._get_app_dir(), "Downloads")
+        os.makedirs(download_dir, exist_ok=True)
         
-        if not self._safe_dialog_update(dialog, lambda: dialog.status_label.config(
-            text=f"Primary URL failed. Trying {len(alternative_urls)} alternative(s)...")):
-            return False
+        def report(text):
+            if on_status and on_status(text) is False:
+                raise DownloadCancelled(f"Download of {req['name']} was closed")
+        
+        def fetch(url):
+            file_path = os.path.join(download_dir, os.path.basename(url))
+            self.log_to_console(f"📥 Starting download: {os.path.basename(url)} from {url}")
+            self._fetch_download(url, file_path, progress, cancelled=cancelled)
+            return file_path
         
+        # Try primary URL first
+        report(f"Downloading {os.path.basename(req['download_url'])}...")
+        try:
+            return fetch(req["download_url"])
+        except DownloadCancelled:
+            raise
+        except Exception as e:
+            primary_error = e
+        
+        # Try to find the latest release dynamically
+        report("Primary URL failed. Searching for latest release...")
+        latest_url = self._find_latest_release(key)
+        if latest_url and latest_url != req["download_url"]:
+            report(f"Found latest release: {os.path.basename(latest_url)}")
+            try:
+                return fetch(latest_url)
+            except DownloadCancelled:
+                raise
+            except Exception as latest_error:
+                print(f"Latest release download failed: {latest_error}")
+        
+        # Try alternative URLs if latest release fails
+        alternative_urls = self._get_alternative_urls(key)
         for i, alt_url in enumerate(alternative_urls, 1):
+            report(f"Trying alternative {i}/{len(alternative_urls)}: {os.path.basename(alt_url)}...")
             try:
-                if not self._safe_dialog_update(dialog, lambda u=alt_url, idx=i, total=len(alternative_urls): 
-                           dialog.status_label.config(
-                               text=f"Trying alternative {idx}/{total}: {os.path.basename(u)}...")):
-                    return False
-                
-                filename = os.path.basename(alt_url)
-                download_dir = os.path.join(self._get_app_dir(), "Downloads")
-                os.makedirs(download_dir, exist_ok=True)
-                file_path = os.path.join(download_dir, filename)
-                
-                # Download with progress
-                def progress_callback(block_num, block_size, total_size):
-                    if total_size > 0:
-                        downloaded = block_num * block_size
-                        percentage = min(int((downloaded * 100) / total_size), 100)
-                        self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress.config(value=p))
-                        self._safe_dialog_update(dialog, lambda p=percentage: dialog.progress_text.config(text=f"{p}%"))
-                
-                # Set timeout for alternative downloads
-                import socket
-                socket.setdefaulttimeout(30)  # 30 second timeout
-                urllib.request.urlretrieve(alt_url, file_path, progress_callback)
-                
-                # Check if cancelled before continuing
-                if hasattr(dialog, 'cancelled') and dialog.cancelled:
-                    return False
-                
-                # Success! Update status and proceed
-                if not self._safe_dialog_update(dialog, lambda: dialog.status_label.config(text="Download completed! Starting installation...")):
-                    return False
-                if not self._safe_dialog_update(dialog, lambda: dialog.progress.config(value=100)):
-                    return False
-                if not self._safe_dialog_update(dialog, lambda: dialog.progress_text.config(text="100%")):
-                    return False
-                
-                import time
-                time.sleep(1)
-                
-                if not self._safe_dialog_update(dialog, lambda: self._prompt_installation(key, req, file_path, dialog)):
-                    return False
-                return True
-                
+                return fetch(alt_url)
+            except DownloadCancelled:
+                raise
             except Exception as e:
                 # Log the error but continue to next alternative
                 print(f"Alternative URL {i} failed: {str(e)}")
-                continue
         
-        return False
+        raise primary_error
     
     def _get_alternative_urls(self, key):
         """Get alternative download URLs for a dependency"""
@@ -4580,13 +4455,9 @@ class AzerothCoreBuilder:
     def _find_latest_git(self):
         """Find latest Git for Windows release"""
         try:
-            import urllib.request
-            import json
-            
             # Get latest release info from GitHub API
             api_url = "https://api.github.com/repos/git-for-windows/git/releases/latest"
-            with urllib.request.urlopen(api_url, timeout=10) as response:
-                data = json.loads(response.read().decode())
+            data = http_client.get_json(api_url, timeout=10)
                 
             # Find the 64-bit Windows installer
             for asset in data.get('assets', []):
@@ -4627,36 +4498,48 @@ class AzerothCoreBuilder:
                 "https://slproweb.com/download/Win64OpenSSL-3_0_10.exe"
             ]
             
-            # Test each URL to see if it's accessible
-            for url in openssl_versions:
-                try:
-                    import urllib.request
-                    with urllib.request.urlopen(url, timeout=5) as response:
-                        if response.status == 200:
-                            print(f"OpenSSL: Found working URL: {url}")
-                            return url
-                except Exception as e:
-                    print(f"OpenSSL: URL {url} failed: {e}")
-                    continue
-            
-            # If none work, return the first one as fallback
-            print(f"OpenSSL: No working URLs found, using fallback: {openssl_versions[0]}")
-            return openssl_versions[0]
+            # Probe all URLs at once and keep the newest that responds
+            return self._resolve_release_url("OpenSSL", openssl_versions)
             
         except Exception as e:
             print(f"Error finding latest OpenSSL: {e}")
             return None
     
+    def _resolve_release_url(self, name, candidates):
+        """Newest candidate URL that responds, remembered in the config for release_url_cache_hours"""
+        try:
+            ttl = float(self._load_config_value("release_url_cache_hours", 24)) * 3600
+        except (TypeError, ValueError):
+            ttl = 24 * 3600
+        
+        cached = self._load_config_value("release_url_cache", {})
+        entry = cached.get(name) if isinstance(cached, dict) else None
+        if isinstance(entry, dict) and entry.get("url") in candidates and time.time() - entry.get("timestamp", 0) < ttl:
+            print(f"{name}: Using cached URL: {entry['url']}")
+            return entry["url"]
+        
+        start_time = time.time()
+        url = first_available_url(candidates)
+        if url is None:
+            # If none work, return the first one as fallback
+            print(f"{name}: No working URLs found, using fallback: {candidates[0]}")
+            return candidates[0]
+        
+        print(f"{name}: Found working URL: {url} ({time.time() - start_time:.1f}s)")
+        with self._config_lock:
+            cached = self._load_config_value("release_url_cache", {})
+            if not isinstance(cached, dict):
+                cached = {}
+            cached[name] = {"url": url, "timestamp": time.time()}
+            self._save_config_value("release_url_cache", cached)
+        return url
+    
     def _find_latest_cmake(self):
         """Find latest CMake release"""
         try:
-            import urllib.request
-            import json
-            
             # Get latest release info from GitHub API
             api_url = "https://api.github.com/repos/Kitware/CMake/releases/latest"
-            with urllib.request.urlopen(api_url, timeout=10) as response:
-                data = json.loads(response.read().decode())
+            data = http_client.get_json(api_url, timeout=10)
                 
             # Find the Windows x64 ZIP
             for asset in data.get('assets', []):
@@ -4682,21 +4565,8 @@ class AzerothCoreBuilder:
                 "https://dev.mysql.com/get/Downloads/MySQL-8.0/mysql-8.0.34-winx64.zip"
             ]
             
-            # Test each URL to see if it's accessible
-            for url in mysql_versions:
-                try:
-                    import urllib.request
-                    with urllib.request.urlopen(url, timeout=5) as response:
-                        if response.status == 200:
-                            print(f"MySQL: Found working URL: {url}")
-                            return url
-                except Exception as e:
-                    print(f"MySQL: URL {url} failed: {e}")
-                    continue
-            
-            # If none work, return the first one as fallback
-            print(f"MySQL: No working URLs found, using fallback: {mysql_versions[0]}")
-            return mysql_versions[0]
+            # Probe all URLs at once and keep the newest that responds
+            return self._resolve_release_url("MySQL", mysql_versions)
             
         except Exception as e:
             print(f"Error finding latest MySQL: {e}")
@@ -4717,21 +4587,8 @@ class AzerothCoreBuilder:
                 "https://boostorg.jfrog.io/artifactory/main/release/1.78.0/source/boost_1_78_0.zip"
             ]
             
-            # Test each URL to see if it's accessible
-            for url in boost_versions:
-                try:
-                    import urllib.request
-                    with urllib.request.urlopen(url, timeout=5) as response:
-                        if response.status == 200:
-                            print(f"Boost: Found working URL: {url}")
-                            return url
-                except Exception as e:
-                    print(f"Boost: URL {url} failed: {e}")
-                    continue
-            
-            # If none work, return the first one as fallback
-            print(f"Boost: No working URLs found, using fallback: {boost_versions[0]}")
-            return boost_versions[0]
+            # Probe all URLs at once and keep the newest that responds
+            return self._resolve_release_url("Boost", boost_versions)
             
         except Exception as e:
             print(f"Error finding latest Boost: {e}")
@@ -4748,21 +4605,8 @@ class AzerothCoreBuilder:
                 "https://aka.ms/vs/16/release/vs_community.exe"
             ]
             
-            # Test each URL to see if it's accessible
-            for url in vs_versions:
-                try:
-                    import urllib.request
-                    with urllib.request.urlopen(url, timeout=5) as response:
-                        if response.status == 200:
-                            print(f"Visual Studio: Found working URL: {url}")
-                            return url
-                except Exception as e:
-                    print(f"Visual Studio: URL {url} failed: {e}")
-                    continue
-            
-            # If none work, return the first one as fallback
-            print(f"Visual Studio: No working URLs found, using fallback: {vs_versions[0]}")
-            return vs_versions[0]
+            # Probe all URLs at once and keep the newest that responds
+            return self._resolve_release_url("Visual Studio", vs_versions)
             
         except Exception as e:
             print(f"Error finding latest Visual Studio: {e}")
@@ -4775,8 +4619,7 @@ class AzerothCoreBuilder:
             working_url = "https://www.heidisql.com/downloads/releases/HeidiSQL_12.11_32_Portable.zip"
             
             # Verify the URL is accessible - same as other requirements
-            import urllib.request
-            with urllib.request.urlopen(working_url, timeout=5) as response:
+            with http_client.get(working_url, timeout=5) as response:
                 if response.status == 200:
                     print(f"HeidiSQL: Found working URL: {working_url}")
                     return working_url
@@ -4931,10 +4774,25 @@ class AzerothCoreBuilder:
             install_dir = req["install_path"]
             os.makedirs(install_dir, exist_ok=True)
             
-            # Extract ZIP file
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                zip_ref.extractall(install_dir)
+            # Extract ZIP file across all CPU cores
+            extract_start = time.time()
+            extracted = extract_zip_parallel(file_path, install_dir)
+            self.log_to_console(f"📦 Extracted {len(extracted)} entries from {os.path.basename(file_path)} in {time.time() - extract_start:.1f}s")
+            
+            self._setup_dependency_environment(key, install_dir)
             
+            messagebox.showinfo("Installation Complete", 
+                              f"{req['name']} has been extracted to:\n{install_dir}\n\n"
+                              "The software is now ready to use!")
+            
+        except Exception as e:
+            messagebox.showerror("Extraction Error", 
+                               f"Failed to extract {req['name']}:\n{str(e)}")
+    
+    def _setup_dependency_environment(self, key, install_dir):
+        """Set the environment variables an extracted dependency needs"""
+        # PATH is read, modified and written back, so only one dependency at a time
+        with self._environment_lock:
             # Special handling for MySQL to set environment variables
             if key == "MySQL":
                 self._setup_mysql_environment(install_dir)
@@ -4946,20 +4804,18 @@ class AzerothCoreBuilder:
             # Special handling for Boost to set BOOST_ROOT environment variable
             if key == "Boost":
                 self._setup_boost_environment(install_dir)
-            
-            messagebox.showinfo("Installation Complete", 
-                              f"{req['name']} has been extracted to:\n{install_dir}\n\n"
-                              "The software is now ready to use!")
-            
-        except Exception as e:
-            messagebox.showerror("Extraction Error", 
-                               f"Failed to extract {req['name']}:\n{str(e)}")
     
+    def _read_persistent_path(self):
+        """Return (scope, PATH) for the first environment scope, system then user, this process can write"""
+        backend = get_backend()
+        for scope in ("machine", "user"):
+            if backend.can_write_environment(scope):
+                return scope, backend.get_environment_variable("Path", scope) or ""
+        raise PermissionError("Environment variables registry is not writable")
+
     def _setup_mysql_environment(self, install_dir):
         """Set MySQL bin, lib, include folders and libmysql.lib as system environment variables"""
         try:
-            import winreg
-            
             # MySQL paths
             mysql_bin = os.path.join(install_dir, "bin")
             mysql_lib = os.path.join(install_dir, "lib")
@@ -4980,28 +4836,12 @@ class AzerothCoreBuilder:
                 print(f"MySQL libmysql.lib not found: {mysql_libmysql}")
                 return
             
-            # Get current PATH from registry
+            # Get current PATH from the persistent environment
             try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                   0, winreg.KEY_READ | winreg.KEY_WRITE) as key:
-                    try:
-                        current_path, _ = winreg.QueryValueEx(key, "Path")
-                    except FileNotFoundError:
-                        current_path = ""
+                path_scope, current_path = self._read_persistent_path()
             except PermissionError:
-                # Try current user environment if system-wide fails
-                try:
-                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                       r"Environment", 
-                                       0, winreg.KEY_READ | winreg.KEY_WRITE) as key:
-                        try:
-                            current_path, _ = winreg.QueryValueEx(key, "Path")
-                        except FileNotFoundError:
-                            current_path = ""
-                except PermissionError:
-                    print("Failed to access environment variables registry")
-                    return
+                print("Failed to access environment variables registry")
+                return
             
             # Check if MySQL paths are already in PATH
             path_dirs = current_path.split(os.pathsep) if current_path else []
@@ -5018,81 +4858,24 @@ class AzerothCoreBuilder:
                 path_dirs.append(mysql_include)
                 print(f"Added MySQL include to PATH: {mysql_include}")
             
-            # Update PATH in registry
+            # Update PATH in the scope it was read from
             new_path = os.pathsep.join(path_dirs)
-            
-            try:
-                # Try system-wide first
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                   0, winreg.KEY_WRITE) as key:
-                    winreg.SetValueEx(key, "Path", 0, winreg.REG_EXPAND_SZ, new_path)
-                    print("Updated system PATH environment variable")
-            except PermissionError:
-                # Fallback to current user
-                try:
-                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                       r"Environment", 
-                                       0, winreg.KEY_WRITE) as key:
-                        winreg.SetValueEx(key, "Path", 0, winreg.REG_EXPAND_SZ, new_path)
-                        print("Updated user PATH environment variable")
-                except Exception as e:
-                    print(f"Failed to update user PATH: {e}")
-                    return
-            
-            # Set MYSQL_HOME environment variable
             try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                   0, winreg.KEY_WRITE) as key:
-                    winreg.SetValueEx(key, "MYSQL_HOME", 0, winreg.REG_EXPAND_SZ, install_dir)
-                    print(f"Set MYSQL_HOME: {install_dir}")
-            except PermissionError:
-                # Fallback to current user
-                try:
-                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                       r"Environment", 
-                                       0, winreg.KEY_WRITE) as key:
-                        winreg.SetValueEx(key, "MYSQL_HOME", 0, winreg.REG_EXPAND_SZ, install_dir)
-                        print(f"Set MYSQL_HOME: {install_dir}")
-                except Exception as e:
-                    print(f"Failed to set MYSQL_HOME: {e}")
-            
-            # Set MYSQL_LIB environment variable pointing to libmysql.lib
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                   0, winreg.KEY_WRITE) as key:
-                    winreg.SetValueEx(key, "MYSQL_LIB", 0, winreg.REG_EXPAND_SZ, mysql_libmysql)
-                    print(f"Set MYSQL_LIB: {mysql_libmysql}")
-            except PermissionError:
-                # Fallback to current user
-                try:
-                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                       r"Environment", 
-                                       0, winreg.KEY_WRITE) as key:
-                        winreg.SetValueEx(key, "MYSQL_LIB", 0, winreg.REG_EXPAND_SZ, mysql_libmysql)
-                        print(f"Set MYSQL_LIB: {mysql_libmysql}")
-                except Exception as e:
-                    print(f"Failed to set MYSQL_LIB: {e}")
+                get_backend().set_environment_variable("Path", new_path, path_scope)
+                print(f"Updated {'system' if path_scope == 'machine' else 'user'} PATH environment variable")
+            except Exception as e:
+                print(f"Failed to update PATH: {e}")
+                return
             
-            # Set MYSQL_INCLUDE environment variable
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                   0, winreg.KEY_WRITE) as key:
-                    winreg.SetValueEx(key, "MYSQL_INCLUDE", 0, winreg.REG_EXPAND_SZ, mysql_include)
-                    print(f"Set MYSQL_INCLUDE: {mysql_include}")
-            except PermissionError:
-                # Fallback to current user
+            # Set MYSQL_HOME, MYSQL_LIB (pointing to libmysql.lib) and MYSQL_INCLUDE
+            for name, value in (("MYSQL_HOME", install_dir),
+                                ("MYSQL_LIB", mysql_libmysql),
+                                ("MYSQL_INCLUDE", mysql_include)):
                 try:
-                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                       r"Environment", 
-                                       0, winreg.KEY_WRITE) as key:
-                        winreg.SetValueEx(key, "MYSQL_INCLUDE", 0, winreg.REG_EXPAND_SZ, mysql_include)
-                        print(f"Set MYSQL_INCLUDE: {mysql_include}")
+                    get_backend().set_environment_variable_any_scope(name, value)
+                    print(f"Set {name}: {value}")
                 except Exception as e:
-                    print(f"Failed to set MYSQL_INCLUDE: {e}")
+                    print(f"Failed to set {name}: {e}")
             
             # Notify user about environment variable changes
             messagebox.showinfo("MySQL Environment Setup", 
@@ -5116,30 +4899,12 @@ class AzerothCoreBuilder:
     def _setup_heidisql_environment(self, install_dir):
         """Add HeidiSQL to PATH environment variable"""
         try:
-            import winreg
-            
-            # Get current PATH from registry
+            # Get current PATH from the persistent environment
             try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                   0, winreg.KEY_READ | winreg.KEY_WRITE) as key:
-                    try:
-                        current_path, _ = winreg.QueryValueEx(key, "Path")
-                    except FileNotFoundError:
-                        current_path = ""
+                path_scope, current_path = self._read_persistent_path()
             except PermissionError:
-                # Try current user environment if system-wide fails
-                try:
-                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                       r"Environment", 
-                                       0, winreg.KEY_READ | winreg.KEY_WRITE) as key:
-                        try:
-                            current_path, _ = winreg.QueryValueEx(key, "Path")
-                        except FileNotFoundError:
-                            current_path = ""
-                except PermissionError:
-                    print("Failed to access environment variables registry")
-                    return
+                print("Failed to access environment variables registry")
+                return
             
             # Check if HeidiSQL path is already in PATH
             path_dirs = current_path.split(os.pathsep) if current_path else []
@@ -5148,27 +4913,14 @@ class AzerothCoreBuilder:
                 path_dirs.append(install_dir)
                 print(f"Added HeidiSQL to PATH: {install_dir}")
                 
-                # Update PATH in registry
+                # Update PATH in the scope it was read from
                 new_path = os.pathsep.join(path_dirs)
-                
                 try:
-                    # Try system-wide first
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                       r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                       0, winreg.KEY_WRITE) as key:
-                        winreg.SetValueEx(key, "Path", 0, winreg.REG_EXPAND_SZ, new_path)
-                        print("Updated system PATH environment variable")
-                except PermissionError:
-                    # Fallback to current user
-                    try:
-                        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                           r"Environment", 
-                                           0, winreg.KEY_WRITE) as key:
-                            winreg.SetValueEx(key, "Path", 0, winreg.REG_EXPAND_SZ, new_path)
-                            print("Updated user PATH environment variable")
-                    except Exception as e:
-                        print(f"Failed to update user PATH: {e}")
-                        return
+                    get_backend().set_environment_variable("Path", new_path, path_scope)
+                    print(f"Updated {'system' if path_scope == 'machine' else 'user'} PATH environment variable")
+                except Exception as e:
+                    print(f"Failed to update PATH: {e}")
+                    return
                 
                 # Notify user about environment variable changes
                 messagebox.showinfo("HeidiSQL Environment Setup", 
@@ -5190,8 +4942,6 @@ class AzerothCoreBuilder:
     def _setup_boost_environment(self, install_dir):
         """Set BOOST_ROOT environment variable for Boost installation"""
         try:
-            import winreg
-            
             # Convert backslashes to forward slashes as required by Boost
             boost_root = install_dir.replace('\\', '/')
             
@@ -5201,23 +4951,18 @@ class AzerothCoreBuilder:
             
             print(f"Setting BOOST_ROOT to: {boost_root}")
             
-            # Try to set BOOST_ROOT in system environment variables first
+            # Set BOOST_ROOT in system environment variables first
+            backend = get_backend()
             try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                                   0, winreg.KEY_WRITE) as key:
-                    winreg.SetValueEx(key, "BOOST_ROOT", 0, winreg.REG_EXPAND_SZ, boost_root)
-                    print("Set BOOST_ROOT in system environment variables")
+                backend.set_environment_variable("BOOST_ROOT", boost_root, "machine")
+                print("Set BOOST_ROOT in system environment variables")
             except PermissionError:
                 print("Failed to set BOOST_ROOT in system environment variables (permission denied)")
             
             # Also set in user environment variables as fallback/recommendation
             try:
-                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                   r"Environment", 
-                                   0, winreg.KEY_WRITE) as key:
-                    winreg.SetValueEx(key, "BOOST_ROOT", 0, winreg.REG_EXPAND_SZ, boost_root)
-                    print("Set BOOST_ROOT in user environment variables")
+                backend.set_environment_variable("BOOST_ROOT", boost_root, "user")
+                print("Set BOOST_ROOT in user environment variables")
             except Exception as e:
                 print(f"Failed to set BOOST_ROOT in user environment variables: {e}")
             
@@ -5231,51 +4976,12 @@ class AzerothCoreBuilder:
             
         except Exception as e:
             print(f"Error setting up Boost environment: {e}")
+            boost_root = install_dir.replace('\\', '/').rstrip('/')
             messagebox.showwarning("Boost Environment Setup", 
                                  f"Boost was installed but there was an issue setting environment variables:\n\n"
                                  f"Error: {str(e)}\n\n"
                                  "You may need to manually set BOOST_ROOT environment variable to:\n"
-                                 f"{install_dir.replace('\\', '/').rstrip('/')}")
-    
-    def _find_msbuild(self):
-        """Find MSBuild executable from Visual Studio installations"""
-        try:
-            # Common MSBuild locations for Visual Studio 2022
-            possible_paths = [
-                r"C:\Program Files\Microsoft Visual Studio\2022\Community\MSBuild\Current\Bin\MSBuild.exe",
-                r"C:\Program Files\Microsoft Visual Studio\2022\Professional\MSBuild\Current\Bin\MSBuild.exe",
-                r"C:\Program Files\Microsoft Visual Studio\2022\Enterprise\MSBuild\Current\Bin\MSBuild.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2022\Community\MSBuild\Current\Bin\MSBuild.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2022\Professional\MSBuild\Current\Bin\MSBuild.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2022\Enterprise\MSBuild\Current\Bin\MSBuild.exe",
-                # Visual Studio 2019 paths as fallback
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2019\Community\MSBuild\Current\Bin\MSBuild.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2019\Professional\MSBuild\Current\Bin\MSBuild.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2019\Enterprise\MSBuild\Current\Bin\MSBuild.exe",
-            ]
-            
-            for path in possible_paths:
-                if os.path.exists(path):
-                    self.log_to_console(f"🔍 Found MSBuild at: {path}")
-                    return path
-            
-            # Try to find from PATH as last resort
-            try:
-                result = subprocess.run(["where", "msbuild"], capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    msbuild_path = result.stdout.strip().split('\n')[0]
-                    if os.path.exists(msbuild_path):
-                        self.log_to_console(f"🔍 Found MSBuild in PATH: {msbuild_path}")
-                        return msbuild_path
-            except:
-                pass
-            
-            self.log_to_console("❌ MSBuild not found in common locations or PATH")
-            return None
-            
-        except Exception as e:
-            self.log_to_console(f"❌ Error finding MSBuild: {str(e)}")
-            return None
+                                 f"{boost_root}")
     
     def _show_build_finished(self, dialog):
         """Show the Build Finished button and hide the Cancel Build button"""
@@ -5359,12 +5065,136 @@ class AzerothCoreBuilder:
                                "You may need to manually delete the folder or close any applications "
                                "that might be using files in this directory.")
 
+    def run_full_repack(self):
+        """Run every repack step as a task graph: independent steps in parallel, up-to-date steps skipped"""
+        app_dir = self._get_app_dir()
+        build_bin_dir = os.path.join(app_dir, "Build", "bin", "RelWithDebInfo")
+        
+        if not os.path.exists(build_bin_dir):
+            messagebox.showerror("Build Bin Folder Not Found", 
+                               f"Build bin folder not found at:\n{build_bin_dir}\n\n"
+                               "Please build AzerothCore first before creating a repack.")
+            self.log_to_console("❌ Build bin folder not found")
+            return
+        
+        if not messagebox.askyesno("Full Repack", 
+                                  "Run Create Repack, Create configs, Config paths, Create MySQL, Create DLL's, "
+                                  "Initialize MySQL, Create My.ini and Download Data?\n\n"
+                                  "Steps whose results are already up to date are skipped and independent "
+                                  "steps run at the same time. Import SQL needs a running MySQL server and "
+                                  "is still started from its own button."):
+            self.log_to_console("❌ Full repack cancelled by user")
+            return
+        
+        dialog = None
+        graph = self._repack_task_graph(include_data=True, reporter_for=lambda name: TkProgressReporter(
+            self.root, status_label=dialog.status_label, cancelled=lambda: dialog.cancelled))
+        dialog = self._create_full_repack_progress_dialog(graph)
+        
+        repack_thread = threading.Thread(target=self._run_full_repack, args=(graph, dialog))
+        repack_thread.daemon = True
+        repack_thread.start()
+    
+    def _create_full_repack_progress_dialog(self, graph):
+        """Create progress dialog with one status row per repack task"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Full Repack")
+        dialog.geometry("450x420")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+        
+        # Center dialog
+        dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 200, self.root.winfo_rooty() + 150))
+        
+        # Title
+        title_label = ttk.Label(dialog, text="Full Repack", 
+                               font=("Arial", 14, "bold"))
+        title_label.pack(pady=(20, 10))
+        
+        # Status label
+        status_label = ttk.Label(dialog, text="Starting repack tasks...", font=("Arial", 10))
+        status_label.pack(pady=(0, 10))
+        
+        # Progress bar counts finished tasks
+        progress = ttk.Progressbar(dialog, mode='determinate', length=350, style='Green.Horizontal.TProgressbar')
+        progress.pack(pady=(0, 15))
+        progress['maximum'] = len(graph.tasks)
+        
+        # One row per task
+        tasks_frame = ttk.Frame(dialog)
+        tasks_frame.pack(fill=tk.X, padx=40)
+        task_labels = {}
+        for row, (name, task) in enumerate(graph.tasks.items()):
+            ttk.Label(tasks_frame, text=task.title, font=("Arial", 10)).grid(row=row, column=0, sticky=tk.W, pady=2)
+            state_label = ttk.Label(tasks_frame, text="⏸️ Waiting", font=("Arial", 10))
+            state_label.grid(row=row, column=1, sticky=tk.W, padx=(20, 0), pady=2)
+            task_labels[name] = state_label
+        
+        # Cancel button
+        dialog.cancelled = False
+        cancel_button = ttk.Button(dialog, text="Cancel", 
+                                 command=lambda: setattr(dialog, 'cancelled', True))
+        cancel_button.pack(pady=(15, 0))
+        
+        # Store references
+        dialog.status_label = status_label
+        dialog.progress = progress
+        dialog.task_labels = task_labels
+        
+        return dialog
+    
+    def _run_full_repack(self, graph, dialog):
+        """Run the repack task graph in background thread"""
+        state_texts = {
+            "start": "⏳ Running",
+            "done": "✅ Done",
+            "skipped": "⏭️ Up to date",
+            "failed": "❌ Failed",
+            "blocked": "⛔ Blocked",
+            "cancelled": "❌ Cancelled",
+        }
+        finished = []
+        
+        def on_event(name, state, elapsed):
+            text = state_texts.get(state, state)
+            if state != "start":
+                finished.append(name)
+                text += f" ({elapsed:.1f}s)" if state in ("done", "failed") else ""
+                title = graph.tasks[name].title
+                self.log_to_console(f"📋 {title}: {state_texts.get(state, state)}")
+            count = len(finished)
+            
+            def update():
+                if dialog.winfo_exists():
+                    dialog.task_labels[name].config(text=text)
+                    dialog.progress.config(value=count)
+            self.root.after(0, update)
+        
+        try:
+            self.log_to_console("⚡ Starting full repack...")
+            results = self._run_task_graph(graph, cancelled=lambda: dialog.cancelled, on_event=on_event)
+            self.root.after(0, lambda: dialog.destroy() if dialog.winfo_exists() else None)
+            
+            summary = "\n".join(f"• {graph.tasks[name].title}: {state_texts.get(state, state)}"
+                                for name, (state, elapsed) in results.items())
+            if all(state in ("done", "skipped") for state, elapsed in results.values()):
+                self.root.after(0, lambda: messagebox.showinfo("Full Repack Complete", 
+                    f"The repack is complete:\n\n{summary}"))
+                self.log_to_console("🎉 Full repack completed!")
+            else:
+                self.root.after(0, lambda: messagebox.showwarning("Full Repack Incomplete", 
+                    f"Some repack steps did not complete:\n\n{summary}\n\nCheck the console for details."))
+                self.log_to_console("⚠️ Full repack finished with failed or blocked steps")
+        except Exception as e:
+            self.root.after(0, lambda: dialog.destroy() if dialog.winfo_exists() else None)
+            error_msg = f"Failed to run the full repack:\n\n{str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Full Repack Failed", error_msg))
+            self.log_to_console(f"❌ Full repack failed: {str(e)}")
+    
     def create_repack(self):
         """Create a Repack folder with server executables and configuration files"""
         try:
-            # Import shutil at the beginning of the method
-            import shutil
-            
             # Get the main app directory (where ACB.py is located)
             app_dir = self._get_app_dir()
             repack_dir = os.path.join(app_dir, "Repack")
@@ -5388,53 +5218,16 @@ class AzerothCoreBuilder:
                 self.log_to_console("❌ Build bin folder not found")
                 return
             
-            # Create Repack directory
+            # Existing repacks are updated in place, only changed files are written
             if os.path.exists(repack_dir):
                 if not messagebox.askyesno("Repack Exists", 
                                          f"Repack folder already exists at:\n{repack_dir}\n\n"
-                                         "Do you want to replace it? This will delete the existing repack."):
+                                         "Do you want to update it? Only changed files are copied; your .conf files, "
+                                         "data and MySQL folders are kept."):
                     self.log_to_console("❌ Repack creation cancelled by user")
                     return
-                
-                # Remove existing repack folder
-                shutil.rmtree(repack_dir)
-                self.log_to_console("🗑️ Removed existing repack folder")
-            
-            # Create new repack directory
-            os.makedirs(repack_dir, exist_ok=True)
-            self.log_to_console(f"📁 Created repack directory: {repack_dir}")
-            
-            # Files and folders to copy - all from Build\bin\RelWithDebInfo
-            items_to_copy = [
-                # Executables from Build\bin\RelWithDebInfo
-                (os.path.join(build_bin_dir, "authserver.exe"), "authserver.exe"),
-                (os.path.join(build_bin_dir, "worldserver.exe"), "worldserver.exe"),
-                # Folders from Build\bin\RelWithDebInfo
-                (os.path.join(build_bin_dir, "configs"), "configs"),
-                (os.path.join(build_bin_dir, "lua_scripts"), "lua_scripts")
-            ]
-            
-            copied_items = []
-            missing_items = []
-            
-            # Copy each item
-            for source_path, dest_name in items_to_copy:
-                dest_path = os.path.join(repack_dir, dest_name)
-                
-                if os.path.exists(source_path):
-                    if os.path.isfile(source_path):
-                        # Copy file
-                        shutil.copy2(source_path, dest_path)
-                        copied_items.append(f"📄 {dest_name}")
-                    elif os.path.isdir(source_path):
-                        # Copy directory
-                        shutil.copytree(source_path, dest_path)
-                        copied_items.append(f"📁 {dest_name}/")
-                    
-                    self.log_to_console(f"✅ Copied {dest_name}")
-                else:
-                    missing_items.append(dest_name)
-                    self.log_to_console(f"⚠️ Not found: {dest_name}")
+            
+            copied_items, missing_items, failed_files = self._assemble_repack(repack_dir, build_bin_dir)
             
             # Show completion message
             if copied_items:
@@ -5446,6 +5239,12 @@ class AzerothCoreBuilder:
                     success_msg += f"\n\nMissing items:\n" + "\n".join(f"• {item}" for item in missing_items)
                     success_msg += f"\n\nNote: Some items were not found in the Build folder."
                 
+                if failed_files:
+                    success_msg += f"\n\nCould not update (in use?):\n" + "\n".join(f"• {item}" for item in failed_files)
+                    messagebox.showwarning("Repack Partially Updated", success_msg)
+                    self.log_to_console(f"⚠️ Repack updated with {len(failed_files)} files that could not be written")
+                    return
+                
                 messagebox.showinfo("Repack Created", success_msg)
                 self.log_to_console("🎉 Repack creation completed successfully!")
             else:
@@ -5483,12 +5282,7 @@ class AzerothCoreBuilder:
                 self.log_to_console("❌ Configs folder not found")
                 return
             
-            # Find all .conf.dist files recursively
-            conf_dist_files = []
-            for root, dirs, files in os.walk(configs_dir):
-                for file in files:
-                    if file.endswith('.conf.dist'):
-                        conf_dist_files.append(os.path.join(root, file))
+            conf_dist_files, transformed_count, failed_files = self._create_config_files(configs_dir)
             
             if not conf_dist_files:
                 messagebox.showinfo("No Config Files Found", 
@@ -5497,33 +5291,6 @@ class AzerothCoreBuilder:
                 self.log_to_console("ℹ️ No .conf.dist files found")
                 return
             
-            # Transform each .conf.dist file to .conf
-            transformed_count = 0
-            failed_files = []
-            
-            for conf_dist_file in conf_dist_files:
-                try:
-                    # Create the new .conf filename
-                    conf_file = conf_dist_file.replace('.conf.dist', '.conf')
-                    
-                    # Check if .conf file already exists
-                    if os.path.exists(conf_file):
-                        self.log_to_console(f"⚠️ Skipping {os.path.basename(conf_dist_file)} - .conf file already exists")
-                        continue
-                    
-                    # Copy .conf.dist to .conf
-                    import shutil
-                    shutil.copy2(conf_dist_file, conf_file)
-                    
-                    # Keep the .conf.dist file (don't delete it)
-                    
-                    transformed_count += 1
-                    self.log_to_console(f"✅ Created: {os.path.basename(conf_file)} (kept .conf.dist)")
-                    
-                except Exception as e:
-                    failed_files.append(os.path.basename(conf_dist_file))
-                    self.log_to_console(f"❌ Failed to transform {os.path.basename(conf_dist_file)}: {str(e)}")
-            
             # Show completion message
             if transformed_count > 0:
                 success_msg = f"Config files created successfully!\n\n"
@@ -5699,39 +5466,7 @@ class AzerothCoreBuilder:
             logs_dir = custom_logs_dir if custom_logs_dir else "Logs"
             mysql_exe = custom_mysql_exe if custom_mysql_exe else ".\\mysql\\bin\\mysql.exe"
             
-            # Define the replacements
-            replacements = [
-                ('DataDir = "."', f'DataDir = "{data_dir}"'),
-                ('LogsDir = ""', f'LogsDir = "{logs_dir}"'),
-                ('MySQLExecutable = ""', f'MySQLExecutable = "{mysql_exe}"')
-            ]
-            
-            total_updated_count = 0
-            
-            # Process each config file
-            for config_name, config_path in config_files:
-                self.log_to_console(f"📁 Processing {config_name}...")
-                
-                # Read the current config file
-                with open(config_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                
-                # Apply replacements
-                file_updated_count = 0
-                for old_value, new_value in replacements:
-                    if old_value in content:
-                        content = content.replace(old_value, new_value)
-                        file_updated_count += 1
-                        self.log_to_console(f"✅ Updated in {config_name}: {old_value} → {new_value}")
-                    else:
-                        self.log_to_console(f"⚠️ Not found in {config_name}: {old_value}")
-                
-                # Write the updated content back to the file
-                with open(config_path, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                
-                total_updated_count += file_updated_count
-                self.log_to_console(f"📄 {config_name}: {file_updated_count} settings updated")
+            total_updated_count = self._update_config_paths(config_files, data_dir, logs_dir, mysql_exe)
             
             # Show completion message
             if total_updated_count > 0:
@@ -5788,9 +5523,9 @@ class AzerothCoreBuilder:
             if os.path.exists(target_mysql_dir):
                 if messagebox.askyesno("MySQL Folder Exists", 
                                      f"MySQL folder already exists in Repack directory:\n\n{target_mysql_dir}\n\n"
-                                     "Do you want to replace it? This will delete the existing folder."):
-                    self.log_to_console("🗑️ Removing existing MySQL folder...")
-                    shutil.rmtree(target_mysql_dir)
+                                     "Do you want to update it? Only changed files are copied; databases in "
+                                     "mysql/data and my.ini are kept."):
+                    self.log_to_console("🔄 Updating existing MySQL folder...")
                 else:
                     self.log_to_console("❌ MySQL folder creation cancelled by user")
                     return
@@ -5812,35 +5547,11 @@ class AzerothCoreBuilder:
             messagebox.showerror("MySQL Creation Failed", error_msg)
             self.log_to_console(f"❌ MySQL creation failed: {str(e)}")
     
-    def _find_mysql_path(self):
-        """Find MySQL installation path from requirements or common locations"""
-        # First check if MySQL is detected in requirements
-        if self.requirements["MySQL"]["detected"] and self.requirements["MySQL"]["path"]:
-            mysql_path = self.requirements["MySQL"]["path"]
-            # If it's pointing to mysql.exe, get the parent directory
-            if mysql_path.endswith("mysql.exe"):
-                mysql_path = os.path.dirname(os.path.dirname(mysql_path))  # Go up two levels (bin -> MySQL Server X.X)
-            return mysql_path
-        
-        # Check common MySQL installation paths
-        common_paths = [
-            r"C:\Program Files\MySQL\MySQL Server 8.0",
-            r"C:\Program Files\MySQL\MySQL Server 8.4",
-            r"C:\Program Files (x86)\MySQL\MySQL Server 8.0",
-            r"C:\Program Files (x86)\MySQL\MySQL Server 8.4"
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-        
-        return None
-    
     def _create_mysql_progress_dialog(self):
         """Create progress dialog for MySQL copying"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Creating MySQL Folder")
-        dialog.geometry("400x200")
+        dialog.geometry("460x200")
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.resizable(False, False)
@@ -5857,10 +5568,9 @@ class AzerothCoreBuilder:
         status_label = ttk.Label(dialog, text="Preparing to copy MySQL files...", font=("Arial", 10))
         status_label.pack(pady=(0, 20))
         
-        # Progress bar
-        progress = ttk.Progressbar(dialog, mode='indeterminate', length=300)
+        # Progress bar, filled by bytes copied
+        progress = ttk.Progressbar(dialog, mode='determinate', length=360, maximum=100)
         progress.pack(pady=(0, 20))
-        progress.start()
         
         # Store references
         dialog.status_label = status_label
@@ -5873,10 +5583,10 @@ class AzerothCoreBuilder:
         try:
             # Update status
             self.root.after(0, lambda: dialog.status_label.config(text="Copying MySQL files..."))
-            self.log_to_console("📁 Starting MySQL folder copy operation...")
             
-            # Copy the entire MySQL directory
-            shutil.copytree(source_path, target_path)
+            # Copy the MySQL directory, minus the repack_mysql_skip manifest and its data and .ini files
+            reporter = TkProgressReporter(self.root, status_label=dialog.status_label, progress_bar=dialog.progress)
+            self._copy_repack_mysql(source_path, target_path, reporter)
             
             # Update status and close dialog
             self.root.after(0, lambda: dialog.status_label.config(text="MySQL folder created successfully!"))
@@ -5890,8 +5600,6 @@ class AzerothCoreBuilder:
                                                         f"Target: {target_path}\n\n"
                                                         "The MySQL folder is now ready for use in your repack."))
             
-            self.log_to_console(f"✅ MySQL folder created successfully at: {target_path}")
-            
         except Exception as e:
             # Update status and close dialog
             self.root.after(0, lambda: dialog.status_label.config(text="Failed to copy MySQL files"))
@@ -5944,28 +5652,7 @@ class AzerothCoreBuilder:
             self.log_to_console(f"🔍 Checking for DLLs in: {openssl_bin_path}")
             
             # Define DLL files to copy
-            dll_files = [
-                {
-                    "source_path": os.path.join(openssl_path, "bin", "libcrypto-3-x64.dll"),
-                    "name": "libcrypto-3-x64.dll",
-                    "type": "OpenSSL"
-                },
-                {
-                    "source_path": os.path.join(openssl_path, "bin", "libssl-3-x64.dll"),
-                    "name": "libssl-3-x64.dll",
-                    "type": "OpenSSL"
-                },
-                {
-                    "source_path": os.path.join(openssl_path, "bin", "legacy.dll"),
-                    "name": "legacy.dll",
-                    "type": "OpenSSL"
-                },
-                {
-                    "source_path": os.path.join(mysql_path, "lib", "libmysql.dll"),
-                    "name": "libmysql.dll",
-                    "type": "MySQL"
-                }
-            ]
+            dll_files = self._repack_dll_files(openssl_path, mysql_path)
             
             # Check which DLL files exist
             existing_dlls = []
@@ -6007,62 +5694,11 @@ class AzerothCoreBuilder:
             messagebox.showerror("DLL Creation Failed", error_msg)
             self.log_to_console(f"❌ DLL creation failed: {str(e)}")
     
-    def _find_openssl_path(self):
-        """Find OpenSSL installation path from requirements or common locations"""
-        # First check if OpenSSL is detected in requirements
-        if self.requirements["OpenSSL"]["detected"] and self.requirements["OpenSSL"]["path"]:
-            openssl_path = self.requirements["OpenSSL"]["path"]
-            self.log_to_console(f"🔍 OpenSSL detected path: {openssl_path}")
-            
-            # If it's pointing to openssl.exe, get the parent directory (bin -> OpenSSL-Win64)
-            if openssl_path.endswith("openssl.exe"):
-                openssl_path = os.path.dirname(openssl_path)  # Go up one level from bin to OpenSSL-Win64
-                self.log_to_console(f"🔍 Adjusted path (from exe): {openssl_path}")
-            # If it's pointing to bin directory, get the parent directory (bin -> OpenSSL-Win64)
-            elif openssl_path.endswith("bin"):
-                openssl_path = os.path.dirname(openssl_path)  # Go up one level from bin to OpenSSL-Win64
-                self.log_to_console(f"🔍 Adjusted path (from bin): {openssl_path}")
-            else:
-                self.log_to_console(f"🔍 Using path as-is: {openssl_path}")
-            
-            # Verify the path exists and has a bin directory
-            if os.path.exists(openssl_path):
-                bin_path = os.path.join(openssl_path, "bin")
-                if os.path.exists(bin_path):
-                    self.log_to_console(f"✅ OpenSSL path verified: {openssl_path} (bin exists)")
-                    return openssl_path
-                else:
-                    self.log_to_console(f"❌ OpenSSL bin directory not found: {bin_path}")
-            else:
-                self.log_to_console(f"❌ OpenSSL path does not exist: {openssl_path}")
-        
-        # Check common OpenSSL installation paths
-        self.log_to_console("🔍 Checking common OpenSSL installation paths...")
-        common_paths = [
-            r"C:\Program Files\OpenSSL-Win64",
-            r"C:\Program Files (x86)\OpenSSL-Win32",
-            r"C:\OpenSSL-Win64",
-            r"C:\OpenSSL-Win32"
-        ]
-        
-        for path in common_paths:
-            self.log_to_console(f"🔍 Checking: {path}")
-            if os.path.exists(path):
-                bin_path = os.path.join(path, "bin")
-                if os.path.exists(bin_path):
-                    self.log_to_console(f"✅ Found OpenSSL at: {path} (bin exists)")
-                    return path
-                else:
-                    self.log_to_console(f"⚠️ Found OpenSSL directory but no bin: {path}")
-        
-        self.log_to_console("❌ No OpenSSL installation found")
-        return None
-    
     def _create_dll_progress_dialog(self):
         """Create progress dialog for DLL copying"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Creating DLL Files")
-        dialog.geometry("400x200")
+        dialog.geometry("460x200")
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.resizable(False, False)
@@ -6079,10 +5715,10 @@ class AzerothCoreBuilder:
         status_label = ttk.Label(dialog, text="Preparing to copy DLL files...", font=("Arial", 10))
         status_label.pack(pady=(0, 20))
         
-        # Progress bar
-        progress = ttk.Progressbar(dialog, mode='indeterminate', length=300, style='Green.Horizontal.TProgressbar')
+        # Progress bar, filled by bytes copied
+        progress = ttk.Progressbar(dialog, mode='determinate', length=360, maximum=100,
+                                   style='Green.Horizontal.TProgressbar')
         progress.pack(pady=(0, 20))
-        progress.start()
         
         # Store references
         dialog.status_label = status_label
@@ -6093,27 +5729,8 @@ class AzerothCoreBuilder:
     def _copy_dll_files(self, dll_files, repack_dir, dialog):
         """Copy DLL files in background thread"""
         try:
-            copied_files = []
-            failed_files = []
-            
-            total_files = len(dll_files)
-            
-            for i, dll_info in enumerate(dll_files):
-                # Update status
-                progress_text = f"Copying {dll_info['name']} ({i+1}/{total_files})..."
-                self.root.after(0, lambda text=progress_text: dialog.status_label.config(text=text))
-                self.log_to_console(f"📁 Copying {dll_info['name']} from {dll_info['type']}...")
-                
-                try:
-                    # Copy the DLL file to Repack directory
-                    target_path = os.path.join(repack_dir, dll_info["name"])
-                    shutil.copy2(dll_info["source_path"], target_path)
-                    copied_files.append(dll_info["name"])
-                    self.log_to_console(f"✅ Successfully copied {dll_info['name']}")
-                    
-                except Exception as e:
-                    failed_files.append(f"{dll_info['name']}: {str(e)}")
-                    self.log_to_console(f"❌ Failed to copy {dll_info['name']}: {str(e)}")
+            reporter = TkProgressReporter(self.root, status_label=dialog.status_label, progress_bar=dialog.progress)
+            copied_files, failed_files = self._copy_repack_dlls(dll_files, repack_dir, reporter)
             
             # Update status and close dialog
             if failed_files:
@@ -6234,22 +5851,6 @@ class AzerothCoreBuilder:
             messagebox.showerror("MySQL Initialization Failed", error_msg)
             self.log_to_console(f"❌ MySQL initialization failed: {str(e)}")
     
-    def _create_mysql_directories(self, mysql_dir):
-        """Create required MySQL directories"""
-        required_dirs = [
-            "data",
-            "tmp",
-            "logs"
-        ]
-        
-        for dir_name in required_dirs:
-            dir_path = os.path.join(mysql_dir, dir_name)
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path, exist_ok=True)
-                self.log_to_console(f"📁 Created directory: {dir_path}")
-            else:
-                self.log_to_console(f"✅ Directory exists: {dir_path}")
-    
     def _create_mysql_init_progress_dialog(self):
         """Create progress dialog for MySQL initialization"""
         dialog = tk.Toplevel(self.root)
@@ -6292,34 +5893,11 @@ class AzerothCoreBuilder:
     def _run_mysql_initialization(self, mysqld_exe, mysql_dir, dialog):
         """Run MySQL initialization in background thread"""
         try:
-            # Update status
-            self.root.after(0, lambda: dialog.status_label.config(text="Setting up MySQL environment..."))
-            self.log_to_console("🔧 Setting up MySQL environment variables...")
-            
-            # Set up MySQL environment variables
-            mysql_env = self._setup_mysql_environment(mysql_dir)
-            
             # Update status
             self.root.after(0, lambda: dialog.status_label.config(text="Initializing MySQL data directory..."))
-            self.log_to_console("🚀 Starting MySQL initialization process...")
             
             # Run MySQL initialization command
-            cmd = [mysqld_exe, "--initialize-insecure"]
-            
-            # Add MySQL paths as environment variables
-            env = os.environ.copy()
-            env.update(mysql_env)
-            
-            self.log_to_console(f"📝 Running command: {' '.join(cmd)}")
-            self.log_to_console(f"🔧 Environment variables set: {list(mysql_env.keys())}")
-            
-            # Execute the command
-            result = subprocess.run(cmd, 
-                                  cwd=mysql_dir,
-                                  env=env,
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=300)  # 5 minute timeout
+            result = self._initialize_repack_mysql(mysqld_exe, mysql_dir)
             
             if result.returncode == 0:
                 # Success
@@ -6379,25 +5957,7 @@ class AzerothCoreBuilder:
     
     def _setup_mysql_environment(self, mysql_dir):
         """Set up MySQL environment variables for proper initialization"""
-        mysql_env = {
-            # MySQL paths
-            "MYSQL_HOME": mysql_dir,
-            "MYSQL_BASE": mysql_dir,
-            
-            # Required paths for MySQL
-            "PATH": f"{os.path.join(mysql_dir, 'bin')};{os.environ.get('PATH', '')}",
-            
-            # MySQL-specific environment variables
-            "MYSQL_UNIX_PORT": os.path.join(mysql_dir, "tmp", "mysql.sock"),
-            "MYSQL_TCP_PORT": "3306",
-        }
-        
-        # Log the environment setup
-        self.log_to_console("🔧 MySQL environment variables:")
-        for key, value in mysql_env.items():
-            self.log_to_console(f"   {key} = {value}")
-        
-        return mysql_env
+        return self._mysql_process_environment(mysql_dir)
 
     def create_myini(self):
         """Create my.ini configuration file for MySQL"""
@@ -6434,49 +5994,25 @@ class AzerothCoreBuilder:
                     self.log_to_console("❌ My.ini creation cancelled by user")
                     return
             
-            # Create the my.ini content
-            myini_content = '''# MySQL 8.4.2 Settings
-[mysqld]
-    port = 3306
-    basedir="."
-    datadir="./data"
-    socket = /tmp/mysql.sock
-
-[client]
-    default-character-set = utf8mb4
-    port = 3306
-    socket = /tmp/mysql.sock
-'''
-            
             # Write the my.ini file
-            self.log_to_console(f"📝 Creating my.ini file at: {myini_path}")
-            with open(myini_path, 'w', encoding='utf-8') as f:
-                f.write(myini_content)
+            file_size = self._write_myini(myini_path)
+            
+            success_msg = f"my.ini file has been successfully created!\n\n"
+            success_msg += f"Location: {myini_path}\n"
+            success_msg += f"File size: {file_size} bytes\n\n"
+            success_msg += "Configuration settings:\n"
+            success_msg += "• Port: 3306\n"
+            success_msg += "• Base directory: . (current directory - Repack/mysql)\n"
+            success_msg += "• Data directory: ./data (Repack/mysql/data)\n"
+            success_msg += "• Socket: /tmp/mysql.sock\n"
+            success_msg += "• Character set: utf8mb4 (client)\n\n"
+            success_msg += "MySQL is now configured and ready to use."
+            
+            messagebox.showinfo("My.ini Created", success_msg)
+            self.log_to_console("✅ my.ini file created successfully!")
+            self.log_to_console(f"📁 File location: {myini_path}")
+            self.log_to_console(f"📊 File size: {file_size} bytes")
             
-            # Verify the file was created successfully
-            if os.path.exists(myini_path):
-                # Get file size for confirmation
-                file_size = os.path.getsize(myini_path)
-                
-                success_msg = f"my.ini file has been successfully created!\n\n"
-                success_msg += f"Location: {myini_path}\n"
-                success_msg += f"File size: {file_size} bytes\n\n"
-                success_msg += "Configuration settings:\n"
-                success_msg += "• Port: 3306\n"
-                success_msg += "• Base directory: . (current directory - Repack/mysql)\n"
-                success_msg += "• Data directory: ./data (Repack/mysql/data)\n"
-                success_msg += "• Socket: /tmp/mysql.sock\n"
-                success_msg += "• Character set: utf8mb4 (client)\n\n"
-                success_msg += "MySQL is now configured and ready to use."
-                
-                messagebox.showinfo("My.ini Created", success_msg)
-                self.log_to_console("✅ my.ini file created successfully!")
-                self.log_to_console(f"📁 File location: {myini_path}")
-                self.log_to_console(f"📊 File size: {file_size} bytes")
-                
-            else:
-                raise Exception("File was not created successfully")
-                
         except Exception as e:
             error_msg = f"Failed to create my.ini file:\n\n{str(e)}"
             messagebox.showerror("My.ini Creation Failed", error_msg)
@@ -7316,8 +6852,8 @@ port = 3306
         self.log_to_console(f"📥 Downloading from: {sql_url}")
         
         try:
-            # Download the file
-            urllib.request.urlretrieve(sql_url, sql_file_path)
+            # Download the file, revalidating any cached copy
+            self._fetch_download(sql_url, sql_file_path)
             
             # Verify the file was downloaded and has content
             if os.path.exists(sql_file_path) and os.path.getsize(sql_file_path) > 0:
@@ -7517,76 +7053,11 @@ port = 3306
                 self.log_to_console("❌ Data download cancelled by user")
                 return
             
-            # Update status and progress
-            self.root.after(0, lambda: dialog.status_label.config(text="Getting latest release information..."))
-            self.root.after(0, lambda: dialog.progress.config(value=10))
-            self.log_to_console("📥 Getting latest release information from wowgaming/client-data...")
-            
-            # Get the latest release download URL
-            download_url = self._get_latest_data_download_url()
-            self.log_to_console(f"✅ Found latest release: {download_url}")
-            
-            # Check for cancellation
-            if dialog.cancelled:
-                self.log_to_console("❌ Data download cancelled by user")
-                return
-            
-            # Update status and progress
-            self.root.after(0, lambda: dialog.status_label.config(text="Downloading data.zip..."))
-            self.root.after(0, lambda: dialog.progress.config(value=30))
-            self.log_to_console("📥 Downloading data.zip...")
-            
-            # Download the data.zip file
-            zip_file_path = self._download_data_zip(download_url)
-            self.log_to_console(f"✅ Downloaded data.zip: {zip_file_path}")
-            
-            # Check for cancellation
-            if dialog.cancelled:
-                # Clean up downloaded file if cancelled
-                if os.path.exists(zip_file_path):
-                    os.remove(zip_file_path)
-                    self.log_to_console("🧹 Cleaned up partially downloaded file")
-                    # Clean up temp directory if empty
-                    temp_dir = os.path.dirname(zip_file_path)
-                    try:
-                        if os.path.exists(temp_dir) and not os.listdir(temp_dir):
-                            os.rmdir(temp_dir)
-                            self.log_to_console(f"🧹 Cleaned up temp directory: {temp_dir}")
-                    except OSError:
-                        pass
-                self.log_to_console("❌ Data download cancelled by user")
-                return
-            
-            # Update status and progress
-            self.root.after(0, lambda: dialog.status_label.config(text="Extracting data to Repack/data..."))
-            self.root.after(0, lambda: dialog.progress.config(value=60))
-            self.log_to_console("📦 Extracting data.zip to Repack/data...")
-            
-            # Extract the zip file
-            self._extract_data_zip(zip_file_path, data_dir)
-            self.log_to_console(f"✅ Extracted data to: {data_dir}")
-            
-            # Check for cancellation
-            if dialog.cancelled:
+            reporter = TkProgressReporter(self.root, dialog.status_label, dialog.progress, lambda: dialog.cancelled)
+            if not self._install_data(data_dir, reporter):
                 self.log_to_console("❌ Data download cancelled by user")
                 return
             
-            # Clean up the zip file
-            os.remove(zip_file_path)
-            self.log_to_console("🧹 Cleaned up temporary zip file")
-            
-            # Clean up the temp directory if empty
-            temp_dir = os.path.dirname(zip_file_path)
-            if os.path.exists(temp_dir):
-                try:
-                    if not os.listdir(temp_dir):
-                        os.rmdir(temp_dir)
-                        self.log_to_console(f"🧹 Cleaned up temp directory: {temp_dir}")
-                    else:
-                        self.log_to_console(f"⚠️ Temp directory not empty, keeping: {temp_dir}")
-                except OSError as e:
-                    self.log_to_console(f"⚠️ Could not remove temp directory: {str(e)}")
-            
             # Success - complete progress bar
             self.root.after(0, lambda: dialog.status_label.config(text="Data download completed!"))
             self.root.after(0, lambda: dialog.progress.config(value=100))
@@ -7615,102 +7086,6 @@ port = 3306
             self.root.after(0, lambda: messagebox.showerror("Data Download Failed", error_msg))
             self.log_to_console(f"❌ Data download failed: {str(e)}")
     
-    def _get_latest_data_download_url(self):
-        """Get the download URL for the latest data.zip from wowgaming/client-data releases or use configured URL"""
-        import json
-        
-        # Check if a custom data URL is configured
-        if hasattr(self, 'data_url') and self.data_url:
-            self.log_to_console(f"📡 Using configured data URL: {self.data_url}")
-            return self.data_url
-        
-        # GitHub API URL for latest release
-        api_url = "https://api.github.com/repos/wowgaming/client-data/releases/latest"
-        
-        self.log_to_console(f"📡 Fetching release info from: {api_url}")
-        
-        try:
-            # Create request with proper headers
-            request = urllib.request.Request(api_url)
-            request.add_header('User-Agent', 'AzerothCoreBuilder/1.0')
-            
-            # Get the release information
-            with urllib.request.urlopen(request) as response:
-                release_data = json.loads(response.read().decode())
-            
-            # Find the data.zip asset
-            for asset in release_data.get('assets', []):
-                if asset['name'] == 'data.zip':
-                    download_url = asset['browser_download_url']
-                    self.log_to_console(f"✅ Found data.zip download URL: {download_url}")
-                    return download_url
-            
-            raise Exception("data.zip asset not found in latest release")
-            
-        except Exception as e:
-            raise Exception(f"Failed to get latest release information: {str(e)}")
-    
-    def _download_data_zip(self, download_url):
-        """Download the data.zip file"""
-        # Create temp directory for zip file
-        app_dir = self._get_app_dir()
-        temp_dir = os.path.join(app_dir, "temp")
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        zip_file_path = os.path.join(temp_dir, "data.zip")
-        
-        self.log_to_console(f"📥 Downloading from: {download_url}")
-        
-        try:
-            # Create request with proper headers
-            request = urllib.request.Request(download_url)
-            request.add_header('User-Agent', 'AzerothCoreBuilder/1.0')
-            
-            # Download the file using urlopen and write to file
-            with urllib.request.urlopen(request) as response:
-                with open(zip_file_path, 'wb') as f:
-                    f.write(response.read())
-            
-            # Verify the file was downloaded and has content
-            if os.path.exists(zip_file_path) and os.path.getsize(zip_file_path) > 0:
-                file_size = os.path.getsize(zip_file_path)
-                self.log_to_console(f"✅ data.zip downloaded successfully: {zip_file_path} ({file_size:,} bytes)")
-                return zip_file_path
-            else:
-                raise Exception("Downloaded data.zip file is empty or corrupted")
-                
-        except Exception as e:
-            raise Exception(f"Failed to download data.zip from {download_url}: {str(e)}")
-    
-    def _extract_data_zip(self, zip_file_path, data_dir):
-        """Extract the data.zip file to Repack/data directory"""
-        # Create data directory if it doesn't exist
-        os.makedirs(data_dir, exist_ok=True)
-        
-        self.log_to_console(f"📦 Extracting {zip_file_path} to {data_dir}")
-        
-        try:
-            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                # Get list of files in the zip
-                file_list = zip_ref.namelist()
-                self.log_to_console(f"📋 Found {len(file_list)} files in data.zip")
-                
-                # Extract all files
-                zip_ref.extractall(data_dir)
-                
-                # Log the extracted folders
-                extracted_folders = set()
-                for file_path in file_list:
-                    if '/' in file_path:
-                        folder = file_path.split('/')[0]
-                        extracted_folders.add(folder)
-                
-                if extracted_folders:
-                    self.log_to_console(f"📁 Extracted folders: {', '.join(sorted(extracted_folders))}")
-                
-        except Exception as e:
-            raise Exception(f"Failed to extract data.zip: {str(e)}")
-
     def create_mysql_bat(self):
         """Create MySQL.bat file in the Repack directory"""
         try:
@@ -8053,70 +7428,8 @@ pause
                 self._safe_update_dialog(dialog, lambda: dialog.destroy())
                 return
             
-            # Define database paths (following PowerShell script structure)
-            auth_db_scripts_path = os.path.join(sql_base_dir, "base", "db_auth")
-            auth_db_update_scripts_path = os.path.join(sql_base_dir, "updates", "db_auth")
-            auth_db_pending_update_scripts_path = os.path.join(sql_base_dir, "updates", "pending_db_auth")
-            
-            character_db_scripts_path = os.path.join(sql_base_dir, "base", "db_characters")
-            character_db_update_scripts_path = os.path.join(sql_base_dir, "updates", "db_characters")
-            character_db_pending_update_scripts_path = os.path.join(sql_base_dir, "updates", "pending_db_characters")
-            
-            world_db_scripts_path = os.path.join(sql_base_dir, "base", "db_world")
-            world_db_update_scripts_path = os.path.join(sql_base_dir, "updates", "db_world")
-            world_db_pending_update_scripts_path = os.path.join(sql_base_dir, "updates", "pending_db_world")
-            
-            # Log the paths
-            self.log_to_console(f"📁 SQL base directory: {sql_base_dir}")
-            self.log_to_console(f"📁 Auth DB scripts: {auth_db_scripts_path}")
-            self.log_to_console(f"📁 Character DB scripts: {character_db_scripts_path}")
-            self.log_to_console(f"📁 World DB scripts: {world_db_scripts_path}")
-            
-            # Total operations count
-            total_operations = 9  # 3 databases × 3 script types each
-            current_operation = 0
-            
-            # Import SQL scripts for acore_auth database
-            self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text="Importing acore_auth database scripts..."))
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_auth", auth_db_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_auth", auth_db_update_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_auth", auth_db_pending_update_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            # Import SQL scripts for acore_characters database
-            self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text="Importing acore_characters database scripts..."))
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_characters", character_db_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_characters", character_db_update_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_characters", character_db_pending_update_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            # Import SQL scripts for acore_world database
-            self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text="Importing acore_world database scripts..."))
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_world", world_db_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_world", world_db_update_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
-            
-            self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=(current_operation / total_operations) * 100))
-            self._import_sql_scripts("acore_world", world_db_pending_update_scripts_path, mysql_details, dialog, root_credentials)
-            current_operation += 1
+            reporter = TkProgressReporter(self.root, dialog.status_label, dialog.progress)
+            ledger = self._import_database_sql(sql_base_dir, mysql_details, root_credentials, reporter)
             
             # Complete
             self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text="Database SQL import completed!"))
@@ -8129,10 +7442,10 @@ pause
             success_msg += f"• acore_auth\n"
             success_msg += f"• acore_characters\n"
             success_msg += f"• acore_world\n\n"
-            success_msg += f"All SQL scripts have been processed."
+            success_msg += f"All SQL scripts have been processed ({ledger.summary()})."
             
             self.root.after(0, lambda: messagebox.showinfo("SQL Import Complete", success_msg))
-            self.log_to_console("✅ Database SQL import completed successfully!")
+            self.log_to_console(f"✅ Database SQL import completed successfully! ({ledger.summary()})")
             
         except Exception as e:
             # Error
@@ -8236,180 +7549,6 @@ pause
             self.log_to_console("❌ Root credentials cancelled")
             return None
 
-    def _import_sql_scripts(self, database_name, scripts_path, mysql_details, dialog, root_credentials):
-        """Import SQL scripts from a specific path to a database"""
-        try:
-            # Check if scripts path exists
-            if not os.path.exists(scripts_path):
-                self.log_to_console(f"⚠️ Scripts path does not exist: {scripts_path}")
-                return
-            
-            # Get all SQL files in the directory
-            sql_files = []
-            for file in os.listdir(scripts_path):
-                if file.lower().endswith('.sql'):
-                    sql_files.append(os.path.join(scripts_path, file))
-            
-            if not sql_files:
-                self.log_to_console(f"⚠️ No SQL files found in: {scripts_path}")
-                return
-            
-            # Sort files for consistent processing
-            sql_files.sort()
-            
-            self.log_to_console(f"📚 Found {len(sql_files)} SQL files in {scripts_path}")
-            
-            # Import each SQL file
-            for sql_file in sql_files:
-                self._import_single_sql_file(database_name, sql_file, mysql_details, root_credentials)
-                
-        except Exception as e:
-            self.log_to_console(f"❌ Error importing SQL scripts from {scripts_path}: {str(e)}")
-            raise
-
-    def _import_single_sql_file(self, database_name, sql_file, mysql_details, root_credentials=None):
-        """Import a single SQL file to the specified database"""
-        try:
-            # Get MySQL executable path
-            mysql_exe = self._get_mysql_executable_path()
-            if not mysql_exe:
-                raise Exception("MySQL executable not found")
-            
-            # Check if SQL file contains database creation statements
-            required_databases = self._detect_required_databases(sql_file)
-            
-            # Create any required databases that don't exist
-            for required_db in required_databases:
-                if not self._database_exists(required_db, mysql_details):
-                    if root_credentials and root_credentials.get("create", False):
-                        self.log_to_console(f"🗃️ Creating database '{required_db}' using root privileges...")
-                        self._create_database(required_db, mysql_details, root_credentials)
-                    else:
-                        self.log_to_console(f"⚠️ Skipping {os.path.basename(sql_file)} - database {required_db} not created (no root credentials)")
-                        return
-            
-            # Prepare MySQL command using environment variable for password
-            import os
-            env = os.environ.copy()
-            env['MYSQL_PWD'] = mysql_details['password']
-            
-            cmd = [
-                mysql_exe,
-                f"-h{mysql_details['host']}",
-                f"-P{mysql_details['port']}",
-                f"-u{mysql_details['user']}",
-                database_name
-            ]
-            
-            self.log_to_console(f"📄 Importing {os.path.basename(sql_file)} to {database_name}...")
-            
-            # Execute MySQL command with timeout for large files
-            with open(sql_file, 'r', encoding='utf-8', errors='ignore') as f:
-                result = subprocess.run(cmd, stdin=f, capture_output=True, text=True, timeout=300, env=env)
-            
-            if result.returncode == 0:
-                self.log_to_console(f"✅ Successfully imported {os.path.basename(sql_file)} to {database_name}")
-            else:
-                error_msg = f"Failed to import {os.path.basename(sql_file)}: {result.stderr}"
-                self.log_to_console(f"❌ {error_msg}")
-                
-                # Check if error is related to missing database
-                if "Access denied" in result.stderr and "database" in result.stderr:
-                    self.log_to_console(f"💡 This error might be due to missing database permissions or database not existing")
-                
-                # Don't raise exception for individual file failures, just log them
-                
-        except subprocess.TimeoutExpired:
-            self.log_to_console(f"⏰ Timeout importing {os.path.basename(sql_file)} - file may be too large")
-        except Exception as e:
-            self.log_to_console(f"❌ Error importing {os.path.basename(sql_file)}: {str(e)}")
-
-    def _detect_required_databases(self, sql_file):
-        """Detect databases that the SQL file requires"""
-        required_databases = set()
-        
-        try:
-            with open(sql_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Look for USE statements
-            import re
-            use_pattern = r'USE\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?'
-            use_matches = re.findall(use_pattern, content, re.IGNORECASE)
-            required_databases.update(use_matches)
-            
-            # Look for CREATE DATABASE statements (more precise pattern)
-            create_db_pattern = r'CREATE\s+DATABASE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?'
-            create_matches = re.findall(create_db_pattern, content, re.IGNORECASE)
-            required_databases.update(create_matches)
-            
-            # Look for INSERT INTO database.table patterns
-            insert_pattern = r'INSERT\s+INTO\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.'
-            insert_matches = re.findall(insert_pattern, content, re.IGNORECASE)
-            required_databases.update(insert_matches)
-            
-            # Look for UPDATE database.table patterns
-            update_pattern = r'UPDATE\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.'
-            update_matches = re.findall(update_pattern, content, re.IGNORECASE)
-            required_databases.update(update_matches)
-            
-            # Look for SELECT FROM database.table patterns
-            select_pattern = r'FROM\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.'
-            select_matches = re.findall(select_pattern, content, re.IGNORECASE)
-            required_databases.update(select_matches)
-            
-            # Remove common MySQL system databases and SQL keywords
-            system_dbs = {'mysql', 'information_schema', 'performance_schema', 'sys'}
-            sql_keywords = {'if', 'not', 'exists', 'where', 'from', 'into', 'update', 'select', 'insert', 'delete', 'create', 'drop', 'alter', 'table', 'database', 'index', 'view', 'procedure', 'function', 'trigger', 'event', 'user', 'grant', 'revoke', 'show', 'describe', 'explain', 'use', 'set', 'declare', 'begin', 'end', 'case', 'when', 'then', 'else', 'loop', 'while', 'repeat', 'until', 'leave', 'iterate', 'return', 'call', 'load', 'replace', 'values', 'default', 'null', 'auto_increment', 'primary', 'key', 'unique', 'index', 'foreign', 'references', 'constraint', 'check', 'cascade', 'restrict', 'no', 'action', 'on', 'off', 'true', 'false', 'and', 'or', 'in', 'like', 'between', 'is', 'as', 'order', 'by', 'group', 'having', 'limit', 'offset', 'union', 'all', 'distinct', 'asc', 'desc', 'inner', 'left', 'right', 'outer', 'join', 'cross', 'natural', 'using', 'with', 'recursive', 'window', 'over', 'partition', 'rows', 'range', 'preceding', 'following', 'current', 'row', 'unbounded', 'first', 'last', 'value', 'lag', 'lead', 'rank', 'dense_rank', 'row_number', 'percent_rank', 'cume_dist', 'ntile', 'first_value', 'last_value', 'nth_value'}
-            required_databases = required_databases - system_dbs - sql_keywords
-            
-            if required_databases:
-                self.log_to_console(f"🔍 Detected required databases in {os.path.basename(sql_file)}: {', '.join(required_databases)}")
-            
-            return list(required_databases)
-            
-        except Exception as e:
-            self.log_to_console(f"⚠️ Could not analyze SQL file {os.path.basename(sql_file)}: {str(e)}")
-            return []
-
-    def _database_exists(self, database_name, mysql_details):
-        """Check if a database exists"""
-        try:
-            mysql_exe = self._get_mysql_executable_path()
-            if not mysql_exe:
-                return False
-            
-            # Use environment variable for password
-            import os
-            env = os.environ.copy()
-            env['MYSQL_PWD'] = mysql_details['password']
-            
-            # Use SHOW DATABASES to check if database exists
-            cmd = [
-                mysql_exe,
-                f"-h{mysql_details['host']}",
-                f"-P{mysql_details['port']}",
-                f"-u{mysql_details['user']}",
-                "-e", f"SHOW DATABASES LIKE '{database_name}';"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, env=env)
-            
-            if result.returncode == 0:
-                exists = database_name in result.stdout
-                if exists:
-                    self.log_to_console(f"✅ Database '{database_name}' exists")
-                else:
-                    self.log_to_console(f"❌ Database '{database_name}' does not exist")
-                return exists
-            else:
-                self.log_to_console(f"⚠️ Could not check if database '{database_name}' exists: {result.stderr}")
-                return False
-                
-        except Exception as e:
-            self.log_to_console(f"⚠️ Error checking database '{database_name}': {str(e)}")
-            return False
-
     def _ask_create_database(self, database_name):
         """Ask user if they want to create a new database and get root credentials if needed"""
         # Create database creation dialog
@@ -8493,130 +7632,6 @@ pause
             self.log_to_console(f"❌ User chose not to create database '{database_name}'")
             return None
 
-    def _create_database(self, database_name, mysql_details, root_credentials):
-        """Create a new database using root credentials and grant permissions to acore user"""
-        try:
-            mysql_exe = self._get_mysql_executable_path()
-            if not mysql_exe:
-                raise Exception("MySQL executable not found")
-            
-            self.log_to_console(f"🗃️ Creating database '{database_name}' using root privileges...")
-            
-            # Create database command using root credentials
-            import os
-            env = os.environ.copy()
-            env['MYSQL_PWD'] = root_credentials['root_password']
-            
-            # Step 1: Create the database using root
-            sql_command = f"CREATE DATABASE IF NOT EXISTS `{database_name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;"
-            cmd = [
-                mysql_exe,
-                f"-h{mysql_details['host']}",
-                f"-P{mysql_details['port']}",
-                f"-u{root_credentials['root_user']}",
-                "-e", sql_command
-            ]
-            
-            self.log_to_console(f"🔧 Creating database with root: {' '.join(cmd)}")
-            self.log_to_console(f"🔧 SQL Command: {sql_command}")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, env=env)
-            
-            if result.returncode != 0:
-                error_msg = f"Failed to create database '{database_name}': {result.stderr}"
-                self.log_to_console(f"❌ {error_msg}")
-                return False
-            
-            self.log_to_console(f"✅ Successfully created database '{database_name}' with root privileges")
-            
-            # Step 2: Grant all privileges on the new database to the acore user
-            acore_user = mysql_details['user']
-            grant_commands = [
-                f"GRANT ALL PRIVILEGES ON `{database_name}`.* TO '{acore_user}'@'localhost';",
-                f"GRANT ALL PRIVILEGES ON `{database_name}`.* TO '{acore_user}'@'%';",
-                "FLUSH PRIVILEGES;"
-            ]
-            
-            for grant_cmd in grant_commands:
-                grant_sql = grant_cmd
-                grant_command = [
-                    mysql_exe,
-                    f"-h{mysql_details['host']}",
-                    f"-P{mysql_details['port']}",
-                    f"-u{root_credentials['root_user']}",
-                    "-e", grant_sql
-                ]
-                
-                self.log_to_console(f"🔧 Granting permissions: {grant_sql}")
-                grant_result = subprocess.run(grant_command, capture_output=True, text=True, timeout=30, env=env)
-                
-                if grant_result.returncode == 0:
-                    self.log_to_console(f"✅ Successfully granted permissions for '{acore_user}' on '{database_name}'")
-                else:
-                    self.log_to_console(f"⚠️ Warning: Could not grant permissions: {grant_result.stderr}")
-            
-            self.log_to_console(f"🎉 Database '{database_name}' created and configured for '{acore_user}' access")
-            return True
-                
-        except Exception as e:
-            self.log_to_console(f"❌ Error creating database '{database_name}': {str(e)}")
-            return False
-
-    def _get_mysql_executable_path(self):
-        """Get MySQL executable path from Repack folder first, then fallback to system locations"""
-        # First priority: Check Repack/mysql/bin directory
-        app_dir = self._get_app_dir()
-        repack_mysql_bin = os.path.join(app_dir, "Repack", "mysql", "bin", "mysql.exe")
-        
-        self.log_to_console(f"🔍 Checking Repack MySQL path: {repack_mysql_bin}")
-        if os.path.exists(repack_mysql_bin):
-            self.log_to_console(f"✅ Using Repack MySQL executable: {repack_mysql_bin}")
-            return repack_mysql_bin
-        
-        # Second priority: Check if MySQL is detected in requirements
-        if self.requirements["MySQL"]["detected"] and self.requirements["MySQL"]["path"]:
-            mysql_path = self.requirements["MySQL"]["path"]
-            self.log_to_console(f"🔍 MySQL detected path: {mysql_path}")
-            
-            # If it's pointing to mysql.exe, use it directly
-            if mysql_path.endswith("mysql.exe"):
-                if os.path.exists(mysql_path):
-                    self.log_to_console(f"✅ Using MySQL executable: {mysql_path}")
-                    return mysql_path
-            # If it's pointing to bin directory, look for mysql.exe
-            elif mysql_path.endswith("bin"):
-                mysql_exe = os.path.join(mysql_path, "mysql.exe")
-                if os.path.exists(mysql_exe):
-                    self.log_to_console(f"✅ Using MySQL executable: {mysql_exe}")
-                    return mysql_exe
-        
-        # Third priority: Check common MySQL installation paths
-        self.log_to_console("🔍 Checking common MySQL installation paths...")
-        common_paths = [
-            r"C:\Program Files\MySQL\MySQL Server 8.0\bin\mysql.exe",
-            r"C:\Program Files\MySQL\MySQL Server 8.4\bin\mysql.exe",
-            r"C:\Program Files (x86)\MySQL\MySQL Server 8.0\bin\mysql.exe",
-            r"C:\Program Files (x86)\MySQL\MySQL Server 8.4\bin\mysql.exe"
-        ]
-        
-        for path in common_paths:
-            self.log_to_console(f"🔍 Checking: {path}")
-            if os.path.exists(path):
-                self.log_to_console(f"✅ Found MySQL executable at: {path}")
-                return path
-        
-        # Last resort: Check if mysql is in PATH
-        try:
-            result = subprocess.run(["mysql", "--version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                self.log_to_console("✅ MySQL found in system PATH")
-                return "mysql"
-        except:
-            pass
-        
-        self.log_to_console("❌ No MySQL executable found")
-        return None
-
     def run_module_sql(self):
         """Run module SQL files from GitSource/azerothcore-wotlk/modules"""
         try:
@@ -8723,6 +7738,7 @@ pause
 
     def _run_module_sql_import(self, modules_dir, mysql_details, dialog):
         """Run module SQL import in background thread"""
+        sql_engine = None
         try:
             self.log_to_console(f"📁 Scanning modules directory: {modules_dir}")
             
@@ -8733,6 +7749,12 @@ pause
                 self._safe_update_dialog(dialog, lambda: dialog.destroy())
                 return
             
+            # Reuse one connection per database for every file
+            sql_engine = self._open_sql_import_engine(mysql_details)
+            
+            # List databases once and answer existence checks from memory
+            self.schema_catalog = self._load_schema_catalog(mysql_details)
+            
             # First, process SQL files in auth/character/world folders
             self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text="Processing auth/character/world folders..."))
             self._safe_update_dialog(dialog, lambda: dialog.progress.config(value=10))
@@ -8768,11 +7790,14 @@ pause
             total_files = len(auth_files) + len(character_files) + len(world_files) + len(other_files)
             processed_files = 0
             
+            # Module files whose content is already recorded as applied are skipped
+            ledger = self._create_sql_update_ledger(mysql_details, sql_engine, modules_dir)
+            
             # Process auth files first
             if auth_files:
                 self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text=f"Importing {len(auth_files)} auth SQL files..."))
                 for sql_file in auth_files:
-                    self._import_single_sql_file("acore_auth", sql_file, mysql_details, root_credentials)
+                    self._import_sql_file_incremental("acore_auth", sql_file, "MODULE", ledger, mysql_details, root_credentials, sql_engine)
                     processed_files += 1
                     progress = 20 + (processed_files / total_files) * 30  # 20-50% for auth files
                     self._safe_update_dialog(dialog, lambda p=progress: dialog.progress.config(value=p))
@@ -8781,7 +7806,7 @@ pause
             if character_files:
                 self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text=f"Importing {len(character_files)} character SQL files..."))
                 for sql_file in character_files:
-                    self._import_single_sql_file("acore_characters", sql_file, mysql_details, root_credentials)
+                    self._import_sql_file_incremental("acore_characters", sql_file, "MODULE", ledger, mysql_details, root_credentials, sql_engine)
                     processed_files += 1
                     progress = 50 + (processed_files / total_files) * 30  # 50-80% for character files
                     self._safe_update_dialog(dialog, lambda p=progress: dialog.progress.config(value=p))
@@ -8790,7 +7815,7 @@ pause
             if world_files:
                 self._safe_update_dialog(dialog, lambda: dialog.status_label.config(text=f"Importing {len(world_files)} world SQL files..."))
                 for sql_file in world_files:
-                    self._import_single_sql_file("acore_world", sql_file, mysql_details, root_credentials)
+                    self._import_sql_file_incremental("acore_world", sql_file, "MODULE", ledger, mysql_details, root_credentials, sql_engine)
                     processed_files += 1
                     progress = 80 + (processed_files / total_files) * 15  # 80-95% for world files
                     self._safe_update_dialog(dialog, lambda p=progress: dialog.progress.config(value=p))
@@ -8801,7 +7826,7 @@ pause
                 for sql_file in other_files:
                     # Try to determine the target database based on file content
                     target_db = self._determine_target_database(sql_file)
-                    self._import_single_sql_file(target_db, sql_file, mysql_details, root_credentials)
+                    self._import_sql_file_incremental(target_db, sql_file, "MODULE", ledger, mysql_details, root_credentials, sql_engine)
                     processed_files += 1
                     progress = 95 + (processed_files / total_files) * 5  # 95-100% for other files
                     self._safe_update_dialog(dialog, lambda p=progress: dialog.progress.config(value=p))
@@ -8818,10 +7843,10 @@ pause
             success_msg += f"• {len(character_files)} character SQL files → acore_characters\n"
             success_msg += f"• {len(world_files)} world SQL files → acore_world\n"
             success_msg += f"• {len(other_files)} other SQL files → determined database\n\n"
-            success_msg += f"Total: {total_files} SQL files processed."
+            success_msg += f"Total: {total_files} SQL files processed ({ledger.summary()})."
             
             self.root.after(0, lambda: messagebox.showinfo("Module SQL Import Complete", success_msg))
-            self.log_to_console("✅ Module SQL import completed successfully!")
+            self.log_to_console(f"✅ Module SQL import completed successfully! ({ledger.summary()})")
             
         except Exception as e:
             # Error
@@ -8831,23 +7856,16 @@ pause
             error_msg = f"Failed to import module SQL files:\n\n{str(e)}"
             self.root.after(0, lambda: messagebox.showerror("Module SQL Import Failed", error_msg))
             self.log_to_console(f"❌ Module SQL import failed: {str(e)}")
+        finally:
+            self.schema_catalog = None
+            if sql_engine:
+                sql_engine.close()
 
     def _determine_target_database(self, sql_file):
         """Determine target database based on SQL file content"""
         try:
-            with open(sql_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read().lower()
-            
-            # Check for database-specific keywords
-            if any(keyword in content for keyword in ['acore_auth', 'auth', 'account', 'login']):
-                return "acore_auth"
-            elif any(keyword in content for keyword in ['acore_characters', 'character', 'player', 'inventory']):
-                return "acore_characters"
-            elif any(keyword in content for keyword in ['acore_world', 'world', 'creature', 'gameobject', 'quest']):
-                return "acore_world"
-            else:
-                # Default to acore_world for unknown files
-                return "acore_world"
+            # Shares the cached single-pass analysis with _detect_required_databases
+            return self._analyze_sql_file(sql_file)["target_database"]
                 
         except Exception as e:
             self.log_to_console(f"⚠️ Could not determine target database for {os.path.basename(sql_file)}: {str(e)}")
@@ -9029,61 +8047,46 @@ The build process will continue, but some features may be limited."""
     def _configure_system_environment_variables(self, mysql_bin_path, mysql_lib_path, boost_path):
         """Configure system environment variables using Windows Registry"""
         try:
-            import winreg
-            
+            backend = get_backend()
             self.log_to_console("🔧 Configuring system environment variables...")
             
-            # Open system environment variables registry key
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                              r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment", 
-                              0, winreg.KEY_ALL_ACCESS) as key:
-                
-                # Get current PATH
-                try:
-                    current_path, _ = winreg.QueryValueEx(key, "PATH")
-                except FileNotFoundError:
-                    current_path = ""
-                
-                # Add MySQL paths to PATH if not already present
-                new_path_entries = []
-                if mysql_bin_path not in current_path:
-                    new_path_entries.append(mysql_bin_path)
-                if mysql_lib_path not in current_path:
-                    new_path_entries.append(mysql_lib_path)
-                
-                if new_path_entries:
-                    # Add new entries to PATH
-                    updated_path = current_path + ";" + ";".join(new_path_entries)
-                    winreg.SetValueEx(key, "PATH", 0, winreg.REG_EXPAND_SZ, updated_path)
-                    self.log_to_console(f"✅ Added to system PATH: {', '.join(new_path_entries)}")
-                else:
-                    self.log_to_console("ℹ️ MySQL paths already in system PATH")
-                
-                # Set BOOST_ROOT
-                winreg.SetValueEx(key, "BOOST_ROOT", 0, winreg.REG_EXPAND_SZ, boost_path)
-                self.log_to_console(f"✅ Set system BOOST_ROOT: {boost_path}")
+            # Fail early without administrator rights on the system environment
+            if not backend.can_write_environment("machine"):
+                raise PermissionError("System environment variables are not writable")
+            
+            # Get current PATH
+            current_path = backend.get_environment_variable("PATH", "machine") or ""
+            
+            # Add MySQL paths to PATH if not already present
+            new_path_entries = []
+            if mysql_bin_path not in current_path:
+                new_path_entries.append(mysql_bin_path)
+            if mysql_lib_path not in current_path:
+                new_path_entries.append(mysql_lib_path)
+            
+            if new_path_entries:
+                # Add new entries to PATH
+                updated_path = current_path + ";" + ";".join(new_path_entries)
+                backend.set_environment_variable("PATH", updated_path, "machine")
+                self.log_to_console(f"✅ Added to system PATH: {', '.join(new_path_entries)}")
+            else:
+                self.log_to_console("ℹ️ MySQL paths already in system PATH")
+            
+            # Set BOOST_ROOT
+            backend.set_environment_variable("BOOST_ROOT", boost_path, "machine")
+            self.log_to_console(f"✅ Set system BOOST_ROOT: {boost_path}")
             
             # Also set in user environment variables
             try:
-                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment", 0, winreg.KEY_ALL_ACCESS) as user_key:
-                    winreg.SetValueEx(user_key, "BOOST_ROOT", 0, winreg.REG_EXPAND_SZ, boost_path)
-                    self.log_to_console(f"✅ Set user BOOST_ROOT: {boost_path}")
+                backend.set_environment_variable("BOOST_ROOT", boost_path, "user")
+                self.log_to_console(f"✅ Set user BOOST_ROOT: {boost_path}")
             except Exception as e:
                 self.log_to_console(f"⚠️ Could not set user BOOST_ROOT: {str(e)}")
             
             # Broadcast WM_SETTINGCHANGE to notify other applications
             try:
-                import ctypes
-                from ctypes import wintypes
-                
-                # Send WM_SETTINGCHANGE message
-                ctypes.windll.user32.SendMessageW(
-                    wintypes.HWND(-1),  # HWND_BROADCAST
-                    0x001A,  # WM_SETTINGCHANGE
-                    0,  # wParam
-                    "Environment"  # lParam
-                )
-                self.log_to_console("✅ Broadcasted environment change notification")
+                if backend.notify_environment_changed():
+                    self.log_to_console("✅ Broadcasted environment change notification")
             except Exception as e:
                 self.log_to_console(f"⚠️ Could not broadcast environment change: {str(e)}")
             
@@ -9593,10 +8596,7 @@ start "" "{heidi_exe_path}"
                 return
             
             try:
-                import urllib.request
-                request = urllib.request.Request(test_url_value)
-                request.add_header('User-Agent', 'AzerothCoreBuilder/1.0')
-                with urllib.request.urlopen(request, timeout=10) as response:
+                with http_client.get(test_url_value, timeout=10) as response:
                     if response.status == 200:
                         messagebox.showinfo("Test URL", f"✅ URL is accessible!\n\nStatus: {response.status}\nContent-Type: {response.headers.get('Content-Type', 'Unknown')}")
                     else:
@@ -9652,13 +8652,6 @@ start "" "{heidi_exe_path}"
     def _copy_heidisql_from_path(self, source_path, target_dir):
         """Copy HeidiSQL from configured path to target directory"""
         try:
-            import shutil
-            
-            # Remove existing target directory if it exists
-            if os.path.exists(target_dir):
-                shutil.rmtree(target_dir)
-                self.log_to_console(f"🗑️ Removed existing HeidiSQL directory")
-            
             # Determine if source_path is a file or directory
             if os.path.isfile(source_path):
                 # If it's a file (heidisql.exe), get the parent directory
@@ -9677,8 +8670,9 @@ start "" "{heidi_exe_path}"
             if not os.path.exists(heidisql_exe):
                 raise Exception(f"heidisql.exe not found in source directory: {source_dir}")
             
-            # Copy the entire HeidiSQL directory
-            shutil.copytree(source_dir, target_dir)
+            # Sync the HeidiSQL directory, keeping settings saved in an existing copy
+            stats = sync_tree(source_dir, target_dir, link=self._link_repack_files(from_build=False))
+            self.log_to_console(f"📁 HeidiSQL files: {stats.summary()}")
             
             # Verify the copy was successful
             if os.path.exists(os.path.join(target_dir, "heidisql.exe")):
@@ -9718,20 +8712,22 @@ start "" "{heidi_exe_path}"
             os.makedirs(temp_dir, exist_ok=True)
             
             # Download the file
-            import urllib.request
             filename = os.path.basename(self.heidisql_url)
             if not filename.endswith('.zip'):
                 filename += '.zip'
             
             zip_path = os.path.join(temp_dir, filename)
             
-            def progress_callback(block_num, block_size, total_size):
-                if total_size > 0:
-                    downloaded = block_num * block_size
+            last_percentage = [-1]
+            
+            def progress_callback(downloaded, total_size):
+                if total_size:
                     percentage = min(int((downloaded * 100) / total_size), 100)
-                    self.log_to_console(f"📥 Downloading HeidiSQL: {percentage}%")
+                    if percentage != last_percentage[0]:
+                        last_percentage[0] = percentage
+                        self.log_to_console(f"📥 Downloading HeidiSQL: {percentage}%")
             
-            urllib.request.urlretrieve(self.heidisql_url, zip_path, progress_callback)
+            self._fetch_download(self.heidisql_url, zip_path, progress_callback)
             self.log_to_console(f"✅ Downloaded HeidiSQL: {zip_path}")
             
             # Extract the zip file
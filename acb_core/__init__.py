@@ -0,0 +1,40 @@
+"""GUI-free core of AzerothCore Builder.
+
+Importing this package never requires tkinter or winreg, so the SQL, download,
+cache and extraction engines can be used from benchmarks and headless tools on
+any platform. Registry, environment and process access go through the backend
+returned by ``acb_core.system.get_backend()``.
+"""
+
+from acb_core.sql import (
+    PYMYSQL_AVAILABLE,
+    SQL_BULK_MAX_ALLOWED_PACKET,
+    SQL_MIN_IMPORT_RATE,
+    iter_sql_statements,
+    iter_sql_file,
+    analyze_sql_stream,
+    analyze_sql_file,
+    sql_file_hash,
+    SQLScriptAnalysis,
+    SQLImportEngine,
+    SQLUpdateLedger,
+    SchemaCatalog,
+)
+from acb_core.net import (
+    URLLIB3_AVAILABLE,
+    HTTPResponse,
+    HTTPClient,
+    http_client,
+    DownloadCancelled,
+    download_file_resumable,
+    RangeRequestsUnsupported,
+    HTTPRangeFile,
+    RangeAssembler,
+    sha256_file,
+    link_or_copy,
+    DownloadCache,
+    probe_url,
+    first_available_url,
+)
+from acb_core.archive import ExtractionCancelled, extract_zip_parallel
+from acb_core.system import SystemBackend, WindowsBackend, get_backend, set_backend
@@ -0,0 +1,5 @@
+import sys
+
+from acb_core.cli import main
+
+sys.exit(main())
@@ -0,0 +1,164 @@
+"""Parallel, cancellable zip extraction"""
+
+import os
+import re
+import threading
+import zipfile
+import concurrent.futures
+
+
+# Bytes decompressed per chunk by the parallel extractor
+_EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+
+class ExtractionCancelled(Exception):
+    """Raised when the user cancels a running extraction"""
+
+
+def _safe_zip_member_path(dest_dir, member_name):
+    """Target path of a zip member with the same protections as ZipFile.extractall, or None to skip it"""
+    arcname = member_name.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    # Drop drive letters, absolute roots and '..' components
+    arcname = os.path.splitdrive(arcname)[1]
+    components = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+    if os.path.sep == '\\':
+        # Characters Windows does not allow in file names
+        components = [re.sub(r'[:<>|"?*]', '_', part).rstrip('.') for part in components]
+        components = [part for part in components if part]
+    if not components:
+        return None
+
+    target = os.path.join(dest_dir, *components)
+    root = os.path.abspath(dest_dir)
+    if os.path.commonpath([root, os.path.abspath(target)]) != root:
+        return None
+    return target
+
+
+def extract_zip_parallel(zip_path, dest_dir, workers=None, progress=None, cancelled=None, open_archive=None):
+    """Extract a zip archive with a thread pool, one ZipFile handle per worker.
+
+    Members are balanced across workers by size, output files are preallocated
+    before writing, and progress(files_done, total_files, bytes_done, total_bytes)
+    is called after each chunk. cancelled() is polled between chunks. Each file is
+    written to a .part name and renamed once complete, so a failure or cancel
+    never leaves a truncated file under its real name. Returns the names of the
+    extracted members; unsafe names that were skipped are left out.
+
+    When open_archive is given it is called once per worker to open a fresh
+    file object for the archive (e.g. an HTTPRangeFile). Workers then get
+    contiguous runs of members so each reads its part of the archive in order.
+    """
+    workers = workers or os.cpu_count() or 4
+    os.makedirs(dest_dir, exist_ok=True)
+
+    def open_zip():
+        source = open_archive() if open_archive else zip_path
+        try:
+            return zipfile.ZipFile(source, 'r'), source
+        except BaseException:
+            if open_archive:
+                source.close()
+            raise
+
+    zip_ref, zip_source = open_zip()
+    try:
+        members = zip_ref.infolist()
+    finally:
+        zip_ref.close()
+        if open_archive:
+            zip_source.close()
+
+    # Directories are created up front so workers never race on makedirs
+    files = []
+    directories = set()
+    extracted = []
+    for member in members:
+        target = _safe_zip_member_path(dest_dir, member.filename)
+        if target is None:
+            continue
+        extracted.append(member.filename)
+        if member.is_dir():
+            directories.add(target)
+        else:
+            directories.add(os.path.dirname(target))
+            files.append((member, target))
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+
+    buckets = [[] for _ in range(max(1, min(workers, len(files))))]
+    if open_archive:
+        # Archive order, cut into runs of roughly equal compressed size
+        ordered = sorted(files, key=lambda item: item[0].header_offset)
+        run_size = sum(member.compress_size for member, _ in ordered) / len(buckets) or 1
+        consumed = 0
+        for member, target in ordered:
+            index = min(int(consumed / run_size), len(buckets) - 1)
+            buckets[index].append((member, target))
+            consumed += member.compress_size
+        buckets = [bucket for bucket in buckets if bucket] or [[]]
+    else:
+        # Largest files first, each to the least loaded worker
+        bucket_sizes = [0] * len(buckets)
+        for member, target in sorted(files, key=lambda item: item[0].file_size, reverse=True):
+            index = bucket_sizes.index(min(bucket_sizes))
+            buckets[index].append((member, target))
+            bucket_sizes[index] += member.file_size
+
+    total_files = len(files)
+    total_bytes = sum(member.file_size for member, _ in files)
+    state = {"files": 0, "bytes": 0, "failed": False}
+    lock = threading.Lock()
+
+    def report(files_done, bytes_done):
+        with lock:
+            state["files"] += files_done
+            state["bytes"] += bytes_done
+            snapshot = (state["files"], total_files, state["bytes"], total_bytes)
+        if progress:
+            progress(*snapshot)
+
+    def extract_bucket(bucket):
+        worker_zip, worker_source = open_zip()
+        try:
+            for member, target in bucket:
+                part_path = target + ".part"
+                try:
+                    with worker_zip.open(member) as source, open(part_path, 'wb') as output:
+                        if member.file_size:
+                            # Reserve the full size so the file system can allocate contiguously
+                            output.truncate(member.file_size)
+                        while True:
+                            if state["failed"] or (cancelled and cancelled()):
+                                raise ExtractionCancelled("Extraction cancelled")
+                            chunk = source.read(_EXTRACT_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            output.write(chunk)
+                            report(0, len(chunk))
+                    os.replace(part_path, target)
+                except BaseException:
+                    try:
+                        os.remove(part_path)
+                    except OSError:
+                        pass
+                    raise
+                report(1, 0)
+        finally:
+            worker_zip.close()
+            if open_archive:
+                worker_source.close()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+        futures = [executor.submit(extract_bucket, bucket) for bucket in buckets]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            # Stop the other workers at their next chunk
+            state["failed"] = True
+            raise
+
+    return extracted
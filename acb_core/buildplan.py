@@ -0,0 +1,74 @@
+"""Decides whether a build can skip CMake configure by fingerprinting its inputs"""
+
+import os
+import json
+import hashlib
+
+
+# Written next to CMakeCache.txt after a successful configure
+BUILD_STATE_FILE = "acb_build_state.json"
+
+# Directories that never hold CMake inputs
+_SKIP_DIRS = {".git", ".github", ".vs", "build", "Build"}
+
+# Extensions whose presence (not content) CMake's source globs depend on
+_SOURCE_EXTENSIONS = (".c", ".cc", ".cpp", ".cxx", ".h", ".hh", ".hpp", ".hxx", ".inl")
+
+
+def _is_cmake_file(name):
+    return name == "CMakeLists.txt" or name.endswith(".cmake") or name.endswith(".cmake.in")
+
+
+def cmake_input_fingerprint(repo_dir, options):
+    """SHA-256 over the configure options, every CMake file's content and the source file listing.
+
+    Editing a .cpp file does not change the fingerprint; adding or removing one does,
+    because AzerothCore collects sources (including modules) with globs at configure time.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(options)).encode("utf-8"))
+    for root, dirs, files in os.walk(repo_dir):
+        dirs[:] = sorted(d for d in dirs if d not in _SKIP_DIRS)
+        relative_root = os.path.relpath(root, repo_dir).replace(os.path.sep, "/")
+        for name in sorted(files):
+            relative_path = f"{relative_root}/{name}"
+            if _is_cmake_file(name):
+                digest.update(b"C" + relative_path.encode("utf-8") + b"\0")
+                try:
+                    with open(os.path.join(root, name), "rb") as f:
+                        digest.update(hashlib.sha256(f.read()).digest())
+                except OSError:
+                    continue
+            elif name.lower().endswith(_SOURCE_EXTENSIONS):
+                digest.update(b"S" + relative_path.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def load_build_state(build_dir):
+    """State saved by the last build in build_dir, or {}"""
+    try:
+        with open(os.path.join(build_dir, BUILD_STATE_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_build_state(build_dir, state):
+    os.makedirs(build_dir, exist_ok=True)
+    with open(os.path.join(build_dir, BUILD_STATE_FILE), "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+def plan_configure(repo_dir, build_dir, options):
+    """Returns (needs_configure, reason, fingerprint) for building repo_dir into build_dir"""
+    fingerprint = cmake_input_fingerprint(repo_dir, options)
+    if not os.path.exists(os.path.join(build_dir, "CMakeCache.txt")):
+        return True, "no CMake cache in the build directory", fingerprint
+    if not os.path.exists(os.path.join(build_dir, "AzerothCore.sln")):
+        return True, "no generated solution", fingerprint
+    previous = load_build_state(build_dir).get("cmake_fingerprint")
+    if not previous:
+        return True, "no fingerprint from an earlier configure", fingerprint
+    if previous != fingerprint:
+        return True, "CMake files, the source file listing or build options changed", fingerprint
+    return False, "CMake inputs unchanged", fingerprint
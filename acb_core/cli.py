@@ -0,0 +1,457 @@
+"""Headless command line for unattended builds: ``python -m acb_core build ...``
+
+Every line written to stdout is one JSON object with an ``event`` field:
+
+* ``{"event": "stage", "stage": "build", "state": "start"}`` when a stage starts,
+  and ``"done"``, ``"skipped"``, ``"failed"``, ``"blocked"`` or ``"cancelled"`` (with
+  ``elapsed`` seconds) when it ends. The repack stages run as a task graph, so several
+  of them may be running at once
+* ``{"event": "status", "stage": ..., "text": ...}`` and
+  ``{"event": "progress", "stage": ..., "value": 0-100}`` while a stage runs
+* ``{"event": "module", "stage": "modules", "module": ..., "status": ...}`` as each
+  module clone is queued, running, retried, cloned or failed
+* ``{"event": "log", "time": ..., "message": ...}`` for every console message
+* ``{"event": "result", "ok": true|false, "stages": {...}}`` once, at the end
+
+The process exits with 0 on success, 1 when a stage failed and 130 when interrupted.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import argparse
+import datetime
+import threading
+
+from acb_core.pipeline import (PipelineOperations, ProgressReporter, SOURCE_REPOS, MODULE_CATALOGS,
+                               default_app_dir)
+
+
+# Stages that run one after another before the repack task graph
+BUILD_STAGES = ("clone", "modules", "build")
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_CANCELLED = 130
+
+
+class StageFailed(Exception):
+    """A requested stage could not complete"""
+
+
+class JsonLinesReporter(ProgressReporter):
+    """Reports status and progress of one stage as JSON lines"""
+
+    def __init__(self, builder, stage):
+        self.builder = builder
+        self.stage = stage
+
+    @property
+    def cancelled(self):
+        return self.builder.build_cancelled
+
+    def status(self, text):
+        self.builder.emit("status", stage=self.stage, text=text)
+
+    def progress(self, value):
+        self.builder.emit("progress", stage=self.stage, value=round(float(value), 1))
+
+
+class HeadlessBuilder(PipelineOperations):
+    """Runs the pipeline steps without a GUI, reporting everything as JSON lines"""
+
+    def __init__(self, app_dir, stream=None):
+        self.app_dir = app_dir
+        self.stream = stream or sys.stdout
+        self.tools_build = None
+        self.current_stage = None
+        self._emit_lock = threading.Lock()
+        self._init_pipeline_state()
+
+    def emit(self, event, **fields):
+        """Write one JSON event line to the output stream"""
+        record = {"event": event}
+        record.update(fields)
+        line = json.dumps(record)
+        with self._emit_lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def log_to_console(self, message):
+        """Emit a console message as a log event"""
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        self.emit("log", time=timestamp, message=message)
+
+    def _tools_build_enabled(self):
+        if self.tools_build is not None:
+            return self.tools_build
+        return super()._tools_build_enabled()
+
+    def _report_build_progress(self, value):
+        self.emit("progress", stage="build", value=value)
+
+    def cancel(self):
+        """Stop the running stage as soon as possible"""
+        self.build_cancelled = True
+        self._terminate_build_processes()
+
+
+def load_build_config(path):
+    """Load a JSON build description, returns an empty dict when no file is given"""
+    if not path:
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} must contain a JSON object")
+    return config
+
+
+def resolve_modules(names):
+    """Map module names (or full git URLs) to (name, url), raises ValueError for unknown names"""
+    known = {}
+    for catalog in MODULE_CATALOGS.values():
+        for url in catalog["urls"]:
+            known.setdefault(url.split('/')[-1], url)
+
+    modules = []
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        if "://" in name or name.startswith("git@"):
+            url = name
+            name = url.rstrip('/').split('/')[-1]
+            if name.endswith(".git"):
+                name = name[:-4]
+        elif name in known:
+            url = known[name]
+        else:
+            raise ValueError(f"Unknown module '{name}', pass its git URL instead")
+        modules.append((name, url))
+    return modules
+
+
+def _split_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item for item in value.split(',') if item.strip()]
+    return list(value)
+
+
+def _same_git_url(first, second):
+    """Whether two git URLs name the same repository, ignoring case and a trailing / or .git"""
+    def normalized(url):
+        url = url.strip().rstrip('/')
+        if url.endswith(".git"):
+            url = url[:-4]
+        return url.lower()
+    return normalized(first) == normalized(second)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="acb",
+        description="AzerothCore Builder without the GUI. Progress is written to stdout as JSON lines.")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    build = commands.add_parser("build", help="Clone, build and package a server")
+    build.add_argument("--config", help="JSON file with build settings; command line options take precedence")
+    build.add_argument("--app-dir", help="Folder holding GitSource, Build and Repack (default: the ACB folder)")
+    build.add_argument("--source", choices=sorted(SOURCE_REPOS), help="Source repository to clone and build")
+    build.add_argument("--source-url", help="Git URL for --source custom (default: custom_git_url from acb_config.json)")
+    build.add_argument("--modules", help="Comma separated module names or git URLs to clone into modules/")
+    build.add_argument("--reclone", action="store_true", default=None,
+                       help="Delete and clone the source and modules again when they already exist")
+    build.add_argument("--skip-build", action="store_true", default=None, help="Do not run CMake and MSBuild")
+    build.add_argument("--reconfigure", action="store_true", default=None,
+                       help="Run CMake configure even when its inputs are unchanged since the last build")
+    build.add_argument("--tools", action="store_true", default=None, help="Also build the map extractor tools")
+    build.add_argument("--repack", action="store_true", default=None,
+                       help="Create the Repack folder, configs, config paths, MySQL, DLLs and my.ini after the build")
+    build.add_argument("--skip-mysql", action="store_true", default=None,
+                       help="Leave MySQL, its DLLs and my.ini out of the repack")
+    build.add_argument("--force", action="store_true", default=None,
+                       help="Run every repack step even when its results are up to date")
+    build.add_argument("--get-data", action="store_true", default=None, help="Download client data into Repack/data")
+    build.add_argument("--import-sql", action="store_true", default=None,
+                       help="Import the source's SQL into MySQL (credentials from the config file or "
+                            "ACB_MYSQL_PASSWORD / ACB_MYSQL_ROOT_PASSWORD)")
+    return parser
+
+
+def resolve_build_options(args):
+    """Merge command line options over the config file, returns the effective settings"""
+    config = load_build_config(args.config)
+
+    def option(name, default=None):
+        value = getattr(args, name, None)
+        if value is not None:
+            return value
+        return config.get(name, default)
+
+    mysql = dict(config.get("mysql") or {})
+    mysql.setdefault("host", "127.0.0.1")
+    mysql["port"] = str(mysql.get("port", "3306"))
+    mysql.setdefault("user", "acore")
+    mysql["password"] = os.environ.get("ACB_MYSQL_PASSWORD", mysql.get("password", ""))
+
+    mysql_root = dict(config.get("mysql_root") or {})
+    root_credentials = {
+        "create": True,
+        "root_user": mysql_root.get("user", "root"),
+        "root_password": os.environ.get("ACB_MYSQL_ROOT_PASSWORD", mysql_root.get("password", "")),
+    }
+
+    paths = config.get("config_paths") or {}
+    return {
+        "app_dir": os.path.abspath(option("app_dir") or default_app_dir()),
+        "source": option("source", "azerothcore"),
+        "source_url": option("source_url"),
+        "modules": resolve_modules(_split_list(option("modules"))),
+        "reclone": bool(option("reclone", False)),
+        "build": not option("skip_build", False),
+        "reconfigure": bool(option("reconfigure", False)),
+        "tools": option("tools"),
+        "repack": bool(option("repack", False)),
+        "mysql_repack": not option("skip_mysql", False),
+        "force": bool(option("force", False)),
+        "get_data": bool(option("get_data", False)),
+        "import_sql": bool(option("import_sql", False)),
+        "mysql": mysql,
+        "root_credentials": root_credentials,
+        "data_dir": paths.get("data_dir", "Data"),
+        "logs_dir": paths.get("logs_dir", "Logs"),
+        "mysql_exe": paths.get("mysql_exe", ".\\mysql\\bin\\mysql.exe"),
+    }
+
+
+class BuildRun:
+    """The stages of one ``build`` command, run in order against a HeadlessBuilder"""
+
+    def __init__(self, builder, options):
+        self.builder = builder
+        self.options = options
+        self.repo = dict(SOURCE_REPOS[options["source"]])
+        if options["source"] == "custom":
+            self.repo["url"] = options["source_url"] or builder._load_config_value("custom_git_url", "")
+        app_dir = builder._get_app_dir()
+        self.git_source_dir = os.path.join(app_dir, "GitSource")
+        self.repo_dir = os.path.join(self.git_source_dir, self.repo["folder"])
+        self.build_dir = os.path.join(app_dir, "Build")
+        self.repack_dir = os.path.join(app_dir, "Repack")
+
+    def requested_stages(self):
+        requested = {
+            "clone": True,
+            "modules": bool(self.options["modules"]),
+            "build": self.options["build"],
+        }
+        return [stage for stage in BUILD_STAGES if requested[stage]]
+
+    def repack_graph(self):
+        """Task graph of the requested repack, data and SQL steps, or None when none were requested"""
+        options = self.options
+        sql = None
+        if options["import_sql"]:
+            sql_base_dir = os.path.join(self.repo_dir, "data", "sql")
+            if not os.path.exists(sql_base_dir):
+                raise StageFailed(f"SQL directory not found at {sql_base_dir}")
+            if not options["mysql"]["password"] or not options["root_credentials"]["root_password"]:
+                raise StageFailed("MySQL passwords are required, set them in the config file or "
+                                  "ACB_MYSQL_PASSWORD and ACB_MYSQL_ROOT_PASSWORD")
+            sql = (sql_base_dir, options["mysql"], options["root_credentials"])
+        if not (options["repack"] or options["get_data"] or sql):
+            return None
+        graph = self.builder._repack_task_graph(
+            include_mysql=options["mysql_repack"], include_data=options["get_data"], sql=sql,
+            config_paths=(options["data_dir"], options["logs_dir"], options["mysql_exe"]),
+            reporter_for=lambda name: JsonLinesReporter(self.builder, name))
+        if not options["repack"]:
+            # Data and SQL only: drop the repack steps they do not need
+            for name in list(graph.tasks):
+                if name not in ("data", "sql"):
+                    del graph.tasks[name]
+            for task in graph.tasks.values():
+                task.deps = ()
+        return graph
+
+    def run(self):
+        """Run every requested stage, returns the process exit code"""
+        builder = self.builder
+        results = {}
+        exit_code = EXIT_OK
+        for stage in self.requested_stages():
+            if builder.build_cancelled:
+                exit_code = EXIT_CANCELLED
+                break
+            builder.current_stage = stage
+            builder.emit("stage", stage=stage, state="start")
+            started = time.time()
+            try:
+                state = getattr(self, f"stage_{stage}")(JsonLinesReporter(builder, stage)) or "done"
+            except Exception as e:
+                builder.log_to_console(f"❌ {stage} failed: {str(e)}")
+                state = "failed"
+            elapsed = round(time.time() - started, 1)
+            if state == "failed" and builder.build_cancelled:
+                state = "cancelled"
+            results[stage] = state
+            builder.emit("stage", stage=stage, state=state, elapsed=elapsed)
+            if state == "cancelled":
+                exit_code = EXIT_CANCELLED
+                break
+            if state == "failed":
+                exit_code = EXIT_FAILED
+                break
+        builder.current_stage = None
+        if exit_code == EXIT_OK:
+            exit_code = self.run_repack_graph(results)
+        builder.emit("result", ok=exit_code == EXIT_OK, exit_code=exit_code, stages=results)
+        return exit_code
+
+    def run_repack_graph(self, results):
+        """Run the repack task graph, adding each task's state to results; returns the exit code"""
+        builder = self.builder
+        try:
+            graph = self.repack_graph()
+        except StageFailed as e:
+            builder.log_to_console(f"❌ {str(e)}")
+            return EXIT_FAILED
+        if graph is None:
+            return EXIT_OK
+
+        def on_event(name, state, elapsed):
+            if state == "start":
+                builder.emit("stage", stage=name, state=state)
+            else:
+                builder.emit("stage", stage=name, state=state, elapsed=round(elapsed, 1))
+
+        graph_results = builder._run_task_graph(graph, force=self.options["force"],
+                                                cancelled=lambda: builder.build_cancelled, on_event=on_event)
+        for name, (state, elapsed) in graph_results.items():
+            results[name] = state
+        states = [state for state, elapsed in graph_results.values()]
+        if "cancelled" in states:
+            return EXIT_CANCELLED
+        if any(state not in ("done", "skipped") for state in states):
+            return EXIT_FAILED
+        return EXIT_OK
+
+    def check_existing_clone(self, path, url, name):
+        """Raise StageFailed when the clone at path was made from another repository than url"""
+        builder = self.builder
+        if not os.path.exists(os.path.join(path, ".git")):
+            builder.log_to_console(f"⚠️ {path} is not a git clone, using it as it is")
+            return
+        result = builder._run_git(["remote", "get-url", "origin"], path, name)
+        if result.returncode != 0:
+            builder.log_to_console(f"⚠️ Could not read the origin of {path}: {result.stderr.strip()}")
+            return
+        origin = result.stdout.strip()
+        if not _same_git_url(origin, url):
+            raise StageFailed(f"{path} was cloned from {origin}, not {url}; pass --reclone to replace it")
+
+    def stage_clone(self, reporter):
+        builder = self.builder
+        repo = self.repo
+        if not repo["url"]:
+            raise StageFailed(f"No URL set for {repo['name']}, pass --source-url")
+        if os.path.exists(self.repo_dir):
+            if not self.options["reclone"]:
+                # Every source variant clones into the same folder
+                self.check_existing_clone(self.repo_dir, repo["url"], repo["name"])
+                builder.log_to_console(f"✅ {repo['name']} already cloned: {self.repo_dir}")
+                return "skipped"
+            builder.log_to_console(f"🗑️ Removing existing {repo['name']} repository for re-clone")
+            shutil.rmtree(self.repo_dir)
+
+        reporter.status(f"Cloning {repo['name']}...")
+        result = builder._clone_source_repository(self.options["source"], repo, self.git_source_dir, reporter)
+        if result.returncode != 0:
+            raise StageFailed(result.stderr.strip() if result.stderr else "Unknown error occurred")
+        builder.log_to_console(f"✅ Successfully cloned {repo['name']} to {self.repo_dir}")
+        builder._save_config_value("cloned_source", self.options["source"])
+
+    def stage_modules(self, reporter):
+        builder = self.builder
+        modules_dir = os.path.join(self.repo_dir, "modules")
+        os.makedirs(modules_dir, exist_ok=True)
+        pending = []
+        for module_name, module_url in self.options["modules"]:
+            module_dir = os.path.join(modules_dir, module_name)
+            if os.path.exists(module_dir):
+                if not self.options["reclone"]:
+                    self.check_existing_clone(module_dir, module_url, module_name)
+                    builder.log_to_console(f"✅ Module {module_name} already cloned")
+                    continue
+                shutil.rmtree(module_dir)
+                builder.log_to_console(f"🗑️ Removed existing {module_name} module")
+            pending.append((module_name, module_url))
+        if not pending:
+            return "skipped"
+
+        finished = []
+
+        def on_status(module_name, text):
+            builder.emit("module", stage="modules", module=module_name, status=text)
+            if text.startswith(("✅", "❌")):
+                finished.append(module_name)
+                reporter.progress(len(finished) / len(pending) * 100)
+                reporter.status(f"[{len(finished)}/{len(pending)}] {module_name}")
+
+        results = builder._clone_modules(pending, modules_dir, on_status=on_status,
+                                         cancelled=lambda: builder.build_cancelled)
+        if builder.build_cancelled:
+            return "cancelled"
+        failed = [module_name for module_name, ok in results.items() if not ok]
+        if failed:
+            raise StageFailed(f"Could not clone {', '.join(failed)}")
+
+    def stage_build(self, reporter):
+        builder = self.builder
+        if not os.path.exists(self.repo_dir):
+            raise StageFailed(f"{self.repo['name']} must be cloned before building")
+        cmake_path = builder._find_cmake()
+        if not cmake_path:
+            raise StageFailed("CMake is required for building AzerothCore")
+        if not builder._find_visual_studio():
+            raise StageFailed("Visual Studio is required for building AzerothCore")
+        builder.tools_build = self.options["tools"]
+        os.makedirs(self.build_dir, exist_ok=True)
+        if not builder._build_source(self.repo_dir, self.build_dir, cmake_path, reporter,
+                                     force_configure=self.options["reconfigure"]):
+            return "failed"
+
+
+def run_build(args, stream=None):
+    """Run the ``build`` command, returns the process exit code"""
+    options = resolve_build_options(args)
+    builder = HeadlessBuilder(options["app_dir"], stream)
+    run = BuildRun(builder, options)
+
+    def interrupted(signum, frame):
+        builder.log_to_console("❌ Interrupted, stopping the current stage")
+        builder.cancel()
+
+    previous_handler = signal.signal(signal.SIGINT, interrupted)
+    try:
+        return run.run()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "build":
+            return run_build(args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    return EXIT_FAILED
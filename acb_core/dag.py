@@ -0,0 +1,193 @@
+"""Dependency graph of pipeline tasks, run concurrently with make-style up-to-date checks"""
+
+import os
+import time
+import concurrent.futures
+
+
+# Final task states reported by TaskGraph.run
+TASK_DONE = "done"
+TASK_SKIPPED = "skipped"
+TASK_FAILED = "failed"
+TASK_BLOCKED = "blocked"
+TASK_CANCELLED = "cancelled"
+
+
+class TaskGraphError(Exception):
+    """The graph refers to unknown tasks or contains a cycle"""
+
+
+def _path_mtime(path):
+    """Modification time of a file, or of the newest entry directly inside a directory"""
+    stat = os.stat(path)
+    if not os.path.isdir(path):
+        return stat.st_mtime
+    newest = stat.st_mtime
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                newest = max(newest, entry.stat().st_mtime)
+            except OSError:
+                continue
+    return newest
+
+
+def outputs_up_to_date(inputs, outputs):
+    """True when every output exists and none is older than the newest existing input"""
+    if not outputs:
+        return False
+    try:
+        oldest_output = min(_path_mtime(path) for path in outputs)
+    except OSError:
+        return False
+    for path in inputs:
+        try:
+            if _path_mtime(path) > oldest_output:
+                return False
+        except OSError:
+            # A missing input cannot make an output stale
+            continue
+    return True
+
+
+class Task:
+    """One step of a pipeline.
+
+    ``action()`` does the work and returns False (or raises) on failure. A task is
+    skipped when ``up_to_date()`` returns True; by default that compares the
+    modification times of ``inputs`` and ``outputs``.
+    """
+
+    def __init__(self, name, action, deps=(), inputs=(), outputs=(), up_to_date=None, title=None):
+        self.name = name
+        self.action = action
+        self.deps = tuple(deps)
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self._up_to_date = up_to_date
+        self.title = title or name
+
+    def up_to_date(self):
+        if self._up_to_date is not None:
+            return bool(self._up_to_date())
+        return outputs_up_to_date(self.inputs, self.outputs)
+
+
+class TaskGraph:
+    """Runs tasks as soon as their dependencies finish, up to max_workers at a time"""
+
+    def __init__(self, tasks=()):
+        self.tasks = {}
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task):
+        if task.name in self.tasks:
+            raise TaskGraphError(f"Duplicate task '{task.name}'")
+        self.tasks[task.name] = task
+        return task
+
+    def order(self):
+        """Task names in a valid execution order; raises TaskGraphError for unknown deps or cycles"""
+        for task in self.tasks.values():
+            for dep in task.deps:
+                if dep not in self.tasks:
+                    raise TaskGraphError(f"Task '{task.name}' depends on unknown task '{dep}'")
+        ordered = []
+        state = {}
+
+        def visit(name, chain):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise TaskGraphError("Dependency cycle: " + " → ".join(chain + [name]))
+            state[name] = "visiting"
+            for dep in self.tasks[name].deps:
+                visit(dep, chain + [name])
+            state[name] = "done"
+            ordered.append(name)
+
+        for name in self.tasks:
+            visit(name, [])
+        return ordered
+
+    def run(self, max_workers=4, force=False, cancelled=None, on_event=None, log=None):
+        """Run every task, returns {name: (state, elapsed seconds)}.
+
+        Tasks whose dependency failed are reported as blocked. ``on_event(name, state, elapsed)``
+        is called with "start" when a task begins and with its final state when it ends.
+        """
+        order = self.order()
+        on_event = on_event or (lambda name, state, elapsed: None)
+        cancelled = cancelled or (lambda: False)
+        log = log or (lambda message: None)
+        results = {}
+        pending = {name: set(self.tasks[name].deps) for name in order}
+        dependents = {name: [] for name in order}
+        for name in order:
+            for dep in self.tasks[name].deps:
+                dependents[dep].append(name)
+
+        def run_task(name):
+            task = self.tasks[name]
+            started = time.time()
+            on_event(name, "start", 0.0)
+            if cancelled():
+                state = TASK_CANCELLED
+            elif not force and task.up_to_date():
+                state = TASK_SKIPPED
+            else:
+                try:
+                    state = TASK_FAILED if task.action() is False else TASK_DONE
+                except Exception as e:
+                    log(f"❌ {task.title} failed: {str(e)}")
+                    state = TASK_FAILED
+                if state != TASK_DONE and cancelled():
+                    state = TASK_CANCELLED
+            return state, time.time() - started
+
+        def block(name):
+            # Everything downstream of a failed task is blocked without running
+            for child in dependents[name]:
+                if child not in results:
+                    results[child] = (TASK_BLOCKED, 0.0)
+                    on_event(child, TASK_BLOCKED, 0.0)
+                    block(child)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            running = {}
+
+            def submit_ready():
+                for name in order:
+                    if name not in results and name not in running.values() and not pending[name]:
+                        running[executor.submit(run_task, name)] = name
+
+            submit_ready()
+            while running:
+                finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    state, elapsed = future.result()
+                    results[name] = (state, elapsed)
+                    on_event(name, state, elapsed)
+                    if state in (TASK_DONE, TASK_SKIPPED):
+                        for child in dependents[name]:
+                            pending[child].discard(name)
+                    else:
+                        block(name)
+                submit_ready()
+        return results
+
+    def critical_path(self, results):
+        """Longest chain of dependent tasks by elapsed time, returns (names, seconds)"""
+        best = {}
+        for name in self.order():
+            elapsed = results.get(name, (None, 0.0))[1]
+            chain, total = [], 0.0
+            for dep in self.tasks[name].deps:
+                if best[dep][1] > total:
+                    chain, total = best[dep]
+            best[name] = (chain + [name], total + elapsed)
+        if not best:
+            return [], 0.0
+        return max(best.values(), key=lambda item: item[1])
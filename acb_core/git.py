@@ -0,0 +1,132 @@
+"""Git commands with live progress parsed from ``--progress`` output"""
+
+import os
+import re
+import time
+import threading
+import subprocess
+
+
+# "Receiving objects:  43% (1234/2870), 120.00 MiB | 12.00 MiB/s"
+_PROGRESS_RE = re.compile(
+    r'^(?:remote:\s*)?(?P<phase>[A-Za-z][A-Za-z ]*?):\s+(?P<percent>\d+)%\s+\((?P<done>\d+)/(?P<total>\d+)\)'
+    r'(?:,\s+(?P<size>[\d.]+\s+\w+)(?:\s+\|\s+(?P<rate>[\d.]+\s+\w+/s))?)?'
+)
+
+# Share of the overall progress bar each clone phase fills, as (start, end) percent
+_PHASE_SPAN = {
+    "Receiving objects": (0, 80),
+    "Resolving deltas": (80, 95),
+    "Updating files": (95, 100),
+}
+
+# Seconds without any output from git before it is treated as stalled
+DEFAULT_STALL_TIMEOUT = 120
+
+
+class GitCancelled(Exception):
+    """Raised when the user cancels a running git command"""
+
+
+class GitProgress:
+    """One parsed progress line from git"""
+
+    def __init__(self, phase, percent, done, total, size=None, rate=None):
+        self.phase = phase
+        self.percent = percent
+        self.done = done
+        self.total = total
+        self.size = size
+        self.rate = rate
+
+    @property
+    def overall(self):
+        """Percent of the whole clone or fetch; remote counting and compressing count as 0"""
+        start, end = _PHASE_SPAN.get(self.phase, (0, 0))
+        return start + (end - start) * self.percent / 100.0
+
+    def describe(self):
+        text = f"{self.phase} {self.percent}%"
+        details = ", ".join(part for part in (self.size, self.rate) if part)
+        return f"{text} ({details})" if details else text
+
+
+def parse_git_progress(line):
+    """GitProgress for a git progress line, or None for anything else"""
+    match = _PROGRESS_RE.match(line.strip())
+    if not match:
+        return None
+    return GitProgress(match.group("phase").strip(), int(match.group("percent")), int(match.group("done")),
+                       int(match.group("total")), match.group("size"), match.group("rate"))
+
+
+def remote_name_for_url(url):
+    """Stable remote name for url in a shared mirror, e.g. github.com-azerothcore-azerothcore-wotlk"""
+    name = url.split("://", 1)[-1]
+    if name.endswith(".git"):
+        name = name[:-4]
+    return re.sub(r'[^A-Za-z0-9._-]+', '-', name).strip('-.').lower() or "origin"
+
+
+def run_git(args, cwd=None, progress=None, stall_timeout=DEFAULT_STALL_TIMEOUT, cancelled=None):
+    """Run git with live progress, returns a CompletedProcess with progress lines removed from stderr.
+
+    ``progress(GitProgress)`` is called for every progress update git prints. Instead of a fixed
+    limit the command is killed when it prints nothing for ``stall_timeout`` seconds, raising
+    subprocess.TimeoutExpired. ``cancelled()`` is polled and kills it with GitCancelled.
+    """
+    command = ["git"] + list(args)
+    env = dict(os.environ)
+    # Never wait on a credential prompt nobody can see
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    process = subprocess.Popen(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    last_output = [time.time()]
+    stdout_chunks = []
+    stderr_lines = []
+
+    def read_stdout():
+        for chunk in iter(lambda: process.stdout.read(4096), b""):
+            last_output[0] = time.time()
+            stdout_chunks.append(chunk)
+
+    def read_stderr():
+        # Progress lines end in \r while git redraws them, everything else in \n
+        pending = b""
+        for chunk in iter(lambda: process.stderr.read1(4096), b""):
+            last_output[0] = time.time()
+            pending += chunk
+            parts = re.split(rb'[\r\n]', pending)
+            pending = parts.pop()
+            for part in parts:
+                handle_line(part.decode("utf-8", errors="replace"))
+        if pending:
+            handle_line(pending.decode("utf-8", errors="replace"))
+
+    def handle_line(line):
+        if not line.strip():
+            return
+        update = parse_git_progress(line)
+        if update is None:
+            stderr_lines.append(line)
+        elif progress:
+            progress(update)
+
+    readers = [threading.Thread(target=read_stdout, daemon=True), threading.Thread(target=read_stderr, daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    while process.poll() is None:
+        if cancelled and cancelled():
+            process.kill()
+            process.wait()
+            raise GitCancelled("Git command cancelled")
+        if stall_timeout and time.time() - last_output[0] > stall_timeout:
+            process.kill()
+            process.wait()
+            raise subprocess.TimeoutExpired(command, stall_timeout, output=b"".join(stdout_chunks))
+        time.sleep(0.2)
+    for reader in readers:
+        reader.join()
+    return subprocess.CompletedProcess(command, process.returncode,
+                                       b"".join(stdout_chunks).decode("utf-8", errors="replace"),
+                                       "\n".join(stderr_lines))
@@ -0,0 +1,122 @@
+"""Incremental parser for MSBuild console output"""
+
+import os
+import re
+
+
+# "  5>Project "C:\...\AzerothCore.sln" (1) is building "C:\...\game.vcxproj" (5) on node 2 (default targets)."
+_PROJECT_START_RE = re.compile(r'Project "(?P<parent>[^"]+)"(?: \([\d:]+\))? is building "(?P<project>[^"]+)"'
+                               r'[^\n]*?(?: \((?P<targets>[^()]*(?:\(s\))?)\))?\.?\s*$')
+# "  5>Done Building Project "C:\...\game.vcxproj" (default targets) -- FAILED."
+# "  6>Done Building Project "C:\...\game.vcxproj" (GetTargetPath target(s))."
+_PROJECT_DONE_RE = re.compile(r'Done Building Project "(?P<project>[^"]+)"'
+                              r'(?: \((?P<targets>[^()]*(?:\(s\))?)\))?[^\n]*?(?P<failed>-- FAILED)?\.?\s*$')
+# "C:\src\a.cpp(12,5): warning C4100: 'x': unreferenced parameter [C:\...\game.vcxproj]"
+# "LINK : fatal error LNK1104: cannot open file 'x.lib' [C:\...\worldserver.vcxproj]"
+_DIAGNOSTIC_RE = re.compile(r'(?::|^)\s*(?P<kind>fatal error|error|warning)\s+(?P<code>[A-Z]+\d+)\s*:')
+# Solution entries: Project("{GUID}") = "game", "src\server\game\game.vcxproj", "{GUID}"
+_SLN_PROJECT_RE = re.compile(r'^Project\("\{[^}]+\}"\)\s*=\s*"(?P<name>[^"]+)",\s*"(?P<path>[^"]+\.vcxproj)"', re.M)
+# "  1>" node prefix added by /m
+_NODE_PREFIX_RE = re.compile(r'^\s*\d+>')
+
+# Targets that compile a project; anything else (GetTargetPath, GetNativeTargetPath,
+# GetCopyToOutputDirectoryItems...) is a project reference being queried
+_BUILD_TARGETS = {"default targets", "build", "rebuild"}
+
+# CMake utility projects a solution build does not include
+_UNBUILT_PROJECTS = {"INSTALL", "PACKAGE", "RUN_TESTS"}
+
+
+def count_solution_projects(solution_file):
+    """Number of .vcxproj projects a solution build compiles, or 0 when the solution cannot be read"""
+    try:
+        with open(solution_file, "r", encoding="utf-8-sig", errors="replace") as f:
+            content = f.read()
+    except OSError:
+        return 0
+    return sum(1 for match in _SLN_PROJECT_RE.finditer(content) if match.group("name") not in _UNBUILT_PROJECTS)
+
+
+def _project_name(path):
+    return os.path.basename(path.replace("\\", "/"))
+
+
+def _project_key(path):
+    """Projects with the same file name live in different folders, MSBuild paths ignore case"""
+    return os.path.normpath(path.replace("\\", "/")).replace("\\", "/").lower()
+
+
+def _builds_project(targets):
+    """True for "default targets" or "Build target(s)", False when only reference targets run"""
+    if not targets:
+        return True
+    targets = targets.strip().lower()
+    if targets.endswith("target(s)"):
+        targets = targets[:-len("target(s)")]
+    return any(target.strip() in _BUILD_TARGETS for target in targets.split(";"))
+
+
+class MSBuildOutputParser:
+    """Turns MSBuild output lines into project and diagnostic events.
+
+    ``feed(line)`` returns a list of events: ("project_started", name),
+    ("project_finished", name, failed), ("warning", text) or ("error", text).
+    Only builds of a project's default (or Build) targets count, not the
+    GetTargetPath-style calls other projects make on their references.
+    Projects are tracked by full path; ``names`` maps that key to the file name
+    shown in events. Diagnostics repeated in MSBuild's closing summary are
+    reported once.
+    """
+
+    def __init__(self):
+        self.started = set()
+        self.finished = set()
+        self.failed = set()
+        self.names = {}
+        self.warnings = []
+        self.errors = []
+        self._seen = set()
+
+    def feed(self, line):
+        line = _NODE_PREFIX_RE.sub("", line.rstrip("\r\n")).strip()
+        if not line:
+            return []
+        match = _PROJECT_START_RE.search(line)
+        if match:
+            key, name = self._project(match.group("project"))
+            if name.endswith(".vcxproj") and _builds_project(match.group("targets")) and key not in self.started:
+                self.started.add(key)
+                return [("project_started", name)]
+            return []
+        match = _PROJECT_DONE_RE.search(line)
+        if match:
+            key, name = self._project(match.group("project"))
+            failed = bool(match.group("failed"))
+            if not name.endswith(".vcxproj") or not _builds_project(match.group("targets")):
+                return []
+            if failed:
+                self.failed.add(key)
+            if key in self.finished:
+                return []
+            self.finished.add(key)
+            return [("project_finished", name, failed)]
+        match = _DIAGNOSTIC_RE.search(line)
+        if match:
+            if line in self._seen:
+                return []
+            self._seen.add(line)
+            if match.group("kind") == "warning":
+                self.warnings.append(line)
+                return [("warning", line)]
+            self.errors.append(line)
+            return [("error", line)]
+        return []
+
+    def failed_projects(self):
+        """File names of the failed projects, sorted"""
+        return sorted(self.names[key] for key in self.failed)
+
+    def _project(self, path):
+        key = _project_key(path)
+        name = self.names.setdefault(key, _project_name(path))
+        return key, name
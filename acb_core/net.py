@@ -0,0 +1,759 @@
+"""Pooled HTTP client, resumable downloads, ranged streaming and the download cache"""
+
+import os
+import json
+import hashlib
+import shutil
+import threading
+import time
+import gzip
+import http.client
+import urllib.request
+import urllib.error
+import urllib.parse
+import concurrent.futures
+
+# Try to import urllib3 for pooled keep-alive HTTP connections
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+
+
+# Bytes read per chunk when streaming downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Largest read when the response cannot return partial data (urllib3 1.x)
+_PARTIAL_READ_SIZE = 64 * 1024
+
+_USER_AGENT = 'AzerothCoreBuilder/1.0'
+
+# Statuses retried with backoff before a response is handed to the caller
+_HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HTTPResponse:
+    """Response from HTTPClient with the file-like surface of a urlopen response"""
+
+    def __init__(self, raw, url, method, body=None):
+        self._raw = raw
+        self._body = body or raw
+        self._exhausted = method == 'HEAD'
+        self.url = url
+        self.status = raw.status
+        self.headers = raw.headers
+
+    def read(self, amt=None):
+        data = self._read(self._body.read, amt)
+        if not data or amt is None:
+            self._exhausted = True
+        return data
+
+    def read1(self, amt):
+        """Read up to amt bytes with at most one read from the connection.
+
+        Unlike read(amt), bytes that arrived before a dropped connection are returned
+        by earlier calls instead of being lost with the exception.
+        """
+        read1 = getattr(self._body, 'read1', None)
+        if read1 is None:
+            # urllib3 1.x has no read1; small reads bound what a drop can lose
+            return self.read(min(amt, _PARTIAL_READ_SIZE))
+        data = self._read(read1, amt)
+        if not data:
+            self._exhausted = True
+        return data
+
+    def _read(self, read, amt):
+        try:
+            return read(amt)
+        except Exception as e:
+            if URLLIB3_AVAILABLE and isinstance(e, urllib3.exceptions.HTTPError):
+                # Surface urllib3 failures as the OSError family every caller handles
+                raise urllib.error.URLError(e) from e
+            raise
+
+    def geturl(self):
+        return self.url
+
+    def close(self):
+        if self._exhausted and hasattr(self._raw, 'release_conn'):
+            # Fully read, the connection goes back to the pool
+            self._raw.release_conn()
+        else:
+            self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class HTTPClient:
+    """One HTTP layer for all network I/O.
+
+    Uses a shared urllib3 pool of keep-alive connections when urllib3 is
+    installed and plain urllib otherwise. Every request sends the ACB
+    User-Agent, has its own timeout (no process-wide socket default) and is
+    retried with exponential backoff on connection errors and on
+    _HTTP_RETRY_STATUSES. Error statuses raise urllib.error.HTTPError and
+    transport failures urllib.error.URLError, as urlopen does.
+    """
+
+    def __init__(self, user_agent=_USER_AGENT, timeout=30, retries=3, backoff=0.5, pool_size=8):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._pool = None
+        if URLLIB3_AVAILABLE:
+            self._pool = urllib3.PoolManager(num_pools=16, maxsize=pool_size, block=False)
+
+    def request(self, method, url, headers=None, timeout=None, retries=None, compressed=False):
+        """Send a request and return an HTTPResponse whose body has not been read yet"""
+        headers = dict(headers or {})
+        headers.setdefault('User-Agent', self.user_agent)
+        if compressed:
+            headers.setdefault('Accept-Encoding', 'gzip, deflate')
+        timeout = self.timeout if timeout is None else timeout
+        retries = self.retries if retries is None else retries
+
+        if self._pool is not None:
+            return self._request_pooled(method, url, headers, timeout, retries)
+        return self._request_urllib(method, url, headers, timeout, retries, compressed)
+
+    def _request_pooled(self, method, url, headers, timeout, retries):
+        retry = urllib3.util.Retry(total=retries, redirect=10, backoff_factor=self.backoff,
+                                   status_forcelist=_HTTP_RETRY_STATUSES,
+                                   allowed_methods=frozenset(['GET', 'HEAD']), raise_on_status=False)
+        try:
+            raw = self._pool.request(method, url, headers=headers, timeout=timeout, retries=retry,
+                                     preload_content=False, redirect=True)
+        except urllib3.exceptions.HTTPError as e:
+            raise urllib.error.URLError(getattr(e, 'reason', None) or e) from e
+
+        # Follow the redirect history for the final location, as urlopen's geturl() reports it
+        final_url = url
+        for entry in getattr(raw.retries, 'history', None) or ():
+            if entry.redirect_location:
+                final_url = urllib.parse.urljoin(final_url, entry.redirect_location)
+        if raw.status >= 300:
+            # Drain small error bodies so the connection can be reused
+            try:
+                raw.drain_conn()
+            except urllib3.exceptions.HTTPError:
+                pass
+            raw.release_conn()
+            raise urllib.error.HTTPError(final_url, raw.status, raw.reason, raw.headers, None)
+        return HTTPResponse(raw, final_url, method)
+
+    def _request_urllib(self, method, url, headers, timeout, retries, compressed):
+        attempt = 0
+        while True:
+            request = urllib.request.Request(url, headers=headers, method=method)
+            try:
+                raw = urllib.request.urlopen(request, timeout=timeout)
+                break
+            except urllib.error.HTTPError as e:
+                if e.code not in _HTTP_RETRY_STATUSES or attempt >= retries:
+                    raise
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                if attempt >= retries:
+                    raise e if isinstance(e, urllib.error.URLError) else urllib.error.URLError(e)
+            time.sleep(self.backoff * (2 ** attempt))
+            attempt += 1
+
+        body = None
+        if compressed and (raw.headers.get('Content-Encoding') or '').lower() == 'gzip':
+            body = gzip.GzipFile(fileobj=raw)
+        return HTTPResponse(raw, raw.geturl(), method, body)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def get_json(self, url, timeout=None):
+        """GET a JSON document, compressed on the wire"""
+        with self.get(url, headers={'Accept': 'application/json'}, timeout=timeout, compressed=True) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+
+# Shared by every download, probe and API lookup so connections are reused
+http_client = HTTPClient()
+
+
+class DownloadCancelled(Exception):
+    """Raised when the user cancels a running download"""
+
+
+def _content_range_total(content_range):
+    """Total size from a Content-Range header such as 'bytes 100-199/5000', or None"""
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    return None
+
+
+def download_file_resumable(url, dest_path, progress=None, cancelled=None, retries=5, timeout=60, info=None,
+                             headers=None):
+    """Stream url to dest_path in chunks through a .part file, resuming with Range requests.
+
+    progress(downloaded_bytes, total_bytes) is called after every chunk (total may be
+    None) and cancelled() is polled between chunks. A .part file left by an earlier
+    run is resumed when it came from the same URL and the server still reports the
+    same ETag/Last-Modified. info, if given, receives the final "etag" and
+    "last_modified" validators. headers are added to requests for the whole file,
+    e.g. If-None-Match, whose 304 is raised as HTTPError. Returns dest_path.
+    """
+    part_path = dest_path + ".part"
+    meta_path = part_path + ".json"
+
+    validator = None
+    if os.path.exists(part_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get("url") == url:
+                validator = meta.get("etag") or meta.get("last_modified")
+        except (OSError, ValueError):
+            pass
+        if not validator:
+            os.remove(part_path)
+
+    attempt = 0
+    total = None
+    while True:
+        downloaded = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if downloaded and not validator:
+            # Without an ETag or Last-Modified a resumed range could splice two versions of the file
+            os.remove(part_path)
+            downloaded = 0
+        start_size = downloaded
+
+        request_headers = {}
+        if downloaded:
+            request_headers['Range'] = f'bytes={downloaded}-'
+            # If the file changed on the server we get a full 200 response instead
+            request_headers['If-Range'] = validator
+        elif headers:
+            request_headers.update(headers)
+
+        try:
+            with http_client.get(url, headers=request_headers, timeout=timeout) as response:
+                if response.status == 206:
+                    total = _content_range_total(response.headers.get('Content-Range'))
+                    mode = 'ab'
+                else:
+                    downloaded = 0
+                    content_length = response.headers.get('Content-Length')
+                    total = int(content_length) if content_length else None
+                    mode = 'wb'
+
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                validator = etag or last_modified
+                if info is not None:
+                    info.update(etag=etag, last_modified=last_modified)
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump({"url": url, "etag": etag, "last_modified": last_modified}, f)
+
+                # read1 hands over whatever has arrived, so a dropped connection keeps every byte
+                # received so far in the .part file; progress is still reported once per chunk size
+                reported = downloaded
+                with open(part_path, mode, buffering=_DOWNLOAD_CHUNK_SIZE) as f:
+                    while True:
+                        if cancelled and cancelled():
+                            raise DownloadCancelled("Download cancelled by user")
+                        chunk = response.read1(_DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress and downloaded - reported >= _DOWNLOAD_CHUNK_SIZE:
+                            reported = downloaded
+                            progress(downloaded, total)
+                if progress and downloaded != reported:
+                    progress(downloaded, total)
+
+            if total is not None and downloaded < total:
+                raise ConnectionError(f"Connection closed after {downloaded:,} of {total:,} bytes")
+            break
+
+        except DownloadCancelled:
+            raise
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and downloaded:
+                # Nothing left to fetch if the .part already holds the whole file
+                total = _content_range_total(e.headers.get('Content-Range'))
+                if total == downloaded:
+                    break
+                os.remove(part_path)
+            elif e.code < 500 or attempt >= retries:
+                raise
+        except (urllib.error.URLError, http.client.HTTPException, OSError):
+            if attempt >= retries:
+                raise
+
+        # Only consecutive attempts without progress count against the retry limit
+        downloaded_now = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        attempt = 0 if downloaded_now > start_size else attempt + 1
+        time.sleep(min(2 ** attempt, 30))
+
+    final_size = os.path.getsize(part_path)
+    if total is not None and final_size != total:
+        raise Exception(f"Downloaded size {final_size:,} bytes does not match expected {total:,} bytes")
+
+    if info is not None and not info:
+        # The .part was already complete, so the validators come from its metadata
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            info.update(etag=meta.get("etag"), last_modified=meta.get("last_modified"))
+        except (OSError, ValueError):
+            pass
+
+    os.replace(part_path, dest_path)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    return dest_path
+
+
+class RangeRequestsUnsupported(Exception):
+    """Raised when a server does not answer byte range requests"""
+
+
+class HTTPRangeFile:
+    """Read-only, seekable file backed by HTTP Range requests.
+
+    Sequential reads share one open-ended streaming response, so reading a run
+    of consecutive zip members costs a single request. A dropped connection is
+    resumed at the current offset. on_data(offset, chunk) is called for every
+    chunk received. Without a size the file is probed first, which also records
+    its etag/last_modified; pass validator to make every range request
+    conditional on the file being unchanged (If-Range).
+    """
+
+    def __init__(self, url, size=None, validator=None, on_data=None, retries=5, timeout=60):
+        self.original_url = url
+        self.url = url
+        self.validator = validator
+        self.on_data = on_data
+        self.retries = retries
+        self.timeout = timeout
+        self.etag = None
+        self.last_modified = None
+        self._pos = 0
+        self._response = None
+        self._response_pos = None
+        self.size = size if size is not None else self._probe_size()
+
+    def _request(self, start, end=None):
+        headers = {'Range': f'bytes={start}-' if end is None else f'bytes={start}-{end}'}
+        if self.validator:
+            headers['If-Range'] = self.validator
+        try:
+            response = http_client.get(self.url, headers=headers, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if self.url == self.original_url or e.code not in (401, 403, 404, 410):
+                raise
+            # Signed redirect targets expire; resolve the original URL again
+            self.url = self.original_url
+            return self._request(start, end)
+        if response.status != 206:
+            response.close()
+            raise RangeRequestsUnsupported(f"Server did not return the requested range of {self.original_url}")
+        # Later requests go straight to the redirect target
+        self.url = response.geturl()
+        return response
+
+    def _probe_size(self):
+        with self._request(0, 0) as response:
+            total = _content_range_total(response.headers.get('Content-Range'))
+            self.etag = response.headers.get('ETag')
+            self.last_modified = response.headers.get('Last-Modified')
+            self.validator = self.validator or self.etag or self.last_modified
+        if total is None:
+            raise RangeRequestsUnsupported(f"Server did not report the size of {self.original_url}")
+        return total
+
+    def _close_response(self):
+        if self._response is not None:
+            try:
+                self._response.close()
+            except OSError:
+                pass
+        self._response = None
+        self._response_pos = None
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self._pos
+        size = min(size, self.size - self._pos)
+        if size <= 0:
+            return b""
+
+        parts = []
+        remaining = size
+        attempt = 0
+        while remaining:
+            try:
+                if self._response is None or self._response_pos != self._pos:
+                    self._close_response()
+                    self._response = self._request(self._pos)
+                    self._response_pos = self._pos
+                chunk = self._response.read(remaining)
+                if not chunk:
+                    raise ConnectionError(f"Connection closed at byte {self._pos:,} of {self.size:,}")
+            except (urllib.error.URLError, http.client.HTTPException, OSError):
+                self._close_response()
+                if attempt >= self.retries:
+                    raise
+                attempt += 1
+                time.sleep(min(2 ** attempt, 30))
+                continue
+
+            attempt = 0
+            parts.append(chunk)
+            remaining -= len(chunk)
+            if self.on_data:
+                self.on_data(self._pos, chunk)
+            self._pos += len(chunk)
+            self._response_pos = self._pos
+        return b"".join(parts)
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += self.size
+        if offset < 0:
+            raise ValueError("Negative seek position")
+        # The open response is kept so seeking to the current offset stays free
+        self._pos = offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def close(self):
+        self._close_response()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RangeAssembler:
+    """Assembles a file from byte ranges that arrive out of order.
+
+    The file is preallocated to its final size; missing() lists the ranges
+    that have not been written yet.
+    """
+
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size
+        self._ranges = []
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb')
+        self._file.truncate(size)
+
+    def _merged(self):
+        merged = []
+        for start, end in sorted(self._ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [tuple(item) for item in merged]
+
+    def write(self, offset, data):
+        with self._lock:
+            self._file.seek(offset)
+            self._file.write(data)
+            self._ranges.append((offset, offset + len(data)))
+            if len(self._ranges) > 4096:
+                self._ranges = self._merged()
+
+    def missing(self):
+        with self._lock:
+            merged = self._merged()
+        gaps = []
+        position = 0
+        for start, end in merged:
+            if start > position:
+                gaps.append((position, start))
+            position = max(position, end)
+        if position < self.size:
+            gaps.append((position, self.size))
+        return gaps
+
+    def close(self):
+        self._file.close()
+
+
+# Bytes read per call when hashing cached downloads
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def sha256_file(path):
+    """SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_or_copy(source, dest):
+    """Hard link source to dest, copying when the file system cannot link"""
+    if os.path.lexists(dest):
+        os.remove(dest)
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copy2(source, dest)
+
+
+class DownloadCache:
+    """Content-addressed cache shared by every downloader.
+
+    Files are stored once under objects/ by SHA-256 and index.json maps each URL
+    to its object, size, ETag/Last-Modified and last use. Cached copies are
+    revalidated with a conditional GET and verified against their hash before
+    use. Least recently used objects are evicted once the cache exceeds max_bytes.
+    """
+
+    def __init__(self, root_dir, max_bytes, log=None):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.log = log or (lambda message: None)
+        self.objects_dir = os.path.join(root_dir, "objects")
+        self.partial_dir = os.path.join(root_dir, "partial")
+        self.index_path = os.path.join(root_dir, "index.json")
+        self._lock = threading.RLock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.partial_dir, exist_ok=True)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get("entries", {})
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_index(self, entries):
+        # Write then rename so other processes sharing the cache never see half a file
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"entries": entries}, f, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    def object_path(self, sha256):
+        return os.path.join(self.objects_dir, sha256)
+
+    def partial_path(self, url):
+        """Staging path for a download of url that has not entered the cache yet"""
+        return os.path.join(self.partial_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def lookup(self, url):
+        """Index entry for url if its object is present and passes SHA-256 verification"""
+        with self._lock:
+            entry = self._load_index().get(url)
+        if not entry:
+            return None
+        path = self.object_path(entry["sha256"])
+        if not os.path.isfile(path) or os.path.getsize(path) != entry.get("size"):
+            return None
+        if sha256_file(path) != entry["sha256"]:
+            self.log(f"⚠️ Cached copy of {url} failed SHA-256 verification, discarding it")
+            self._remove_object(entry["sha256"])
+            return None
+        return entry
+
+    def add(self, url, file_path, etag=None, last_modified=None):
+        """Move a finished download into the cache and return its object path"""
+        sha256 = sha256_file(file_path)
+        size = os.path.getsize(file_path)
+        path = self.object_path(sha256)
+        with self._lock:
+            if os.path.exists(path):
+                # Same content under another URL or validator, keep the existing object
+                os.remove(file_path)
+            else:
+                os.replace(file_path, path)
+            entries = self._load_index()
+            entries[url] = {
+                "sha256": sha256,
+                "size": size,
+                "etag": etag,
+                "last_modified": last_modified,
+                "last_used": time.time(),
+            }
+            self._evict(entries, keep=sha256)
+            self._save_index(entries)
+        return path
+
+    def contains(self, url):
+        """Whether the index has an object for url, without the SHA-256 check lookup does"""
+        with self._lock:
+            entry = self._load_index().get(url)
+        return bool(entry) and os.path.isfile(self.object_path(entry["sha256"]))
+
+    def touch(self, url):
+        with self._lock:
+            entries = self._load_index()
+            if url in entries:
+                entries[url]["last_used"] = time.time()
+                self._save_index(entries)
+
+    def _remove_object(self, sha256):
+        with self._lock:
+            try:
+                os.remove(self.object_path(sha256))
+            except OSError:
+                pass
+            entries = self._load_index()
+            self._save_index({url: entry for url, entry in entries.items() if entry.get("sha256") != sha256})
+
+    def _evict(self, entries, keep):
+        objects = {}
+        for entry in entries.values():
+            info = objects.setdefault(entry["sha256"], {"size": entry.get("size", 0), "last_used": 0})
+            info["last_used"] = max(info["last_used"], entry.get("last_used", 0))
+
+        total = sum(info["size"] for info in objects.values())
+        for sha256, info in sorted(objects.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            try:
+                os.remove(self.object_path(sha256))
+            except OSError:
+                pass
+            total -= info["size"]
+            for url in [url for url, entry in entries.items() if entry["sha256"] == sha256]:
+                del entries[url]
+                self.log(f"🧹 Evicted {url} from the download cache")
+
+    def revalidate(self, url, progress=None, cancelled=None, timeout=60):
+        """Object path of a current copy of url, or None when nothing usable is cached.
+
+        Sends a conditional GET (If-None-Match / If-Modified-Since). A 304 keeps the
+        cached copy; a 200 means the file changed and its body is streamed into the
+        cache as the new copy. When the server cannot be reached the cached copy is
+        used as it is.
+        """
+        entry = self.lookup(url)
+        if not entry:
+            return None
+        if not entry.get("etag") and not entry.get("last_modified"):
+            return None
+
+        headers = {}
+        if entry.get("etag"):
+            headers['If-None-Match'] = entry["etag"]
+        if entry.get("last_modified"):
+            headers['If-Modified-Since'] = entry["last_modified"]
+        staging_path = self.partial_path(url)
+        info = {}
+        try:
+            # No retries: an unreachable server should not hold up the cached copy
+            download_file_resumable(url, staging_path, progress=progress, cancelled=cancelled,
+                                     retries=0, timeout=timeout, info=info, headers=headers)
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                return None
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+            if os.path.exists(staging_path + ".part"):
+                # The new version was arriving, let the caller resume it
+                self.log(f"⚠️ Download of the changed {url} was interrupted ({str(e)})")
+                return None
+            self.log(f"⚠️ Could not revalidate {url} ({str(e)}), using the cached copy")
+        else:
+            self.log(f"🔄 {url} changed on the server, cached the new version")
+            return self.add(url, staging_path, info.get("etag"), info.get("last_modified"))
+
+        self.touch(url)
+        return self.object_path(entry["sha256"])
+
+    def fetch(self, url, dest_path=None, progress=None, cancelled=None, timeout=60):
+        """Local copy of url, downloaded only when the cached copy is missing or stale.
+
+        Returns the object path, or dest_path (hard linked or copied from the
+        object) when given. Callers must not modify the object path in place.
+        """
+        path = self.revalidate(url, progress=progress, cancelled=cancelled, timeout=timeout)
+        if path:
+            self.log(f"♻️ Using cached download of {url}")
+        else:
+            staging_path = self.partial_path(url)
+            info = {}
+            download_file_resumable(url, staging_path, progress=progress, cancelled=cancelled,
+                                     timeout=timeout, info=info)
+            path = self.add(url, staging_path, info.get("etag"), info.get("last_modified"))
+
+        if dest_path:
+            link_or_copy(path, dest_path)
+            return dest_path
+        return path
+
+
+def probe_url(url, timeout=5):
+    """Whether url can be downloaded, checked with HEAD (or a one-byte GET if HEAD is refused)"""
+    for method in ('HEAD', 'GET'):
+        headers = {'Range': 'bytes=0-0'} if method == 'GET' else {}
+        try:
+            with http_client.request(method, url, headers=headers, timeout=timeout, retries=0) as response:
+                return response.status in (200, 206)
+        except urllib.error.HTTPError as e:
+            if method == 'HEAD' and e.code in (403, 405, 501):
+                continue
+            return False
+        except (urllib.error.URLError, http.client.HTTPException, OSError):
+            return False
+    return False
+
+
+def first_available_url(candidates, timeout=5, max_workers=32):
+    """Probe candidate URLs concurrently and return the first one, in list order, that responds.
+
+    Candidates are ordered by preference. The result is returned as soon as every
+    preferred candidate has failed, without waiting on slower probes of the rest.
+    Returns None when no candidate responds.
+    """
+    if not candidates:
+        return None
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(candidates)))
+    futures = {}
+    try:
+        for index, url in enumerate(candidates):
+            futures[executor.submit(probe_url, url, timeout)] = index
+        results = [None] * len(candidates)
+        for future in concurrent.futures.as_completed(futures):
+            results[futures[future]] = future.result()
+            for index, available in enumerate(results):
+                if available is None:
+                    # A preferred candidate is still being probed
+                    break
+                if available:
+                    return candidates[index]
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
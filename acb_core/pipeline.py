@@ -0,0 +1,2698 @@
+"""Non-interactive build, repack, data and SQL operations shared by the GUI and the command line"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import threading
+import subprocess
+import concurrent.futures
+
+from acb_core.sql import (PYMYSQL_AVAILABLE, SQL_BULK_MAX_ALLOWED_PACKET, SQL_MIN_IMPORT_RATE,
+                          analyze_sql_file, SQLScriptAnalysis, SQLImportEngine, SQLUpdateLedger,
+                          SchemaCatalog)
+from acb_core.net import (http_client, DownloadCancelled, download_file_resumable,
+                          RangeRequestsUnsupported, HTTPRangeFile, RangeAssembler, DownloadCache)
+from acb_core.archive import ExtractionCancelled, extract_zip_parallel
+from acb_core.system import get_backend
+from acb_core.git import DEFAULT_STALL_TIMEOUT, remote_name_for_url, run_git
+from acb_core.buildplan import load_build_state, plan_configure, save_build_state
+from acb_core.msbuild import MSBuildOutputParser, count_solution_projects
+from acb_core.dag import Task, TaskGraph
+from acb_core.sync import (LINK_MODES, SyncCancelled, SyncStats, break_hard_link, manifest_filter, sync_file,
+                           sync_tree, tree_unchanged)
+
+
+# Source repositories that can be cloned into GitSource
+SOURCE_REPOS = {
+    "azerothcore": {
+        "name": "AzerothCore Standard",
+        "url": "https://github.com/azerothcore/azerothcore-wotlk",
+        "folder": "azerothcore-wotlk"
+    },
+    "npcbots": {
+        "name": "AzerothCore with NPCBots",
+        "url": "https://github.com/trickerer/AzerothCore-wotlk-with-NPCBots",
+        "folder": "azerothcore-wotlk"
+    },
+    "playerbots": {
+        "name": "AzerothCore with PlayerBots",
+        "url": "https://github.com/liyunfan1223/azerothcore-wotlk.git",
+        "folder": "azerothcore-wotlk"
+    },
+    "custom": {
+        "name": "Custom",
+        "url": "",
+        "folder": "azerothcore-wotlk"
+    }
+}
+
+
+# Module repositories offered for cloning into GitSource/azerothcore-wotlk/modules, by group
+MODULE_CATALOGS = {
+    "azerothcore_modules": {
+        "name": "AzerothCore Modules",
+        "urls": [
+            "https://github.com/azerothcore/mod-resurrection-scroll",
+            "https://github.com/azerothcore/mod-progression-system",
+            "https://github.com/azerothcore/mod-zone-difficulty",
+            "https://github.com/azerothcore/mod-transmog",
+            "https://github.com/azerothcore/mod-acore-subscriptions",
+            "https://github.com/azerothcore/mod-global-chat",
+            "https://github.com/azerothcore/mod-server-auto-shutdown",
+            "https://github.com/azerothcore/mod-npc-beastmaster",
+            "https://github.com/azerothcore/mod-autobalance",
+            "https://github.com/azerothcore/mod-war-effort",
+            "https://github.com/azerothcore/mod-instanced-worldbosses",
+            "https://github.com/azerothcore/mod-starter-guild",
+            "https://github.com/azerothcore/mod-morphsummon",
+            "https://github.com/azerothcore/mod-bg-reward",
+            "https://github.com/azerothcore/mod-npc-morph",
+            "https://github.com/azerothcore/mod-bg-item-reward",
+            "https://github.com/azerothcore/mod-ip-tracker",
+            "https://github.com/azerothcore/mod-dmf-switch",
+            "https://github.com/azerothcore/mod-buff-command",
+            "https://github.com/azerothcore/mod-npc-codebox",
+            "https://github.com/azerothcore/mod-chromie-xp",
+            "https://github.com/azerothcore/mod-pvp-zones",
+            "https://github.com/azerothcore/mod-congrats-on-level",
+            "https://github.com/azerothcore/mod-guild-zone-system",
+            "https://github.com/azerothcore/mod-pvp-quests",
+            "https://github.com/azerothcore/mod-cta-switch",
+            "https://github.com/azerothcore/mod-tic-tac-toe",
+            "https://github.com/azerothcore/mod-fireworks-on-level",
+            "https://github.com/azerothcore/mod-notify-muted",
+            "https://github.com/azerothcore/mod-npc-enchanter",
+            "https://github.com/azerothcore/mod-chat-transmitter",
+            "https://github.com/azerothcore/mod-npc-gambler",
+            "https://github.com/azerothcore/mod-weapon-visual",
+            "https://github.com/azerothcore/mod-npc-all-mounts",
+            "https://github.com/azerothcore/mod-racial-trait-swap",
+            "https://github.com/azerothcore/mod-npc-buffer",
+            "https://github.com/azerothcore/mod-aoe-loot",
+            "https://github.com/azerothcore/mod-queue-list-cache",
+            "https://github.com/azerothcore/mod-pvpstats-announcer",
+            "https://github.com/azerothcore/mod-pvp-titles",
+            "https://github.com/azerothcore/mod-rdf-expansion",
+            "https://github.com/azerothcore/mod-costumes",
+            "https://github.com/azerothcore/mod-duel-reset",
+            "https://github.com/azerothcore/mod-desertion-warnings",
+            "https://github.com/azerothcore/mod-low-level-rbg",
+            "https://github.com/azerothcore/mod-low-level-arena",
+            "https://github.com/azerothcore/mod-npc-services",
+            "https://github.com/azerothcore/mod-azerothshard"
+        ],
+        "folder": "azerothcore-modules"
+    },
+    "community_modules": {
+        "name": "Community Modules",
+        "urls": [
+            "https://github.com/azerothcore/mod-weekend-xp",
+            "https://github.com/azerothcore/mod-eluna",
+            "https://github.com/azerothcore/mod-reward-played-time",
+            "https://github.com/azerothcore/mod-phased-duels",
+            "https://github.com/azerothcore/mod-premium",
+            "https://github.com/azerothcore/mod-item-level-up",
+            "https://github.com/azerothcore/mod-pocket-portal",
+            "https://github.com/azerothcore/mod-system-vip",
+            "https://github.com/azerothcore/mod-spell-regulator",
+            "https://github.com/azerothcore/mod-ah-bot",
+            "https://github.com/azerothcore/mod-random-enchants",
+            "https://github.com/azerothcore/mod-npc-talent-template",
+            "https://github.com/azerothcore/mod-keep-out",
+            "https://github.com/azerothcore/mod-who-logged",
+            "https://github.com/azerothcore/mod-solocraft",
+            "https://github.com/azerothcore/mod-account-mounts",
+            "https://github.com/azerothcore/mod-npc-free-professions",
+            "https://github.com/azerothcore/mod-antifarming",
+            "https://github.com/azerothcore/mod-promotion-azerothcore",
+            "https://github.com/azerothcore/mod-arena-replay",
+            "https://github.com/azerothcore/mod-breaking-news-override",
+            "https://github.com/azerothcore/mod-instance-reset",
+            "https://github.com/azerothcore/mod-learn-spells",
+            "https://github.com/azerothcore/mod-dynamic-xp",
+            "https://github.com/azerothcore/mod-custom-login",
+            "https://github.com/azerothcore/mod-npc-titles-tokens",
+            "https://github.com/azerothcore/mod-skip-dk-starting-area",
+            "https://github.com/azerothcore/mod-top-arena",
+            "https://github.com/azerothcore/mod-morph-all-players",
+            "https://github.com/azerothcore/mod-reward-shop",
+            "https://github.com/azerothcore/mod-character-tools",
+            "https://github.com/azerothcore/mod-quick-teleport",
+            "https://github.com/azerothcore/mod-chat-login",
+            "https://github.com/azerothcore/mod-learn-highest-talent",
+            "https://github.com/azerothcore/mod-mall-teleport",
+            "https://github.com/azerothcore/mod-emblem-transfer",
+            "https://github.com/azerothcore/mod-auto-revive",
+            "https://github.com/azerothcore/mod-quest-status",
+            "https://github.com/azerothcore/mod-detailed-logging",
+            "https://github.com/azerothcore/mod-solo-lfg",
+            "https://github.com/azerothcore/mod-boss-announcer",
+            "https://github.com/azerothcore/mod-gain-honor-guard",
+            "https://github.com/azerothcore/mod-pvpscript",
+            "https://github.com/azerothcore/mod-individual-xp",
+            "https://github.com/azerothcore/mod-guildhouse",
+            "https://github.com/azerothcore/mod-multi-client-check",
+            "https://github.com/azerothcore/mod-arena-3v3-solo-queue",
+            "https://github.com/azerothcore/mod-cfbg",
+            "https://github.com/azerothcore/mod-1v1-arena",
+            "https://github.com/azerothcore/mod-world-chat",
+            "https://github.com/azerothcore/mod-account-achievements",
+            "https://github.com/azerothcore/mod-anticheat",
+            "https://github.com/azerothcore/mod-better-item-reloading",
+            "https://github.com/araxiaonline/mod-mythic-plus",
+            "https://github.com/araxiaonline/mod-auctionator",
+            "https://github.com/araxiaonline/mod-money-for-kills",
+            "https://github.com/araxiaonline/mod-worgoblin",
+            "https://github.com/araxiaonline/mod-boss-runeworder",
+            "https://github.com/araxiaonline/mod-sharedrep",
+            "https://github.com/heyitsbench/mod-arac",
+            "https://github.com/heyitsbench/mod-chromiecraft-smartstone",
+            "https://github.com/ZhengPeiRu21/mod-challenge-modes",
+            "https://github.com/ZhengPeiRu21/mod-reagent-bank",
+            "https://github.com/ZhengPeiRu21/mod-leech",
+            "https://github.com/ZhengPeiRu21/mod-bg-set-level",
+            "https://github.com/talamortis/mod-bg-slaveryvalley",
+            "https://github.com/sogladev/mod-vanilla-naxxramas",
+            "https://github.com/sogladev/mod-dbg-tools",
+            "https://github.com/sogladev/mod-dkp-aio",
+            "https://github.com/sogladev/mod-individual-spellqueue",
+            "https://github.com/sogladev/mod-reset-raid-cooldowns",
+            "https://github.com/sogladev/mod-ghost-speed",
+            "https://github.com/sogladev/mod-deathroll-aio",
+            "https://github.com/sogladev/mod-demonic-pact-classic",
+            "https://github.com/stylo019/SkyWall-HardCore-Mode-3.3.5-WoW",
+            "https://github.com/pangolp/mod-recruit-friend",
+            "https://github.com/tbcstar/mod-high-risk-system",
+            "https://github.com/tbcstar/mod-bounty-hunter",
+            "https://github.com/pangolp/mod-guildfunds",
+            "https://github.com/tbcstar/mod-LadyLuck",
+            "https://github.com/tbcstar/mod-npc-spectator",
+            "https://github.com/tbcstar/mod-antifarming",
+            "https://github.com/tbcstar/mod-TimeIsTime",
+            "https://github.com/pangolp/mod-npc-promotion",
+            "https://github.com/noisiver/mod-progression",
+            "https://github.com/noisiver/mod-appreciation",
+            "https://github.com/noisiver/mod-weekendbonus",
+            "https://github.com/noisiver/mod-junk-to-gold",
+            "https://github.com/noisiver/mod-alterac-valley-additions",
+            "https://github.com/noisiver/mod-groupquests",
+            "https://github.com/noisiver/mod-accountbound",
+            "https://github.com/noisiver/mod-assistant",
+            "https://github.com/Nyeriah/mod-black-portal",
+            "https://github.com/Nyeriah/mod-save-inventory",
+            "https://github.com/noisiver/mod-giftvouchers"
+        ],
+        "folder": "community-modules"
+    },
+    "npcbot_modules": {
+        "name": "NPCBot Modules",
+        "urls": [
+            "https://github.com/trickerer/mod-autobalance",
+            "https://github.com/trickerer/Trinity-Bots",
+            "https://github.com/trickerer/mod-solocraft"
+        ],
+        "folder": "npcbot-modules"
+    },
+    "playerbot_modules": {
+        "name": "PlayerBot Modules",
+        "urls": [
+            "https://github.com/liyunfan1223/mod-playerbots",
+            "https://github.com/noisiver/mod-player-bot-level-brackets",
+            "https://github.com/DustinHendrickson/mod-ollama-chat",
+            "https://github.com/DustinHendrickson/mod-player-bot-reset",
+            "https://github.com/DustinHendrickson/mod-player-bot-guildhouse"
+        ],
+        "folder": "playerbot-modules"
+    }
+}
+
+
+# my.ini written into Repack/mysql, paths are relative to that folder
+MYINI_CONTENT = '''# MySQL 8.4.2 Settings
+[mysqld]
+    port = 3306
+    basedir="."
+    datadir="./data"
+    socket = /tmp/mysql.sock
+
+[client]
+    default-character-set = utf8mb4
+    port = 3306
+    socket = /tmp/mysql.sock
+'''
+
+# Placeholders in the .conf.dist files that "Config paths" replaces
+CONFIG_PATH_PLACEHOLDERS = ('DataDir = "."', 'LogsDir = ""', 'MySQLExecutable = ""')
+
+# Parts of a MySQL installation the servers never load; override with repack_mysql_skip
+MYSQL_REPACK_SKIP = ("docs/*", "mysql-test/*", "include/*", "lib/debug/*", "bin/debug/*", "*.pdb")
+
+# Never synced from the installed MySQL whatever repack_mysql_skip says: the repack's own
+# databases and my.ini are written by the repack and must not be replaced or shared with it
+MYSQL_REPACK_PROTECTED = ("data/*", "*.ini")
+
+# Written into Repack/data once data.zip has been extracted completely
+DATA_MARKER_FILE = ".acb_data.json"
+
+
+def default_app_dir():
+    """Directory holding GitSource, Build, Repack and acb_config.json (the exe's folder when frozen)"""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ProgressReporter:
+    """Receives status text and 0-100 progress from long-running operations.
+
+    Operations poll ``cancelled`` between steps; set it to stop them early.
+    """
+
+    cancelled = False
+
+    def status(self, text):
+        """Show a one-line description of the current step"""
+
+    def progress(self, value):
+        """Show overall progress as a percentage"""
+
+
+class PipelineOperations:
+    """Build, repack, data and SQL steps without any dialogs.
+
+    Hosts (the tkinter GUI and the command line) provide ``app_dir`` and
+    ``log_to_console(message)`` and call ``_init_pipeline_state()`` once.
+    """
+
+    def _init_pipeline_state(self):
+        """Create the locks, caches and process handles used by the pipeline steps"""
+        # Initialize build process tracking
+        self.build_cancelled = False
+        self.current_cmake_process = None
+        self.current_msbuild_process = None
+        
+        # Databases known to exist during the current SQL import session
+        self.schema_catalog = None
+        
+        # SQL file analysis results keyed by (path, size, mtime)
+        self._sql_analysis_cache = {}
+        self._sql_analysis_lock = threading.Lock()
+        
+        # Serialize read-modify-write updates of acb_config.json from worker threads
+        self._config_lock = threading.RLock()
+        
+        # Shared content-addressed download cache, created on first use
+        self._download_cache = None
+        self._download_cache_lock = threading.Lock()
+
+    def _tools_build_enabled(self):
+        """Whether the extractor tools are built, read from configuration"""
+        return bool(self._load_config_value("tools_build", False))
+
+    def _report_build_progress(self, value):
+        """Hook for hosts that display overall build progress"""
+
+    def _get_app_dir(self):
+        """Get the application directory (works for both PyInstaller and development)"""
+        return self.app_dir
+
+    def _load_config_value(self, key, default):
+        """Load a single setting from the configuration file, falling back to default"""
+        try:
+            config_file = os.path.join(self._get_app_dir(), "acb_config.json")
+
+            if os.path.exists(config_file):
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+
+                if key in config:
+                    return config[key]
+
+        except Exception as e:
+            self.log_to_console(f"⚠️ Could not load '{key}' from config: {str(e)}")
+
+        return default
+
+    def _save_config_value(self, key, value):
+        """Save a single setting to the configuration file"""
+        try:
+            config_file = os.path.join(self._get_app_dir(), "acb_config.json")
+
+            with self._config_lock:
+                # Load existing config or create new one
+                config = {}
+                if os.path.exists(config_file):
+                    with open(config_file, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
+
+                config[key] = value
+
+                with open(config_file, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, indent=2)
+
+        except Exception as e:
+            self.log_to_console(f"⚠️ Could not save '{key}' to config: {str(e)}")
+
+    def _get_download_cache(self):
+        """Shared download cache from configuration, or None when it is disabled"""
+        if not self._load_config_value("download_cache_enabled", True):
+            return None
+        with self._download_cache_lock:
+            if self._download_cache is None:
+                cache_dir = self._load_config_value("download_cache_dir", "") or \
+                    os.path.join(self._get_app_dir(), "cache", "downloads")
+                try:
+                    max_bytes = int(float(self._load_config_value("download_cache_max_gb", 10)) * 1024 ** 3)
+                except (TypeError, ValueError):
+                    max_bytes = 10 * 1024 ** 3
+                self._download_cache = DownloadCache(cache_dir, max_bytes, log=self.log_to_console)
+            return self._download_cache
+
+    def _fetch_download(self, url, dest_path, progress=None, cancelled=None):
+        """Download url to dest_path, through the download cache when it is enabled"""
+        cache = self._get_download_cache()
+        if cache is None:
+            return download_file_resumable(url, dest_path, progress=progress, cancelled=cancelled)
+        return cache.fetch(url, dest_path, progress=progress, cancelled=cancelled)
+
+    def _git_stall_timeout(self):
+        """Seconds a git command may go without output, from git_stall_timeout in acb_config.json"""
+        try:
+            return max(10, int(self._load_config_value("git_stall_timeout", DEFAULT_STALL_TIMEOUT)))
+        except (TypeError, ValueError):
+            return DEFAULT_STALL_TIMEOUT
+
+    def _git_progress(self, name, reporter):
+        """progress(GitProgress) forwarding git's own percentages and throughput to reporter"""
+        last_update = [0.0]
+        finished_phases = set()
+
+        def report_progress(update):
+            if update.percent == 100 and update.phase not in finished_phases:
+                finished_phases.add(update.phase)
+                self.log_to_console(f"📥 {name}: {update.describe()}")
+            # Throttle UI updates, git redraws its progress many times a second
+            now = time.time()
+            if now - last_update[0] < 0.25 and update.percent != 100:
+                return
+            last_update[0] = now
+            reporter.progress(update.overall)
+            reporter.status(update.describe())
+        return report_progress
+
+    def _run_git(self, args, cwd, name, reporter=None):
+        """Run a git command with --progress output forwarded to reporter, returns the completed process"""
+        reporter = reporter or ProgressReporter()
+        return run_git(args, cwd=cwd, progress=self._git_progress(name, reporter),
+                       stall_timeout=self._git_stall_timeout(), cancelled=lambda: reporter.cancelled)
+
+    def _git_cache_enabled(self):
+        """Whether clones borrow objects from the local git mirror cache"""
+        return bool(self._load_config_value("git_cache_enabled", True))
+
+    def _refresh_git_cache(self, cache_name, url, name, reporter=None):
+        """Fetch url into the bare mirror <git cache>/<cache_name>.git, returns its path or None if unusable.
+
+        Each URL is a remote of the mirror, so forks fetched into the same mirror only
+        download the objects the mirror does not have yet.
+        """
+        cache_root = self._load_config_value("git_cache_dir", "") or os.path.join(self._get_app_dir(), "cache", "git")
+        cache_dir = os.path.join(cache_root, cache_name + ".git")
+        remote = remote_name_for_url(url)
+        try:
+            if os.path.isdir(cache_dir) and \
+                    self._run_git(["rev-parse", "--is-bare-repository"], cache_dir, name).stdout.strip() != "true":
+                self.log_to_console(f"🧹 Removing broken git cache for {name}")
+                shutil.rmtree(cache_dir)
+            if not os.path.isdir(cache_dir):
+                self._create_git_mirror(cache_dir, name)
+            remotes = self._run_git(["remote"], cache_dir, name).stdout.split()
+            if remote not in remotes:
+                result = self._run_git(["remote", "add", "--no-tags", remote, url], cache_dir, name)
+                if result.returncode != 0:
+                    raise OSError(result.stderr.strip())
+            self.log_to_console(f"📦 Refreshing git cache for {name}")
+            result = self._run_git(["fetch", "--progress", "--prune", remote], cache_dir, name, reporter)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.log_to_console(f"⚠️ Git cache unavailable for {name}, cloning without it: {str(e)}")
+            return None
+        if result.returncode != 0:
+            self.log_to_console(f"⚠️ Could not refresh git cache for {name}, cloning without it: {result.stderr.strip()}")
+            return None
+        return cache_dir
+
+    def _create_git_mirror(self, cache_dir, name):
+        """Create an empty bare mirror; it only appears at cache_dir once it is fully set up"""
+        temp_dir = cache_dir + ".tmp"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+        # Concurrent fetches must not race an automatic gc
+        for args in (["init", "--bare", "--quiet"], ["config", "gc.auto", "0"]):
+            result = self._run_git(args, temp_dir, name)
+            if result.returncode != 0:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                raise OSError(f"git {args[0]} failed: {result.stderr.strip()}")
+        os.replace(temp_dir, cache_dir)
+
+    def _git_reference_args(self, cache_name, url, name, reporter=None):
+        """git clone options borrowing objects from the mirror cache, or [] when the cache is off or unusable"""
+        if not self._git_cache_enabled():
+            return []
+        cache_dir = self._refresh_git_cache(cache_name, url, name, reporter)
+        if not cache_dir:
+            return []
+        # --dissociate copies the borrowed objects, so the clone never depends on the cache
+        return ["--reference-if-able", cache_dir, "--dissociate"]
+
+    def _clone_source_repository(self, key, repo, git_source_dir, reporter=None):
+        """Run git clone for a source repository into git_source_dir, returns the completed process"""
+        # All source variants are forks of azerothcore-wotlk and share one mirror
+        reference_args = self._git_reference_args("azerothcore-wotlk", repo["url"], repo["name"], reporter)
+        # Prepare clone command based on repository type
+        if key == "playerbots":
+            # Clone with Playerbot branch
+            clone_args = ["clone", "--progress"] + reference_args + [repo["url"], "--branch=Playerbot", repo["folder"]]
+        else:
+            # Standard clone
+            clone_args = ["clone", "--progress"] + reference_args + [repo["url"], repo["folder"]]
+        self.log_to_console(f"🔧 Executing: git {' '.join(clone_args)}")
+        
+        os.makedirs(git_source_dir, exist_ok=True)
+        return self._run_git(clone_args, git_source_dir, repo["name"], reporter)
+
+    def _module_clone_args(self):
+        """Extra git clone options for modules from module_clone_depth and module_clone_filter"""
+        args = []
+        try:
+            depth = int(self._load_config_value("module_clone_depth", 1) or 0)
+        except (TypeError, ValueError):
+            depth = 1
+        if depth > 0:
+            args += ["--depth", str(depth)]
+        clone_filter = self._load_config_value("module_clone_filter", "")
+        if clone_filter:
+            args.append(f"--filter={clone_filter}")
+        return args
+
+    def _clone_module_repository(self, module_name, module_url, modules_dir, reporter=None):
+        """Clone a single module into the modules directory, returns True on success"""
+        try:
+            clone_args = self._module_clone_args()
+            if "--depth" not in clone_args:
+                # A mirror holds full history, so it only pays off for full clones (module_clone_depth 0)
+                clone_args = self._git_reference_args(f"modules/{module_name}", module_url, module_name,
+                                                      reporter) + clone_args
+            result = self._run_git(["clone", "--progress"] + clone_args + [module_url, module_name],
+                                   modules_dir, module_name, reporter)
+            
+            if result.returncode == 0:
+                self.log_to_console(f"✅ Successfully cloned {module_name}")
+                return True
+            else:
+                error_msg = result.stderr if result.stderr else "Unknown error occurred"
+                self.log_to_console(f"❌ Failed to clone {module_name}: {error_msg}")
+                return False
+                
+        except subprocess.TimeoutExpired as e:
+            self.log_to_console(f"⏰ Clone of {module_name} stalled: no output from git for {e.timeout}s")
+            return False
+        except Exception as e:
+            self.log_to_console(f"❌ Error cloning {module_name}: {str(e)}")
+            return False
+
+    def _clone_modules(self, modules, modules_dir, reporter_for=None, on_status=None, cancelled=None):
+        """Clone (name, url) modules concurrently, retrying failures, returns {name: True/False}.
+
+        Up to module_clone_workers clones run at once and each failed clone is retried
+        module_clone_retries times. ``on_status(name, text)`` receives per-module status changes.
+        """
+        reporter_for = reporter_for or (lambda name: ProgressReporter())
+        on_status = on_status or (lambda name, text: None)
+        cancelled = cancelled or (lambda: False)
+        try:
+            workers = max(1, int(self._load_config_value("module_clone_workers", 8)))
+            retries = max(0, int(self._load_config_value("module_clone_retries", 2)))
+        except (TypeError, ValueError):
+            workers, retries = 8, 2
+        os.makedirs(modules_dir, exist_ok=True)
+        clone_args = self._module_clone_args()
+        if "--depth" not in clone_args and self._git_cache_enabled():
+            clone_args.append("via git cache")
+        extra_args = " ".join(clone_args)
+        self.log_to_console(f"🚀 Cloning {len(modules)} modules with up to {workers} in parallel"
+                            + (f" ({extra_args})" if extra_args else ""))
+        started = time.time()
+
+        def clone(module_name, module_url):
+            on_status(module_name, "⏳ Cloning")
+            module_started = time.time()
+            for attempt in range(retries + 1):
+                if cancelled():
+                    on_status(module_name, "❌ Cancelled")
+                    return False
+                if attempt:
+                    # A stalled or failed clone can leave a partial checkout behind
+                    shutil.rmtree(os.path.join(modules_dir, module_name), ignore_errors=True)
+                    on_status(module_name, f"🔁 Retry {attempt}/{retries}")
+                    self.log_to_console(f"🔁 Retrying {module_name} ({attempt}/{retries})")
+                    time.sleep(2 * attempt)
+                if self._clone_module_repository(module_name, module_url, modules_dir, reporter_for(module_name)):
+                    on_status(module_name, f"✅ Cloned ({time.time() - module_started:.1f}s)")
+                    return True
+            on_status(module_name, "❌ Failed")
+            return False
+
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, max(len(modules), 1))) as executor:
+            futures = {}
+            for module_name, module_url in modules:
+                on_status(module_name, "⏸️ Queued")
+                futures[executor.submit(clone, module_name, module_url)] = module_name
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    self.log_to_console(f"❌ Failed to clone {futures[future]}: {str(e)}")
+                    results[futures[future]] = False
+        cloned = sum(1 for ok in results.values() if ok)
+        self.log_to_console(f"⏱️ Cloned {cloned}/{len(modules)} modules in {time.time() - started:.1f}s")
+        return results
+
+    def _find_git_repositories(self, source_dir):
+        """(name, path) of the core checkout and every git module under its modules folder"""
+        repositories = []
+        if os.path.isdir(os.path.join(source_dir, ".git")):
+            repositories.append((os.path.basename(source_dir), source_dir))
+        modules_dir = os.path.join(source_dir, "modules")
+        if os.path.isdir(modules_dir):
+            for name in sorted(os.listdir(modules_dir)):
+                module_dir = os.path.join(modules_dir, name)
+                if os.path.exists(os.path.join(module_dir, ".git")):
+                    repositories.append((name, module_dir))
+        return repositories
+
+    def _update_repository(self, name, repo_dir, reporter=None):
+        """Fetch a checkout and fast-forward it to its upstream, returns a dict describing what changed"""
+        def git(*args):
+            result = self._run_git(list(args), repo_dir, name)
+            if result.returncode != 0:
+                raise Exception(result.stderr.strip() or f"git {args[0]} failed")
+            return result.stdout.strip()
+
+        update = {"name": name, "path": repo_dir, "ok": False, "changed": False, "commits": 0,
+                  "files": [], "cmake_changed": False, "status": ""}
+        try:
+            old_head = git("rev-parse", "HEAD")
+            fetch = self._run_git(["fetch", "--progress", "--prune"], repo_dir, name, reporter)
+            if fetch.returncode != 0:
+                raise Exception(fetch.stderr.strip() or "git fetch failed")
+            try:
+                git("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}")
+            except Exception:
+                update.update(ok=True, status="No upstream branch")
+                return update
+            update["commits"] = int(git("rev-list", "--count", "HEAD..@{u}") or 0)
+            if not update["commits"]:
+                update.update(ok=True, status="Up to date")
+                return update
+            merge = self._run_git(["merge", "--ff-only", "@{u}"], repo_dir, name)
+            if merge.returncode != 0:
+                ahead = int(git("rev-list", "--count", "@{u}..HEAD") or 0)
+                reason = f"{ahead} local commits" if ahead else "local changes"
+                update["status"] = f"Cannot fast-forward ({reason})"
+                return update
+            new_head = git("rev-parse", "HEAD")
+            files = [path for path in git("diff", "--name-only", old_head, new_head).splitlines() if path]
+            update.update(ok=True, changed=True, files=files, old=old_head, new=new_head,
+                          cmake_changed=any(os.path.basename(path) == "CMakeLists.txt" or path.endswith(".cmake")
+                                            for path in files),
+                          status=f"{update['commits']} new commits")
+        except subprocess.TimeoutExpired as e:
+            update["status"] = f"Stalled: no output from git for {e.timeout}s"
+        except Exception as e:
+            update["status"] = str(e).splitlines()[-1] if str(e) else "Update failed"
+        return update
+
+    def _update_repositories(self, repositories, reporter_for=None, on_status=None, cancelled=None):
+        """Update (name, path) checkouts concurrently, returns their update dicts and saves the change set.
+
+        Changed repositories are recorded in last_update_changes in acb_config.json, so the
+        build can tell whether CMake has to be configured again.
+        """
+        reporter_for = reporter_for or (lambda name: ProgressReporter())
+        on_status = on_status or (lambda name, text: None)
+        cancelled = cancelled or (lambda: False)
+        try:
+            workers = max(1, int(self._load_config_value("update_workers", 8)))
+        except (TypeError, ValueError):
+            workers = 8
+        self.log_to_console(f"🔄 Updating {len(repositories)} repositories with up to {workers} in parallel")
+        started = time.time()
+
+        def update(name, repo_dir):
+            if cancelled():
+                on_status(name, "❌ Cancelled")
+                return {"name": name, "path": repo_dir, "ok": False, "changed": False, "commits": 0,
+                        "files": [], "cmake_changed": False, "status": "Cancelled"}
+            on_status(name, "⏳ Fetching")
+            result = self._update_repository(name, repo_dir, reporter_for(name))
+            icon = "🆕" if result["changed"] else "✅" if result["ok"] else "❌"
+            on_status(name, f"{icon} {result['status']}")
+            self.log_to_console(f"{icon} {name}: {result['status']}")
+            return result
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, max(len(repositories), 1))) as executor:
+            futures = []
+            for name, repo_dir in repositories:
+                on_status(name, "⏸️ Queued")
+                futures.append(executor.submit(update, name, repo_dir))
+            results = [future.result() for future in futures]
+
+        # Merge into the change set of earlier updates that have not been built yet
+        changes = dict(self._load_config_value("last_update_changes", {}) or {})
+        for result in results:
+            if not result["changed"]:
+                continue
+            previous = changes.get(result["name"], {})
+            changes[result["name"]] = {
+                "commits": previous.get("commits", 0) + result["commits"],
+                "files": previous.get("files", 0) + len(result["files"]),
+                "cmake_changed": previous.get("cmake_changed", False) or result["cmake_changed"],
+                "old": previous.get("old", result["old"]),
+                "new": result["new"],
+            }
+        if any(result["changed"] for result in results):
+            self._save_config_value("last_update_changes", changes)
+        changed = [result["name"] for result in results if result["changed"]]
+        self.log_to_console(f"⏱️ Updated {len(repositories)} repositories in {time.time() - started:.1f}s, "
+                            f"{len(changed)} changed" + (f": {', '.join(changed)}" if changed else ""))
+        return results
+
+    def _find_cmake(self):
+        """Find CMake installation path"""
+        # Check common CMake paths
+        cmake_paths = [
+            r"C:\Program Files\CMake\bin\cmake.exe",
+            r"C:\Program Files (x86)\CMake\bin\cmake.exe"
+        ]
+
+        for path in cmake_paths:
+            if os.path.exists(path):
+                self.log_to_console(f"✅ Found CMake at: {path}")
+                return path
+
+        # Check PATH environment variable
+        try:
+            result = subprocess.run(["cmake", "--version"], capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                self.log_to_console("✅ Found CMake in PATH")
+                return "cmake"
+        except:
+            pass
+
+        return None
+
+    def _find_visual_studio(self):
+        """Find Visual Studio installation path"""
+        # Check registry for Visual Studio
+        install_path = get_backend().read_registry_value("HKLM", r"SOFTWARE\Microsoft\VisualStudio\Setup\VS",
+                                                         "InstallLocation")
+        if install_path and os.path.exists(install_path):
+            self.log_to_console(f"✅ Found Visual Studio at: {install_path}")
+            return install_path
+
+        # Check common Visual Studio paths
+        vs_paths = [
+            r"C:\Program Files\Microsoft Visual Studio\2022\Community\Common7\IDE\devenv.exe",
+            r"C:\Program Files\Microsoft Visual Studio\2022\Professional\Common7\IDE\devenv.exe",
+            r"C:\Program Files\Microsoft Visual Studio\2022\Enterprise\Common7\IDE\devenv.exe"
+        ]
+
+        for path in vs_paths:
+            if os.path.exists(path):
+                self.log_to_console(f"✅ Found Visual Studio at: {path}")
+                return path
+
+        return None
+
+    def _find_msbuild(self):
+        """Find MSBuild executable from Visual Studio installations"""
+        try:
+            # Common MSBuild locations for Visual Studio 2022
+            possible_paths = [
+                r"C:\Program Files\Microsoft Visual Studio\2022\Community\MSBuild\Current\Bin\MSBuild.exe",
+                r"C:\Program Files\Microsoft Visual Studio\2022\Professional\MSBuild\Current\Bin\MSBuild.exe",
+                r"C:\Program Files\Microsoft Visual Studio\2022\Enterprise\MSBuild\Current\Bin\MSBuild.exe",
+                r"C:\Program Files (x86)\Microsoft Visual Studio\2022\Community\MSBuild\Current\Bin\MSBuild.exe",
+                r"C:\Program Files (x86)\Microsoft Visual Studio\2022\Professional\MSBuild\Current\Bin\MSBuild.exe",
+                r"C:\Program Files (x86)\Microsoft Visual Studio\2022\Enterprise\MSBuild\Current\Bin\MSBuild.exe",
+                # Visual Studio 2019 paths as fallback
+                r"C:\Program Files (x86)\Microsoft Visual Studio\2019\Community\MSBuild\Current\Bin\MSBuild.exe",
+                r"C:\Program Files (x86)\Microsoft Visual Studio\2019\Professional\MSBuild\Current\Bin\MSBuild.exe",
+                r"C:\Program Files (x86)\Microsoft Visual Studio\2019\Enterprise\MSBuild\Current\Bin\MSBuild.exe",
+            ]
+
+            for path in possible_paths:
+                if os.path.exists(path):
+                    self.log_to_console(f"🔍 Found MSBuild at: {path}")
+                    return path
+
+            # Try to find from PATH as last resort
+            try:
+                result = subprocess.run(["where", "msbuild"], capture_output=True, text=True, timeout=10)
+                if result.returncode == 0:
+                    msbuild_path = result.stdout.strip().split('\n')[0]
+                    if os.path.exists(msbuild_path):
+                        self.log_to_console(f"🔍 Found MSBuild in PATH: {msbuild_path}")
+                        return msbuild_path
+            except:
+                pass
+
+            self.log_to_console("❌ MSBuild not found in common locations or PATH")
+            return None
+
+        except Exception as e:
+            self.log_to_console(f"❌ Error finding MSBuild: {str(e)}")
+            return None
+
+    def _cmake_configure_command(self, repo_dir, build_dir, cmake_path):
+        """CMake configure command line; its options are part of the build fingerprint"""
+        # CMake configure command - this generates the Visual Studio solution files
+        cmd = [
+            cmake_path,
+            "-S", repo_dir,
+            "-B", build_dir,
+            "-G", "Visual Studio 17 2022",
+            "-A", "x64",
+            "-DCMAKE_BUILD_TYPE=RelWithDebInfo"
+        ]
+
+        # Add extractor tools option based on checkbox state
+        if self._tools_build_enabled():
+            cmd.append("-DTOOLS_BUILD=all")
+        else:
+            cmd.append("-DTOOLS_BUILD=none")
+        return cmd
+
+    def _run_cmake_configure_new(self, repo_dir, build_dir, cmake_path):
+        """Run CMake configure step without dialog"""
+        try:
+            self.log_to_console(f"📁 Source directory: {repo_dir}")
+            self.log_to_console(f"📁 Build directory: {build_dir}")
+
+            cmd = self._cmake_configure_command(repo_dir, build_dir, cmake_path)
+            if "-DTOOLS_BUILD=all" in cmd:
+                self.log_to_console("🔧 Including extractor tools (DTOOLS) in build")
+            else:
+                self.log_to_console("⏭️ Skipping extractor tools (DTOOLS) in build")
+
+            self.log_to_console(f"🔧 Running CMake configure: {' '.join(cmd)}")
+
+            # Use Popen to allow process termination
+            self.current_cmake_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+            # Wait for process to complete or be cancelled
+            try:
+                stdout, stderr = self.current_cmake_process.communicate(timeout=300)
+                result = type('Result', (), {'returncode': self.current_cmake_process.returncode, 'stdout': stdout, 'stderr': stderr})()
+            except subprocess.TimeoutExpired:
+                self.current_cmake_process.kill()
+                stdout, stderr = self.current_cmake_process.communicate()
+                result = type('Result', (), {'returncode': -1, 'stdout': stdout, 'stderr': stderr})()
+
+            # Check if build was cancelled during CMake
+            if self.build_cancelled:
+                self.log_to_console("❌ Build cancelled during CMake configuration")
+                return False
+
+            if result.returncode == 0:
+                self.log_to_console("✅ CMake configuration completed successfully")
+                self.log_to_console("📋 Visual Studio solution files generated")
+                # Update build progress - CMake configure is ~30% of total build
+                self._report_build_progress(30)
+                return True
+            else:
+                self.log_to_console("❌ CMake configuration failed:")
+                self.log_to_console(f"STDOUT: {result.stdout}")
+                self.log_to_console(f"STDERR: {result.stderr}")
+                return False
+
+        except subprocess.TimeoutExpired:
+            self.log_to_console("⏰ CMake configuration timed out")
+            return False
+        except Exception as e:
+            self.log_to_console(f"❌ CMake configuration error: {str(e)}")
+            return False
+
+    def _run_cmake_generate_new(self, build_dir):
+        """Run CMake generate step without dialog - this is now just a verification step"""
+        try:
+            self.log_to_console("📋 Verifying generated Visual Studio solution files...")
+
+            # Check if the solution file was created
+            solution_file = os.path.join(build_dir, "AzerothCore.sln")
+            if os.path.exists(solution_file):
+                self.log_to_console(f"✅ Solution file found: {solution_file}")
+                # Update build progress - CMake generate is ~40% of total build
+                self._report_build_progress(40)
+                return True
+            else:
+                self.log_to_console(f"❌ Solution file not found: {solution_file}")
+                self.log_to_console("📁 Checking build directory contents:")
+
+                # List contents of build directory for debugging
+                try:
+                    build_contents = os.listdir(build_dir)
+                    for item in build_contents:
+                        self.log_to_console(f"   - {item}")
+                except Exception as e:
+                    self.log_to_console(f"   Error listing directory: {str(e)}")
+
+                return False
+
+        except Exception as e:
+            self.log_to_console(f"❌ CMake generation verification error: {str(e)}")
+            return False
+
+    def _run_visual_studio_build_new(self, build_dir, reporter=None):
+        """Run MSBuild, streaming and parsing its output for per-project progress and diagnostics"""
+        try:
+            self.log_to_console("🔨 Starting Visual Studio build process...")
+
+            # Find MSBuild executable
+            msbuild_path = self._find_msbuild()
+            if not msbuild_path:
+                self.log_to_console("❌ MSBuild not found. Please ensure Visual Studio is installed.")
+                return False
+
+            self.log_to_console(f"🔍 Using MSBuild: {msbuild_path}")
+
+            # Build the solution using MSBuild
+            solution_file = os.path.join(build_dir, "AzerothCore.sln")
+            if not os.path.exists(solution_file):
+                self.log_to_console(f"❌ Solution file not found: {solution_file}")
+                return False
+
+            self.log_to_console(f"📁 Building solution: {solution_file}")
+
+            # Use MSBuild to build the solution with full path
+            msbuild_cmd = [
+                msbuild_path,
+                solution_file,
+                "/p:Configuration=RelWithDebInfo",
+                "/p:Platform=x64",
+                "/p:BuildProjectReferences=false",
+                "/m"
+            ]
+
+            self.log_to_console(f"🔧 Running MSBuild: {' '.join(msbuild_cmd)}")
+            return self._stream_msbuild(msbuild_cmd, build_dir, count_solution_projects(solution_file), reporter)
+
+        except Exception as e:
+            self.log_to_console(f"❌ Visual Studio build error: {str(e)}")
+            return False
+
+    def _stream_msbuild(self, msbuild_cmd, build_dir, total_projects, reporter=None):
+        """Run MSBuild with a reader thread, returns True on success.
+
+        Progress is projects finished out of total_projects. The full output goes to
+        Build/msbuild.log, and MSBuild is stopped after build_inactivity_timeout seconds
+        (default 1200) without output instead of after a fixed time.
+        """
+        reporter = reporter or ProgressReporter()
+        try:
+            inactivity_timeout = max(60, int(self._load_config_value("build_inactivity_timeout", 1200)))
+        except (TypeError, ValueError):
+            inactivity_timeout = 1200
+        parser = MSBuildOutputParser()
+        last_output = [time.time()]
+        last_update = [0.0]
+        log_path = os.path.join(build_dir, "msbuild.log")
+
+        def report():
+            # Throttle UI updates, MSBuild prints hundreds of lines a second
+            now = time.time()
+            if now - last_update[0] < 0.25:
+                return
+            last_update[0] = now
+            done = len(parser.finished)
+            if total_projects:
+                self._report_build_progress(40 + 59 * min(done, total_projects) / total_projects)
+                text = f"Building with Visual Studio... {done}/{total_projects} projects"
+            else:
+                text = f"Building with Visual Studio... {done} projects"
+            if parser.warnings or parser.errors:
+                text += f" ({len(parser.warnings)} warnings, {len(parser.errors)} errors)"
+            reporter.status(text)
+
+        def read_output(process):
+            with open(log_path, "w", encoding="utf-8", errors="replace") as log_file:
+                for line in process.stdout:
+                    last_output[0] = time.time()
+                    log_file.write(line)
+                    for event in parser.feed(line):
+                        if event[0] == "project_finished":
+                            icon = "❌" if event[2] else "✅"
+                            self.log_to_console(f"{icon} [{len(parser.finished)}/{total_projects or '?'}] {event[1]}")
+                        elif event[0] == "error":
+                            self.log_to_console(f"❌ {event[1]}")
+                    report()
+
+        # Use Popen to allow process termination
+        self.current_msbuild_process = subprocess.Popen(msbuild_cmd, stdout=subprocess.PIPE,
+                                                        stderr=subprocess.STDOUT, text=True, errors="replace")
+        process = self.current_msbuild_process
+        reader = threading.Thread(target=read_output, args=(process,), daemon=True)
+        reader.start()
+
+        # Wait for process to complete, be cancelled or go silent
+        stalled = False
+        while process.poll() is None:
+            if self.build_cancelled or time.time() - last_output[0] > inactivity_timeout:
+                stalled = not self.build_cancelled
+                process.kill()
+                break
+            time.sleep(0.5)
+        process.wait()
+        reader.join(timeout=10)
+
+        # Check if build was cancelled during MSBuild
+        if self.build_cancelled:
+            self.log_to_console("❌ Build cancelled during MSBuild compilation")
+            return False
+
+        summary = (f"{len(parser.finished)} projects, {len(parser.warnings)} warnings, "
+                   f"{len(parser.errors)} errors (full output: {log_path})")
+        if stalled:
+            self.log_to_console(f"⏰ MSBuild printed nothing for {inactivity_timeout}s and was stopped; {summary}")
+            return False
+        if process.returncode == 0:
+            self.log_to_console("✅ Visual Studio build completed successfully")
+            self.log_to_console(f"📊 Build output: {summary}")
+            # Update build progress - Visual Studio build is ~100% of total build
+            self._report_build_progress(100)
+            return True
+        self.log_to_console(f"❌ Visual Studio build failed with exit code {process.returncode}: {summary}")
+        if parser.failed:
+            self.log_to_console(f"❌ Failed projects: {', '.join(parser.failed_projects())}")
+        for error in parser.errors[:20]:
+            self.log_to_console(f"   {error}")
+        if len(parser.errors) > 20:
+            self.log_to_console(f"   ... and {len(parser.errors) - 20} more errors in {log_path}")
+        return False
+
+    def _build_source(self, repo_dir, build_dir, cmake_path, reporter=None, force_configure=False):
+        """Configure, verify and compile a cloned source, returns True when the build succeeded.
+
+        Configure is skipped when the CMake cache exists and the CMake inputs fingerprint
+        matches the last configure (disable with incremental_build or force_configure).
+        """
+        reporter = reporter or ProgressReporter()
+        timings = {}
+        
+        # Check if build was cancelled before starting
+        if self.build_cancelled:
+            self.log_to_console("❌ Build process cancelled before starting")
+            return False
+        
+        # Report what "Update All" brought in since the last build
+        changes = self._load_config_value("last_update_changes", {}) or {}
+        if changes:
+            commits = sum(change.get("commits", 0) for change in changes.values())
+            cmake_changed = [name for name, change in changes.items() if change.get("cmake_changed")]
+            self.log_to_console(f"📋 Updated since last build: {', '.join(changes)} ({commits} commits)"
+                                + (f", CMake files changed in {', '.join(cmake_changed)}" if cmake_changed else ""))
+        
+        # Step 1: CMake Configuration, unless its inputs are unchanged since the last one
+        started = time.time()
+        options = self._cmake_configure_command(repo_dir, build_dir, cmake_path)
+        needs_configure, reason, fingerprint = plan_configure(repo_dir, build_dir, options)
+        timings["plan"] = time.time() - started
+        if force_configure or not self._load_config_value("incremental_build", True):
+            needs_configure, reason = True, "full configure requested"
+        
+        started = time.time()
+        if needs_configure:
+            reporter.status("Configuring CMake project...")
+            self.log_to_console(f"🚀 Starting CMake configuration ({reason})...")
+            
+            # Forget the last fingerprint first: a configure that fails or is stopped half way
+            # leaves a CMake cache that a matching fingerprint must not vouch for
+            state = load_build_state(build_dir)
+            if state.pop("cmake_fingerprint", None) is not None:
+                save_build_state(build_dir, state)
+            
+            # Run CMake configure
+            cmake_config_result = self._run_cmake_configure_new(repo_dir, build_dir, cmake_path)
+            if not cmake_config_result or self.build_cancelled:
+                self.log_to_console("❌ CMake configuration failed")
+                return False
+            state = load_build_state(build_dir)
+            state["cmake_fingerprint"] = fingerprint
+            save_build_state(build_dir, state)
+        else:
+            self.log_to_console(f"⏭️ Skipping CMake configuration: {reason}, reusing {build_dir}")
+            self._report_build_progress(30)
+        timings["configure"] = time.time() - started
+        
+        # Step 2: CMake Generation
+        started = time.time()
+        reporter.status("Generating Visual Studio solution...")
+        self.log_to_console("📋 Generating Visual Studio solution files...")
+        
+        cmake_generate_result = self._run_cmake_generate_new(build_dir)
+        if not cmake_generate_result or self.build_cancelled:
+            self.log_to_console("❌ CMake generation failed")
+            return False
+        timings["verify"] = time.time() - started
+        
+        # Step 3: Visual Studio Build
+        started = time.time()
+        reporter.status("Building with Visual Studio...")
+        self.log_to_console("🔨 Starting Visual Studio build process...")
+        
+        build_result = self._run_visual_studio_build_new(build_dir, reporter)
+        timings["compile"] = time.time() - started
+        self._record_build_timings(build_dir, timings, needs_configure)
+        if not build_result or self.build_cancelled:
+            self.log_to_console("❌ Visual Studio build failed")
+            return False
+        
+        # Build completed successfully, the updates are now built
+        if changes:
+            self._save_config_value("last_update_changes", {})
+        reporter.status("Build completed successfully!")
+        self.log_to_console("🎉 Build completed successfully!")
+        self.log_to_console(f"📁 Build output location: {build_dir}")
+        return True
+
+    def _record_build_timings(self, build_dir, timings, configured):
+        """Log how long each build stage took and keep the numbers in the build state"""
+        stages = ", ".join(f"{stage} {seconds:.1f}s" + (" (skipped)" if stage == "configure" and not configured else "")
+                           for stage, seconds in timings.items())
+        self.log_to_console(f"⏱️ Build stages: {stages} (total {sum(timings.values()):.1f}s)")
+        try:
+            state = load_build_state(build_dir)
+            state["last_timings"] = {stage: round(seconds, 2) for stage, seconds in timings.items()}
+            state["last_configured"] = configured
+            save_build_state(build_dir, state)
+        except OSError as e:
+            self.log_to_console(f"⚠️ Could not save build timings: {str(e)}")
+
+    def _terminate_build_processes(self):
+        """Terminate all running build processes"""
+        try:
+            # Terminate CMake process if running
+            if self.current_cmake_process and self.current_cmake_process.poll() is None:
+                self.log_to_console("🛑 Terminating CMake process...")
+                self.current_cmake_process.terminate()
+                try:
+                    self.current_cmake_process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self.log_to_console("⚠️ CMake process did not terminate gracefully, forcing kill...")
+                    self.current_cmake_process.kill()
+                self.current_cmake_process = None
+
+            # Terminate MSBuild process if running
+            if self.current_msbuild_process and self.current_msbuild_process.poll() is None:
+                self.log_to_console("🛑 Terminating MSBuild process...")
+                self.current_msbuild_process.terminate()
+                try:
+                    self.current_msbuild_process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self.log_to_console("⚠️ MSBuild process did not terminate gracefully, forcing kill...")
+                    self.current_msbuild_process.kill()
+                self.current_msbuild_process = None
+
+            # Also try to kill any remaining MSBuild processes
+            self._kill_remaining_msbuild_processes()
+
+            self.log_to_console("✅ All build processes terminated")
+
+        except Exception as e:
+            self.log_to_console(f"⚠️ Error terminating build processes: {str(e)}")
+
+    def _kill_remaining_msbuild_processes(self):
+        """Kill any remaining MSBuild processes that might be running"""
+        try:
+            backend = get_backend()
+            for pid, name in backend.list_processes():
+                if 'msbuild' in name.lower():
+                    self.log_to_console(f"🛑 Killing remaining MSBuild process (PID: {pid})")
+                    try:
+                        backend.kill_process(pid)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+        except Exception as e:
+            self.log_to_console(f"⚠️ Error killing remaining MSBuild processes: {str(e)}")
+
+    def _repack_link_mode(self):
+        """repack_link_mode from configuration: auto, hardlink or copy"""
+        mode = self._load_config_value("repack_link_mode", "auto")
+        return mode if mode in LINK_MODES else "auto"
+
+    def _link_repack_files(self, from_build):
+        """Whether files are hard linked into the repack instead of copied.
+
+        In auto mode only installed files (MySQL, DLLs) are linked: a running, hard
+        linked worldserver.exe would lock the build output and fail the next link step.
+        """
+        mode = self._repack_link_mode()
+        return mode == "hardlink" or (mode == "auto" and not from_build)
+
+    def _assemble_repack(self, repack_dir, build_bin_dir):
+        """Sync the server executables, configs and lua_scripts from the build output into repack_dir.
+
+        Only changed files are written; .conf files, data and mysql in the repack are never touched.
+        Returns (copied_items, missing_items, failed_files).
+        """
+        os.makedirs(repack_dir, exist_ok=True)
+        self.log_to_console(f"📁 Repack directory: {repack_dir}")
+        
+        # Files and folders to copy - all from Build\bin\RelWithDebInfo
+        items_to_copy = [
+            # Executables from Build\bin\RelWithDebInfo
+            (os.path.join(build_bin_dir, "authserver.exe"), "authserver.exe"),
+            (os.path.join(build_bin_dir, "worldserver.exe"), "worldserver.exe"),
+            # Folders from Build\bin\RelWithDebInfo
+            (os.path.join(build_bin_dir, "configs"), "configs"),
+            (os.path.join(build_bin_dir, "lua_scripts"), "lua_scripts")
+        ]
+        
+        copied_items = []
+        missing_items = []
+        failed_files = []
+        link = self._link_repack_files(from_build=True)
+        checksum = bool(self._load_config_value("repack_compare_hash", False))
+        started = time.time()
+        total = SyncStats()
+        
+        # Sync each item
+        for source_path, dest_name in items_to_copy:
+            dest_path = os.path.join(repack_dir, dest_name)
+            
+            if not os.path.exists(source_path):
+                missing_items.append(dest_name)
+                self.log_to_console(f"⚠️ Not found: {dest_name}")
+                continue
+            
+            stats = SyncStats()
+            if os.path.isfile(source_path):
+                try:
+                    sync_file(source_path, dest_path, link, checksum, stats)
+                except OSError as e:
+                    stats.failed.append((dest_name, str(e)))
+                copied_items.append(f"📄 {dest_name}")
+            else:
+                sync_tree(source_path, dest_path, link, checksum, stats)
+                stats.failed = [(os.path.join(dest_name, path), error) for path, error in stats.failed]
+                copied_items.append(f"📁 {dest_name}/")
+            
+            for path, error in stats.failed:
+                failed_files.append(path)
+                self.log_to_console(f"❌ Could not update {path}: {error}")
+            self.log_to_console(f"✅ Synced {dest_name} ({stats.summary()})")
+            total.copied += stats.copied
+            total.linked += stats.linked
+            total.unchanged += stats.unchanged
+            total.bytes_written += stats.bytes_written
+        
+        self.log_to_console(f"📦 Repack synced in {time.time() - started:.1f}s: {total.summary()}, "
+                            f"{total.bytes_written / (1024 * 1024):.1f} MB written")
+        return copied_items, missing_items, failed_files
+
+    def _create_config_files(self, configs_dir):
+        """Copy every .conf.dist under configs_dir to a .conf that does not exist yet.
+
+        Returns (conf_dist_files, transformed_count, failed_files).
+        """
+        # Find all .conf.dist files recursively
+        conf_dist_files = []
+        for root, dirs, files in os.walk(configs_dir):
+            for file in files:
+                if file.endswith('.conf.dist'):
+                    conf_dist_files.append(os.path.join(root, file))
+        
+        # Transform each .conf.dist file to .conf
+        transformed_count = 0
+        failed_files = []
+        
+        for conf_dist_file in conf_dist_files:
+            try:
+                # Create the new .conf filename
+                conf_file = conf_dist_file.replace('.conf.dist', '.conf')
+                
+                # Check if .conf file already exists
+                if os.path.exists(conf_file):
+                    self.log_to_console(f"⚠️ Skipping {os.path.basename(conf_dist_file)} - .conf file already exists")
+                    continue
+                
+                # Copy .conf.dist to .conf, keeping the .conf.dist file
+                shutil.copy2(conf_dist_file, conf_file)
+                
+                transformed_count += 1
+                self.log_to_console(f"✅ Created: {os.path.basename(conf_file)} (kept .conf.dist)")
+                
+            except Exception as e:
+                failed_files.append(os.path.basename(conf_dist_file))
+                self.log_to_console(f"❌ Failed to transform {os.path.basename(conf_dist_file)}: {str(e)}")
+        
+        return conf_dist_files, transformed_count, failed_files
+
+    def _update_config_paths(self, config_files, data_dir, logs_dir, mysql_exe):
+        """Point DataDir, LogsDir and MySQLExecutable in the (name, path) config files at the repack, returns the settings updated"""
+        # Define the replacements
+        replacements = list(zip(CONFIG_PATH_PLACEHOLDERS, (
+            f'DataDir = "{data_dir}"',
+            f'LogsDir = "{logs_dir}"',
+            f'MySQLExecutable = "{mysql_exe}"'
+        )))
+        
+        total_updated_count = 0
+        
+        # Process each config file
+        for config_name, config_path in config_files:
+            self.log_to_console(f"📁 Processing {config_name}...")
+            
+            # Read the current config file
+            with open(config_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+            
+            # Apply replacements
+            file_updated_count = 0
+            for old_value, new_value in replacements:
+                if old_value in content:
+                    content = content.replace(old_value, new_value)
+                    file_updated_count += 1
+                    self.log_to_console(f"✅ Updated in {config_name}: {old_value} → {new_value}")
+                else:
+                    self.log_to_console(f"⚠️ Not found in {config_name}: {old_value}")
+            
+            # Write the updated content back to the file
+            with open(config_path, 'w', encoding='utf-8') as file:
+                file.write(content)
+            
+            total_updated_count += file_updated_count
+            self.log_to_console(f"📄 {config_name}: {file_updated_count} settings updated")
+        
+        return total_updated_count
+
+    def _find_mysql_path(self):
+        """Find MySQL installation path from requirements or common locations"""
+        # First check if MySQL is detected in requirements
+        mysql_requirement = getattr(self, "requirements", {}).get("MySQL", {})
+        if mysql_requirement.get("detected") and mysql_requirement.get("path"):
+            mysql_path = mysql_requirement["path"]
+            # If it's pointing to mysql.exe, get the parent directory
+            if mysql_path.endswith("mysql.exe"):
+                mysql_path = os.path.dirname(os.path.dirname(mysql_path))  # Go up two levels (bin -> MySQL Server X.X)
+            return mysql_path
+        
+        # Check common MySQL installation paths
+        common_paths = [
+            r"C:\Program Files\MySQL\MySQL Server 8.0",
+            r"C:\Program Files\MySQL\MySQL Server 8.4",
+            r"C:\Program Files (x86)\MySQL\MySQL Server 8.0",
+            r"C:\Program Files (x86)\MySQL\MySQL Server 8.4"
+        ]
+        
+        for path in common_paths:
+            if os.path.exists(path):
+                return path
+        
+        return None
+
+    def _find_openssl_path(self):
+        """Find OpenSSL installation path from requirements or common locations"""
+        # First check if OpenSSL is detected in requirements
+        openssl_requirement = getattr(self, "requirements", {}).get("OpenSSL", {})
+        if openssl_requirement.get("detected") and openssl_requirement.get("path"):
+            openssl_path = openssl_requirement["path"]
+            self.log_to_console(f"🔍 OpenSSL detected path: {openssl_path}")
+            
+            # If it's pointing to openssl.exe, get the parent directory (bin -> OpenSSL-Win64)
+            if openssl_path.endswith("openssl.exe"):
+                openssl_path = os.path.dirname(openssl_path)  # Go up one level from bin to OpenSSL-Win64
+                self.log_to_console(f"🔍 Adjusted path (from exe): {openssl_path}")
+            # If it's pointing to bin directory, get the parent directory (bin -> OpenSSL-Win64)
+            elif openssl_path.endswith("bin"):
+                openssl_path = os.path.dirname(openssl_path)  # Go up one level from bin to OpenSSL-Win64
+                self.log_to_console(f"🔍 Adjusted path (from bin): {openssl_path}")
+            else:
+                self.log_to_console(f"🔍 Using path as-is: {openssl_path}")
+            
+            # Verify the path exists and has a bin directory
+            if os.path.exists(openssl_path):
+                bin_path = os.path.join(openssl_path, "bin")
+                if os.path.exists(bin_path):
+                    self.log_to_console(f"✅ OpenSSL path verified: {openssl_path} (bin exists)")
+                    return openssl_path
+                else:
+                    self.log_to_console(f"❌ OpenSSL bin directory not found: {bin_path}")
+            else:
+                self.log_to_console(f"❌ OpenSSL path does not exist: {openssl_path}")
+        
+        # Check common OpenSSL installation paths
+        self.log_to_console("🔍 Checking common OpenSSL installation paths...")
+        common_paths = [
+            r"C:\Program Files\OpenSSL-Win64",
+            r"C:\Program Files (x86)\OpenSSL-Win32",
+            r"C:\OpenSSL-Win64",
+            r"C:\OpenSSL-Win32"
+        ]
+        
+        for path in common_paths:
+            self.log_to_console(f"🔍 Checking: {path}")
+            if os.path.exists(path):
+                bin_path = os.path.join(path, "bin")
+                if os.path.exists(bin_path):
+                    self.log_to_console(f"✅ Found OpenSSL at: {path} (bin exists)")
+                    return path
+                else:
+                    self.log_to_console(f"⚠️ Found OpenSSL directory but no bin: {path}")
+        
+        self.log_to_console("❌ No OpenSSL installation found")
+        return None
+
+    def _copy_workers(self):
+        """Number of parallel file copies, from copy_workers in acb_config.json"""
+        try:
+            return max(1, int(self._load_config_value("copy_workers", 4)))
+        except (TypeError, ValueError):
+            return 4
+
+    def _copy_progress(self, label, reporter):
+        """progress(bytes_done, total_bytes, files_done, total_files) showing MB/s and ETA on reporter"""
+        started = time.time()
+        last_update = [0.0]
+
+        def report_progress(bytes_done, total_bytes, files_done, total_files):
+            # Throttle UI updates from the copy workers
+            now = time.time()
+            if now - last_update[0] < 0.25 and files_done < total_files:
+                return
+            last_update[0] = now
+            rate = bytes_done / max(now - started, 0.001)
+            eta = (total_bytes - bytes_done) / rate if rate else 0
+            reporter.progress(bytes_done / max(total_bytes, 1) * 100)
+            reporter.status(f"{label}... {bytes_done / (1024 * 1024):,.1f}/{total_bytes / (1024 * 1024):,.1f} MB "
+                            f"({rate / (1024 * 1024):.1f} MB/s, ETA {int(eta // 60)}:{int(eta % 60):02d})")
+        return report_progress
+
+    def _copy_repack_mysql(self, source_path, target_path, reporter=None):
+        """Sync a MySQL installation into the repack; data and my.ini in the target are kept"""
+        reporter = reporter or ProgressReporter()
+        self.log_to_console("📁 Starting MySQL folder copy operation...")
+        started = time.time()
+        skip_patterns = self._repack_mysql_skip_patterns()
+        self._unshare_repack_mysql_files(target_path)
+        try:
+            stats = sync_tree(source_path, target_path, link=self._link_repack_files(from_build=False),
+                              skip=self._repack_mysql_filter(),
+                              workers=self._copy_workers(),
+                              progress=self._copy_progress("Copying MySQL", reporter),
+                              cancelled=lambda: reporter.cancelled)
+        except SyncCancelled:
+            self.log_to_console("⚠️ MySQL folder copy cancelled")
+            raise
+        for path, error in stats.failed:
+            self.log_to_console(f"❌ Could not update mysql/{path}: {error}")
+        if stats.failed:
+            raise Exception(f"{len(stats.failed)} MySQL files could not be copied")
+        if stats.skipped:
+            self.log_to_console(f"📋 Skipped {stats.skipped} files ({stats.skipped_bytes / (1024 * 1024):.1f} MB) "
+                                f"matching repack_mysql_skip: {', '.join(skip_patterns)}")
+        self.log_to_console(f"✅ MySQL folder created successfully at: {target_path} "
+                            f"({stats.summary()} in {time.time() - started:.1f}s)")
+
+    def _repack_mysql_skip_patterns(self):
+        return list(self._load_config_value("repack_mysql_skip", list(MYSQL_REPACK_SKIP)))
+
+    def _repack_mysql_filter(self):
+        """skip(relative_path) for the MySQL files the repack never takes from the installed MySQL"""
+        return manifest_filter(self._repack_mysql_skip_patterns() + list(MYSQL_REPACK_PROTECTED))
+
+    def _unshare_repack_mysql_files(self, mysql_dir):
+        """Break hard links an earlier repack made from mysql/data and .ini files to the installed MySQL"""
+        paths = []
+        for root, dirs, files in os.walk(mysql_dir):
+            in_data = os.path.relpath(root, mysql_dir).replace(os.path.sep, '/').split('/')[0] == "data"
+            paths += [os.path.join(root, name) for name in files if in_data or name.lower().endswith(".ini")]
+        unshared = 0
+        for path in paths:
+            try:
+                unshared += break_hard_link(path)
+            except OSError as e:
+                raise Exception(f"Could not separate {path} from the installed MySQL: {str(e)}")
+        if unshared:
+            self.log_to_console(f"🔗 Gave {unshared} repack MySQL data/config files their own copy instead of "
+                                "hard links to the installed MySQL")
+
+    def _repack_dll_files(self, openssl_path, mysql_path):
+        """The OpenSSL and MySQL DLLs the servers load, as dicts with source_path, name and type"""
+        return [
+            {
+                "source_path": os.path.join(openssl_path, "bin", "libcrypto-3-x64.dll"),
+                "name": "libcrypto-3-x64.dll",
+                "type": "OpenSSL"
+            },
+            {
+                "source_path": os.path.join(openssl_path, "bin", "libssl-3-x64.dll"),
+                "name": "libssl-3-x64.dll",
+                "type": "OpenSSL"
+            },
+            {
+                "source_path": os.path.join(openssl_path, "bin", "legacy.dll"),
+                "name": "legacy.dll",
+                "type": "OpenSSL"
+            },
+            {
+                "source_path": os.path.join(mysql_path, "lib", "libmysql.dll"),
+                "name": "libmysql.dll",
+                "type": "MySQL"
+            }
+        ]
+
+    def _copy_repack_dlls(self, dll_files, repack_dir, reporter=None):
+        """Copy DLL files next to the server executables, returns (copied_files, failed_files)"""
+        reporter = reporter or ProgressReporter()
+        copied_files = []
+        failed_files = []
+        
+        link = self._link_repack_files(from_build=False)
+        sizes = {}
+        for dll_info in dll_files:
+            try:
+                sizes[dll_info["name"]] = os.path.getsize(dll_info["source_path"])
+            except OSError:
+                sizes[dll_info["name"]] = 0
+        total_bytes = sum(sizes.values())
+        done = {"bytes": 0, "files": 0}
+        lock = threading.Lock()
+        report_progress = self._copy_progress("Copying DLL files", reporter)
+
+        def on_bytes(count):
+            with lock:
+                done["bytes"] += count
+                snapshot = (done["bytes"], total_bytes, done["files"], len(dll_files))
+            report_progress(*snapshot)
+
+        def copy_dll(dll_info):
+            self.log_to_console(f"📁 Copying {dll_info['name']} from {dll_info['type']}...")
+            # Copy the DLL file to Repack directory, skipping it when unchanged
+            target_path = os.path.join(repack_dir, dll_info["name"])
+            return sync_file(dll_info["source_path"], target_path, link, on_bytes=on_bytes,
+                             cancelled=lambda: reporter.cancelled)
+
+        # The DLLs are independent, so they are copied side by side
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self._copy_workers(), max(len(dll_files), 1))) as executor:
+            futures = {executor.submit(copy_dll, dll_info): dll_info for dll_info in dll_files}
+            for future in concurrent.futures.as_completed(futures):
+                dll_info = futures[future]
+                with lock:
+                    done["files"] += 1
+                try:
+                    result = future.result()
+                    copied_files.append(dll_info["name"])
+                    self.log_to_console(f"✅ {dll_info['name']}: {result}")
+                except Exception as e:
+                    failed_files.append(f"{dll_info['name']}: {str(e)}")
+                    self.log_to_console(f"❌ Failed to copy {dll_info['name']}: {str(e)}")
+        
+        return copied_files, failed_files
+
+    def _create_mysql_directories(self, mysql_dir):
+        """Create required MySQL directories"""
+        required_dirs = [
+            "data",
+            "tmp",
+            "logs"
+        ]
+        
+        for dir_name in required_dirs:
+            dir_path = os.path.join(mysql_dir, dir_name)
+            if not os.path.exists(dir_path):
+                os.makedirs(dir_path, exist_ok=True)
+                self.log_to_console(f"📁 Created directory: {dir_path}")
+            else:
+                self.log_to_console(f"✅ Directory exists: {dir_path}")
+
+    def _mysql_process_environment(self, mysql_dir):
+        """Environment variables for running the repack's mysqld"""
+        mysql_env = {
+            # MySQL paths
+            "MYSQL_HOME": mysql_dir,
+            "MYSQL_BASE": mysql_dir,
+            
+            # Required paths for MySQL
+            "PATH": f"{os.path.join(mysql_dir, 'bin')};{os.environ.get('PATH', '')}",
+            
+            # MySQL-specific environment variables
+            "MYSQL_UNIX_PORT": os.path.join(mysql_dir, "tmp", "mysql.sock"),
+            "MYSQL_TCP_PORT": "3306",
+        }
+        
+        # Log the environment setup
+        self.log_to_console("🔧 MySQL environment variables:")
+        for key, value in mysql_env.items():
+            self.log_to_console(f"   {key} = {value}")
+        
+        return mysql_env
+
+    def _initialize_repack_mysql(self, mysqld_exe, mysql_dir):
+        """Run mysqld --initialize-insecure for the repack's MySQL, returns the completed process"""
+        self.log_to_console("🔧 Setting up MySQL environment variables...")
+        mysql_env = self._mysql_process_environment(mysql_dir)
+        
+        self.log_to_console("🚀 Starting MySQL initialization process...")
+        
+        # Run MySQL initialization command
+        cmd = [mysqld_exe, "--initialize-insecure"]
+        
+        # Add MySQL paths as environment variables
+        env = os.environ.copy()
+        env.update(mysql_env)
+        
+        self.log_to_console(f"📝 Running command: {' '.join(cmd)}")
+        self.log_to_console(f"🔧 Environment variables set: {list(mysql_env.keys())}")
+        
+        return subprocess.run(cmd, 
+                              cwd=mysql_dir,
+                              env=env,
+                              capture_output=True, 
+                              text=True, 
+                              timeout=300)  # 5 minute timeout
+
+    def _write_myini(self, myini_path):
+        """Write the repack's my.ini, returns its size in bytes"""
+        self.log_to_console(f"📝 Creating my.ini file at: {myini_path}")
+        # Write a new file and rename it over my.ini, so a my.ini hard linked elsewhere is never rewritten
+        temp_path = myini_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(MYINI_CONTENT)
+        os.replace(temp_path, myini_path)
+        
+        # Verify the file was created successfully
+        if not os.path.exists(myini_path):
+            raise Exception("File was not created successfully")
+        return os.path.getsize(myini_path)
+
+    def _install_data(self, data_dir, reporter=None):
+        """Download the latest data.zip and extract it into data_dir, returns False if cancelled.
+
+        DATA_MARKER_FILE is removed first and only written back once the extraction completed.
+        """
+        reporter = reporter or ProgressReporter()
+        self._remove_data_marker(data_dir)
+        
+        # Update status and progress
+        reporter.status("Getting latest release information...")
+        reporter.progress(10)
+        self.log_to_console("📥 Getting latest release information from wowgaming/client-data...")
+        
+        # Get the latest release download URL
+        download_url = self._get_latest_data_download_url()
+        self.log_to_console(f"✅ Found latest release: {download_url}")
+        
+        # Check for cancellation
+        if reporter.cancelled:
+            return False
+        
+        cache = self._get_download_cache()
+        
+        # Extract straight from the server while the archive is still arriving, unless a cached
+        # copy exists: the cache revalidates it and only downloads a data.zip that changed
+        if (not (cache and cache.contains(download_url)) and self._use_pipelined_data_download(download_url)
+                and self._stream_extract_data_zip(download_url, data_dir, reporter)):
+            return self._finish_data_install(data_dir, download_url, reporter)
+        
+        # Update status and progress
+        reporter.status("Downloading data.zip...")
+        reporter.progress(30)
+        self.log_to_console("📥 Downloading data.zip...")
+        
+        # Download the data.zip file
+        zip_file_path = self._download_data_zip(download_url, reporter)
+        self.log_to_console(f"✅ Downloaded data.zip: {zip_file_path}")
+        
+        # Check for cancellation
+        if reporter.cancelled:
+            # Clean up downloaded file if cancelled, cached copies stay for the next run
+            if not cache and os.path.exists(zip_file_path):
+                os.remove(zip_file_path)
+                self.log_to_console("🧹 Cleaned up partially downloaded file")
+                # Clean up temp directory if empty
+                temp_dir = os.path.dirname(zip_file_path)
+                try:
+                    if os.path.exists(temp_dir) and not os.listdir(temp_dir):
+                        os.rmdir(temp_dir)
+                        self.log_to_console(f"🧹 Cleaned up temp directory: {temp_dir}")
+                except OSError:
+                    pass
+            return False
+        
+        # Update status and progress
+        reporter.status("Extracting data to Repack/data...")
+        reporter.progress(60)
+        self.log_to_console("📦 Extracting data.zip to Repack/data...")
+        
+        # Extract the zip file
+        self._extract_data_zip(zip_file_path, data_dir, reporter)
+        self.log_to_console(f"✅ Extracted data to: {data_dir}")
+        
+        # Check for cancellation
+        if not self._finish_data_install(data_dir, download_url, reporter,
+                                         sha256=os.path.basename(zip_file_path) if cache else None):
+            return False
+        
+        if cache:
+            self.log_to_console("💾 data.zip kept in the download cache for the next run")
+        else:
+            # Clean up the zip file
+            os.remove(zip_file_path)
+            self.log_to_console("🧹 Cleaned up temporary zip file")
+            
+            # Clean up the temp directory if empty
+            temp_dir = os.path.dirname(zip_file_path)
+            if os.path.exists(temp_dir):
+                try:
+                    if not os.listdir(temp_dir):
+                        os.rmdir(temp_dir)
+                        self.log_to_console(f"🧹 Cleaned up temp directory: {temp_dir}")
+                    else:
+                        self.log_to_console(f"⚠️ Temp directory not empty, keeping: {temp_dir}")
+                except OSError as e:
+                    self.log_to_console(f"⚠️ Could not remove temp directory: {str(e)}")
+        
+        return True
+
+    def _remove_data_marker(self, data_dir):
+        try:
+            os.remove(os.path.join(data_dir, DATA_MARKER_FILE))
+        except FileNotFoundError:
+            pass
+
+    def _finish_data_install(self, data_dir, download_url, reporter, sha256=None):
+        """Write DATA_MARKER_FILE unless the extraction was cancelled, returns False if cancelled"""
+        if reporter.cancelled:
+            return False
+        marker = {"url": download_url, "sha256": sha256, "completed": time.time()}
+        with open(os.path.join(data_dir, DATA_MARKER_FILE), 'w', encoding='utf-8') as f:
+            json.dump(marker, f, indent=2)
+        return True
+
+    def _data_installed(self, data_dir):
+        """True when DATA_MARKER_FILE says an extraction into data_dir completed"""
+        try:
+            with open(os.path.join(data_dir, DATA_MARKER_FILE), 'r', encoding='utf-8') as f:
+                return bool(json.load(f).get("url"))
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    def _get_latest_data_download_url(self):
+        """Get the download URL for the latest data.zip from wowgaming/client-data releases or use configured URL"""
+        # Check if a custom data URL is configured
+        if hasattr(self, 'data_url') and self.data_url:
+            self.log_to_console(f"📡 Using configured data URL: {self.data_url}")
+            return self.data_url
+
+        # GitHub API URL for latest release
+        api_url = "https://api.github.com/repos/wowgaming/client-data/releases/latest"
+
+        self.log_to_console(f"📡 Fetching release info from: {api_url}")
+
+        try:
+            # Get the release information
+            release_data = http_client.get_json(api_url)
+
+            # Find the data.zip asset
+            for asset in release_data.get('assets', []):
+                if asset['name'] == 'data.zip':
+                    download_url = asset['browser_download_url']
+                    self.log_to_console(f"✅ Found data.zip download URL: {download_url}")
+                    return download_url
+
+            raise Exception("data.zip asset not found in latest release")
+
+        except Exception as e:
+            raise Exception(f"Failed to get latest release information: {str(e)}")
+
+    def _use_pipelined_data_download(self, download_url):
+        """Whether data.zip should be extracted while it downloads"""
+        if not self._load_config_value("data_pipelined_download", True):
+            return False
+        cache = self._get_download_cache()
+        if cache:
+            part_path = cache.partial_path(download_url) + ".part"
+        else:
+            part_path = os.path.join(self._get_app_dir(), "temp", "data.zip.part")
+        if os.path.exists(part_path):
+            # Resuming the partial file on disk is cheaper than starting over
+            self.log_to_console("🔁 Partial data.zip found, resuming the regular download instead of streaming")
+            return False
+        return True
+
+    def _stream_extract_data_zip(self, download_url, data_dir, reporter=None):
+        """Extract data.zip over HTTP range requests, returns False if the server does not support them"""
+        workers = self._load_config_value("data_download_connections", 4)
+        try:
+            workers = max(1, int(workers))
+        except (TypeError, ValueError):
+            workers = 4
+
+        try:
+            probe = HTTPRangeFile(download_url)
+        except RangeRequestsUnsupported as e:
+            self.log_to_console(f"⚠️ {str(e)}, falling back to download then extract")
+            return False
+        except Exception as e:
+            self.log_to_console(f"⚠️ Could not probe data.zip for streaming ({str(e)}), falling back to download then extract")
+            return False
+
+        archive_size = probe.size
+
+        os.makedirs(data_dir, exist_ok=True)
+        self.log_to_console(f"📥 Streaming data.zip ({archive_size:,} bytes) into {data_dir} over {workers} connections")
+        if reporter:
+            reporter.status("Downloading and extracting data.zip...")
+
+        # Received ranges are also assembled into a copy for the download cache
+        cache = self._get_download_cache()
+        assembler = RangeAssembler(cache.partial_path(download_url) + ".ranges", archive_size) if cache else None
+
+        start_time = time.time()
+        last_update = [0.0]
+        received = [0]
+        received_lock = threading.Lock()
+
+        def on_data(offset, chunk):
+            with received_lock:
+                received[0] += len(chunk)
+            if assembler:
+                assembler.write(offset, chunk)
+
+        def open_archive():
+            return HTTPRangeFile(download_url, size=archive_size, validator=probe.validator, on_data=on_data)
+
+        def report_progress(files_done, total_files, bytes_done, total_bytes):
+            # Throttle UI updates from the extraction workers
+            now = time.time()
+            if now - last_update[0] < 0.25 or not reporter or reporter.cancelled:
+                return
+            last_update[0] = now
+            speed = received[0] / max(now - start_time, 0.001) / (1024 * 1024)
+            status = (f"Downloading and extracting... {received[0] / (1024 * 1024):,.0f} / "
+                      f"{archive_size / (1024 * 1024):,.0f} MB, {files_done:,}/{total_files:,} files ({speed:.1f} MB/s)")
+            value = 30 + (bytes_done / max(total_bytes, 1)) * 65  # 30-95% for download and extraction
+            reporter.progress(value)
+            reporter.status(status)
+
+        try:
+            file_list = extract_zip_parallel(None, data_dir, workers=workers, progress=report_progress,
+                                              cancelled=lambda: bool(reporter and reporter.cancelled),
+                                              open_archive=open_archive)
+        except BaseException as e:
+            if assembler:
+                assembler.close()
+                os.remove(assembler.path)
+            if isinstance(e, ExtractionCancelled) or not isinstance(e, Exception):
+                raise
+            raise Exception(f"Failed to stream data.zip from {download_url}: {str(e)}")
+
+        self.log_to_console(f"📋 Extracted {len(file_list)} files from data.zip in {time.time() - start_time:.1f}s "
+                            f"({received[0]:,} bytes received)")
+        extracted_folders = sorted({file_path.split('/')[0] for file_path in file_list if '/' in file_path})
+        if extracted_folders:
+            self.log_to_console(f"📁 Extracted folders: {', '.join(extracted_folders)}")
+
+        if assembler:
+            self._cache_streamed_data_zip(download_url, probe, assembler)
+        return True
+
+    def _cache_streamed_data_zip(self, download_url, probe, assembler):
+        """Fetch the few bytes extraction skipped and store the assembled data.zip in the download cache"""
+        try:
+            gaps = assembler.missing()
+            if gaps:
+                with HTTPRangeFile(download_url, size=assembler.size, validator=probe.validator,
+                                   on_data=assembler.write) as remote:
+                    for start, end in gaps:
+                        remote.seek(start)
+                        remote.read(end - start)
+            assembler.close()
+            self._get_download_cache().add(download_url, assembler.path, probe.etag, probe.last_modified)
+            self.log_to_console(f"💾 Stored data.zip in the download cache ({len(gaps)} gap(s) filled)")
+        except Exception as e:
+            assembler.close()
+            if os.path.exists(assembler.path):
+                os.remove(assembler.path)
+            self.log_to_console(f"⚠️ Could not store data.zip in the download cache: {str(e)}")
+
+    def _download_data_zip(self, download_url, reporter=None):
+        """Download the data.zip file, streaming it to disk and resuming after interruptions.
+
+        With the download cache enabled the returned path is the cached copy, which must be kept.
+        """
+        cache = self._get_download_cache()
+        if cache:
+            zip_file_path = cache.partial_path(download_url)
+        else:
+            # Create temp directory for zip file
+            temp_dir = os.path.join(self._get_app_dir(), "temp")
+            os.makedirs(temp_dir, exist_ok=True)
+            zip_file_path = os.path.join(temp_dir, "data.zip")
+
+        self.log_to_console(f"📥 Downloading from: {download_url}")
+        if os.path.exists(zip_file_path + ".part"):
+            self.log_to_console(f"🔁 Found partial download ({os.path.getsize(zip_file_path + '.part'):,} bytes on disk)")
+
+        start_time = time.time()
+        last_update = [0.0]
+
+        def report_progress(downloaded, total):
+            # Throttle UI updates, the download itself runs at full speed
+            now = time.time()
+            if now - last_update[0] < 0.25 or not reporter or reporter.cancelled:
+                return
+            last_update[0] = now
+            speed = downloaded / max(now - start_time, 0.001) / (1024 * 1024)
+            if total:
+                status = f"Downloading data.zip... {downloaded / (1024 * 1024):,.0f} / {total / (1024 * 1024):,.0f} MB ({speed:.1f} MB/s)"
+                value = 30 + (downloaded / total) * 30  # 30-60% for the download
+                reporter.progress(value)
+            else:
+                status = f"Downloading data.zip... {downloaded / (1024 * 1024):,.0f} MB ({speed:.1f} MB/s)"
+            reporter.status(status)
+
+        try:
+            if cache:
+                zip_file_path = cache.fetch(download_url, progress=report_progress,
+                                            cancelled=lambda: bool(reporter and reporter.cancelled))
+            else:
+                download_file_resumable(download_url, zip_file_path, progress=report_progress,
+                                         cancelled=lambda: bool(reporter and reporter.cancelled))
+
+            # Verify the file was downloaded and has content
+            if os.path.exists(zip_file_path) and os.path.getsize(zip_file_path) > 0:
+                file_size = os.path.getsize(zip_file_path)
+                self.log_to_console(f"✅ data.zip downloaded successfully: {zip_file_path} ({file_size:,} bytes)")
+                return zip_file_path
+            else:
+                raise Exception("Downloaded data.zip file is empty or corrupted")
+
+        except DownloadCancelled:
+            self.log_to_console("💾 Partial data.zip kept on disk, the next download will resume it")
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to download data.zip from {download_url}: {str(e)}")
+
+    def _extract_data_zip(self, zip_file_path, data_dir, reporter=None):
+        """Extract the data.zip file to Repack/data directory"""
+        # Create data directory if it doesn't exist
+        os.makedirs(data_dir, exist_ok=True)
+
+        self.log_to_console(f"📦 Extracting {zip_file_path} to {data_dir}")
+
+        start_time = time.time()
+        last_update = [0.0]
+
+        def report_progress(files_done, total_files, bytes_done, total_bytes):
+            # Throttle UI updates from the extraction workers
+            now = time.time()
+            if now - last_update[0] < 0.25 or not reporter or reporter.cancelled:
+                return
+            last_update[0] = now
+            speed = bytes_done / max(now - start_time, 0.001) / (1024 * 1024)
+            status = f"Extracting data... {files_done:,}/{total_files:,} files ({speed:.1f} MB/s)"
+            value = 60 + (bytes_done / max(total_bytes, 1)) * 35  # 60-95% for the extraction
+            reporter.progress(value)
+            reporter.status(status)
+
+        try:
+            # Extract all files in parallel
+            file_list = extract_zip_parallel(zip_file_path, data_dir, progress=report_progress,
+                                              cancelled=lambda: bool(reporter and reporter.cancelled))
+            self.log_to_console(f"📋 Extracted {len(file_list)} files from data.zip in {time.time() - start_time:.1f}s")
+
+            # Log the extracted folders
+            extracted_folders = set()
+            for file_path in file_list:
+                if '/' in file_path:
+                    folder = file_path.split('/')[0]
+                    extracted_folders.add(folder)
+
+            if extracted_folders:
+                self.log_to_console(f"📁 Extracted folders: {', '.join(sorted(extracted_folders))}")
+
+        except ExtractionCancelled:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to extract data.zip: {str(e)}")
+
+    def _import_database_sql(self, sql_base_dir, mysql_details, root_credentials, reporter=None):
+        """Import the auth, characters and world SQL pipelines under sql_base_dir, returns the update ledger"""
+        reporter = reporter or ProgressReporter()
+        sql_engine = None
+        previous_max_allowed_packet = None
+        try:
+            # Reuse one connection per database for every file
+            sql_engine = self._open_sql_import_engine(mysql_details)
+            
+            # List databases once and answer existence checks from memory
+            self.schema_catalog = self._load_schema_catalog(mysql_details)
+            
+            # Define database paths (following PowerShell script structure)
+            auth_db_scripts_path = os.path.join(sql_base_dir, "base", "db_auth")
+            auth_db_update_scripts_path = os.path.join(sql_base_dir, "updates", "db_auth")
+            auth_db_pending_update_scripts_path = os.path.join(sql_base_dir, "updates", "pending_db_auth")
+            
+            character_db_scripts_path = os.path.join(sql_base_dir, "base", "db_characters")
+            character_db_update_scripts_path = os.path.join(sql_base_dir, "updates", "db_characters")
+            character_db_pending_update_scripts_path = os.path.join(sql_base_dir, "updates", "pending_db_characters")
+            
+            world_db_scripts_path = os.path.join(sql_base_dir, "base", "db_world")
+            world_db_update_scripts_path = os.path.join(sql_base_dir, "updates", "db_world")
+            world_db_pending_update_scripts_path = os.path.join(sql_base_dir, "updates", "pending_db_world")
+            
+            # Log the paths
+            self.log_to_console(f"📁 SQL base directory: {sql_base_dir}")
+            self.log_to_console(f"📁 Auth DB scripts: {auth_db_scripts_path}")
+            self.log_to_console(f"📁 Character DB scripts: {character_db_scripts_path}")
+            self.log_to_console(f"📁 World DB scripts: {world_db_scripts_path}")
+            
+            # Each database runs its own base → updates → pending pipeline; the databases are independent
+            pipelines = {
+                "acore_auth": [(auth_db_scripts_path, "BASE"), (auth_db_update_scripts_path, "RELEASED"), (auth_db_pending_update_scripts_path, "PENDING")],
+                "acore_characters": [(character_db_scripts_path, "BASE"), (character_db_update_scripts_path, "RELEASED"), (character_db_pending_update_scripts_path, "PENDING")],
+                "acore_world": [(world_db_scripts_path, "BASE"), (world_db_update_scripts_path, "RELEASED"), (world_db_pending_update_scripts_path, "PENDING")]
+            }
+            pipeline_files = {}
+            for database_name, scripts_paths in pipelines.items():
+                pipeline_files[database_name] = []
+                for scripts_path, state in scripts_paths:
+                    for sql_file in self._list_sql_scripts(scripts_path):
+                        pipeline_files[database_name].append((sql_file, state))
+            
+            # Files whose content is already recorded as applied are skipped
+            ledger = self._create_sql_update_ledger(mysql_details, sql_engine, sql_base_dir)
+            
+            # Opt-in bulk mode for the large base dumps
+            bulk_import = bool(self._load_config_value("sql_bulk_import", False))
+            if bulk_import:
+                self.log_to_console("⚡ Bulk import enabled for base dumps")
+                try:
+                    previous_max_allowed_packet = self._set_server_max_allowed_packet(
+                        mysql_details, root_credentials, SQL_BULK_MAX_ALLOWED_PACKET)
+                except Exception as e:
+                    self.log_to_console(f"⚠️ Could not raise max_allowed_packet: {str(e)}")
+            
+            total_files = sum(len(files) for files in pipeline_files.values())
+            workers = min(self._load_sql_import_workers(), len(pipelines))
+            self.log_to_console(f"🚀 Importing {total_files} SQL files with {workers} parallel database pipeline(s)")
+            reporter.status(f"Importing {total_files} SQL files...")
+            
+            # Progress is fed by real per-file completion across all pipelines
+            progress_lock = threading.Lock()
+            progress_state = {"done": 0}
+            
+            def file_done(database_name, sql_file):
+                with progress_lock:
+                    progress_state["done"] += 1
+                    done = progress_state["done"]
+                reporter.progress((done / max(total_files, 1)) * 100)
+                reporter.status(f"[{done}/{total_files}] {database_name}: {os.path.basename(sql_file)}")
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._import_sql_pipeline, database_name, sql_files,
+                                    mysql_details, root_credentials, sql_engine, ledger, file_done, bulk_import)
+                    for database_name, sql_files in pipeline_files.items()
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    # Re-raise pipeline errors in this thread
+                    future.result()
+            
+            return ledger
+            
+        finally:
+            self.schema_catalog = None
+            if sql_engine:
+                sql_engine.close()
+            if previous_max_allowed_packet is not None:
+                try:
+                    self._set_server_max_allowed_packet(mysql_details, root_credentials, previous_max_allowed_packet)
+                    self.log_to_console("🔧 Restored server max_allowed_packet")
+                except Exception as e:
+                    self.log_to_console(f"⚠️ Could not restore max_allowed_packet: {str(e)}")
+
+    def _open_sql_import_engine(self, mysql_details):
+        """Create a persistent-connection import engine, or None to fall back to the mysql client"""
+        if not PYMYSQL_AVAILABLE:
+            self.log_to_console("ℹ️ PyMySQL not installed - importing each file with the mysql client")
+            return None
+
+        self.log_to_console("⚡ Using persistent MySQL connections for SQL import")
+        return SQLImportEngine(mysql_details, log=self.log_to_console)
+
+    def _list_sql_scripts(self, scripts_path):
+        """List the SQL files of a scripts folder in import order"""
+        # Check if scripts path exists
+        if not os.path.exists(scripts_path):
+            self.log_to_console(f"⚠️ Scripts path does not exist: {scripts_path}")
+            return []
+
+        # Get all SQL files in the directory
+        sql_files = []
+        for file in os.listdir(scripts_path):
+            if file.lower().endswith('.sql'):
+                sql_files.append(os.path.join(scripts_path, file))
+
+        if not sql_files:
+            self.log_to_console(f"⚠️ No SQL files found in: {scripts_path}")
+            return []
+
+        # Sort files for consistent processing
+        sql_files.sort()
+
+        self.log_to_console(f"📚 Found {len(sql_files)} SQL files in {scripts_path}")
+        return sql_files
+
+    def _import_sql_pipeline(self, database_name, sql_files, mysql_details, root_credentials, sql_engine, ledger, on_file_done, bulk_import=False):
+        """Import one database's (sql_file, state) list strictly in order, reporting each finished file"""
+        try:
+            # Re-importing a base dump recreates its tables, so every later update must be applied again
+            base_reapplied = False
+
+            for sql_file, state in sql_files:
+                outcome = self._import_sql_file_incremental(database_name, sql_file, state, ledger, mysql_details,
+                                                            root_credentials, sql_engine, force=base_reapplied,
+                                                            bulk=bulk_import and state == "BASE")
+                if state == "BASE" and outcome == "applied":
+                    base_reapplied = True
+                on_file_done(database_name, sql_file)
+
+            self.log_to_console(f"✅ Finished {database_name} pipeline ({len(sql_files)} files)")
+
+        except Exception as e:
+            self.log_to_console(f"❌ Error importing SQL scripts for {database_name}: {str(e)}")
+            raise
+
+    def _import_sql_file_incremental(self, database_name, sql_file, state, ledger, mysql_details, root_credentials, sql_engine, force=False, bulk=False):
+        """Import a SQL file unless the ledger shows this exact content was already applied"""
+        ledger_name = ledger.file_name(sql_file)
+
+        # Only files the ledger already knows need hashing before the import; new files are hashed while importing
+        recorded_hash = None if force else ledger.recorded_hash(database_name, ledger_name)
+        if recorded_hash and self._analyze_sql_file(sql_file)["hash"] == recorded_hash:
+            ledger.count("skipped")
+            return "skipped"
+
+        start_time = time.time()
+        if not self._import_single_sql_file(database_name, sql_file, mysql_details, root_credentials, sql_engine, bulk=bulk):
+            ledger.count("failed")
+            return "failed"
+
+        file_hash = self._analyze_sql_file(sql_file)["hash"]
+        ledger.record(database_name, ledger_name, file_hash, state, (time.time() - start_time) * 1000)
+        ledger.count("applied")
+        return "applied"
+
+    def _create_sql_update_ledger(self, mysql_details, sql_engine, root_dir):
+        """Create the applied-file ledger for an import, names are stored relative to root_dir"""
+        if sql_engine:
+            run_query = sql_engine.query
+        else:
+            run_query = lambda database_name, sql: self._run_mysql_client_query(database_name, sql, mysql_details)
+        return SQLUpdateLedger(run_query, root_dir, log=self.log_to_console)
+
+    def _run_mysql_client_query(self, database_name, sql, mysql_details):
+        """Run one statement with the mysql client (optionally in a database), returns the result rows as tuples"""
+        mysql_exe = self._get_mysql_executable_path()
+        if not mysql_exe:
+            raise Exception("MySQL executable not found")
+
+        env = os.environ.copy()
+        env['MYSQL_PWD'] = mysql_details['password']
+
+        cmd = [
+            mysql_exe,
+            f"-h{mysql_details['host']}",
+            f"-P{mysql_details['port']}",
+            f"-u{mysql_details['user']}",
+            "-N", "-B",
+            "-e", sql
+        ]
+        if database_name:
+            cmd.append(database_name)
+
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, env=env)
+        if result.returncode != 0:
+            raise Exception(result.stderr.strip())
+
+        return [tuple(line.split("\t")) for line in result.stdout.splitlines() if line]
+
+    def _load_sql_import_workers(self):
+        """Load the number of parallel database import pipelines from configuration file"""
+        try:
+            # One pipeline per database by default
+            return max(1, int(self._load_config_value("sql_import_workers", 3)))
+        except (TypeError, ValueError):
+            return 3
+
+    def _sql_import_timeout(self, sql_file):
+        """Timeout for importing a file with the mysql client, scaled with the file size"""
+        return max(300, int(os.path.getsize(sql_file) / SQL_MIN_IMPORT_RATE))
+
+    def _set_server_max_allowed_packet(self, mysql_details, root_credentials, value):
+        """Set the server's global max_allowed_packet with root credentials, returns the previous value"""
+        root_details = dict(mysql_details, user=root_credentials['root_user'], password=root_credentials['root_password'])
+        rows = self._run_mysql_client_query(None, "SELECT @@GLOBAL.max_allowed_packet", root_details)
+        previous = int(rows[0][0])
+        self._run_mysql_client_query(None, f"SET GLOBAL max_allowed_packet = {int(value)}", root_details)
+        return previous
+
+    def _import_single_sql_file(self, database_name, sql_file, mysql_details, root_credentials=None, sql_engine=None, bulk=False):
+        """Import a single SQL file to the specified database, returns True on success"""
+        try:
+            cache_key = self._sql_analysis_key(sql_file)
+            analyzed = self._cached_sql_analysis(cache_key) is not None
+            if not sql_engine or analyzed:
+                # The mysql client reads the file itself, so its databases are needed up front
+                required_databases = self._detect_required_databases(sql_file)
+                if not self._ensure_required_databases(required_databases, sql_file, mysql_details, root_credentials):
+                    return False
+
+            self.log_to_console(f"📄 Importing {os.path.basename(sql_file)} to {database_name}...")
+
+            start_time = time.time()
+            rows = None
+            if sql_engine:
+                # Stream statements through the pooled connection (one transaction per file); unanalyzed
+                # files are analyzed and hashed by the same read, creating databases as they are referenced
+                analysis = None if analyzed else SQLScriptAnalysis()
+                on_databases = None if analyzed else (
+                    lambda names: self._ensure_required_databases(names, sql_file, mysql_details, root_credentials))
+                success, error_output, rows = sql_engine.import_file(database_name, sql_file, bulk=bulk,
+                                                                     analysis=analysis, on_databases=on_databases)
+                if success and analysis is not None:
+                    self._store_sql_analysis(cache_key, analysis.result())
+            else:
+                success, error_output = self._import_sql_file_with_client(database_name, sql_file, mysql_details, bulk=bulk)
+
+            if success:
+                self.log_to_console(f"✅ Successfully imported {os.path.basename(sql_file)} to {database_name}")
+                if bulk:
+                    self._log_import_throughput(sql_file, rows, time.time() - start_time)
+            else:
+                error_msg = f"Failed to import {os.path.basename(sql_file)}: {error_output}"
+                self.log_to_console(f"❌ {error_msg}")
+
+                # Check if error is related to missing database
+                if "Access denied" in error_output and "database" in error_output:
+                    self.log_to_console("💡 This error might be due to missing database permissions or database not existing")
+
+                # Don't raise exception for individual file failures, just log them
+
+            return success
+
+        except subprocess.TimeoutExpired:
+            self.log_to_console(f"⏰ Timeout importing {os.path.basename(sql_file)} - file may be too large")
+            return False
+        except Exception as e:
+            self.log_to_console(f"❌ Error importing {os.path.basename(sql_file)}: {str(e)}")
+            return False
+
+    def _import_sql_file_with_client(self, database_name, sql_file, mysql_details, bulk=False):
+        """Import a SQL file by piping it through the mysql client, returns (success, error_output)"""
+        # Get MySQL executable path
+        mysql_exe = self._get_mysql_executable_path()
+        if not mysql_exe:
+            raise Exception("MySQL executable not found")
+
+        # Prepare MySQL command using environment variable for password
+        env = os.environ.copy()
+        env['MYSQL_PWD'] = mysql_details['password']
+
+        cmd = [
+            mysql_exe,
+            f"-h{mysql_details['host']}",
+            f"-P{mysql_details['port']}",
+            f"-u{mysql_details['user']}"
+        ]
+        if bulk:
+            # The client commits each statement itself, so only the checks can be relaxed here
+            cmd.append(f"--max_allowed_packet={SQL_BULK_MAX_ALLOWED_PACKET}")
+            cmd.append("--init-command=SET SESSION unique_checks = 0, foreign_key_checks = 0")
+        cmd.append(database_name)
+
+        # Execute MySQL command with a timeout that grows with the file size
+        with open(sql_file, 'r', encoding='utf-8', errors='ignore') as f:
+            result = subprocess.run(cmd, stdin=f, capture_output=True, text=True,
+                                    timeout=self._sql_import_timeout(sql_file), env=env)
+
+        return result.returncode == 0, result.stderr
+
+    def _sql_analysis_key(self, sql_file):
+        """Analysis cache key of a SQL file: (path, size, mtime)"""
+        stat = os.stat(sql_file)
+        return (os.path.abspath(sql_file), stat.st_size, stat.st_mtime_ns)
+
+    def _cached_sql_analysis(self, cache_key):
+        with self._sql_analysis_lock:
+            return self._sql_analysis_cache.get(cache_key)
+
+    def _store_sql_analysis(self, cache_key, analysis):
+        with self._sql_analysis_lock:
+            self._sql_analysis_cache[cache_key] = analysis
+
+    def _analyze_sql_file(self, sql_file):
+        """Tokenize and hash a SQL file in one read and cache its analysis by (path, size, mtime)"""
+        cache_key = self._sql_analysis_key(sql_file)
+        analysis = self._cached_sql_analysis(cache_key)
+        if analysis is None:
+            analysis = analyze_sql_file(sql_file)
+            self._store_sql_analysis(cache_key, analysis)
+        return analysis
+
+    def _log_import_throughput(self, sql_file, rows, elapsed):
+        """Log rows/s and MB/s for a bulk-loaded file"""
+        elapsed = max(elapsed, 0.001)
+        size_mb = os.path.getsize(sql_file) / (1024 * 1024)
+        message = f"⚡ Bulk-loaded {os.path.basename(sql_file)}: {size_mb:.1f} MB in {elapsed:.1f}s ({size_mb / elapsed:.1f} MB/s"
+        if rows is not None:
+            message += f", {rows / elapsed:,.0f} rows/s"
+        self.log_to_console(message + ")")
+
+    def _ensure_required_databases(self, required_databases, sql_file, mysql_details, root_credentials):
+        """Create any of the required databases that don't exist, returns False when one cannot be created"""
+        for required_db in required_databases:
+            if not self._database_exists(required_db, mysql_details):
+                if root_credentials and root_credentials.get("create", False):
+                    self.log_to_console(f"🗃️ Creating database '{required_db}' using root privileges...")
+                    self._create_database(required_db, mysql_details, root_credentials)
+                else:
+                    self.log_to_console(f"⚠️ Skipping {os.path.basename(sql_file)} - database {required_db} not created (no root credentials)")
+                    return False
+        return True
+
+    def _detect_required_databases(self, sql_file):
+        """Detect databases that the SQL file requires"""
+        try:
+            required_databases = self._analyze_sql_file(sql_file)["databases"]
+
+            if required_databases:
+                self.log_to_console(f"🔍 Detected required databases in {os.path.basename(sql_file)}: {', '.join(required_databases)}")
+
+            return list(required_databases)
+
+        except Exception as e:
+            self.log_to_console(f"⚠️ Could not analyze SQL file {os.path.basename(sql_file)}: {str(e)}")
+            return []
+
+    def _load_schema_catalog(self, mysql_details):
+        """List the server's databases once for the current import session"""
+        try:
+            mysql_exe = self._get_mysql_executable_path()
+            if not mysql_exe:
+                return None
+
+            env = os.environ.copy()
+            env['MYSQL_PWD'] = mysql_details['password']
+
+            # -N -B prints bare database names, one per line
+            cmd = [
+                mysql_exe,
+                f"-h{mysql_details['host']}",
+                f"-P{mysql_details['port']}",
+                f"-u{mysql_details['user']}",
+                "-N", "-B",
+                "-e", "SHOW DATABASES;"
+            ]
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, env=env)
+
+            if result.returncode != 0:
+                self.log_to_console(f"⚠️ Could not list databases, checking each one individually: {result.stderr}")
+                return None
+
+            catalog = SchemaCatalog(line.strip() for line in result.stdout.splitlines() if line.strip())
+            self.log_to_console(f"📋 Cached {len(catalog)} existing databases for this import")
+            return catalog
+
+        except Exception as e:
+            self.log_to_console(f"⚠️ Could not list databases, checking each one individually: {str(e)}")
+            return None
+
+    def _database_exists(self, database_name, mysql_details):
+        """Check if a database exists"""
+        # Answer from the session catalog when one is loaded
+        catalog = self.schema_catalog
+        if catalog is not None:
+            exists = catalog.exists(database_name)
+            if not exists:
+                self.log_to_console(f"❌ Database '{database_name}' does not exist")
+            return exists
+
+        try:
+            mysql_exe = self._get_mysql_executable_path()
+            if not mysql_exe:
+                return False
+
+            # Use environment variable for password
+            import os
+            env = os.environ.copy()
+            env['MYSQL_PWD'] = mysql_details['password']
+
+            # Use SHOW DATABASES to check if database exists
+            cmd = [
+                mysql_exe,
+                f"-h{mysql_details['host']}",
+                f"-P{mysql_details['port']}",
+                f"-u{mysql_details['user']}",
+                "-e", f"SHOW DATABASES LIKE '{database_name}';"
+            ]
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, env=env)
+
+            if result.returncode == 0:
+                exists = database_name in result.stdout
+                if exists:
+                    self.log_to_console(f"✅ Database '{database_name}' exists")
+                else:
+                    self.log_to_console(f"❌ Database '{database_name}' does not exist")
+                return exists
+            else:
+                self.log_to_console(f"⚠️ Could not check if database '{database_name}' exists: {result.stderr}")
+                return False
+
+        except Exception as e:
+            self.log_to_console(f"⚠️ Error checking database '{database_name}': {str(e)}")
+            return False
+
+    def _create_database(self, database_name, mysql_details, root_credentials):
+        """Create a new database using root credentials and grant permissions to acore user"""
+        try:
+            mysql_exe = self._get_mysql_executable_path()
+            if not mysql_exe:
+                raise Exception("MySQL executable not found")
+
+            self.log_to_console(f"🗃️ Creating database '{database_name}' using root privileges...")
+
+            # Create database command using root credentials
+            import os
+            env = os.environ.copy()
+            env['MYSQL_PWD'] = root_credentials['root_password']
+
+            # Step 1: Create the database using root
+            sql_command = f"CREATE DATABASE IF NOT EXISTS `{database_name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;"
+            cmd = [
+                mysql_exe,
+                f"-h{mysql_details['host']}",
+                f"-P{mysql_details['port']}",
+                f"-u{root_credentials['root_user']}",
+                "-e", sql_command
+            ]
+
+            self.log_to_console(f"🔧 Creating database with root: {' '.join(cmd)}")
+            self.log_to_console(f"🔧 SQL Command: {sql_command}")
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, env=env)
+
+            if result.returncode != 0:
+                error_msg = f"Failed to create database '{database_name}': {result.stderr}"
+                self.log_to_console(f"❌ {error_msg}")
+                return False
+
+            self.log_to_console(f"✅ Successfully created database '{database_name}' with root privileges")
+
+            # Keep the session catalog in sync
+            catalog = self.schema_catalog
+            if catalog is not None:
+                catalog.add(database_name)
+
+            # Step 2: Grant all privileges on the new database to the acore user
+            acore_user = mysql_details['user']
+            grant_commands = [
+                f"GRANT ALL PRIVILEGES ON `{database_name}`.* TO '{acore_user}'@'localhost';",
+                f"GRANT ALL PRIVILEGES ON `{database_name}`.* TO '{acore_user}'@'%';",
+                "FLUSH PRIVILEGES;"
+            ]
+
+            for grant_cmd in grant_commands:
+                grant_sql = grant_cmd
+                grant_command = [
+                    mysql_exe,
+                    f"-h{mysql_details['host']}",
+                    f"-P{mysql_details['port']}",
+                    f"-u{root_credentials['root_user']}",
+                    "-e", grant_sql
+                ]
+
+                self.log_to_console(f"🔧 Granting permissions: {grant_sql}")
+                grant_result = subprocess.run(grant_command, capture_output=True, text=True, timeout=30, env=env)
+
+                if grant_result.returncode == 0:
+                    self.log_to_console(f"✅ Successfully granted permissions for '{acore_user}' on '{database_name}'")
+                else:
+                    self.log_to_console(f"⚠️ Warning: Could not grant permissions: {grant_result.stderr}")
+
+            self.log_to_console(f"🎉 Database '{database_name}' created and configured for '{acore_user}' access")
+            return True
+
+        except Exception as e:
+            self.log_to_console(f"❌ Error creating database '{database_name}': {str(e)}")
+            return False
+
+    def _get_mysql_executable_path(self):
+        """Get MySQL executable path from Repack folder first, then fallback to system locations"""
+        # First priority: Check Repack/mysql/bin directory
+        app_dir = self._get_app_dir()
+        repack_mysql_bin = os.path.join(app_dir, "Repack", "mysql", "bin", "mysql.exe")
+
+        self.log_to_console(f"🔍 Checking Repack MySQL path: {repack_mysql_bin}")
+        if os.path.exists(repack_mysql_bin):
+            self.log_to_console(f"✅ Using Repack MySQL executable: {repack_mysql_bin}")
+            return repack_mysql_bin
+
+        # Second priority: Check if MySQL is detected in requirements
+        mysql_requirement = getattr(self, "requirements", {}).get("MySQL", {})
+        if mysql_requirement.get("detected") and mysql_requirement.get("path"):
+            mysql_path = mysql_requirement["path"]
+            self.log_to_console(f"🔍 MySQL detected path: {mysql_path}")
+
+            # If it's pointing to mysql.exe, use it directly
+            if mysql_path.endswith("mysql.exe"):
+                if os.path.exists(mysql_path):
+                    self.log_to_console(f"✅ Using MySQL executable: {mysql_path}")
+                    return mysql_path
+            # If it's pointing to bin directory, look for mysql.exe
+            elif mysql_path.endswith("bin"):
+                mysql_exe = os.path.join(mysql_path, "mysql.exe")
+                if os.path.exists(mysql_exe):
+                    self.log_to_console(f"✅ Using MySQL executable: {mysql_exe}")
+                    return mysql_exe
+
+        # Third priority: Check common MySQL installation paths
+        self.log_to_console("🔍 Checking common MySQL installation paths...")
+        common_paths = [
+            r"C:\Program Files\MySQL\MySQL Server 8.0\bin\mysql.exe",
+            r"C:\Program Files\MySQL\MySQL Server 8.4\bin\mysql.exe",
+            r"C:\Program Files (x86)\MySQL\MySQL Server 8.0\bin\mysql.exe",
+            r"C:\Program Files (x86)\MySQL\MySQL Server 8.4\bin\mysql.exe"
+        ]
+
+        for path in common_paths:
+            self.log_to_console(f"🔍 Checking: {path}")
+            if os.path.exists(path):
+                self.log_to_console(f"✅ Found MySQL executable at: {path}")
+                return path
+
+        # Last resort: Check if mysql is in PATH
+        try:
+            result = subprocess.run(["mysql", "--version"], capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                self.log_to_console("✅ MySQL found in system PATH")
+                return "mysql"
+        except:
+            pass
+
+        self.log_to_console("❌ No MySQL executable found")
+        return None
+
+    def _repack_task_graph(self, include_mysql=True, include_data=False, sql=None, config_paths=None, reporter_for=None):
+        """Describe Create Repack → ... → Import SQL as a TaskGraph of the repack steps.
+
+        ``sql`` is (sql_base_dir, mysql_details, root_credentials) to add the SQL import,
+        ``config_paths`` is (data_dir, logs_dir, mysql_exe) and ``reporter_for(name)``
+        returns the ProgressReporter for a task.
+        """
+        reporter_for = reporter_for or (lambda name: ProgressReporter())
+        app_dir = self._get_app_dir()
+        build_bin_dir = os.path.join(app_dir, "Build", "bin", "RelWithDebInfo")
+        repack_dir = os.path.join(app_dir, "Repack")
+        configs_dir = os.path.join(repack_dir, "configs")
+        mysql_dir = os.path.join(repack_dir, "mysql")
+        mysqld_exe = os.path.join(mysql_dir, "bin", "mysqld.exe")
+        myini_path = os.path.join(mysql_dir, "my.ini")
+        data_dir = os.path.join(repack_dir, "data")
+        data_dir_name, logs_dir_name, mysql_exe = config_paths or ("Data", "Logs", ".\\mysql\\bin\\mysql.exe")
+        repack_items = ("authserver.exe", "worldserver.exe", "configs", "lua_scripts")
+        
+        def existing(paths):
+            return [path for path in paths if os.path.exists(path)]
+        
+        def copies_up_to_date(sources, target_dir):
+            # Walks directories too, so a changed file deep in lua_scripts or the DLLs is noticed
+            return all(tree_unchanged(source, os.path.join(target_dir, os.path.basename(source)))
+                       for source in sources)
+        
+        def conf_files():
+            return [(name, os.path.join(configs_dir, name)) for name in ("worldserver.conf", "authserver.conf")
+                    if os.path.exists(os.path.join(configs_dir, name))]
+        
+        def conf_dist_files():
+            found = []
+            for root, dirs, files in os.walk(configs_dir):
+                found.extend(os.path.join(root, file) for file in files if file.endswith('.conf.dist'))
+            return found
+        
+        def repack_up_to_date():
+            sources = existing(os.path.join(build_bin_dir, item) for item in repack_items)
+            return bool(sources) and copies_up_to_date(sources, repack_dir)
+        
+        def run_repack():
+            if not os.path.exists(build_bin_dir):
+                raise Exception(f"Build bin folder not found at {build_bin_dir}")
+            copied_items, missing_items, failed_files = self._assemble_repack(repack_dir, build_bin_dir)
+            return bool(copied_items) and not failed_files
+        
+        def configs_up_to_date():
+            dist_files = conf_dist_files()
+            return bool(dist_files) and all(os.path.exists(path[:-len('.dist')]) for path in dist_files)
+        
+        def run_configs():
+            dist_files, transformed_count, failed_files = self._create_config_files(configs_dir)
+            return bool(dist_files) and not failed_files
+        
+        def config_paths_up_to_date():
+            files = conf_files()
+            if not files:
+                return False
+            for name, path in files:
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                if any(placeholder in content for placeholder in CONFIG_PATH_PLACEHOLDERS):
+                    return False
+            return True
+        
+        def run_config_paths():
+            files = conf_files()
+            if not files:
+                raise Exception("Neither worldserver.conf nor authserver.conf found")
+            self._update_config_paths(files, data_dir_name, logs_dir_name, mysql_exe)
+        
+        def mysql_up_to_date():
+            mysql_path = self._find_mysql_path()
+            return (bool(mysql_path) and os.path.exists(mysqld_exe)
+                    and tree_unchanged(mysql_path, mysql_dir, skip=self._repack_mysql_filter()))
+        
+        def run_mysql():
+            mysql_path = self._find_mysql_path()
+            if not mysql_path:
+                raise Exception("MySQL installation not found")
+            self.log_to_console(f"✅ Found MySQL installation at: {mysql_path}")
+            self._copy_repack_mysql(mysql_path, mysql_dir, reporter_for("mysql"))
+        
+        def dll_files():
+            openssl_path = self._find_openssl_path()
+            mysql_path = self._find_mysql_path()
+            if not openssl_path or not mysql_path:
+                raise Exception("OpenSSL installation not found" if not openssl_path else "MySQL installation not found")
+            return self._repack_dll_files(openssl_path, mysql_path)
+        
+        def dlls_up_to_date():
+            try:
+                sources = existing(dll["source_path"] for dll in dll_files())
+            except Exception:
+                return False
+            return bool(sources) and copies_up_to_date(sources, repack_dir)
+        
+        def run_dlls():
+            available = [dll for dll in dll_files() if os.path.exists(dll["source_path"])]
+            for dll in dll_files():
+                if dll not in available:
+                    self.log_to_console(f"⚠️ Missing: {dll['name']} at {dll['source_path']}")
+            copied_files, failed_files = self._copy_repack_dlls(available, repack_dir, reporter_for("dlls"))
+            return bool(copied_files) and not failed_files
+        
+        def init_mysql_up_to_date():
+            data = os.path.join(mysql_dir, "data")
+            return os.path.isdir(data) and bool(os.listdir(data))
+        
+        def run_init_mysql():
+            if not os.path.exists(mysqld_exe):
+                raise Exception(f"mysqld.exe not found at {mysqld_exe}")
+            self._create_mysql_directories(mysql_dir)
+            result = self._initialize_repack_mysql(mysqld_exe, mysql_dir)
+            if result.returncode != 0:
+                self.log_to_console(f"❌ MySQL initialization failed with return code: {result.returncode}")
+                if result.stderr:
+                    self.log_to_console(f"❌ Error output: {result.stderr}")
+                return False
+            self.log_to_console("✅ MySQL initialization completed successfully!")
+        
+        def run_myini():
+            self._write_myini(myini_path)
+            self.log_to_console("✅ my.ini file created successfully!")
+        
+        def data_up_to_date():
+            return self._data_installed(data_dir)
+        
+        tasks = [
+            Task("repack", run_repack, up_to_date=repack_up_to_date, title="Create Repack"),
+            Task("configs", run_configs, deps=("repack",), up_to_date=configs_up_to_date, title="Create configs"),
+            Task("config_paths", run_config_paths, deps=("configs",), up_to_date=config_paths_up_to_date,
+                 title="Config paths"),
+        ]
+        if include_mysql:
+            tasks += [
+                Task("mysql", run_mysql, deps=("repack",), up_to_date=mysql_up_to_date, title="Create MySQL"),
+                Task("dlls", run_dlls, deps=("repack",), up_to_date=dlls_up_to_date, title="Create DLL's"),
+                Task("init_mysql", run_init_mysql, deps=("mysql",), up_to_date=init_mysql_up_to_date,
+                     title="Initialize MySQL"),
+                # mysqld reads my.ini from its base directory, so it is written after initialization
+                Task("myini", run_myini, deps=("init_mysql",), outputs=(myini_path,), title="Create My.ini"),
+            ]
+        if include_data:
+            tasks.append(Task("data", lambda: self._install_data(data_dir, reporter_for("data")),
+                              deps=("repack",), up_to_date=data_up_to_date, title="Get data"))
+        if sql:
+            sql_base_dir, mysql_details, root_credentials = sql
+            
+            def run_sql():
+                ledger = self._import_database_sql(sql_base_dir, mysql_details, root_credentials, reporter_for("sql"))
+                self.log_to_console(f"✅ Database SQL import completed successfully! ({ledger.summary()})")
+            
+            # The import needs the repack's MySQL fully set up (or at least the repack) before it starts;
+            # already applied files are skipped by the update ledger, so the task always runs
+            tasks.append(Task("sql", run_sql, deps=("myini",) if include_mysql else ("repack",),
+                              up_to_date=lambda: False, title="Import SQL"))
+        return TaskGraph(tasks)
+
+    def _run_task_graph(self, graph, force=False, cancelled=None, on_event=None):
+        """Run a task graph with repack_workers threads and log timings, returns the results"""
+        try:
+            workers = max(1, int(self._load_config_value("repack_workers", 4)))
+        except (TypeError, ValueError):
+            workers = 4
+        self.log_to_console(f"🚀 Running {len(graph.tasks)} repack tasks with up to {workers} in parallel")
+        started = time.time()
+        results = graph.run(max_workers=workers, force=force, cancelled=cancelled,
+                            on_event=on_event, log=self.log_to_console)
+        path, path_seconds = graph.critical_path(results)
+        titles = [graph.tasks[name].title for name in path]
+        self.log_to_console(f"⏱️ Repack tasks finished in {time.time() - started:.1f}s "
+                            f"(critical path {path_seconds:.1f}s: {' → '.join(titles)})")
+        return results
@@ -0,0 +1,580 @@
+"""Streaming SQL tokenizer, import engine and update bookkeeping"""
+
+import io
+import os
+import re
+import hashlib
+import threading
+
+# Try to import PyMySQL for persistent-connection SQL import
+try:
+    import pymysql
+    PYMYSQL_AVAILABLE = True
+except ImportError:
+    PYMYSQL_AVAILABLE = False
+
+
+# Text read from SQL files per chunk by the streaming tokenizer
+_SQL_CHUNK_SIZE = 1024 * 1024
+
+# max_allowed_packet used while bulk-loading base dumps
+SQL_BULK_MAX_ALLOWED_PACKET = 1024 * 1024 * 1024
+
+# Slowest import rate assumed when sizing mysql client timeouts (bytes per second)
+SQL_MIN_IMPORT_RATE = 256 * 1024
+
+# Quoted strings/identifiers; doubled quotes are escapes, so a quote never closes before another one
+_SQL_QUOTE_PATTERNS = {
+    "'": re.compile(r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'(?!')", re.S),
+    '"': re.compile(r'"[^"\\]*(?:(?:\\.|"")[^"\\]*)*"(?!")', re.S),
+    "`": re.compile(r"`[^`]*(?:``[^`]*)*`(?!`)", re.S),
+}
+# Backtick identifiers are captured so that _blank_sql_literals can keep them
+_SQL_LITERAL_RE = re.compile(
+    "(" + _SQL_QUOTE_PATTERNS["`"].pattern + ")|" + _SQL_QUOTE_PATTERNS["'"].pattern + "|" + _SQL_QUOTE_PATTERNS['"'].pattern,
+    re.S
+)
+
+# USE / CREATE DATABASE / database-qualified INSERT, UPDATE and FROM references
+_SQL_DATABASE_REFERENCE_RE = re.compile(
+    r"\bUSE\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?"
+    r"|\bCREATE\s+DATABASE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?"
+    r"|\b(?:INSERT\s+INTO|UPDATE|FROM)\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.",
+    re.IGNORECASE
+)
+
+# Keywords used to route module SQL files outside auth/character/world folders, in priority order
+_SQL_TARGET_KEYWORDS = [
+    ("acore_auth", ['acore_auth', 'auth', 'account', 'login']),
+    ("acore_characters", ['acore_characters', 'character', 'player', 'inventory']),
+    ("acore_world", ['acore_world', 'world', 'creature', 'gameobject', 'quest'])
+]
+
+# MySQL system databases and SQL keywords that are never treated as required databases
+_SQL_IGNORED_DATABASE_NAMES = {'mysql', 'information_schema', 'performance_schema', 'sys'} | {'if', 'not', 'exists', 'where', 'from', 'into', 'update', 'select', 'insert', 'delete', 'create', 'drop', 'alter', 'table', 'database', 'index', 'view', 'procedure', 'function', 'trigger', 'event', 'user', 'grant', 'revoke', 'show', 'describe', 'explain', 'use', 'set', 'declare', 'begin', 'end', 'case', 'when', 'then', 'else', 'loop', 'while', 'repeat', 'until', 'leave', 'iterate', 'return', 'call', 'load', 'replace', 'values', 'default', 'null', 'auto_increment', 'primary', 'key', 'unique', 'index', 'foreign', 'references', 'constraint', 'check', 'cascade', 'restrict', 'no', 'action', 'on', 'off', 'true', 'false', 'and', 'or', 'in', 'like', 'between', 'is', 'as', 'order', 'by', 'group', 'having', 'limit', 'offset', 'union', 'all', 'distinct', 'asc', 'desc', 'inner', 'left', 'right', 'outer', 'join', 'cross', 'natural', 'using', 'with', 'recursive', 'window', 'over', 'partition', 'rows', 'range', 'preceding', 'following', 'current', 'row', 'unbounded', 'first', 'last', 'value', 'lag', 'lead', 'rank', 'dense_rank', 'row_number', 'percent_rank', 'cume_dist', 'ntile', 'first_value', 'last_value', 'nth_value'}
+
+
+def _sql_special_pattern(delimiter):
+    """Pattern matching every character the tokenizer has to look at"""
+    return re.compile("[" + re.escape("'\"`#-/" + delimiter[0]) + "]")
+
+
+def _sql_run_pattern(delimiter):
+    """Pattern consuming plain text and complete quoted strings in one step (the fast path for data)"""
+    # A quote only counts as complete when the next character is known, so runs never end mid-token
+    return re.compile(
+        "(?:[^" + re.escape("'\"`#-/" + delimiter[0]) + "]+"
+        r"|'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'(?=[^'])"
+        r'|"[^"\\]*(?:(?:\\.|"")[^"\\]*)*"(?=[^"])'
+        r"|`[^`]*(?:``[^`]*)*`(?=[^`]))+",
+        re.S
+    )
+
+
+def _blank_sql_literals(text):
+    """Remove string literals while keeping backtick identifiers"""
+    return _SQL_LITERAL_RE.sub(r"\1", text)
+
+
+def iter_sql_statements(stream, collect_code=False, chunk_size=_SQL_CHUNK_SIZE):
+    """Yield (statement, code) pairs from a SQL script stream, reading it in chunks.
+
+    Quotes, comments and client-side DELIMITER commands are honoured. When
+    collect_code is set, code is the statement with comments and string literals
+    removed, so references can be matched without hits inside data;
+    otherwise it is None.
+    """
+    delimiter = ";"
+    special_re = _sql_special_pattern(delimiter)
+    run_re = _sql_run_pattern(delimiter)
+    buffer = ""
+    eof = False
+    start = 0
+    pos = 0
+    has_code = False
+    code_parts = []
+
+    while True:
+        if not eof:
+            chunk = stream.read(chunk_size)
+            if chunk:
+                # Drop text of statements that were already yielded
+                buffer = buffer[start:] + chunk
+                pos -= start
+                start = 0
+            else:
+                eof = True
+        length = len(buffer)
+
+        # Every "break" below means the token may continue in the next chunk
+        while pos < length:
+            if has_code:
+                # Inside a statement: skip plain text and quoted data in a single regex step
+                run = run_re.match(buffer, pos)
+                if run:
+                    if collect_code:
+                        code_parts.append(_blank_sql_literals(run.group(0)))
+                    pos = run.end()
+                    if pos >= length:
+                        continue
+
+            match = special_re.search(buffer, pos)
+            if not match and not eof:
+                if has_code:
+                    if collect_code:
+                        code_parts.append(buffer[pos:])
+                    pos = length
+                break
+            gap_end = match.start() if match else length
+
+            # Plain text between special characters - may hold a DELIMITER command
+            gap = buffer[pos:gap_end]
+            stripped = gap.lstrip()
+            if stripped:
+                if not has_code and stripped[:9].upper() == "DELIMITER" and stripped[9:10].isspace():
+                    command_start = gap_end - len(stripped)
+                    line_end = buffer.find("\n", command_start)
+                    if line_end == -1:
+                        if not eof:
+                            break
+                        line_end = length
+                    new_delimiter = buffer[command_start + 9:line_end].strip()
+                    if new_delimiter:
+                        delimiter = new_delimiter
+                        special_re = _sql_special_pattern(delimiter)
+                        run_re = _sql_run_pattern(delimiter)
+                    start = pos = min(line_end + 1, length)
+                    code_parts = []
+                    continue
+                has_code = True
+            if collect_code and has_code:
+                code_parts.append(gap)
+            pos = gap_end
+
+            if not match:
+                break
+
+            char = buffer[pos]
+            if char in "'\"`":
+                # Quoted string or identifier - a match ending at the buffer end may be a doubled quote
+                quote_match = _SQL_QUOTE_PATTERNS[char].match(buffer, pos)
+                if (not quote_match or quote_match.end() >= length) and not eof:
+                    break
+                end = quote_match.end() if quote_match else length
+                if collect_code:
+                    code_parts.append(buffer[pos:end] if char == "`" else "")
+                has_code = True
+                pos = end
+                continue
+
+            if char in "/-" and pos + 2 >= length and not eof:
+                break
+
+            if buffer.startswith("/*", pos):
+                comment_end = buffer.find("*/", pos + 2)
+                if comment_end == -1:
+                    if not eof:
+                        break
+                    comment_end = length
+                if buffer.startswith("/*!", pos):
+                    # Versioned comments are executed by the server
+                    has_code = True
+                if collect_code:
+                    code_parts.append(" ")
+                pos = comment_end + 2
+                continue
+
+            if char == "#" or (buffer.startswith("--", pos) and buffer[pos + 2:pos + 3] in ("", " ", "\t", "\r", "\n")):
+                line_end = buffer.find("\n", pos)
+                if line_end == -1:
+                    if not eof:
+                        break
+                    line_end = length
+                if collect_code:
+                    code_parts.append(" ")
+                pos = line_end
+                continue
+
+            if buffer.startswith(delimiter, pos):
+                if has_code:
+                    yield buffer[start:pos].strip(), ("".join(code_parts) if collect_code else None)
+                pos += len(delimiter)
+                start = pos
+                has_code = False
+                code_parts = []
+                continue
+
+            if not eof and length - pos < len(delimiter) and delimiter.startswith(buffer[pos:]):
+                break
+
+            if collect_code:
+                code_parts.append(char)
+            has_code = True
+            pos += 1
+
+        if eof:
+            break
+
+    if has_code and buffer[start:].strip():
+        yield buffer[start:].strip(), ("".join(code_parts) if collect_code else None)
+
+
+class SQLScriptAnalysis:
+    """Database references and likely target database of a SQL script, collected statement by statement"""
+
+    def __init__(self):
+        self.databases = set()
+        self.statements = 0
+        self.hash = None
+        self._matched_targets = set()
+
+    def add(self, code):
+        """Feed one statement's code (comments and literals removed), returns databases it references first"""
+        self.statements += 1
+
+        referenced = set()
+        for groups in _SQL_DATABASE_REFERENCE_RE.findall(code):
+            referenced.update(name for name in groups if name and name.lower() not in _SQL_IGNORED_DATABASE_NAMES)
+        new_databases = sorted(referenced - self.databases)
+        self.databases.update(new_databases)
+
+        lowered = code.lower()
+        for database_name, keywords in _SQL_TARGET_KEYWORDS:
+            if database_name not in self._matched_targets and any(keyword in lowered for keyword in keywords):
+                self._matched_targets.add(database_name)
+        return new_databases
+
+    def result(self):
+        """Analysis as a dict with databases, target_database, statements and hash (None for streams)"""
+        # Default to acore_world for files without recognizable keywords
+        target_database = "acore_world"
+        for database_name, keywords in _SQL_TARGET_KEYWORDS:
+            if database_name in self._matched_targets:
+                target_database = database_name
+                break
+
+        return {
+            "databases": sorted(self.databases),
+            "target_database": target_database,
+            "statements": self.statements,
+            "hash": self.hash
+        }
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw reader that feeds every byte it reads into a digest"""
+
+    def __init__(self, raw, digest):
+        self._raw = raw
+        self._digest = digest
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self._raw.readinto(buffer)
+        if count:
+            self._digest.update(memoryview(buffer)[:count])
+        return count
+
+    def close(self):
+        self._raw.close()
+        super().close()
+
+
+def iter_sql_file(sql_file, analysis=None):
+    """Yield (statement, new_databases) from a single read of a SQL file.
+
+    The same read feeds the tokenizer, the SHA-1 of the raw content and, when
+    given, a SQLScriptAnalysis; new_databases are the databases a statement
+    references for the first time, so they can be created before it runs.
+    analysis.hash is set once the file has been read to the end.
+    """
+    sha1 = hashlib.sha1()
+    raw = _HashingReader(open(sql_file, 'rb', buffering=0), sha1)
+    with io.TextIOWrapper(io.BufferedReader(raw, _SQL_CHUNK_SIZE), encoding='utf-8', errors='ignore') as f:
+        for statement, code in iter_sql_statements(f, collect_code=analysis is not None):
+            yield statement, (analysis.add(code) if analysis is not None else [])
+    if analysis is not None:
+        analysis.hash = sha1.hexdigest().upper()
+
+
+def analyze_sql_stream(stream):
+    """Collect referenced databases and the likely target database of a SQL script in one pass"""
+    analysis = SQLScriptAnalysis()
+    for statement, code in iter_sql_statements(stream, collect_code=True):
+        analysis.add(code)
+    return analysis.result()
+
+
+def analyze_sql_file(sql_file):
+    """Analysis of a SQL file including the SHA-1 of its content, from one read"""
+    analysis = SQLScriptAnalysis()
+    for _ in iter_sql_file(sql_file, analysis):
+        pass
+    return analysis.result()
+
+
+class SQLImportEngine:
+    """Stream SQL files through one persistent connection per database"""
+
+    def __init__(self, mysql_details, log=print):
+        self.mysql_details = mysql_details
+        self.log = log
+        self._connections = {}
+        self._locks = {}
+        self._pool_lock = threading.Lock()
+
+    def _get_lock(self, database_name):
+        """Get the lock guarding the connection of a database"""
+        with self._pool_lock:
+            if database_name not in self._locks:
+                self._locks[database_name] = threading.Lock()
+            return self._locks[database_name]
+
+    def _get_connection(self, database_name):
+        """Return the pooled connection for a database, opening it on first use"""
+        connection = self._connections.get(database_name)
+        if connection is not None:
+            # Reconnect transparently if the server dropped an idle connection
+            connection.ping(reconnect=True)
+            connection.select_db(database_name)
+            return connection
+
+        connection = pymysql.connect(
+            host=self.mysql_details['host'],
+            port=int(self.mysql_details['port']),
+            user=self.mysql_details['user'],
+            password=self.mysql_details['password'],
+            database=database_name,
+            charset="utf8mb4",
+            autocommit=False,
+            # Client-side limit only; the server limit is raised separately for bulk imports
+            max_allowed_packet=SQL_BULK_MAX_ALLOWED_PACKET
+        )
+        self._connections[database_name] = connection
+        self.log(f"🔌 Opened persistent connection to {database_name}")
+        return connection
+
+    def import_file(self, database_name, sql_file, bulk=False, analysis=None, on_databases=None):
+        """Import one SQL file inside its own transaction, returns (success, error_message, rows)
+
+        In bulk mode unique and foreign-key checks are switched off for the
+        session while the file loads and restored afterwards. The file is read
+        once: a given SQLScriptAnalysis is filled in the same pass, and
+        on_databases(names) is called before a statement that first references
+        those databases runs; returning False stops the import.
+        """
+        with self._get_lock(database_name):
+            connection = self._get_connection(database_name)
+            statement_number = 0
+            rows = 0
+            saved_checks = None
+            try:
+                if bulk:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT @@SESSION.unique_checks, @@SESSION.foreign_key_checks")
+                        saved_checks = cursor.fetchone()
+                        cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+
+                connection.begin()
+                if on_databases is not None and analysis is None:
+                    analysis = SQLScriptAnalysis()
+                with connection.cursor() as cursor:
+                    for statement, new_databases in iter_sql_file(sql_file, analysis):
+                        statement_number += 1
+                        if new_databases and on_databases is not None and not on_databases(new_databases):
+                            raise Exception(f"required database {', '.join(new_databases)} is not available")
+                        rows += max(cursor.execute(statement), 0)
+                        # Drain any result sets so the connection stays usable
+                        while cursor.nextset():
+                            pass
+                connection.commit()
+                return True, None, rows
+
+            except Exception as e:
+                try:
+                    connection.rollback()
+                except Exception:
+                    # A broken connection is reopened on next use
+                    self._connections.pop(database_name, None)
+                return False, f"statement {statement_number}: {str(e)}", rows
+
+            finally:
+                if saved_checks and database_name in self._connections:
+                    try:
+                        with connection.cursor() as cursor:
+                            cursor.execute("SET SESSION unique_checks = %s, foreign_key_checks = %s", saved_checks)
+                    except Exception:
+                        self._connections.pop(database_name, None)
+
+    def query(self, database_name, sql):
+        """Run a single statement on the pooled connection and commit, returns the result rows"""
+        with self._get_lock(database_name):
+            connection = self._get_connection(database_name)
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(sql)
+                    rows = cursor.fetchall()
+                connection.commit()
+                return list(rows)
+            except Exception:
+                try:
+                    connection.rollback()
+                except Exception:
+                    self._connections.pop(database_name, None)
+                raise
+
+    def close(self):
+        """Close all pooled connections"""
+        for database_name, connection in list(self._connections.items()):
+            try:
+                connection.close()
+            except Exception:
+                pass
+        self._connections.clear()
+
+
+def sql_file_hash(sql_file):
+    """SHA-1 of a SQL file's content in uppercase hex, as AzerothCore's updates table stores it"""
+    sha1 = hashlib.sha1()
+    with open(sql_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(_SQL_CHUNK_SIZE), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest().upper()
+
+
+def _sql_quote(value):
+    """Quote a value as a MySQL string literal"""
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+class SQLUpdateLedger:
+    """Record of applied SQL files in an `acb_updates` table per database.
+
+    Modelled on AzerothCore's own `updates` table: each file is stored by name
+    with the SHA-1 of its content, so unchanged files are skipped on later runs
+    and edited files are applied again.
+    """
+
+    TABLE_NAME = "acb_updates"
+    CREATE_TABLE_SQL = (
+        "CREATE TABLE IF NOT EXISTS `acb_updates` ("
+        "`name` VARCHAR(255) NOT NULL, "
+        "`hash` CHAR(40) NOT NULL DEFAULT '', "
+        "`state` ENUM('BASE','RELEASED','PENDING','MODULE') NOT NULL DEFAULT 'RELEASED', "
+        "`timestamp` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+        "`speed` INT UNSIGNED NOT NULL DEFAULT 0, "
+        "PRIMARY KEY (`name`)"
+        ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+    )
+
+    def __init__(self, run_query, root_dir, log=print):
+        # run_query(database_name, sql) returns the result rows as tuples
+        self.run_query = run_query
+        self.root_dir = root_dir
+        self.log = log
+        self._entries = {}
+        # Databases whose ledger table exists, and whose ledger could not be used at all
+        self._tables = set()
+        self._unavailable = set()
+        self._lock = threading.Lock()
+        self.applied = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def _get_entries(self, database_name):
+        """Load the ledger of a database once, creating the table if needed"""
+        with self._lock:
+            entries = self._entries.get(database_name)
+        if entries is not None:
+            return entries
+
+        try:
+            self._ensure_table(database_name)
+            rows = self.run_query(database_name, f"SELECT `name`, `hash` FROM `{self.TABLE_NAME}`")
+            entries = {row[0]: row[1] for row in rows}
+            self.log(f"📒 Loaded {len(entries)} applied-file records for {database_name}")
+        except Exception as e:
+            # Without a ledger every file is imported, as before; warn once per database
+            self.log(f"⚠️ Could not load applied-file ledger for {database_name}: {str(e)}")
+            entries = {}
+            with self._lock:
+                self._unavailable.add(database_name)
+
+        with self._lock:
+            self._entries[database_name] = entries
+        return entries
+
+    def _ensure_table(self, database_name):
+        """Create the ledger table of a database once per ledger"""
+        with self._lock:
+            if database_name in self._tables:
+                return
+        self.run_query(database_name, self.CREATE_TABLE_SQL)
+        with self._lock:
+            self._tables.add(database_name)
+
+    def file_name(self, sql_file):
+        """Ledger name of a file: its path relative to the import root, with forward slashes"""
+        return os.path.relpath(sql_file, self.root_dir).replace("\\", "/")
+
+    def is_applied(self, database_name, name, file_hash):
+        """Check whether this exact file content was already applied to the database"""
+        return self._get_entries(database_name).get(name) == file_hash
+
+    def recorded_hash(self, database_name, name):
+        """Hash the file was last applied with, or None for files not in the ledger"""
+        return self._get_entries(database_name).get(name)
+
+    def record(self, database_name, name, file_hash, state, speed_ms):
+        """Store a successfully applied file in the ledger"""
+        with self._lock:
+            if database_name in self._unavailable:
+                return
+        try:
+            self._ensure_table(database_name)
+            self.run_query(
+                database_name,
+                f"REPLACE INTO `{self.TABLE_NAME}` (`name`, `hash`, `state`, `speed`) "
+                f"VALUES ({_sql_quote(name)}, {_sql_quote(file_hash)}, {_sql_quote(state)}, {int(speed_ms)})"
+            )
+            with self._lock:
+                self._entries.setdefault(database_name, {})[name] = file_hash
+        except Exception as e:
+            self.log(f"⚠️ Could not record {name} in applied-file ledger for {database_name}: {str(e)}")
+
+    def count(self, outcome):
+        """Count one file outcome: 'applied', 'skipped' or 'failed'"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def summary(self):
+        """Human readable outcome of the import"""
+        text = f"{self.skipped} skipped, {self.applied} applied"
+        if self.failed:
+            text += f", {self.failed} failed"
+        return text
+
+
+class SchemaCatalog:
+    """Session-scoped, in-memory record of which databases exist on the server"""
+
+    def __init__(self, databases):
+        # MySQL on Windows uses case-insensitive database names
+        self._databases = {name.lower() for name in databases}
+        self._lock = threading.Lock()
+
+    def exists(self, database_name):
+        """Check whether a database is known to exist"""
+        with self._lock:
+            return database_name.lower() in self._databases
+
+    def add(self, database_name):
+        """Record a database created during this session"""
+        with self._lock:
+            self._databases.add(database_name.lower())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._databases)
@@ -0,0 +1,301 @@
+"""Incremental file synchronisation used to assemble and refresh the repack"""
+
+import os
+import shutil
+import fnmatch
+import threading
+import concurrent.futures
+
+from acb_core.net import sha256_file
+
+# fcntl only exists on POSIX; reflinks are attempted there and skipped elsewhere
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+# ioctl that makes dest share source's extents (Linux FICLONE, btrfs/XFS)
+_FICLONE = 0x40049409
+
+# Values of repack_link_mode in acb_config.json
+LINK_MODES = ("auto", "hardlink", "copy")
+
+# Bytes read and written per chunk by the copy workers
+_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class SyncCancelled(Exception):
+    """Raised when the user cancels a running sync"""
+
+
+class SyncStats:
+    """Counts what a sync did, shared across several sync_file/sync_tree calls and threads"""
+
+    def __init__(self):
+        self.copied = 0
+        self.linked = 0
+        self.unchanged = 0
+        self.skipped = 0
+        self.skipped_bytes = 0
+        self.bytes_written = 0
+        self.failed = []
+        self._lock = threading.Lock()
+
+    def record(self, result, size=0):
+        """Count one file as "copied", "linked", "unchanged" or "skipped" """
+        with self._lock:
+            if result == "copied":
+                self.copied += 1
+                self.bytes_written += size
+            elif result == "linked":
+                self.linked += 1
+            elif result == "skipped":
+                self.skipped += 1
+                self.skipped_bytes += size
+            else:
+                self.unchanged += 1
+
+    def summary(self):
+        text = f"{self.copied} copied, {self.linked} linked, {self.unchanged} unchanged"
+        if self.skipped:
+            text += f", {self.skipped} skipped by manifest"
+        if self.failed:
+            text += f", {len(self.failed)} failed"
+        return text
+
+
+def manifest_filter(patterns):
+    """skip(relative_path) for glob patterns such as "docs/*" or "*.pdb", matched case-insensitively"""
+    patterns = [pattern.replace('\\', '/').lower() for pattern in patterns or ()]
+
+    def skip(relative_path):
+        path = relative_path.replace(os.path.sep, '/').lower()
+        return any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+    return skip
+
+
+def file_unchanged(source, dest, checksum=False):
+    """True when dest already matches source by identity, size and mtime (or SHA-256 with checksum)"""
+    try:
+        source_stat = os.stat(source)
+        dest_stat = os.stat(dest)
+    except OSError:
+        return False
+    if source_stat.st_ino and (source_stat.st_dev, source_stat.st_ino) == (dest_stat.st_dev, dest_stat.st_ino):
+        # Already hard linked
+        return True
+    if source_stat.st_size != dest_stat.st_size:
+        return False
+    # copy2 keeps the modification time, allow for 2 s FAT timestamps
+    if abs(source_stat.st_mtime - dest_stat.st_mtime) < 2:
+        return True
+    if checksum and sha256_file(source) == sha256_file(dest):
+        shutil.copystat(source, dest)
+        return True
+    return False
+
+
+def tree_unchanged(source, dest, skip=None, checksum=False):
+    """True when every file under source (a file or a directory) is unchanged in dest, see file_unchanged"""
+    if not os.path.isdir(source):
+        return file_unchanged(source, dest, checksum)
+    for root, dirs, files in os.walk(source):
+        relative_root = os.path.relpath(root, source)
+        for name in files:
+            relative_path = name if relative_root == "." else os.path.join(relative_root, name)
+            if skip and skip(relative_path):
+                continue
+            if not file_unchanged(os.path.join(root, name), os.path.join(dest, relative_path), checksum):
+                return False
+    return True
+
+
+def break_hard_link(path):
+    """Give path its own copy of its data if it is hard linked elsewhere, returns True when it was"""
+    try:
+        if os.stat(path).st_nlink <= 1:
+            return False
+    except OSError:
+        return False
+    temp_path = path + ".acbsync"
+    try:
+        shutil.copy2(path, temp_path)
+        # Replacing the directory entry leaves the other links untouched
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        raise
+    return True
+
+
+def _reflink(source, dest):
+    """Clone source into dest without copying data, returns False when the file system cannot"""
+    if not FCNTL_AVAILABLE:
+        return False
+    try:
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        try:
+            os.remove(dest)
+        except OSError:
+            pass
+        return False
+    shutil.copystat(source, dest)
+    return True
+
+
+def _copy_file_chunked(source, dest, on_bytes=None, cancelled=None):
+    """Copy source to dest in large chunks, preallocating dest and reporting each chunk"""
+    with open(source, 'rb') as src, open(dest, 'wb') as dst:
+        size = os.fstat(src.fileno()).st_size
+        if size:
+            # Reserve the full size so the file system can allocate contiguously
+            dst.truncate(size)
+        while True:
+            if cancelled and cancelled():
+                raise SyncCancelled("Copy cancelled")
+            chunk = src.read(_COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            dst.write(chunk)
+            if on_bytes:
+                on_bytes(len(chunk))
+    shutil.copystat(source, dest)
+
+
+def sync_file(source, dest, link=False, checksum=False, stats=None, on_bytes=None, cancelled=None):
+    """Bring dest up to date with source, returns "unchanged", "linked" or "copied".
+
+    Changed files are written next to dest and renamed over it, so dest is never
+    left half written. With link=True a hard link is made when the file system allows.
+    on_bytes(n) is called as data is copied; linked and unchanged files report their size at once.
+    """
+    stats = stats if stats is not None else SyncStats()
+    size = os.path.getsize(source)
+    if file_unchanged(source, dest, checksum):
+        stats.record("unchanged")
+        if on_bytes:
+            on_bytes(size)
+        return "unchanged"
+
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+    temp_path = dest + ".acbsync"
+    if os.path.lexists(temp_path):
+        os.remove(temp_path)
+    try:
+        result = None
+        if link:
+            try:
+                os.link(source, temp_path)
+                result = "linked"
+            except OSError:
+                # Different volume or no hard link support, fall back to copying
+                pass
+        if result is None:
+            if _reflink(source, temp_path):
+                if on_bytes:
+                    on_bytes(size)
+            else:
+                _copy_file_chunked(source, temp_path, on_bytes, cancelled)
+            result = "copied"
+        elif on_bytes:
+            on_bytes(size)
+        os.replace(temp_path, dest)
+    except BaseException:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    stats.record(result, size)
+    return result
+
+
+def sync_tree(source_dir, dest_dir, link=False, checksum=False, stats=None, skip=None, workers=1,
+              progress=None, cancelled=None):
+    """Mirror source_dir into dest_dir, touching only changed files.
+
+    The tree is walked once, then files are synced by a pool of workers, largest
+    first. Files matched by skip(relative_path) are left out. progress(bytes_done,
+    total_bytes, files_done, total_files) is called as data moves and cancelled()
+    is polled between chunks (raising SyncCancelled).
+
+    Files that exist only in dest_dir (edited .conf files, data, databases) are never
+    removed. Files that cannot be written, e.g. a running executable, are recorded in
+    stats.failed as (relative path, error) and the sync carries on.
+    """
+    stats = stats if stats is not None else SyncStats()
+    jobs = []
+    for root, dirs, files in os.walk(source_dir):
+        relative_root = os.path.relpath(root, source_dir)
+        target_root = dest_dir if relative_root == "." else os.path.join(dest_dir, relative_root)
+        for name in files:
+            relative_path = name if relative_root == "." else os.path.join(relative_root, name)
+            source = os.path.join(root, name)
+            try:
+                size = os.path.getsize(source)
+            except OSError as e:
+                stats.failed.append((relative_path, str(e)))
+                continue
+            if skip and skip(relative_path):
+                stats.record("skipped", size)
+                continue
+            jobs.append((size, source, os.path.join(target_root, name), relative_path))
+
+    # Directories are created up front so workers never race on makedirs
+    os.makedirs(dest_dir, exist_ok=True)
+    for directory in sorted({os.path.dirname(target) for size, source, target, relative_path in jobs}):
+        os.makedirs(directory, exist_ok=True)
+
+    jobs.sort(key=lambda job: job[0], reverse=True)
+    total_bytes = sum(job[0] for job in jobs)
+    state = {"bytes": 0, "files": 0, "cancelled": False}
+    lock = threading.Lock()
+
+    def report(bytes_done=0, files_done=0):
+        with lock:
+            state["bytes"] += bytes_done
+            state["files"] += files_done
+            snapshot = (state["bytes"], total_bytes, state["files"], len(jobs))
+        if progress:
+            progress(*snapshot)
+
+    def is_cancelled():
+        return state["cancelled"] or bool(cancelled and cancelled())
+
+    def sync_job(job):
+        size, source, target, relative_path = job
+        if is_cancelled():
+            raise SyncCancelled("Copy cancelled")
+        reported = [0]
+
+        def on_bytes(count):
+            reported[0] += count
+            report(bytes_done=count)
+
+        try:
+            sync_file(source, target, link, checksum, stats, on_bytes=on_bytes, cancelled=is_cancelled)
+        except SyncCancelled:
+            raise
+        except OSError as e:
+            with lock:
+                stats.failed.append((relative_path, str(e)))
+            # Count the rest of a failed file so the total still adds up, without the chunks already reported
+            report(bytes_done=max(size - reported[0], 0))
+        report(files_done=1)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs) or 1))) as executor:
+        futures = [executor.submit(sync_job, job) for job in jobs]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            # Stop the other workers before re-raising
+            state["cancelled"] = True
+            for future in futures:
+                future.cancel()
+            raise
+    return stats
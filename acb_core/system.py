@@ -0,0 +1,205 @@
+"""Pluggable platform backend for registry lookups, persistent environment variables and processes"""
+
+import os
+import sys
+import csv
+import signal
+import subprocess
+import threading
+
+# winreg only exists on Windows; the stub backend is used everywhere else
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+# Try to import psutil for process listing
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+# Scopes accepted by the environment variable methods, in the order they are tried
+ENVIRONMENT_SCOPES = ("machine", "user")
+
+
+class SystemBackend:
+    """Portable backend: no registry, environment variables live in the current process only.
+
+    Used on Linux and in headless tooling, where nothing persists beyond the process.
+    """
+
+    name = "stub"
+
+    def read_registry_value(self, hive, subkey, value_name):
+        """Return a registry value, or None when it (or the registry) does not exist"""
+        return None
+
+    def get_environment_variable(self, name, scope="machine"):
+        """Return the persistent value of an environment variable, or None if it is not set"""
+        return os.environ.get(name)
+
+    def set_environment_variable(self, name, value, scope="machine"):
+        """Persist an environment variable; raises PermissionError when the scope is not writable"""
+        os.environ[name] = value
+
+    def can_write_environment(self, scope="machine"):
+        """Whether this process may persist environment variables in the given scope"""
+        return True
+
+    def set_environment_variable_any_scope(self, name, value):
+        """Persist an environment variable machine-wide, falling back to the user; returns the scope used"""
+        for scope in ENVIRONMENT_SCOPES[:-1]:
+            try:
+                self.set_environment_variable(name, value, scope)
+                return scope
+            except PermissionError:
+                continue
+        self.set_environment_variable(name, value, ENVIRONMENT_SCOPES[-1])
+        return ENVIRONMENT_SCOPES[-1]
+
+    def notify_environment_changed(self):
+        """Tell running applications that persistent environment variables changed"""
+        return False
+
+    def list_processes(self):
+        """Return (pid, name) for every running process"""
+        if PSUTIL_AVAILABLE:
+            processes = []
+            for proc in psutil.process_iter(['pid', 'name']):
+                processes.append((proc.info['pid'], proc.info['name'] or ""))
+            return processes
+        processes = []
+        try:
+            entries = os.listdir('/proc')
+        except OSError:
+            return processes
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            try:
+                with open(os.path.join('/proc', entry, 'comm'), 'r') as f:
+                    processes.append((int(entry), f.read().strip()))
+            except OSError:
+                continue
+        return processes
+
+    def kill_process(self, pid):
+        """Forcefully stop a process; raises ProcessLookupError or PermissionError"""
+        if PSUTIL_AVAILABLE:
+            try:
+                psutil.Process(pid).kill()
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                raise ProcessLookupError(pid)
+            except psutil.AccessDenied:
+                raise PermissionError(pid)
+            return
+        os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+
+
+class WindowsBackend(SystemBackend):
+    """Windows backend: registry lookups and persistent environment variables via winreg"""
+
+    name = "windows"
+
+    _ENVIRONMENT_KEYS = {
+        "machine": ("HKLM", r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"),
+        "user": ("HKCU", r"Environment"),
+    }
+
+    def _hive(self, hive):
+        return {
+            "HKLM": winreg.HKEY_LOCAL_MACHINE,
+            "HKCU": winreg.HKEY_CURRENT_USER,
+        }[hive]
+
+    def read_registry_value(self, hive, subkey, value_name):
+        """Return a registry value, or None when it does not exist"""
+        try:
+            with winreg.OpenKey(self._hive(hive), subkey) as key:
+                value, _ = winreg.QueryValueEx(key, value_name)
+                return value
+        except (FileNotFoundError, OSError):
+            return None
+
+    def get_environment_variable(self, name, scope="machine"):
+        """Return the persistent value of an environment variable, or None if it is not set"""
+        hive, subkey = self._ENVIRONMENT_KEYS[scope]
+        with winreg.OpenKey(self._hive(hive), subkey, 0, winreg.KEY_READ) as key:
+            try:
+                value, _ = winreg.QueryValueEx(key, name)
+                return value
+            except FileNotFoundError:
+                return None
+
+    def set_environment_variable(self, name, value, scope="machine"):
+        """Persist an environment variable; raises PermissionError when the scope is not writable"""
+        hive, subkey = self._ENVIRONMENT_KEYS[scope]
+        with winreg.OpenKey(self._hive(hive), subkey, 0, winreg.KEY_WRITE) as key:
+            winreg.SetValueEx(key, name, 0, winreg.REG_EXPAND_SZ, value)
+
+    def can_write_environment(self, scope="machine"):
+        """Whether this process may persist environment variables in the given scope"""
+        hive, subkey = self._ENVIRONMENT_KEYS[scope]
+        try:
+            with winreg.OpenKey(self._hive(hive), subkey, 0, winreg.KEY_READ | winreg.KEY_WRITE):
+                return True
+        except PermissionError:
+            return False
+
+    def notify_environment_changed(self):
+        """Broadcast WM_SETTINGCHANGE so other applications pick up environment changes"""
+        import ctypes
+        from ctypes import wintypes
+
+        ctypes.windll.user32.SendMessageW(
+            wintypes.HWND(-1),  # HWND_BROADCAST
+            0x001A,  # WM_SETTINGCHANGE
+            0,  # wParam
+            "Environment"  # lParam
+        )
+        return True
+
+    def list_processes(self):
+        """Return (pid, name) for every running process"""
+        if PSUTIL_AVAILABLE:
+            return super().list_processes()
+        result = subprocess.run(['tasklist', '/fo', 'csv', '/nh'],
+                                capture_output=True, text=True, timeout=10)
+        processes = []
+        for row in csv.reader(result.stdout.splitlines()):
+            if len(row) >= 2 and row[1].isdigit():
+                processes.append((int(row[1]), row[0]))
+        return processes
+
+    def kill_process(self, pid):
+        """Forcefully stop a process; raises ProcessLookupError or PermissionError"""
+        if PSUTIL_AVAILABLE:
+            return super().kill_process(pid)
+        result = subprocess.run(['taskkill', '/f', '/pid', str(pid)],
+                                capture_output=True, text=True, timeout=10)
+        if result.returncode != 0:
+            raise ProcessLookupError(pid)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the platform backend for this process, choosing one on first use"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = WindowsBackend() if sys.platform == "win32" and WINREG_AVAILABLE else SystemBackend()
+        return _backend
+
+
+def set_backend(backend):
+    """Replace the platform backend, e.g. with a recording stub for headless runs"""
+    global _backend
+    with _backend_lock:
+        _backend = backend
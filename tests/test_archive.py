@@ -0,0 +1,129 @@
+"""Tests for parallel zip extraction"""
+
+import os
+import zipfile
+
+import pytest
+
+from acb_core.archive import ExtractionCancelled, _safe_zip_member_path, extract_zip_parallel
+
+
+def make_zip(tmp_path):
+    """data.zip-like archive with dbc text and binary maps of different sizes"""
+    zip_path = str(tmp_path / "data.zip")
+    contents = {"dbc/x.txt": b"dbc" * 100, "empty/": b""}
+    for index in range(60):
+        contents[f"maps/f{index}.bin"] = os.urandom(index * 1000 + 1)
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in contents.items():
+            archive.writestr(name, data)
+    return zip_path, contents
+
+
+def assert_extracted(dest, contents):
+    for name, data in contents.items():
+        path = os.path.join(dest, *name.rstrip("/").split("/"))
+        if name.endswith("/"):
+            assert os.path.isdir(path)
+        else:
+            with open(path, "rb") as f:
+                assert f.read() == data
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("maps/f0.bin", ["maps", "f0.bin"]),
+    ("../../evil.txt", ["evil.txt"]),
+    ("/etc/passwd", ["etc", "passwd"]),
+    ("a/./b/../c.txt", ["a", "b", "c.txt"]),
+])
+def test_safe_member_path_stays_inside_destination(tmp_path, name, expected):
+    dest = str(tmp_path)
+    assert _safe_zip_member_path(dest, name) == os.path.join(dest, *expected)
+
+
+@pytest.mark.parametrize("name", ["", "..", "../", "./."])
+def test_safe_member_path_skips_empty_names(tmp_path, name):
+    assert _safe_zip_member_path(str(tmp_path), name) is None
+
+
+@pytest.mark.parametrize("workers", [1, 4, 16])
+def test_parallel_extract_round_trip(tmp_path, workers):
+    zip_path, contents = make_zip(tmp_path)
+    dest = str(tmp_path / "out")
+    calls = []
+    names = extract_zip_parallel(zip_path, dest, workers=workers, progress=lambda *args: calls.append(args))
+
+    assert sorted(names) == sorted(contents)
+    assert_extracted(dest, contents)
+    files = [name for name in contents if not name.endswith("/")]
+    assert calls[-1] == (len(files), len(files), sum(len(contents[name]) for name in files),
+                         sum(len(contents[name]) for name in files))
+
+
+def test_extract_with_per_worker_archive_handles(tmp_path):
+    zip_path, contents = make_zip(tmp_path)
+    dest = str(tmp_path / "out")
+    opened = []
+
+    def open_archive():
+        handle = open(zip_path, "rb")
+        opened.append(handle)
+        return handle
+
+    extract_zip_parallel(zip_path, dest, workers=4, open_archive=open_archive)
+    assert_extracted(dest, contents)
+    assert len(opened) == 5
+    assert all(handle.closed for handle in opened)
+
+
+def test_cancel_stops_extraction(tmp_path):
+    zip_path, _ = make_zip(tmp_path)
+    with pytest.raises(ExtractionCancelled):
+        extract_zip_parallel(zip_path, str(tmp_path / "out"), workers=4, cancelled=lambda: True)
+
+
+def test_unsafe_members_are_not_reported_as_extracted(tmp_path):
+    zip_path = str(tmp_path / "evil.zip")
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        archive.writestr("dbc/x.txt", b"dbc")
+        archive.writestr("..", b"")
+        archive.writestr("./.", b"")
+    names = extract_zip_parallel(zip_path, str(tmp_path / "out"), workers=2)
+    assert names == ["dbc/x.txt"]
+
+
+def test_cancel_leaves_no_partial_files(tmp_path):
+    zip_path, contents = make_zip(tmp_path)
+    dest = tmp_path / "out"
+    polls = [0]
+
+    def cancelled():
+        # Cancel part-way, after some files have finished
+        polls[0] += 1
+        return polls[0] > 40
+
+    with pytest.raises(ExtractionCancelled):
+        extract_zip_parallel(zip_path, str(dest), workers=4, cancelled=cancelled)
+    written = [path for path in dest.rglob("*") if path.is_file()]
+    assert written
+    assert not [path for path in written if path.name.endswith(".part")]
+    for path in written:
+        # Every file left behind is complete
+        assert path.read_bytes() == contents[path.relative_to(dest).as_posix()]
+
+
+def test_failed_member_is_removed(tmp_path, monkeypatch):
+    zip_path, contents = make_zip(tmp_path)
+    dest = tmp_path / "out"
+    read = zipfile.ZipExtFile.read
+
+    def failing_read(self, n=-1):
+        if self.name == "maps/f59.bin":
+            raise zipfile.BadZipFile("Bad CRC-32 for file 'maps/f59.bin'")
+        return read(self, n)
+
+    monkeypatch.setattr(zipfile.ZipExtFile, "read", failing_read)
+    with pytest.raises(zipfile.BadZipFile):
+        extract_zip_parallel(zip_path, str(dest), workers=1)
+    assert not (dest / "maps" / "f59.bin").exists()
+    assert not (dest / "maps" / "f59.bin.part").exists()
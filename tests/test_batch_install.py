@@ -0,0 +1,230 @@
+"""Tests for "Install All Missing" with downloads, installers and widgets stubbed"""
+
+import time
+import threading
+
+import pytest
+
+import ACB
+
+
+class FakeWidget:
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **options):
+        self.options.update(options)
+
+
+class FakeDialog:
+    """Stands in for the batch Toplevel, running widget updates straight away"""
+
+    def __init__(self, keys):
+        self.cancelled = False
+        self.destroyed = False
+        self.rows = {key: {"status": FakeWidget(), "progress": FakeWidget()} for key in keys}
+        self.progress = FakeWidget()
+        self.status_label = FakeWidget()
+
+    def winfo_exists(self):
+        return not self.destroyed
+
+    def after(self, ms, callback):
+        callback()
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class FakeRoot:
+    """Collects the callbacks queued for the Tk thread"""
+
+    def __init__(self):
+        self.queued = []
+
+    def after(self, ms, callback):
+        self.queued.append((ms, callback))
+
+    def run_queued(self):
+        for ms, callback in self.queued:
+            if ms == 0:
+                callback()
+
+
+def requirement(name, download_url):
+    return {"name": name, "download_url": download_url, "install_path": f"C:\\local\\{name}",
+            "detected": False, "path": "", "version": ""}
+
+
+REQUIREMENTS = {
+    "Git": "https://example.invalid/Git-2.44.0-64-bit.exe",
+    "Boost": "https://example.invalid/boost_1_85_0.zip",
+    "OpenSSL": "https://example.invalid/Win64OpenSSL-3_5_2.exe",
+    "CMake": "https://example.invalid/cmake-3.29.0-windows-x86_64.zip",
+    "VisualStudio": "https://example.invalid/vs_community.exe",
+}
+
+
+class BatchBuilder(ACB.AzerothCoreBuilder):
+    """AzerothCoreBuilder without a window; installs are recorded instead of run"""
+
+    def __init__(self, app_dir, detected=()):
+        self.app_dir = app_dir
+        self._init_pipeline_state()
+        self.root = FakeRoot()
+        self.requirements = {key: requirement(key, url) for key, url in REQUIREMENTS.items()}
+        self.detected = set(detected)
+        self.messages = []
+        self.fetched = []
+        self.installed = []
+        self.fail_on = {}
+        self.on_install = {}
+        self.lock = threading.Lock()
+        self.running_installers = 0
+        self.max_running_installers = 0
+
+    def log_to_console(self, message):
+        self.messages.append(message)
+
+    def check_requirement(self, req):
+        if req["name"] in self.detected:
+            return True, f"C:\\Program Files\\{req['name']}", "1.0"
+        return False, "", ""
+
+    def update_status(self, key, icon, status, info):
+        pass
+
+    def _cleanup_temp_files(self, file_path):
+        pass
+
+    def _fetch_dependency_file(self, key, req, progress=None, cancelled=None, on_status=None):
+        with self.lock:
+            self.fetched.append(key)
+        progress(512, 1024)
+        progress(1024, 1024)
+        return "C:\\temp\\" + req["download_url"].rsplit("/", 1)[1]
+
+    def _install_dependency_file(self, key, req, file_path, progress=None, cancelled=None):
+        installer = not file_path.endswith(".zip")
+        with self.lock:
+            if installer:
+                self.running_installers += 1
+                self.max_running_installers = max(self.max_running_installers, self.running_installers)
+        try:
+            if key in self.on_install:
+                self.on_install[key]()
+            if key in self.fail_on:
+                raise self.fail_on[key]
+            with self.lock:
+                self.installed.append(key)
+            if installer:
+                self.detected.add(req["name"])
+        finally:
+            with self.lock:
+                if installer:
+                    self.running_installers -= 1
+
+
+@pytest.fixture
+def dialogs(monkeypatch):
+    """Records the message boxes shown at the end of a batch"""
+    shown = []
+    monkeypatch.setattr(ACB.messagebox, "showinfo", lambda title, text: shown.append(("info", text)))
+    monkeypatch.setattr(ACB.messagebox, "showwarning", lambda title, text: shown.append(("warning", text)))
+    return shown
+
+
+def run_batch(builder, keys):
+    dialog = FakeDialog(keys)
+    builder._run_batch_install(keys, dialog)
+    builder.root.run_queued()
+    return dialog
+
+
+def test_missing_requirements_are_queued_in_install_order(tmp_path, monkeypatch):
+    builder = BatchBuilder(str(tmp_path))
+    builder.requirements["Boost"]["detected"] = True
+    batches = []
+    monkeypatch.setattr(ACB.messagebox, "askyesno", lambda title, text: True)
+    builder.create_batch_install_dialog = lambda keys: FakeDialog(keys)
+    builder._run_batch_install = lambda keys, dialog: batches.append(keys)
+
+    builder.install_all_missing()
+    for _ in range(100):
+        if batches:
+            break
+        time.sleep(0.01)
+    assert batches == [["VisualStudio", "Git", "CMake", "OpenSSL"]]
+
+
+def test_nothing_missing_shows_a_message(tmp_path, monkeypatch, dialogs):
+    builder = BatchBuilder(str(tmp_path))
+    for req in builder.requirements.values():
+        req["detected"] = True
+    builder._run_batch_install = lambda keys, dialog: pytest.fail("nothing should be installed")
+
+    builder.install_all_missing()
+    assert dialogs == [("info", "All requirements are already detected.")]
+
+
+def test_installers_run_one_at_a_time_while_archives_extract(tmp_path, dialogs):
+    builder = BatchBuilder(str(tmp_path))
+    archive_started = threading.Event()
+    builder.on_install["CMake"] = archive_started.set
+    # The first installer only finishes once an archive was extracted alongside it
+    builder.on_install["VisualStudio"] = lambda: archive_started.wait(5) or pytest.fail("archive waited")
+
+    keys = ["VisualStudio", "Git", "CMake", "OpenSSL", "Boost"]
+    dialog = run_batch(builder, keys)
+
+    assert sorted(builder.fetched) == sorted(keys)
+    assert [key for key in builder.installed if key in ("VisualStudio", "Git", "OpenSSL")] == \
+        ["VisualStudio", "Git", "OpenSSL"]
+    assert builder.max_running_installers == 1
+    assert builder.installed.index("CMake") < builder.installed.index("VisualStudio")
+    # Extracted archives count as installed even without a detector hit
+    assert builder.requirements["Boost"]["version"] == "Installed via ACB"
+    assert all(row["status"].options["text"] == "✅ Installed" for row in dialog.rows.values())
+    assert dialog.progress.options["value"] == 100
+    assert dialogs == [("info", "5 of 5 requirement(s) are installed.\n\n"
+                                "Use 'Scan System' to refresh detection once all installers have finished.")]
+
+
+def test_requirement_installed_since_the_scan_is_skipped(tmp_path, dialogs):
+    builder = BatchBuilder(str(tmp_path), detected=["Git"])
+    dialog = run_batch(builder, ["Git", "OpenSSL"])
+
+    assert builder.fetched == ["OpenSSL"]
+    assert builder.installed == ["OpenSSL"]
+    assert dialog.rows["Git"]["status"].options["text"] == "✅ Already installed"
+    assert builder.requirements["Git"]["detected"]
+
+
+def test_failed_install_does_not_stop_the_rest(tmp_path, dialogs):
+    builder = BatchBuilder(str(tmp_path))
+    builder.fail_on["Git"] = Exception("Installer exited with code 1603")
+    dialog = run_batch(builder, ["VisualStudio", "Git", "OpenSSL"])
+
+    assert builder.installed == ["VisualStudio", "OpenSSL"]
+    assert dialog.rows["Git"]["status"].options["text"] == "❌ Installer exited with code 1603"
+    kind, summary = dialogs[0]
+    assert kind == "warning"
+    assert summary.startswith("2 of 3 requirement(s) are installed.")
+    assert "• Git: Installer exited with code 1603" in summary
+
+
+def test_cancel_skips_the_remaining_installers(tmp_path, dialogs):
+    builder = BatchBuilder(str(tmp_path))
+    keys = ["VisualStudio", "Git", "OpenSSL"]
+    dialog = FakeDialog(keys)
+
+    def cancel():
+        dialog.cancelled = True
+
+    builder.on_install["VisualStudio"] = cancel
+    builder._run_batch_install(keys, dialog)
+    builder.root.run_queued()
+
+    assert builder.installed == ["VisualStudio"]
+    assert "❌ Batch installation cancelled" in builder.messages
+    assert dialogs == []
@@ -0,0 +1,108 @@
+"""Tests for skipping CMake configure when its inputs are unchanged"""
+
+import os
+
+import pytest
+
+from acb_core.buildplan import load_build_state, plan_configure, save_build_state
+from acb_core.pipeline import PipelineOperations
+
+OPTIONS = ["-DTOOLS_BUILD=none", "-DSCRIPTS=static"]
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def configured(tmp_path):
+    """Source tree and a build directory configured from it"""
+    repo = tmp_path / "azerothcore-wotlk"
+    build = tmp_path / "Build"
+    write(repo / "CMakeLists.txt", "project(AzerothCore)")
+    write(repo / "src" / "game" / "Player.cpp", "int x;")
+    write(repo / "modules" / "mod-a" / "CMakeLists.txt", "")
+    write(build / "CMakeCache.txt", "")
+    write(build / "AzerothCore.sln", "")
+    needs, reason, fingerprint = plan_configure(str(repo), str(build), OPTIONS)
+    save_build_state(str(build), {"cmake_fingerprint": fingerprint})
+    return repo, build
+
+
+def test_fresh_build_directory_needs_configure(tmp_path):
+    write(tmp_path / "repo" / "CMakeLists.txt", "")
+    needs, reason, fingerprint = plan_configure(str(tmp_path / "repo"), str(tmp_path / "Build"), OPTIONS)
+    assert needs
+    assert "no CMake cache" in reason
+
+
+def test_unchanged_inputs_skip_configure(configured):
+    repo, build = configured
+    needs, reason, fingerprint = plan_configure(str(repo), str(build), OPTIONS)
+    assert not needs
+
+
+def test_editing_a_source_file_keeps_configure_skipped(configured):
+    repo, build = configured
+    write(repo / "src" / "game" / "Player.cpp", "int y;")
+    assert not plan_configure(str(repo), str(build), OPTIONS)[0]
+
+
+@pytest.mark.parametrize("change", [
+    lambda repo: write(repo / "CMakeLists.txt", "project(AzerothCore) # edited"),
+    lambda repo: write(repo / "src" / "game" / "New.cpp", ""),
+    lambda repo: os.remove(str(repo / "src" / "game" / "Player.cpp")),
+    lambda repo: write(repo / "modules" / "mod-b" / "CMakeLists.txt", ""),
+    lambda repo: write(repo / "cmake" / "macros" / "Config.cmake", ""),
+])
+def test_cmake_inputs_changes_need_configure(configured, change):
+    repo, build = configured
+    change(repo)
+    assert plan_configure(str(repo), str(build), OPTIONS)[0]
+
+
+def test_changed_options_need_configure(configured):
+    repo, build = configured
+    assert plan_configure(str(repo), str(build), ["-DTOOLS_BUILD=all", "-DSCRIPTS=static"])[0]
+
+
+def test_build_output_is_not_an_input(configured):
+    repo, build = configured
+    write(repo / "build" / "generated.h", "")
+    write(repo / ".git" / "index.cmake", "")
+    assert not plan_configure(str(repo), str(build), OPTIONS)[0]
+
+
+def test_missing_solution_or_state_needs_configure(configured):
+    repo, build = configured
+    os.remove(str(build / "acb_build_state.json"))
+    assert plan_configure(str(repo), str(build), OPTIONS)[0]
+    os.remove(str(build / "AzerothCore.sln"))
+    assert "solution" in plan_configure(str(repo), str(build), OPTIONS)[1]
+
+
+class Builder(PipelineOperations):
+    def __init__(self, app_dir):
+        self.app_dir = app_dir
+        self._init_pipeline_state()
+
+    def log_to_console(self, message):
+        pass
+
+    def _cmake_configure_command(self, repo_dir, build_dir, cmake_path):
+        return OPTIONS
+
+    def _run_cmake_configure_new(self, repo_dir, build_dir, cmake_path):
+        # CMake stops half way
+        return False
+
+
+def test_interrupted_configure_clears_the_fingerprint(configured, tmp_path):
+    repo, build = configured
+    builder = Builder(str(tmp_path))
+    assert not builder._build_source(str(repo), str(build), "cmake", force_configure=True)
+
+    assert "cmake_fingerprint" not in load_build_state(str(build))
+    needs, reason, fingerprint = plan_configure(str(repo), str(build), OPTIONS)
+    assert needs
@@ -0,0 +1,177 @@
+"""Tests for the headless command line with the pipeline steps stubbed"""
+
+import io
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from acb_core import cli
+from acb_core.cli import BuildRun, HeadlessBuilder, build_parser, resolve_build_options, resolve_modules
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def parse(*argv):
+    return build_parser().parse_args(["build"] + list(argv))
+
+
+class StubBuilder(HeadlessBuilder):
+    """HeadlessBuilder whose clone and build steps only record that they ran"""
+
+    def __init__(self, app_dir):
+        super().__init__(app_dir, io.StringIO())
+        self.calls = []
+        self.build_ok = True
+
+    def _clone_source_repository(self, key, repo, git_source_dir, reporter=None):
+        self.calls.append(("clone", key))
+        os.makedirs(os.path.join(git_source_dir, repo["folder"]))
+        return subprocess.CompletedProcess(["git", "clone"], 0, "", "")
+
+    def _clone_modules(self, modules, modules_dir, on_status=None, cancelled=None):
+        self.calls.append(("modules", [name for name, url in modules]))
+        for name, url in modules:
+            os.makedirs(os.path.join(modules_dir, name))
+            on_status(name, "✅ Cloned")
+        return {name: True for name, url in modules}
+
+    def _find_cmake(self):
+        return "cmake"
+
+    def _find_visual_studio(self):
+        return True
+
+    def _build_source(self, repo_dir, build_dir, cmake_path, reporter=None, force_configure=False):
+        self.calls.append(("build", force_configure))
+        return self.build_ok
+
+    def events(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+
+def run(tmp_path, *argv, builder=None):
+    builder = builder or StubBuilder(str(tmp_path))
+    options = resolve_build_options(parse("--app-dir", str(tmp_path), *argv))
+    return BuildRun(builder, options).run(), builder
+
+
+def stage_states(builder):
+    return [(event["stage"], event["state"]) for event in builder.events() if event["event"] == "stage"]
+
+
+def test_command_line_overrides_the_config_file(tmp_path, monkeypatch):
+    config = tmp_path / "build.json"
+    config.write_text(json.dumps({
+        "source": "playerbots",
+        "repack": True,
+        "modules": ["mod-transmog"],
+        "mysql": {"port": 3307, "password": "from-file"},
+    }), encoding="utf-8")
+    monkeypatch.setenv("ACB_MYSQL_PASSWORD", "from-env")
+    options = resolve_build_options(parse("--config", str(config), "--source", "azerothcore", "--skip-build"))
+
+    assert options["source"] == "azerothcore"
+    assert options["repack"] and not options["build"]
+    assert options["modules"] == [("mod-transmog", "https://github.com/azerothcore/mod-transmog")]
+    assert options["mysql"]["port"] == "3307"
+    assert options["mysql"]["password"] == "from-env"
+
+
+def test_modules_by_name_or_url():
+    assert resolve_modules(["mod-autobalance", " https://example.invalid/me/mod-custom.git", ""]) == [
+        ("mod-autobalance", "https://github.com/azerothcore/mod-autobalance"),
+        ("mod-custom", "https://example.invalid/me/mod-custom.git"),
+    ]
+    with pytest.raises(ValueError, match="Unknown module"):
+        resolve_modules(["mod-does-not-exist"])
+
+
+def test_unknown_module_is_a_usage_error(tmp_path):
+    with pytest.raises(SystemExit) as raised:
+        cli.main(["build", "--app-dir", str(tmp_path), "--modules", "mod-does-not-exist"])
+    assert raised.value.code == 2
+
+
+def test_stages_run_in_order(tmp_path):
+    exit_code, builder = run(tmp_path, "--modules", "mod-transmog", "--reconfigure")
+    assert exit_code == cli.EXIT_OK
+    assert builder.calls == [("clone", "azerothcore"), ("modules", ["mod-transmog"]), ("build", True)]
+    assert stage_states(builder) == [("clone", "start"), ("clone", "done"), ("modules", "start"),
+                                     ("modules", "done"), ("build", "start"), ("build", "done")]
+    assert builder.events()[-1]["ok"]
+    assert builder._load_config_value("cloned_source", None) == "azerothcore"
+
+
+def test_failed_stage_stops_the_run(tmp_path):
+    builder = StubBuilder(str(tmp_path))
+    builder.build_ok = False
+    exit_code, builder = run(tmp_path, "--repack", builder=builder)
+    assert exit_code == cli.EXIT_FAILED
+    assert stage_states(builder)[-1] == ("build", "failed")
+    result = builder.events()[-1]
+    assert result["event"] == "result" and not result["ok"]
+    # The repack graph never started
+    assert "repack" not in result["stages"]
+
+
+def test_existing_clone_without_git_is_reused(tmp_path):
+    (tmp_path / "GitSource" / "azerothcore-wotlk").mkdir(parents=True)
+    exit_code, builder = run(tmp_path, "--skip-build")
+    assert exit_code == cli.EXIT_OK
+    assert builder.calls == []
+    assert stage_states(builder) == [("clone", "start"), ("clone", "skipped")]
+
+
+def existing_clone(tmp_path, url):
+    repo_dir = tmp_path / "GitSource" / "azerothcore-wotlk"
+    repo_dir.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(repo_dir)], check=True)
+    subprocess.run(["git", "remote", "add", "origin", url], cwd=str(repo_dir), check=True)
+    return repo_dir
+
+
+@requires_git
+def test_existing_clone_of_the_same_source_is_skipped(tmp_path):
+    existing_clone(tmp_path, "https://github.com/azerothcore/azerothcore-wotlk.git")
+    exit_code, builder = run(tmp_path, "--skip-build")
+    assert exit_code == cli.EXIT_OK
+    assert stage_states(builder)[-1] == ("clone", "skipped")
+
+
+@requires_git
+def test_existing_clone_of_another_source_fails(tmp_path):
+    existing_clone(tmp_path, "https://github.com/azerothcore/azerothcore-wotlk")
+    exit_code, builder = run(tmp_path, "--source", "npcbots", "--skip-build")
+    assert exit_code == cli.EXIT_FAILED
+    assert builder.calls == []
+    assert stage_states(builder)[-1] == ("clone", "failed")
+    messages = [event["message"] for event in builder.events() if event["event"] == "log"]
+    assert any("--reclone" in message for message in messages)
+
+
+@requires_git
+def test_reclone_replaces_a_clone_of_another_source(tmp_path):
+    existing_clone(tmp_path, "https://github.com/azerothcore/azerothcore-wotlk")
+    exit_code, builder = run(tmp_path, "--source", "npcbots", "--skip-build", "--reclone")
+    assert exit_code == cli.EXIT_OK
+    assert builder.calls == [("clone", "npcbots")]
+
+
+def test_data_only_run_drops_the_repack_steps(tmp_path):
+    options = resolve_build_options(parse("--app-dir", str(tmp_path), "--get-data"))
+    graph = BuildRun(StubBuilder(str(tmp_path)), options).repack_graph()
+    assert list(graph.tasks) == ["data"]
+    assert graph.tasks["data"].deps == ()
+
+
+def test_sql_import_needs_passwords(tmp_path, monkeypatch):
+    monkeypatch.delenv("ACB_MYSQL_PASSWORD", raising=False)
+    monkeypatch.delenv("ACB_MYSQL_ROOT_PASSWORD", raising=False)
+    (tmp_path / "GitSource" / "azerothcore-wotlk" / "data" / "sql").mkdir(parents=True)
+    exit_code, builder = run(tmp_path, "--skip-build", "--import-sql")
+    assert exit_code == cli.EXIT_FAILED
+    messages = [event["message"] for event in builder.events() if event["event"] == "log"]
+    assert any("MySQL passwords are required" in message for message in messages)
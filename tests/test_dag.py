@@ -0,0 +1,219 @@
+"""Tests for the repack task graph executor"""
+
+import os
+import threading
+
+import pytest
+
+from acb_core.dag import (TASK_BLOCKED, TASK_CANCELLED, TASK_DONE, TASK_FAILED, TASK_SKIPPED,
+                          Task, TaskGraph, TaskGraphError, outputs_up_to_date)
+from acb_core.pipeline import PipelineOperations
+
+
+class Recorder:
+    """Task actions that record the order they ran in"""
+
+    def __init__(self):
+        self.ran = []
+        self._lock = threading.Lock()
+
+    def action(self, name, result=None):
+        def run():
+            with self._lock:
+                self.ran.append(name)
+            return result
+        return run
+
+
+def states(results):
+    return {name: state for name, (state, elapsed) in results.items()}
+
+
+def test_order_puts_dependencies_first():
+    graph = TaskGraph([
+        Task("sql", None, deps=("myini",)),
+        Task("myini", None, deps=("repack",)),
+        Task("data", None, deps=("repack",)),
+        Task("repack", None),
+    ])
+    order = graph.order()
+    assert order.index("repack") < order.index("myini") < order.index("sql")
+    assert order.index("repack") < order.index("data")
+
+
+def test_cycle_is_rejected():
+    graph = TaskGraph([Task("a", None, deps=("b",)), Task("b", None, deps=("a",))])
+    with pytest.raises(TaskGraphError, match="cycle"):
+        graph.order()
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(TaskGraphError, match="unknown"):
+        TaskGraph([Task("a", None, deps=("missing",))]).order()
+
+
+def test_duplicate_task_is_rejected():
+    with pytest.raises(TaskGraphError):
+        TaskGraph([Task("a", None), Task("a", None)])
+
+
+def test_dependents_run_after_their_dependencies():
+    recorder = Recorder()
+    graph = TaskGraph([
+        Task("repack", recorder.action("repack")),
+        Task("configs", recorder.action("configs"), deps=("repack",)),
+        Task("mysql", recorder.action("mysql"), deps=("repack",)),
+        Task("init_mysql", recorder.action("init_mysql"), deps=("mysql",)),
+    ])
+    results = graph.run(max_workers=4)
+    assert set(states(results).values()) == {TASK_DONE}
+    assert recorder.ran[0] == "repack"
+    assert recorder.ran.index("mysql") < recorder.ran.index("init_mysql")
+
+
+def test_failure_blocks_everything_downstream():
+    recorder = Recorder()
+    graph = TaskGraph([
+        Task("repack", recorder.action("repack")),
+        Task("mysql", recorder.action("mysql", result=False), deps=("repack",)),
+        Task("init_mysql", recorder.action("init_mysql"), deps=("mysql",)),
+        Task("myini", recorder.action("myini"), deps=("init_mysql",)),
+        Task("data", recorder.action("data"), deps=("repack",)),
+    ])
+    assert states(graph.run()) == {
+        "repack": TASK_DONE,
+        "mysql": TASK_FAILED,
+        "init_mysql": TASK_BLOCKED,
+        "myini": TASK_BLOCKED,
+        "data": TASK_DONE,
+    }
+    assert "init_mysql" not in recorder.ran
+
+
+def test_exception_counts_as_failure():
+    def explode():
+        raise Exception("boom")
+    messages = []
+    results = TaskGraph([Task("a", explode, title="Explode")]).run(log=messages.append)
+    assert states(results) == {"a": TASK_FAILED}
+    assert "Explode failed: boom" in messages[0]
+
+
+def test_up_to_date_tasks_are_skipped_unless_forced():
+    recorder = Recorder()
+    graph = TaskGraph([
+        Task("repack", recorder.action("repack"), up_to_date=lambda: True),
+        Task("configs", recorder.action("configs"), deps=("repack",), up_to_date=lambda: False),
+    ])
+    assert states(graph.run()) == {"repack": TASK_SKIPPED, "configs": TASK_DONE}
+    assert recorder.ran == ["configs"]
+    assert states(graph.run(force=True)) == {"repack": TASK_DONE, "configs": TASK_DONE}
+
+
+def test_cancelled_graph_runs_nothing():
+    recorder = Recorder()
+    graph = TaskGraph([Task("a", recorder.action("a")), Task("b", recorder.action("b"), deps=("a",))])
+    assert states(graph.run(cancelled=lambda: True)) == {"a": TASK_CANCELLED, "b": TASK_BLOCKED}
+    assert recorder.ran == []
+
+
+def test_outputs_up_to_date_compares_modification_times(tmp_path):
+    source = tmp_path / "worldserver.exe"
+    copy = tmp_path / "copy.exe"
+    source.write_text("new")
+    assert not outputs_up_to_date([str(source)], [str(copy)])
+    copy.write_text("new")
+    assert outputs_up_to_date([str(source)], [str(copy)])
+
+
+def test_critical_path_follows_the_slowest_chain():
+    graph = TaskGraph([Task("a", None), Task("b", None, deps=("a",)), Task("c", None, deps=("a",))])
+    results = {"a": (TASK_DONE, 1.0), "b": (TASK_DONE, 5.0), "c": (TASK_DONE, 2.0)}
+    assert graph.critical_path(results) == (["a", "b"], 6.0)
+
+
+class Builder(PipelineOperations):
+    def __init__(self, app_dir):
+        self.app_dir = app_dir
+        self._init_pipeline_state()
+
+    def log_to_console(self, message):
+        pass
+
+
+@pytest.mark.parametrize("include_mysql, dependency", [(True, "myini"), (False, "repack")])
+def test_sql_import_waits_for_the_repack_mysql(tmp_path, include_mysql, dependency):
+    graph = Builder(str(tmp_path))._repack_task_graph(include_mysql=include_mysql, include_data=True,
+                                                      sql=(str(tmp_path), {}, {}))
+    assert graph.tasks["sql"].deps == (dependency,)
+    graph.order()
+
+
+def data_builder(tmp_path, extract):
+    builder = Builder(str(tmp_path))
+    zip_path = tmp_path / "temp" / "data.zip"
+    zip_path.parent.mkdir()
+    zip_path.write_bytes(b"zip")
+    builder._get_latest_data_download_url = lambda: "https://example.invalid/data.zip"
+    builder._get_download_cache = lambda: None
+    builder._use_pipelined_data_download = lambda url: False
+    builder._download_data_zip = lambda url, reporter=None: str(zip_path)
+    builder._extract_data_zip = extract
+    return builder
+
+
+def test_data_is_up_to_date_only_after_a_completed_extraction(tmp_path):
+    def interrupted(zip_file_path, data_dir, reporter=None):
+        for folder in ("dbc", "maps"):
+            os.makedirs(os.path.join(data_dir, folder))
+        raise OSError("disk full")
+
+    builder = data_builder(tmp_path, interrupted)
+    data_task = builder._repack_task_graph(include_mysql=False, include_data=True).tasks["data"]
+    with pytest.raises(OSError):
+        data_task.action()
+    assert not data_task.up_to_date()
+
+    builder._extract_data_zip = lambda zip_file_path, data_dir, reporter=None: None
+    assert data_task.action()
+    assert data_task.up_to_date()
+
+
+def test_repack_notices_a_change_below_the_top_level(tmp_path):
+    build_bin = tmp_path / "Build" / "bin" / "RelWithDebInfo"
+    script = build_bin / "lua_scripts" / "events" / "a.lua"
+    script.parent.mkdir(parents=True)
+    script.write_bytes(b"print(1)")
+    (build_bin / "worldserver.exe").write_bytes(b"exe")
+
+    builder = Builder(str(tmp_path))
+    repack_task = builder._repack_task_graph(include_mysql=False).tasks["repack"]
+    assert not repack_task.up_to_date()
+    repack_task.action()
+    assert repack_task.up_to_date()
+
+    script.write_bytes(b"print('changed')")
+    assert not repack_task.up_to_date()
+
+
+def test_repack_mysql_follows_the_installed_mysql(tmp_path):
+    installed = tmp_path / "MySQL Server 8.4"
+    (installed / "bin").mkdir(parents=True)
+    (installed / "bin" / "mysqld.exe").write_bytes(b"mysqld")
+    (installed / "lib" / "plugin").mkdir(parents=True)
+    (installed / "lib" / "plugin" / "auth.dll").write_bytes(b"v1")
+    (installed / "docs").mkdir()
+    (installed / "docs" / "manual.pdf").write_bytes(b"skipped")
+
+    builder = Builder(str(tmp_path))
+    builder.requirements = {"MySQL": {"detected": True, "path": str(installed)}}
+    mysql_task = builder._repack_task_graph().tasks["mysql"]
+    assert not mysql_task.up_to_date()
+    mysql_task.action()
+    # docs/* is in repack_mysql_skip, so its absence from the repack does not matter
+    assert mysql_task.up_to_date()
+
+    # An upgrade replaces the file, the repack may still hold a hard link to the old one
+    (installed / "lib" / "plugin" / "auth.dll").unlink()
+    (installed / "lib" / "plugin" / "auth.dll").write_bytes(b"v2 plugin")
+    assert not mysql_task.up_to_date()
@@ -0,0 +1,172 @@
+"""Tests for extracting data.zip over HTTP range requests while it downloads"""
+
+import io
+import json
+import hashlib
+import zipfile
+import threading
+import http.server
+
+import pytest
+
+import acb_core.net as net
+from acb_core.archive import ExtractionCancelled
+from acb_core.pipeline import DATA_MARKER_FILE, PipelineOperations, ProgressReporter
+
+
+def build_zip():
+    members = {
+        "dbc/Spell.dbc": bytes(range(256)) * 600,
+        "dbc/Map.dbc": b"map records " * 2000,
+        "maps/0000000.map": b"\x00\x01" * 40000,
+        "maps/0010000.map": b"terrain" * 5000,
+        "vmaps/temp_gameobject_models": b"models",
+        "README.txt": b"client data",
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue(), members
+
+
+ARCHIVE, MEMBERS = build_zip()
+
+
+class RangeHandler(http.server.BaseHTTPRequestHandler):
+    """Serves ARCHIVE with bytes=a-b and bytes=a- ranges unless ranges is False"""
+
+    ranges = True
+    etag = '"d1"'
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        type(self).requests.append(range_header)
+        if_range = self.headers.get("If-Range")
+        if self.ranges and range_header and (if_range is None or if_range == self.etag):
+            first, _, last = range_header[len("bytes="):].partition("-")
+            start = int(first)
+            end = int(last) if last else len(ARCHIVE) - 1
+            body = ARCHIVE[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{start + len(body) - 1}/{len(ARCHIVE)}")
+        else:
+            body = ARCHIVE
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(params=["urllib3", "urllib"])
+def server(request, monkeypatch):
+    """URL of data.zip on the stub server, fetched over the pooled urllib3 client and over the urllib fallback"""
+    if request.param == "urllib3":
+        if not net.URLLIB3_AVAILABLE:
+            pytest.skip("urllib3 is not installed")
+        monkeypatch.setattr(net, "http_client", net.HTTPClient())
+    else:
+        client = net.HTTPClient()
+        client._pool = None
+        monkeypatch.setattr(net, "http_client", client)
+    monkeypatch.setattr(net.time, "sleep", lambda seconds: None)
+    RangeHandler.ranges = True
+    RangeHandler.requests = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/data.zip"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class Builder(PipelineOperations):
+    def __init__(self, app_dir, config):
+        self.app_dir = app_dir
+        self.messages = []
+        with open(f"{app_dir}/acb_config.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        self._init_pipeline_state()
+
+    def log_to_console(self, message):
+        self.messages.append(message)
+
+
+class CancellingReporter(ProgressReporter):
+    cancelled = True
+
+
+def assert_extracted(data_dir):
+    for name, data in MEMBERS.items():
+        assert (data_dir / name).read_bytes() == data
+
+
+def test_streamed_extraction_without_the_cache(server, tmp_path):
+    builder = Builder(str(tmp_path), {"download_cache_enabled": False, "data_download_connections": 3})
+    data_dir = tmp_path / "Repack" / "data"
+
+    assert builder._stream_extract_data_zip(server, str(data_dir))
+    assert_extracted(data_dir)
+    # Every member was read over a range request, nothing was written to temp/
+    assert all(header and header.startswith("bytes=") for header in RangeHandler.requests)
+    assert not (tmp_path / "temp").exists()
+
+
+def test_streamed_ranges_are_assembled_into_the_download_cache(server, tmp_path):
+    builder = Builder(str(tmp_path), {"download_cache_dir": str(tmp_path / "cache")})
+    data_dir = tmp_path / "data"
+
+    assert builder._stream_extract_data_zip(server, str(data_dir))
+    assert_extracted(data_dir)
+
+    cache = builder._get_download_cache()
+    entry = cache.lookup(server)
+    assert entry["sha256"] == hashlib.sha256(ARCHIVE).hexdigest()
+    assert entry["etag"] == RangeHandler.etag
+    assert list((tmp_path / "cache" / "partial").iterdir()) == []
+
+
+def test_server_without_range_support_falls_back(server, tmp_path):
+    RangeHandler.ranges = False
+    builder = Builder(str(tmp_path), {"download_cache_dir": str(tmp_path / "cache")})
+
+    assert not builder._stream_extract_data_zip(server, str(tmp_path / "data"))
+    assert not (tmp_path / "data").exists()
+    assert any("falling back to download then extract" in message for message in builder.messages)
+
+
+def test_install_data_downloads_when_streaming_is_refused(server, tmp_path):
+    RangeHandler.ranges = False
+    builder = Builder(str(tmp_path), {"download_cache_enabled": False})
+    builder.data_url = server
+    data_dir = tmp_path / "data"
+
+    assert builder._install_data(str(data_dir))
+    assert_extracted(data_dir)
+    assert json.loads((data_dir / DATA_MARKER_FILE).read_text(encoding="utf-8"))["url"] == server
+    # The downloaded copy is cleaned up again
+    assert not (tmp_path / "temp").exists()
+
+
+def test_cancelled_stream_leaves_no_assembled_copy(server, tmp_path):
+    builder = Builder(str(tmp_path), {"download_cache_dir": str(tmp_path / "cache")})
+
+    with pytest.raises(ExtractionCancelled):
+        builder._stream_extract_data_zip(server, str(tmp_path / "data"), CancellingReporter())
+    assert list((tmp_path / "cache" / "partial").iterdir()) == []
+    assert not builder._get_download_cache().contains(server)
+
+
+def test_partial_download_is_resumed_instead_of_streamed(tmp_path):
+    builder = Builder(str(tmp_path), {"download_cache_enabled": False})
+    url = "https://example.invalid/data.zip"
+    assert builder._use_pipelined_data_download(url)
+
+    (tmp_path / "temp").mkdir()
+    (tmp_path / "temp" / "data.zip.part").write_bytes(ARCHIVE[:100])
+    assert not builder._use_pipelined_data_download(url)
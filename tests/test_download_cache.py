@@ -0,0 +1,127 @@
+"""Tests for the content-addressed download cache"""
+
+import hashlib
+import threading
+import http.server
+
+import pytest
+
+import acb_core.net as net
+from acb_core.net import DownloadCache
+
+BODY = b"dependency archive " * 1000
+
+
+class ConditionalHandler(http.server.BaseHTTPRequestHandler):
+    """Serves BODY with an ETag and answers a matching If-None-Match with 304"""
+
+    etag = '"a1"'
+    downloads = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        type(self).downloads += 1
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+@pytest.fixture
+def server():
+    ConditionalHandler.etag = '"a1"'
+    ConditionalHandler.downloads = 0
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ConditionalHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/openssl.zip"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def add_file(cache, tmp_path, url, data):
+    path = tmp_path / hashlib.sha1(url.encode()).hexdigest()
+    path.write_bytes(data)
+    return cache.add(url, str(path))
+
+
+def test_second_fetch_is_a_cache_hit(server, tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), 10 * 1024 * 1024)
+    first = cache.fetch(server)
+    second = cache.fetch(server, dest_path=str(tmp_path / "copy.zip"))
+
+    assert ConditionalHandler.downloads == 1
+    assert (tmp_path / "copy.zip").read_bytes() == BODY
+    assert first == cache.object_path(hashlib.sha256(BODY).hexdigest())
+    assert second == str(tmp_path / "copy.zip")
+
+
+def test_changed_etag_downloads_again(server, tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), 10 * 1024 * 1024)
+    cache.fetch(server)
+    ConditionalHandler.etag = '"a2"'
+    cache.fetch(server)
+    # The revalidation GET gets a 200 instead of a 304 and its body becomes the new cached copy
+    assert ConditionalHandler.downloads == 2
+    assert cache.lookup(server)["etag"] == '"a2"'
+
+
+def test_unchanged_file_is_revalidated_without_a_download(server, tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), 10 * 1024 * 1024)
+    assert cache.revalidate(server) is None
+    first = cache.fetch(server)
+    assert cache.contains(server)
+    assert cache.revalidate(server) == first
+    assert ConditionalHandler.downloads == 1
+
+
+def test_unreachable_server_uses_the_cached_copy(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), 10 * 1024 * 1024)
+    staged = tmp_path / "staged"
+    staged.write_bytes(b"cached")
+    # Nothing listens on the discard port
+    url = "http://127.0.0.1:9/openssl.zip"
+    path = cache.add(url, str(staged), etag='"a1"')
+    assert cache.revalidate(url, timeout=2) == path
+
+
+def test_corrupted_object_is_discarded(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), 10 * 1024 * 1024)
+    path = add_file(cache, tmp_path, "http://example.invalid/a.zip", b"original")
+    with open(path, "wb") as f:
+        f.write(b"tampered")
+    assert cache.lookup("http://example.invalid/a.zip") is None
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), 10 * 1024 * 1024)
+    first = add_file(cache, tmp_path, "http://example.invalid/a.zip", b"same")
+    second = add_file(cache, tmp_path, "http://mirror.invalid/a.zip", b"same")
+    assert first == second
+    assert cache.lookup("http://example.invalid/a.zip")["sha256"] == cache.lookup("http://mirror.invalid/a.zip")["sha256"]
+
+
+def test_least_recently_used_objects_are_evicted(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(net.time, "time", lambda: clock[0])
+    cache = DownloadCache(str(tmp_path / "cache"), 250)
+
+    for name in ("a", "b"):
+        clock[0] += 1
+        add_file(cache, tmp_path, f"http://example.invalid/{name}.zip", name.encode() * 100)
+
+    # a is used again, so b is now the least recently used
+    clock[0] += 1
+    cache.touch("http://example.invalid/a.zip")
+    clock[0] += 1
+    add_file(cache, tmp_path, "http://example.invalid/c.zip", b"c" * 100)
+
+    assert cache.lookup("http://example.invalid/b.zip") is None
+    assert cache.lookup("http://example.invalid/a.zip") is not None
+    assert cache.lookup("http://example.invalid/c.zip") is not None
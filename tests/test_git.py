@@ -0,0 +1,157 @@
+"""Tests for parsing git --progress output and running git"""
+
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+import acb_core.git as git
+from acb_core.git import GitCancelled, parse_git_progress, remote_name_for_url, run_git
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def test_receiving_objects_with_size_and_rate():
+    update = parse_git_progress("Receiving objects:  43% (1234/2870), 120.00 MiB | 12.00 MiB/s\r")
+    assert (update.phase, update.percent, update.done, update.total) == ("Receiving objects", 43, 1234, 2870)
+    assert (update.size, update.rate) == ("120.00 MiB", "12.00 MiB/s")
+    assert update.overall == pytest.approx(43 * 0.8)
+    assert update.describe() == "Receiving objects 43% (120.00 MiB, 12.00 MiB/s)"
+
+
+def test_final_line_with_done():
+    update = parse_git_progress("Resolving deltas: 100% (2000/2000), done.")
+    assert (update.phase, update.percent) == ("Resolving deltas", 100)
+    assert update.overall == pytest.approx(95)
+    assert update.describe() == "Resolving deltas 100%"
+
+
+def test_remote_phases_do_not_move_the_overall_bar():
+    update = parse_git_progress("remote: Compressing objects:  50% (10/20)")
+    assert update.phase == "Compressing objects"
+    assert update.overall == 0
+
+
+def test_updating_files_finishes_the_bar():
+    assert parse_git_progress("Updating files: 100% (9000/9000), done.").overall == pytest.approx(100)
+
+
+@pytest.mark.parametrize("line", [
+    "Cloning into 'azerothcore-wotlk'...",
+    "remote: Enumerating objects: 1234, done.",
+    "fatal: repository 'x' not found",
+    "",
+])
+def test_other_lines_are_not_progress(line):
+    assert parse_git_progress(line) is None
+
+
+def test_remote_name_for_url():
+    assert remote_name_for_url("https://github.com/azerothcore/azerothcore-wotlk.git") == \
+        "github.com-azerothcore-azerothcore-wotlk"
+    assert remote_name_for_url("https://github.com/Liyunfan1223/AzerothCore-wotlk") == \
+        "github.com-liyunfan1223-azerothcore-wotlk"
+
+
+def git_setup(*args, cwd=None):
+    subprocess.run(["git", "-c", "user.name=ACB", "-c", "user.email=acb@example.invalid"] + list(args),
+                   cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def bare_repo(tmp_path):
+    """file:// URL of a bare repository with one commit"""
+    work = tmp_path / "work"
+    work.mkdir()
+    git_setup("init", "-q", str(work))
+    (work / "README.md").write_text("AzerothCore module\n", encoding="utf-8")
+    git_setup("add", "README.md", cwd=str(work))
+    git_setup("commit", "-q", "-m", "Initial commit", cwd=str(work))
+    git_setup("clone", "-q", "--bare", str(work), str(tmp_path / "module.git"))
+    return (tmp_path / "module.git").as_uri()
+
+
+@requires_git
+def test_clone_over_file_url_reports_progress(bare_repo, tmp_path):
+    updates = []
+    target = tmp_path / "clone"
+    result = run_git(["clone", "--progress", bare_repo, str(target)], progress=updates.append)
+    assert result.returncode == 0
+    assert (target / "README.md").read_text(encoding="utf-8") == "AzerothCore module\n"
+    assert updates and all(update.phase for update in updates)
+    # Progress lines are removed from stderr, git's other messages are kept
+    assert "Receiving objects" not in result.stderr
+    assert "Cloning into" in result.stderr
+
+
+@requires_git
+def test_fetch_into_an_existing_clone(bare_repo, tmp_path):
+    target = tmp_path / "clone"
+    assert run_git(["clone", "-q", bare_repo, str(target)]).returncode == 0
+    result = run_git(["fetch", "--progress", "origin"], cwd=str(target))
+    assert result.returncode == 0
+    assert run_git(["rev-parse", "--is-inside-work-tree"], cwd=str(target)).stdout.strip() == "true"
+
+
+@requires_git
+def test_failing_command_keeps_its_return_code_and_message(tmp_path):
+    result = run_git(["clone", (tmp_path / "missing.git").as_uri(), str(tmp_path / "clone")])
+    assert result.returncode != 0
+    assert "fatal" in result.stderr
+
+
+@pytest.fixture
+def fake_git(monkeypatch):
+    """Replaces the git child process with a Python script, set script to its source"""
+    popen = subprocess.Popen
+    fake = {"script": "", "command": None}
+
+    def fake_popen(command, **kwargs):
+        fake["command"] = command
+        return popen([sys.executable, "-c", fake["script"]], **kwargs)
+
+    monkeypatch.setattr(git.subprocess, "Popen", fake_popen)
+    return fake
+
+
+def test_silent_child_is_killed_after_the_stall_timeout(fake_git):
+    fake_git["script"] = "import time; time.sleep(30)"
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired) as raised:
+        run_git(["fetch", "origin"], stall_timeout=0.5)
+    assert time.monotonic() - started < 10
+    assert raised.value.cmd == ["git", "fetch", "origin"]
+
+
+def test_output_keeps_a_slow_child_alive(fake_git):
+    # Prints more often than the stall timeout but runs longer than it in total
+    fake_git["script"] = ("import sys, time\n"
+                          "for i in range(6):\n"
+                          "    sys.stderr.write(f'Receiving objects: {i * 20}% ({i}/5)\\r'); sys.stderr.flush()\n"
+                          "    time.sleep(0.3)\n")
+    updates = []
+    result = run_git(["fetch", "--progress", "origin"], progress=updates.append, stall_timeout=1)
+    assert result.returncode == 0
+    assert [update.percent for update in updates] == [0, 20, 40, 60, 80, 100]
+    assert result.stderr == ""
+
+
+def test_cancel_kills_the_child(fake_git):
+    fake_git["script"] = "import time; time.sleep(30)"
+    started = time.monotonic()
+    deadline = started + 0.5
+    with pytest.raises(GitCancelled):
+        run_git(["clone", "https://example.invalid/module.git"], cancelled=lambda: time.monotonic() > deadline)
+    assert time.monotonic() - started < 10
+
+
+def test_return_code_and_stderr_of_the_child(fake_git):
+    fake_git["script"] = ("import sys; print('abc123')\n"
+                          "sys.stderr.write('fatal: not a git repository\\n'); sys.exit(128)\n")
+    result = run_git(["rev-parse", "HEAD"])
+    assert result.returncode == 128
+    assert result.stdout.strip() == "abc123"
+    assert result.stderr == "fatal: not a git repository"
+    assert fake_git["command"] == ["git", "rev-parse", "HEAD"]
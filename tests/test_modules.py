@@ -0,0 +1,228 @@
+"""Tests for cloning and updating modules in parallel against local bare repositories"""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import acb_core.pipeline as pipeline
+from acb_core.pipeline import PipelineOperations
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def git_setup(*args, cwd=None):
+    return subprocess.run(["git", "-c", "user.name=ACB", "-c", "user.email=acb@example.invalid"] + list(args),
+                          cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def make_module(tmp_path, name, commits=2):
+    """file:// URL of a bare repository named name with a few commits"""
+    work = tmp_path / "upstream" / name
+    work.mkdir(parents=True)
+    git_setup("init", "-q", str(work))
+    for number in range(commits):
+        (work / "README.md").write_text(f"{name} revision {number}\n", encoding="utf-8")
+        git_setup("add", "README.md", cwd=str(work))
+        git_setup("commit", "-q", "-m", f"Revision {number}", cwd=str(work))
+    bare = tmp_path / "remotes" / f"{name}.git"
+    git_setup("clone", "-q", "--bare", str(work), str(bare))
+    return bare.as_uri()
+
+
+class Builder(PipelineOperations):
+    def __init__(self, app_dir, config=None):
+        self.app_dir = app_dir
+        self.messages = []
+        with open(f"{app_dir}/acb_config.json", "w", encoding="utf-8") as f:
+            json.dump(config or {}, f)
+        self._init_pipeline_state()
+
+    def log_to_console(self, message):
+        self.messages.append(message)
+
+
+@pytest.fixture
+def statuses(monkeypatch):
+    """on_status callback that keeps every status per module; retries do not wait"""
+    monkeypatch.setattr(pipeline.time, "sleep", lambda seconds: None)
+    seen = {}
+
+    def on_status(name, text):
+        seen.setdefault(name, []).append(text)
+
+    on_status.seen = seen
+    return on_status
+
+
+def test_modules_are_cloned_shallow(tmp_path, statuses):
+    modules = [(name, make_module(tmp_path, name)) for name in ("mod-transmog", "mod-autobalance", "mod-ah-bot")]
+    modules_dir = tmp_path / "modules"
+
+    results = Builder(str(tmp_path))._clone_modules(modules, str(modules_dir), on_status=statuses)
+
+    assert results == {name: True for name, url in modules}
+    for name, url in modules:
+        assert (modules_dir / name / "README.md").read_text(encoding="utf-8") == f"{name} revision 1\n"
+        assert git_setup("rev-parse", "--is-shallow-repository", cwd=str(modules_dir / name)) == "true"
+        assert statuses.seen[name][:2] == ["⏸️ Queued", "⏳ Cloning"]
+        assert statuses.seen[name][-1].startswith("✅ Cloned")
+
+
+def test_missing_module_fails_after_its_retries(tmp_path, statuses):
+    good = make_module(tmp_path, "mod-transmog")
+    missing = (tmp_path / "remotes" / "mod-missing.git").as_uri()
+    builder = Builder(str(tmp_path), {"module_clone_retries": 1})
+
+    results = builder._clone_modules([("mod-missing", missing), ("mod-transmog", good)], str(tmp_path / "modules"),
+                                     on_status=statuses)
+
+    assert results == {"mod-missing": False, "mod-transmog": True}
+    assert statuses.seen["mod-missing"] == ["⏸️ Queued", "⏳ Cloning", "🔁 Retry 1/1", "❌ Failed"]
+    assert "⏱️ Cloned 1/2 modules" in builder.messages[-1]
+
+
+def test_retry_starts_from_a_clean_directory(tmp_path, statuses):
+    url = make_module(tmp_path, "mod-transmog")
+    modules_dir = tmp_path / "modules"
+    builder = Builder(str(tmp_path))
+    clone = builder._clone_module_repository
+    attempts = []
+
+    def flaky_clone(module_name, module_url, modules_dir, reporter=None):
+        attempts.append(module_name)
+        if len(attempts) == 1:
+            # A stalled clone leaves a partial checkout behind
+            (tmp_path / "modules" / module_name / ".git").mkdir(parents=True)
+            return False
+        return clone(module_name, module_url, modules_dir, reporter)
+
+    builder._clone_module_repository = flaky_clone
+    assert builder._clone_modules([("mod-transmog", url)], str(modules_dir), on_status=statuses) == \
+        {"mod-transmog": True}
+    assert attempts == ["mod-transmog", "mod-transmog"]
+    assert (modules_dir / "mod-transmog" / "README.md").exists()
+
+
+def test_cancelled_clone_starts_nothing(tmp_path, statuses):
+    url = make_module(tmp_path, "mod-transmog")
+    results = Builder(str(tmp_path))._clone_modules([("mod-transmog", url)], str(tmp_path / "modules"),
+                                                    on_status=statuses, cancelled=lambda: True)
+    assert results == {"mod-transmog": False}
+    assert statuses.seen["mod-transmog"][-1] == "❌ Cancelled"
+    assert list((tmp_path / "modules").iterdir()) == []
+
+
+def test_full_clone_borrows_from_the_git_cache(tmp_path, statuses):
+    url = make_module(tmp_path, "mod-transmog", commits=3)
+    modules_dir = tmp_path / "modules"
+    builder = Builder(str(tmp_path), {"module_clone_depth": 0})
+
+    assert builder._clone_modules([("mod-transmog", url)], str(modules_dir), on_status=statuses) == \
+        {"mod-transmog": True}
+    clone_dir = str(modules_dir / "mod-transmog")
+    assert git_setup("rev-list", "--count", "HEAD", cwd=clone_dir) == "3"
+    assert (tmp_path / "cache" / "git" / "modules" / "mod-transmog.git").is_dir()
+    # --dissociate leaves no link to the cache behind
+    assert not (modules_dir / "mod-transmog" / ".git" / "objects" / "info" / "alternates").exists()
+
+
+def push_commit(tmp_path, name, path, text):
+    """Commit path in the upstream work tree of name and push it to its bare repository"""
+    work = tmp_path / "upstream" / name
+    (work / path).parent.mkdir(parents=True, exist_ok=True)
+    (work / path).write_text(text, encoding="utf-8")
+    git_setup("add", path, cwd=str(work))
+    git_setup("commit", "-q", "-m", f"Change {path}", cwd=str(work))
+    git_setup("push", "-q", str(tmp_path / "remotes" / f"{name}.git"), "HEAD", cwd=str(work))
+
+
+@pytest.fixture
+def checkout(tmp_path):
+    """azerothcore-wotlk checkout with two cloned modules, all tracking local bare repositories"""
+    source_dir = tmp_path / "GitSource" / "azerothcore-wotlk"
+    git_setup("clone", "-q", make_module(tmp_path, "azerothcore-wotlk"), str(source_dir))
+    for name in ("mod-transmog", "mod-autobalance"):
+        git_setup("clone", "-q", make_module(tmp_path, name), str(source_dir / "modules" / name))
+    (source_dir / "modules" / "CMakeLists.txt").write_text("# not a module\n", encoding="utf-8")
+    return source_dir
+
+
+def update_all(builder, checkout, on_status=None):
+    repositories = builder._find_git_repositories(str(checkout))
+    return {result["name"]: result for result in builder._update_repositories(repositories, on_status=on_status)}
+
+
+def test_repositories_are_the_core_and_its_git_modules(tmp_path, checkout):
+    repositories = Builder(str(tmp_path))._find_git_repositories(str(checkout))
+    assert [name for name, path in repositories] == ["azerothcore-wotlk", "mod-autobalance", "mod-transmog"]
+
+
+def test_update_fast_forwards_and_records_the_changes(tmp_path, checkout, statuses):
+    push_commit(tmp_path, "azerothcore-wotlk", "src/server/CMakeLists.txt", "add_subdirectory(game)\n")
+    push_commit(tmp_path, "mod-transmog", "src/transmog.cpp", "// new feature\n")
+    push_commit(tmp_path, "mod-transmog", "README.md", "docs\n")
+    builder = Builder(str(tmp_path))
+
+    results = update_all(builder, checkout, on_status=statuses)
+
+    core, transmog, autobalance = results["azerothcore-wotlk"], results["mod-transmog"], results["mod-autobalance"]
+    assert (core["changed"], core["commits"], core["files"], core["cmake_changed"]) == \
+        (True, 1, ["src/server/CMakeLists.txt"], True)
+    assert (transmog["changed"], transmog["commits"], transmog["cmake_changed"]) == (True, 2, False)
+    assert sorted(transmog["files"]) == ["README.md", "src/transmog.cpp"]
+    assert (autobalance["ok"], autobalance["changed"], autobalance["status"]) == (True, False, "Up to date")
+    assert (checkout / "modules" / "mod-transmog" / "src" / "transmog.cpp").exists()
+    assert statuses.seen["mod-transmog"] == ["⏸️ Queued", "⏳ Fetching", "🆕 2 new commits"]
+
+    changes = builder._load_config_value("last_update_changes", {})
+    assert sorted(changes) == ["azerothcore-wotlk", "mod-transmog"]
+    assert changes["mod-transmog"]["files"] == 2 and changes["mod-transmog"]["new"] == transmog["new"]
+
+
+def test_unbuilt_updates_accumulate(tmp_path, checkout):
+    builder = Builder(str(tmp_path))
+    push_commit(tmp_path, "mod-transmog", "src/a.cpp", "a\n")
+    first = update_all(builder, checkout)["mod-transmog"]
+    push_commit(tmp_path, "mod-transmog", "src/b.cpp", "b\n")
+    second = update_all(builder, checkout)["mod-transmog"]
+
+    changes = builder._load_config_value("last_update_changes", {})["mod-transmog"]
+    assert (changes["commits"], changes["files"]) == (2, 2)
+    assert (changes["old"], changes["new"]) == (first["old"], second["new"])
+
+
+def test_local_commits_block_the_fast_forward(tmp_path, checkout):
+    module_dir = checkout / "modules" / "mod-transmog"
+    (module_dir / "local.conf").write_text("local\n", encoding="utf-8")
+    git_setup("add", "local.conf", cwd=str(module_dir))
+    git_setup("commit", "-q", "-m", "Local change", cwd=str(module_dir))
+    push_commit(tmp_path, "mod-transmog", "src/transmog.cpp", "// upstream\n")
+    builder = Builder(str(tmp_path))
+
+    result = update_all(builder, checkout)["mod-transmog"]
+
+    assert (result["ok"], result["changed"]) == (False, False)
+    assert result["status"] == "Cannot fast-forward (1 local commits)"
+    assert not (module_dir / "src" / "transmog.cpp").exists()
+    assert builder._load_config_value("last_update_changes", None) is None
+
+
+def test_checkout_without_upstream_is_left_alone(tmp_path):
+    repo_dir = tmp_path / "mod-local"
+    git_setup("init", "-q", str(repo_dir))
+    git_setup("commit", "-q", "--allow-empty", "-m", "Local module", cwd=str(repo_dir))
+
+    result = Builder(str(tmp_path))._update_repository("mod-local", str(repo_dir))
+    assert (result["ok"], result["changed"], result["status"]) == (True, False, "No upstream branch")
+
+
+def test_cancelled_update_fetches_nothing(tmp_path, checkout, statuses):
+    push_commit(tmp_path, "mod-transmog", "src/transmog.cpp", "// upstream\n")
+    repositories = [("mod-transmog", str(checkout / "modules" / "mod-transmog"))]
+
+    results = Builder(str(tmp_path))._update_repositories(repositories, on_status=statuses, cancelled=lambda: True)
+    assert [result["status"] for result in results] == ["Cancelled"]
+    assert statuses.seen["mod-transmog"][-1] == "❌ Cancelled"
+    assert not (checkout / "modules" / "mod-transmog" / "src").exists()
@@ -0,0 +1,88 @@
+"""Tests for the MSBuild output parser, replaying a captured build log"""
+
+import os
+
+from acb_core.msbuild import MSBuildOutputParser, count_solution_projects
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+SOLUTION = """Microsoft Visual Studio Solution File, Format Version 12.00
+Project("{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}") = "ALL_BUILD", "ALL_BUILD.vcxproj", "{A}"
+EndProject
+Project("{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}") = "INSTALL", "INSTALL.vcxproj", "{B}"
+EndProject
+Project("{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}") = "game", "src\\server\\game\\game.vcxproj", "{E}"
+EndProject
+Project("{2150E333-8FDC-42A3-9474-1A3956D46DE8}") = "CMakePredefinedTargets", "CMakePredefinedTargets", "{G}"
+EndProject
+"""
+
+
+def replay(name):
+    parser = MSBuildOutputParser()
+    events = []
+    with open(os.path.join(DATA_DIR, name), "r", encoding="utf-8") as f:
+        for line in f:
+            events += parser.feed(line)
+    return parser, events
+
+
+def test_projects_start_and_finish_once():
+    parser, events = replay("msbuild_failed.log")
+    started = [event[1] for event in events if event[0] == "project_started"]
+    finished = [(event[1], event[2]) for event in events if event[0] == "project_finished"]
+    assert started == ["ZERO_CHECK.vcxproj", "common.vcxproj", "game.vcxproj", "worldserver.vcxproj"]
+    assert finished == [
+        ("ZERO_CHECK.vcxproj", False),
+        ("common.vcxproj", False),
+        ("game.vcxproj", True),
+        ("worldserver.vcxproj", True),
+    ]
+    assert parser.failed_projects() == ["game.vcxproj", "worldserver.vcxproj"]
+
+
+def test_diagnostics_in_the_closing_summary_are_reported_once():
+    parser, events = replay("msbuild_failed.log")
+    assert len(parser.warnings) == 1
+    assert "warning C4100" in parser.warnings[0]
+    assert [error.split(": ", 1)[1].split(":")[0] for error in parser.errors] == ["error C2065", "fatal error LNK1104"]
+    assert len([event for event in events if event[0] == "error"]) == 2
+
+
+def test_node_prefix_and_line_endings_are_ignored():
+    parser = MSBuildOutputParser()
+    line = '  12>Project "C:\\B\\AzerothCore.sln" (1) is building "C:\\B\\shared.vcxproj" (12) on node 4.\r\n'
+    assert parser.feed(line) == [("project_started", "shared.vcxproj")]
+    assert parser.feed("   \r\n") == []
+
+
+def test_count_solution_projects(tmp_path):
+    solution = tmp_path / "AzerothCore.sln"
+    solution.write_text(SOLUTION, encoding="utf-8")
+    assert count_solution_projects(str(solution)) == 2
+    assert count_solution_projects(str(tmp_path / "missing.sln")) == 0
+
+
+def test_reference_target_calls_do_not_finish_a_project():
+    parser = MSBuildOutputParser()
+    events = []
+    with open(os.path.join(DATA_DIR, "msbuild_references.log"), "r", encoding="utf-8") as f:
+        for line in f:
+            events += parser.feed(line)
+            if "GetCopyToOutputDirectoryItems" in line:
+                # worldserver has queried game.vcxproj twice, game itself is still compiling
+                assert ("project_finished", "game.vcxproj", False) not in events
+    finished = [(event[1], event[2]) for event in events if event[0] == "project_finished"]
+    assert finished == [
+        ("lib.vcxproj", False),
+        ("lib.vcxproj", True),
+        ("game.vcxproj", False),
+        ("worldserver.vcxproj", False),
+    ]
+
+
+def test_projects_with_the_same_file_name_are_kept_apart():
+    parser, events = replay("msbuild_references.log")
+    assert len(parser.started) == len(parser.finished) == 4
+    assert parser.failed == {"c:/acb/build/modules/mod-ah-bot/lib.vcxproj"}
+    assert parser.failed_projects() == ["lib.vcxproj"]
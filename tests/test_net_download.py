@@ -0,0 +1,146 @@
+"""Tests for resumable downloads against a local HTTP server"""
+
+import json
+import threading
+import http.server
+
+import pytest
+
+import acb_core.net as net
+from acb_core.net import download_file_resumable
+
+PAYLOAD = bytes(range(256)) * 4096
+
+
+class RangeHandler(http.server.BaseHTTPRequestHandler):
+    """Serves PAYLOAD with Range/If-Range support; drop_after truncates the next response"""
+
+    etag = '"v1"'
+    drop_after = None
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        type(self).requests.append(dict(self.headers))
+        start = 0
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and (if_range is None or if_range == self.etag):
+            start = int(range_header[len("bytes="):].rstrip("-"))
+            if start >= len(PAYLOAD):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(PAYLOAD)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+        else:
+            self.send_response(200)
+        body = PAYLOAD[start:]
+        self.send_header("Content-Length", str(len(body)))
+        if self.etag:
+            self.send_header("ETag", self.etag)
+        self.end_headers()
+        if type(self).drop_after is not None:
+            # Close the connection part-way through the body
+            body = body[:type(self).drop_after]
+            type(self).drop_after = None
+            self.close_connection = True
+        self.wfile.write(body)
+
+
+@pytest.fixture(params=["urllib3", "urllib"])
+def client_path(request, monkeypatch):
+    """Runs a test over the pooled urllib3 client and over the plain urllib fallback"""
+    if request.param == "urllib3":
+        if not net.URLLIB3_AVAILABLE:
+            pytest.skip("urllib3 is not installed")
+        monkeypatch.setattr(net, "http_client", net.HTTPClient())
+    else:
+        client = net.HTTPClient()
+        client._pool = None
+        monkeypatch.setattr(net, "http_client", client)
+    return request.param
+
+
+@pytest.fixture
+def server(monkeypatch, client_path):
+    monkeypatch.setattr(net.time, "sleep", lambda seconds: None)
+    RangeHandler.etag = '"v1"'
+    RangeHandler.drop_after = None
+    RangeHandler.requests = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/data.zip"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def write_partial(dest, url, size, etag):
+    with open(dest + ".part", "wb") as f:
+        f.write(PAYLOAD[:size])
+    with open(dest + ".part.json", "w", encoding="utf-8") as f:
+        json.dump({"url": url, "etag": etag, "last_modified": None}, f)
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_full_download(server, tmp_path):
+    dest = str(tmp_path / "data.zip")
+    seen = []
+    download_file_resumable(server, dest, progress=lambda done, total: seen.append((done, total)))
+    assert read(dest) == PAYLOAD
+    assert seen[-1] == (len(PAYLOAD), len(PAYLOAD))
+    assert not (tmp_path / "data.zip.part").exists()
+
+
+def test_resumes_part_file_with_if_range(server, tmp_path):
+    dest = str(tmp_path / "data.zip")
+    write_partial(dest, server, 1000, '"v1"')
+    download_file_resumable(server, dest)
+    assert read(dest) == PAYLOAD
+    assert RangeHandler.requests[0]["Range"] == "bytes=1000-"
+    assert RangeHandler.requests[0]["If-Range"] == '"v1"'
+
+
+def test_changed_file_restarts_from_zero(server, tmp_path):
+    dest = str(tmp_path / "data.zip")
+    write_partial(dest, server, 1000, '"v0"')
+    download_file_resumable(server, dest)
+    assert read(dest) == PAYLOAD
+    assert len(RangeHandler.requests) == 1
+
+
+def test_complete_part_file_is_finished_on_416(server, tmp_path):
+    dest = str(tmp_path / "data.zip")
+    write_partial(dest, server, len(PAYLOAD), '"v1"')
+    download_file_resumable(server, dest)
+    assert read(dest) == PAYLOAD
+
+
+def test_dropped_connection_resumes(server, tmp_path):
+    RangeHandler.drop_after = 100000
+    dest = str(tmp_path / "data.zip")
+    download_file_resumable(server, dest)
+    assert read(dest) == PAYLOAD
+    # Everything received before the drop is kept (urllib3 1.x may lose the last partial read)
+    resumed_from = int(RangeHandler.requests[1]["Range"][len("bytes="):].rstrip("-"))
+    assert 0 < resumed_from <= 100000
+    assert RangeHandler.requests[1]["If-Range"] == '"v1"'
+
+
+def test_dropped_connection_without_validator_restarts(server, tmp_path):
+    RangeHandler.etag = None
+    RangeHandler.drop_after = 100000
+    dest = str(tmp_path / "data.zip")
+    download_file_resumable(server, dest)
+    assert read(dest) == PAYLOAD
+    assert "Range" not in RangeHandler.requests[1]
+    assert "If-Range" not in RangeHandler.requests[1]
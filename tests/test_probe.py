@@ -0,0 +1,119 @@
+"""Tests for mirror probing against a local HTTP server"""
+
+import threading
+import time
+import http.server
+
+import pytest
+
+import acb_core.net as net
+from acb_core.net import first_available_url, probe_url
+
+
+class MirrorHandler(http.server.BaseHTTPRequestHandler):
+    """/ok serves a file, /missing is a 404, /slow answers after a delay and /nohead refuses HEAD"""
+
+    delay = 1.0
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def answer(self, method):
+        type(self).requests.append((method, self.path))
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/nohead") and method == "HEAD":
+            self.send_response(405)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/slow"):
+            time.sleep(type(self).delay)
+        ranged = self.headers.get("Range") == "bytes=0-0"
+        self.send_response(206 if ranged else 200)
+        if ranged:
+            self.send_header("Content-Range", "bytes 0-0/4")
+        self.send_header("Content-Length", "1" if ranged else "4")
+        self.end_headers()
+        if method == "GET":
+            self.wfile.write(b"z" if ranged else b"zip!")
+
+    def do_HEAD(self):
+        self.answer("HEAD")
+
+    def do_GET(self):
+        self.answer("GET")
+
+
+@pytest.fixture(params=["urllib3", "urllib"])
+def mirror(request, monkeypatch):
+    """Base URL of the stub mirror, probed over the pooled urllib3 client and over the urllib fallback"""
+    if request.param == "urllib3":
+        if not net.URLLIB3_AVAILABLE:
+            pytest.skip("urllib3 is not installed")
+        monkeypatch.setattr(net, "http_client", net.HTTPClient())
+    else:
+        client = net.HTTPClient()
+        client._pool = None
+        monkeypatch.setattr(net, "http_client", client)
+    MirrorHandler.delay = 1.0
+    MirrorHandler.requests = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), MirrorHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_probe_url(mirror):
+    assert probe_url(f"{mirror}/ok/boost.7z")
+    assert not probe_url(f"{mirror}/missing/boost.7z")
+
+
+def test_probe_falls_back_to_a_one_byte_get_when_head_is_refused(mirror):
+    assert probe_url(f"{mirror}/nohead/boost.7z")
+    assert MirrorHandler.requests == [("HEAD", "/nohead/boost.7z"), ("GET", "/nohead/boost.7z")]
+
+
+def test_probe_gives_up_on_a_slow_mirror(mirror):
+    MirrorHandler.delay = 3.0
+    assert not probe_url(f"{mirror}/slow/boost.7z", timeout=0.5)
+
+
+def test_probe_of_an_unreachable_host():
+    # Nothing listens on the discard port
+    assert not probe_url("http://127.0.0.1:9/boost.7z", timeout=1)
+
+
+def test_first_available_skips_a_404_mirror(mirror):
+    candidates = [f"{mirror}/missing/boost.7z", f"{mirror}/ok/boost.7z", f"{mirror}/nohead/boost.7z"]
+    assert first_available_url(candidates) == f"{mirror}/ok/boost.7z"
+
+
+def test_first_available_waits_for_a_preferred_slow_mirror(mirror):
+    candidates = [f"{mirror}/slow/boost.7z", f"{mirror}/ok/boost.7z"]
+    assert first_available_url(candidates, timeout=5) == f"{mirror}/slow/boost.7z"
+
+
+def test_first_available_does_not_wait_for_a_slower_fallback(mirror):
+    MirrorHandler.delay = 3.0
+    candidates = [f"{mirror}/missing/boost.7z", f"{mirror}/ok/boost.7z", f"{mirror}/slow/boost.7z"]
+    started = time.monotonic()
+    assert first_available_url(candidates, timeout=5) == f"{mirror}/ok/boost.7z"
+    assert time.monotonic() - started < 2
+
+
+def test_first_available_falls_back_past_a_timed_out_mirror(mirror):
+    MirrorHandler.delay = 3.0
+    candidates = [f"{mirror}/slow/boost.7z", f"{mirror}/missing/boost.7z", f"{mirror}/ok/boost.7z"]
+    assert first_available_url(candidates, timeout=0.5) == f"{mirror}/ok/boost.7z"
+
+
+def test_first_available_returns_none_when_every_mirror_fails(mirror):
+    assert first_available_url([f"{mirror}/missing/a.7z", f"{mirror}/missing/b.7z"]) is None
+    assert first_available_url([]) is None
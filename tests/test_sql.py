@@ -0,0 +1,80 @@
+"""Tests for the streaming SQL tokenizer"""
+
+import io
+
+import pytest
+
+from acb_core.sql import iter_sql_statements
+
+
+def statements(text, chunk_size=1024 * 1024):
+    return [statement for statement, _ in iter_sql_statements(io.StringIO(text), chunk_size=chunk_size)]
+
+
+def test_splits_on_semicolons():
+    assert statements("SELECT 1;\nSELECT 2;\n") == ["SELECT 1", "SELECT 2"]
+
+
+def test_last_statement_without_delimiter():
+    assert statements("SELECT 1;\nSELECT 2") == ["SELECT 1", "SELECT 2"]
+
+
+def test_semicolons_inside_quotes_do_not_split():
+    text = "INSERT INTO t VALUES ('a;b', \"c;d\", `e;f`);\nSELECT 'it''s;', 'back\\'slash;';"
+    assert statements(text) == [
+        "INSERT INTO t VALUES ('a;b', \"c;d\", `e;f`)",
+        "SELECT 'it''s;', 'back\\'slash;'",
+    ]
+
+
+def test_comment_only_text_is_not_a_statement():
+    text = "-- header; comment\n# hash; comment\n/* block; comment */\nSELECT 1;\n-- trailer\n"
+    # Comments before a statement are sent with it; the trailing comment is dropped
+    [statement] = statements(text)
+    assert statement.endswith("*/\nSELECT 1")
+
+
+def test_double_dash_needs_whitespace_to_start_a_comment():
+    assert statements("SELECT 1--1;") == ["SELECT 1--1"]
+
+
+def test_versioned_comment_is_a_statement():
+    assert statements("/*!40101 SET NAMES utf8 */;\nSELECT 1;") == ["/*!40101 SET NAMES utf8 */", "SELECT 1"]
+
+
+def test_delimiter_command_changes_the_terminator():
+    text = (
+        "DROP PROCEDURE IF EXISTS p;\n"
+        "DELIMITER $$\n"
+        "CREATE PROCEDURE p() BEGIN SELECT 1; SELECT 2; END$$\n"
+        "DELIMITER ;\n"
+        "CALL p();\n"
+    )
+    assert statements(text) == [
+        "DROP PROCEDURE IF EXISTS p",
+        "CREATE PROCEDURE p() BEGIN SELECT 1; SELECT 2; END",
+        "CALL p()",
+    ]
+
+
+def test_code_excludes_comments_and_string_literals():
+    text = "INSERT INTO `acore_world`.`t` VALUES ('acore_auth') -- acore_characters\n;"
+    [(statement, code)] = list(iter_sql_statements(io.StringIO(text), collect_code=True))
+    assert "`acore_world`" in code
+    assert "acore_auth" not in code
+    assert "acore_characters" not in code
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_tokens_split_across_chunks(chunk_size):
+    text = (
+        "SELECT 'a;''b';\n"
+        "-- comment;\n"
+        "/* c; */ SELECT 2;\n"
+        "DELIMITER //\n"
+        "CREATE TRIGGER x BEGIN SET @a = ';'; END//\n"
+        "DELIMITER ;\n"
+        "SELECT 3"
+    )
+    assert statements(text, chunk_size) == statements(text)
+    assert len(statements(text)) == 4
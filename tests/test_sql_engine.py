@@ -0,0 +1,199 @@
+"""Tests for SQLImportEngine transactions against a fake pymysql connection"""
+
+import types
+
+import pytest
+
+import acb_core.sql as sql
+from acb_core.sql import SQLImportEngine, SQLScriptAnalysis
+
+MYSQL_DETAILS = {"host": "127.0.0.1", "port": "3306", "user": "acore", "password": "acore"}
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, statement, args=None):
+        self.connection.calls.append(("execute", statement.strip()))
+        session = self.connection.session
+        if self.connection.fail_on and self.connection.fail_on in statement:
+            raise Exception(f"You have an error in your SQL syntax near '{self.connection.fail_on}'")
+        if statement.startswith("SELECT @@SESSION"):
+            self._row = (session["unique_checks"], session["foreign_key_checks"])
+        elif statement.startswith("SET SESSION"):
+            values = args if args is not None else (0, 0)
+            session["unique_checks"], session["foreign_key_checks"] = values
+        else:
+            self.connection.executed.append((statement.strip(), dict(session)))
+        return 1
+
+    def fetchone(self):
+        return self._row
+
+    def nextset(self):
+        return None
+
+
+class FakeConnection:
+    """Records begin/commit/rollback and every statement with the session settings it ran under"""
+
+    def __init__(self, database):
+        self.database = database
+        self.calls = []
+        self.executed = []
+        self.session = {"unique_checks": 1, "foreign_key_checks": 1}
+        self.fail_on = None
+        self.rollback_fails = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def select_db(self, database):
+        self.database = database
+
+    def begin(self):
+        self.calls.append(("begin",))
+
+    def commit(self):
+        self.calls.append(("commit",))
+
+    def rollback(self):
+        self.calls.append(("rollback",))
+        if self.rollback_fails:
+            raise Exception("Lost connection to MySQL server during query")
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Every FakeConnection the engine opened, in order"""
+    opened = []
+
+    def connect(**kwargs):
+        opened.append(FakeConnection(kwargs["database"]))
+        return opened[-1]
+
+    monkeypatch.setattr(sql, "pymysql", types.SimpleNamespace(connect=connect), raising=False)
+    return opened
+
+
+def write_sql(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def transactions(connection):
+    return [call[0] for call in connection.calls if call[0] != "execute"]
+
+
+def test_each_file_commits_on_one_persistent_connection(connections, tmp_path):
+    engine = SQLImportEngine(MYSQL_DETAILS, log=lambda message: None)
+    first = write_sql(tmp_path, "a.sql", "INSERT INTO creature VALUES (1);\nINSERT INTO creature VALUES (2);\n")
+    second = write_sql(tmp_path, "b.sql", "DELETE FROM creature WHERE guid = 1;\n")
+
+    assert engine.import_file("acore_world", first) == (True, None, 2)
+    assert engine.import_file("acore_world", second) == (True, None, 1)
+    assert len(connections) == 1
+    assert transactions(connections[0]) == ["begin", "commit", "begin", "commit"]
+
+
+def test_failed_statement_rolls_back_its_file_only(connections, tmp_path):
+    engine = SQLImportEngine(MYSQL_DETAILS, log=lambda message: None)
+    broken = write_sql(tmp_path, "a.sql", "INSERT INTO creature VALUES (1);\nINSRT INTO creature VALUES (2);\n")
+    engine.import_file("acore_world", write_sql(tmp_path, "ok.sql", "SELECT 1;\n"))
+    connections[0].fail_on = "INSRT"
+
+    success, error, rows = engine.import_file("acore_world", broken)
+    assert not success
+    assert error.startswith("statement 2: ") and "INSRT" in error
+    assert rows == 1
+    assert transactions(connections[0]) == ["begin", "commit", "begin", "rollback"]
+
+    # The connection survives a rolled back file
+    connections[0].fail_on = None
+    assert engine.import_file("acore_world", write_sql(tmp_path, "c.sql", "SELECT 2;\n"))[0]
+    assert len(connections) == 1
+
+
+def test_broken_connection_is_reopened(connections, tmp_path):
+    engine = SQLImportEngine(MYSQL_DETAILS, log=lambda message: None)
+    engine.import_file("acore_world", write_sql(tmp_path, "a.sql", "SELECT 1;\n"))
+    connections[0].fail_on = "SELECT"
+    connections[0].rollback_fails = True
+    assert not engine.import_file("acore_world", write_sql(tmp_path, "b.sql", "SELECT 2;\n"))[0]
+
+    assert engine.import_file("acore_world", write_sql(tmp_path, "c.sql", "UPDATE creature SET id = 1;\n"))[0]
+    assert len(connections) == 2
+    assert transactions(connections[1]) == ["begin", "commit"]
+
+
+def test_on_databases_runs_before_the_first_reference(connections, tmp_path):
+    engine = SQLImportEngine(MYSQL_DETAILS, log=lambda message: None)
+    sql_file = write_sql(tmp_path, "a.sql", (
+        "UPDATE creature SET id = 1;\n"
+        "INSERT INTO acore_characters.character_settings VALUES (1);\n"
+        "DELETE FROM acore_characters.character_settings;\n"
+    ))
+    requested = []
+
+    def on_databases(names):
+        requested.append((names, len(connections[0].executed)))
+        return True
+
+    analysis = SQLScriptAnalysis()
+    assert engine.import_file("acore_world", sql_file, analysis=analysis, on_databases=on_databases)[0]
+    # Called once, after the first statement and before the one naming acore_characters
+    assert requested == [(["acore_characters"], 1)]
+    assert analysis.result()["databases"] == ["acore_characters"]
+
+
+def test_unavailable_database_stops_the_file(connections, tmp_path):
+    engine = SQLImportEngine(MYSQL_DETAILS, log=lambda message: None)
+    sql_file = write_sql(tmp_path, "a.sql", (
+        "UPDATE creature SET id = 1;\n"
+        "INSERT INTO acore_playerbots.playerbots_names VALUES (1);\n"
+    ))
+
+    success, error, rows = engine.import_file("acore_world", sql_file, on_databases=lambda names: False)
+    assert not success
+    assert error == "statement 2: required database acore_playerbots is not available"
+    assert [statement for statement, session in connections[0].executed] == ["UPDATE creature SET id = 1"]
+    assert transactions(connections[0]) == ["begin", "rollback"]
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_bulk_mode_restores_the_session_checks(connections, tmp_path, fail):
+    engine = SQLImportEngine(MYSQL_DETAILS, log=lambda message: None)
+    engine.import_file("acore_world", write_sql(tmp_path, "a.sql", "SELECT 1;\n"))
+    connection = connections[0]
+    # Whatever the session had before is put back, not a hard-coded 1
+    connection.session = {"unique_checks": 1, "foreign_key_checks": 0}
+    connection.fail_on = "broken" if fail else None
+
+    sql_file = write_sql(tmp_path, "b.sql", "INSERT INTO item_template VALUES (1);\nINSERT broken;\n")
+    assert engine.import_file("acore_world", sql_file, bulk=True)[0] is not fail
+
+    assert connection.executed[1] == ("INSERT INTO item_template VALUES (1)",
+                                      {"unique_checks": 0, "foreign_key_checks": 0})
+    assert connection.session == {"unique_checks": 1, "foreign_key_checks": 0}
+
+
+def test_without_bulk_the_session_is_untouched(connections, tmp_path):
+    engine = SQLImportEngine(MYSQL_DETAILS, log=lambda message: None)
+    engine.import_file("acore_world", write_sql(tmp_path, "a.sql", "INSERT INTO item_template VALUES (1);\n"))
+    assert not any(call[1].startswith("SET SESSION") for call in connections[0].calls if call[0] == "execute")
+    assert connections[0].executed[0][1] == {"unique_checks": 1, "foreign_key_checks": 1}
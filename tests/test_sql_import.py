@@ -0,0 +1,372 @@
+"""Tests for the per-database SQL import pipelines with the MySQL side stubbed"""
+
+import json
+import os
+import threading
+
+import subprocess
+
+import pytest
+
+import acb_core.pipeline as pipeline
+from acb_core.pipeline import PipelineOperations, ProgressReporter
+from acb_core.sql import SQL_BULK_MAX_ALLOWED_PACKET, SchemaCatalog, SQLUpdateLedger
+
+MYSQL_DETAILS = {"host": "127.0.0.1", "port": "3306", "user": "acore", "password": "acore"}
+ROOT_CREDENTIALS = {"create": True, "root_user": "root", "root_password": "root"}
+
+# base → updates → pending per database, listed out of order on purpose
+SQL_TREE = {
+    "base/db_auth/realmlist.sql": "INSERT INTO realmlist VALUES (1);",
+    "base/db_auth/account.sql": "CREATE TABLE account (id INT);",
+    "updates/db_auth/2024_01_02_00.sql": "UPDATE realmlist SET name = 'ACB';",
+    "base/db_characters/characters.sql": "CREATE TABLE characters (guid INT);",
+    "updates/db_characters/2024_01_01_00.sql": "ALTER TABLE characters ADD name TEXT;",
+    "updates/db_characters/2024_01_01_01.sql": "ALTER TABLE characters ADD race INT;",
+    "updates/pending_db_characters/rev_1.sql": "ALTER TABLE characters ADD class INT;",
+    "base/db_world/creature.sql": "CREATE TABLE creature (guid INT);",
+    "updates/db_world/2024_01_01_00.sql": "INSERT INTO creature VALUES (1);",
+    "updates/pending_db_world/rev_2.sql": "DELETE FROM creature WHERE guid = 1;",
+}
+
+
+class LedgerDatabase:
+    """Keeps the acb_updates rows of every database in memory"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def run_query(self, database_name, sql):
+        rows = self.rows.setdefault(database_name, {})
+        if sql.startswith("SELECT"):
+            return list(rows.items())
+        if sql.startswith("REPLACE"):
+            values = sql[sql.index("VALUES (") + 8:].split(", ")
+            rows[values[0].strip("'")] = values[1].strip("'")
+        return []
+
+
+class Builder(PipelineOperations):
+    """Imports by recording (database, file, bulk) instead of talking to MySQL"""
+
+    def __init__(self, app_dir, sql_base_dir, database=None):
+        self.app_dir = app_dir
+        self._init_pipeline_state()
+        self.sql_base_dir = sql_base_dir
+        self.database = database or LedgerDatabase()
+        self.imported = []
+        self.fail_on = {}
+        self.list_databases = False
+        self._imported_lock = threading.Lock()
+
+    def log_to_console(self, message):
+        pass
+
+    def _open_sql_import_engine(self, mysql_details):
+        return None
+
+    def _load_schema_catalog(self, mysql_details):
+        return super()._load_schema_catalog(mysql_details) if self.list_databases else None
+
+    def _create_sql_update_ledger(self, mysql_details, sql_engine, root_dir):
+        return SQLUpdateLedger(self.database.run_query, root_dir, log=self.log_to_console)
+
+    def _import_single_sql_file(self, database_name, sql_file, mysql_details, root_credentials=None,
+                                sql_engine=None, bulk=False):
+        name = os.path.relpath(sql_file, self.sql_base_dir).replace(os.path.sep, "/")
+        with self._imported_lock:
+            self.imported.append((database_name, name, bulk))
+        outcome = self.fail_on.get(name)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome is None
+
+
+def write_tree(root, tree):
+    for name, text in tree.items():
+        path = root.joinpath(*name.split("/"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def sql_base(tmp_path):
+    root = tmp_path / "azerothcore-wotlk" / "data" / "sql"
+    write_tree(root, SQL_TREE)
+    return root
+
+
+def make_builder(tmp_path, sql_base, config=None, database=None):
+    (tmp_path / "acb_config.json").write_text(json.dumps(config or {}), encoding="utf-8")
+    return Builder(str(tmp_path), str(sql_base), database)
+
+
+def imported_for(builder, database_name):
+    return [name for database, name, bulk in builder.imported if database == database_name]
+
+
+def test_each_database_imports_base_then_updates_then_pending(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base)
+    ledger = builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+
+    assert imported_for(builder, "acore_auth") == [
+        "base/db_auth/account.sql", "base/db_auth/realmlist.sql", "updates/db_auth/2024_01_02_00.sql"]
+    assert imported_for(builder, "acore_characters") == [
+        "base/db_characters/characters.sql", "updates/db_characters/2024_01_01_00.sql",
+        "updates/db_characters/2024_01_01_01.sql", "updates/pending_db_characters/rev_1.sql"]
+    assert imported_for(builder, "acore_world") == [
+        "base/db_world/creature.sql", "updates/db_world/2024_01_01_00.sql", "updates/pending_db_world/rev_2.sql"]
+    assert (ledger.applied, ledger.skipped, ledger.failed) == (len(SQL_TREE), 0, 0)
+
+
+def test_databases_are_imported_in_parallel(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base, {"sql_import_workers": 3})
+    # Every pipeline has to reach its first file before any of them can go on
+    barrier = threading.Barrier(3, timeout=10)
+    import_file = builder._import_single_sql_file
+
+    def import_together(database_name, sql_file, *args, **kwargs):
+        if sql_file.endswith(("account.sql", "characters.sql", "creature.sql")):
+            barrier.wait()
+        return import_file(database_name, sql_file, *args, **kwargs)
+
+    builder._import_single_sql_file = import_together
+    builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert len(builder.imported) == len(SQL_TREE)
+
+
+def test_progress_counts_every_file(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base)
+    values = []
+
+    class Reporter(ProgressReporter):
+        def progress(self, value):
+            values.append(value)
+
+    builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS, Reporter())
+    assert len(values) == len(SQL_TREE)
+    assert values[-1] == pytest.approx(100)
+
+
+def test_error_stops_its_database_and_reaches_the_caller(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base, {"sql_import_workers": 1})
+    builder.fail_on["updates/db_characters/2024_01_01_00.sql"] = RuntimeError("MySQL server has gone away")
+
+    with pytest.raises(RuntimeError, match="gone away"):
+        builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    # Nothing after the failing file ran for that database
+    assert imported_for(builder, "acore_characters") == [
+        "base/db_characters/characters.sql", "updates/db_characters/2024_01_01_00.sql"]
+    assert builder.schema_catalog is None
+
+
+def test_failed_file_is_counted_and_not_recorded(tmp_path, sql_base):
+    database = LedgerDatabase()
+    builder = make_builder(tmp_path, sql_base, database=database)
+    builder.fail_on["updates/db_world/2024_01_01_00.sql"] = False
+    ledger = builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+
+    assert ledger.failed == 1
+    assert "updates/db_world/2024_01_01_00.sql" not in database.rows["acore_world"]
+    # The pipeline carries on with the files after it
+    assert imported_for(builder, "acore_world")[-1] == "updates/pending_db_world/rev_2.sql"
+
+    # Only the failed file is imported again
+    rerun = make_builder(tmp_path, sql_base, database=database)
+    ledger = rerun._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert rerun.imported == [("acore_world", "updates/db_world/2024_01_01_00.sql", False)]
+    assert (ledger.applied, ledger.skipped) == (1, len(SQL_TREE) - 1)
+
+
+def test_changed_base_dump_reapplies_the_updates_after_it(tmp_path, sql_base):
+    database = LedgerDatabase()
+    make_builder(tmp_path, sql_base, database=database)._import_database_sql(
+        str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    write_tree(sql_base, {"base/db_characters/characters.sql": "CREATE TABLE characters (guid BIGINT);"})
+
+    rerun = make_builder(tmp_path, sql_base, database=database)
+    rerun._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert imported_for(rerun, "acore_characters") == [
+        "base/db_characters/characters.sql", "updates/db_characters/2024_01_01_00.sql",
+        "updates/db_characters/2024_01_01_01.sql", "updates/pending_db_characters/rev_1.sql"]
+    assert imported_for(rerun, "acore_auth") == []
+
+
+class FakeMySQLClient:
+    """Stands in for subprocess.run of mysql.exe, answering SHOW/CREATE DATABASE from a set"""
+
+    def __init__(self, databases):
+        self.databases = set(databases)
+        self.commands = []
+
+    def run(self, cmd, **kwargs):
+        sql = cmd[cmd.index("-e") + 1] if "-e" in cmd else ""
+        self.commands.append(sql)
+        stdout = ""
+        if sql == "SHOW DATABASES;":
+            stdout = "".join(f"{name}\n" for name in sorted(self.databases))
+        elif sql.startswith("SHOW DATABASES LIKE"):
+            name = sql.split("'")[1]
+            stdout = f"Database ({name})\n{name}\n" if name in self.databases else ""
+        elif sql.startswith("CREATE DATABASE"):
+            self.databases.add(sql.split("`")[1])
+        return subprocess.CompletedProcess(cmd, 0, stdout, "")
+
+    def count(self, prefix):
+        return len([sql for sql in self.commands if sql.startswith(prefix)])
+
+
+@pytest.fixture
+def mysql_client(monkeypatch):
+    client = FakeMySQLClient(["information_schema", "acore_auth", "acore_world"])
+    monkeypatch.setattr(pipeline.subprocess, "run", client.run)
+    monkeypatch.setattr(PipelineOperations, "_get_mysql_executable_path", lambda self: "mysql.exe")
+    return client
+
+
+def catalog_builder(tmp_path):
+    builder = Builder(str(tmp_path), str(tmp_path))
+    builder.list_databases = True
+    return builder
+
+
+def test_catalog_answers_existence_checks_from_memory(tmp_path, mysql_client):
+    builder = catalog_builder(tmp_path)
+    builder.schema_catalog = builder._load_schema_catalog(MYSQL_DETAILS)
+    assert mysql_client.commands == ["SHOW DATABASES;"]
+
+    for _ in range(3):
+        assert builder._database_exists("acore_world", MYSQL_DETAILS)
+        # MySQL on Windows compares database names case-insensitively
+        assert builder._database_exists("ACORE_AUTH", MYSQL_DETAILS)
+        assert not builder._database_exists("acore_characters", MYSQL_DETAILS)
+    assert mysql_client.commands == ["SHOW DATABASES;"]
+
+
+def test_created_database_joins_the_catalog(tmp_path, mysql_client):
+    builder = catalog_builder(tmp_path)
+    builder.schema_catalog = builder._load_schema_catalog(MYSQL_DETAILS)
+
+    for sql_file in ("a.sql", "b.sql", "c.sql"):
+        assert builder._ensure_required_databases(["acore_playerbots"], sql_file, MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert mysql_client.count("CREATE DATABASE") == 1
+    assert mysql_client.count("SHOW DATABASES") == 1
+
+
+def test_without_a_catalog_each_check_asks_the_server(tmp_path, mysql_client):
+    builder = catalog_builder(tmp_path)
+    assert builder.schema_catalog is None
+    assert builder._database_exists("acore_world", MYSQL_DETAILS)
+    assert not builder._database_exists("acore_characters", MYSQL_DETAILS)
+    assert mysql_client.count("SHOW DATABASES LIKE") == 2
+
+
+def test_missing_database_without_root_credentials_skips_the_file(tmp_path, mysql_client):
+    builder = catalog_builder(tmp_path)
+    builder.schema_catalog = SchemaCatalog(["acore_world"])
+    assert not builder._ensure_required_databases(["acore_playerbots"], "a.sql", MYSQL_DETAILS, {"create": False})
+    assert mysql_client.count("CREATE DATABASE") == 0
+
+
+def test_catalog_lives_for_one_import(tmp_path, sql_base, mysql_client):
+    builder = make_builder(tmp_path, sql_base)
+    builder.list_databases = True
+    seen = []
+    import_file = builder._import_single_sql_file
+
+    def import_and_check(database_name, sql_file, *args, **kwargs):
+        seen.append(builder.schema_catalog)
+        return import_file(database_name, sql_file, *args, **kwargs)
+
+    builder._import_single_sql_file = import_and_check
+    builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert seen and all(catalog is seen[0] for catalog in seen)
+    assert isinstance(seen[0], SchemaCatalog)
+    assert mysql_client.count("SHOW DATABASES;") == 1
+    assert builder.schema_catalog is None
+
+
+class PacketServer:
+    """Answers the root queries _set_server_max_allowed_packet sends"""
+
+    def __init__(self, value=64 * 1024 * 1024):
+        self.value = value
+        self.queries = []
+
+    def run_query(self, database_name, sql, mysql_details):
+        self.queries.append((mysql_details["user"], sql))
+        if sql.startswith("SELECT @@GLOBAL.max_allowed_packet"):
+            return [(str(self.value),)]
+        if sql.startswith("SET GLOBAL max_allowed_packet"):
+            self.value = int(sql.rsplit("=", 1)[1])
+        return []
+
+
+def test_bulk_mode_covers_only_the_base_dumps(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base, {"sql_bulk_import": True})
+    server = PacketServer()
+    builder._run_mysql_client_query = server.run_query
+    builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+
+    bulk_files = sorted(name for database, name, bulk in builder.imported if bulk)
+    assert bulk_files == sorted(name for name in SQL_TREE if name.startswith("base/"))
+
+
+def test_bulk_mode_raises_and_restores_max_allowed_packet(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base, {"sql_bulk_import": True})
+    server = PacketServer()
+    builder._run_mysql_client_query = server.run_query
+    during = []
+    import_file = builder._import_single_sql_file
+
+    def import_and_check(*args, **kwargs):
+        during.append(server.value)
+        return import_file(*args, **kwargs)
+
+    builder._import_single_sql_file = import_and_check
+    builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert set(during) == {SQL_BULK_MAX_ALLOWED_PACKET}
+    assert server.value == 64 * 1024 * 1024
+    # Only root can change a global variable
+    assert {user for user, sql in server.queries} == {"root"}
+
+
+def test_max_allowed_packet_is_restored_after_an_error(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base, {"sql_bulk_import": True})
+    server = PacketServer()
+    builder._run_mysql_client_query = server.run_query
+    builder.fail_on["base/db_world/creature.sql"] = RuntimeError("Lost connection")
+    with pytest.raises(RuntimeError):
+        builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert server.value == 64 * 1024 * 1024
+
+
+def test_without_bulk_mode_the_server_is_left_alone(tmp_path, sql_base):
+    builder = make_builder(tmp_path, sql_base)
+    server = PacketServer()
+    builder._run_mysql_client_query = server.run_query
+    builder._import_database_sql(str(sql_base), MYSQL_DETAILS, ROOT_CREDENTIALS)
+    assert server.queries == []
+    assert not any(bulk for database, name, bulk in builder.imported)
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_client_import_relaxes_checks_only_in_bulk_mode(tmp_path, monkeypatch, bulk):
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(pipeline.subprocess, "run", run)
+    monkeypatch.setattr(PipelineOperations, "_get_mysql_executable_path", lambda self: "mysql.exe")
+    sql_file = tmp_path / "creature.sql"
+    sql_file.write_text("INSERT INTO creature VALUES (1);", encoding="utf-8")
+    builder = Builder(str(tmp_path), str(tmp_path))
+    assert builder._import_sql_file_with_client("acore_world", str(sql_file), MYSQL_DETAILS, bulk=bulk) == (True, "")
+
+    cmd = calls[0]
+    assert cmd[-1] == "acore_world"
+    bulk_args = [f"--max_allowed_packet={SQL_BULK_MAX_ALLOWED_PACKET}",
+                 "--init-command=SET SESSION unique_checks = 0, foreign_key_checks = 0"]
+    assert all((arg in cmd) is bulk for arg in bulk_args)
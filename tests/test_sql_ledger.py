@@ -0,0 +1,92 @@
+"""Tests for the applied-file ledger behind incremental SQL import"""
+
+import os
+
+from acb_core.sql import SQLUpdateLedger, analyze_sql_file, sql_file_hash
+
+
+class FakeDatabase:
+    """Answers the ledger's queries from a dict and records every statement"""
+
+    def __init__(self, fail=False):
+        self.rows = {}
+        self.queries = []
+        self.fail = fail
+
+    def run_query(self, database_name, sql):
+        self.queries.append((database_name, sql))
+        if self.fail:
+            raise Exception("Unknown database")
+        if sql.startswith("SELECT"):
+            return [(name, file_hash) for name, file_hash in self.rows.items()]
+        if sql.startswith("REPLACE"):
+            values = sql[sql.index("VALUES (") + 8:].split(", ")
+            self.rows[values[0].strip("'")] = values[1].strip("'")
+        return []
+
+
+def write_sql(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_file_name_is_relative_with_forward_slashes(tmp_path):
+    ledger = SQLUpdateLedger(FakeDatabase().run_query, str(tmp_path), log=lambda message: None)
+    assert ledger.file_name(os.path.join(str(tmp_path), "updates", "db_world", "a.sql")) == "updates/db_world/a.sql"
+
+
+def test_recorded_file_is_skipped_until_its_content_changes(tmp_path):
+    database = FakeDatabase()
+    sql_file = write_sql(tmp_path, "a.sql", "UPDATE creature SET id = 1;\n")
+    file_hash = sql_file_hash(sql_file)
+
+    ledger = SQLUpdateLedger(database.run_query, str(tmp_path), log=lambda message: None)
+    assert ledger.recorded_hash("acore_world", "a.sql") is None
+    ledger.record("acore_world", "a.sql", file_hash, "RELEASED", 12)
+
+    # A later run loads the ledger from the database
+    rerun = SQLUpdateLedger(database.run_query, str(tmp_path), log=lambda message: None)
+    assert rerun.is_applied("acore_world", "a.sql", file_hash)
+
+    write_sql(tmp_path, "a.sql", "UPDATE creature SET id = 2;\n")
+    assert not rerun.is_applied("acore_world", "a.sql", sql_file_hash(sql_file))
+
+
+def test_analysis_hash_matches_file_hash(tmp_path):
+    sql_file = write_sql(tmp_path, "a.sql", "USE acore_auth;\r\nSELECT 'x';\n")
+    analysis = analyze_sql_file(sql_file)
+    assert analysis["hash"] == sql_file_hash(sql_file)
+    assert analysis["databases"] == ["acore_auth"]
+    assert analysis["statements"] == 2
+
+
+def test_table_is_created_once_per_database(tmp_path):
+    database = FakeDatabase()
+    ledger = SQLUpdateLedger(database.run_query, str(tmp_path), log=lambda message: None)
+    ledger.recorded_hash("acore_world", "a.sql")
+    for name in ("a.sql", "b.sql", "c.sql"):
+        ledger.record("acore_world", name, "0" * 40, "RELEASED", 1)
+    ledger.record("acore_auth", "d.sql", "0" * 40, "RELEASED", 1)
+
+    creates = [name for name, sql in database.queries if sql.startswith("CREATE TABLE")]
+    assert creates == ["acore_world", "acore_auth"]
+
+
+def test_unavailable_ledger_is_reported_once(tmp_path):
+    database = FakeDatabase(fail=True)
+    messages = []
+    ledger = SQLUpdateLedger(database.run_query, str(tmp_path), log=messages.append)
+    for name in ("a.sql", "b.sql", "c.sql"):
+        assert ledger.recorded_hash("acore_world", name) is None
+        ledger.record("acore_world", name, "0" * 40, "RELEASED", 1)
+
+    assert len(database.queries) == 1
+    assert len(messages) == 1
+
+
+def test_summary_counts_outcomes(tmp_path):
+    ledger = SQLUpdateLedger(FakeDatabase().run_query, str(tmp_path), log=lambda message: None)
+    for outcome in ("skipped", "skipped", "applied", "failed"):
+        ledger.count(outcome)
+    assert ledger.summary() == "2 skipped, 1 applied, 1 failed"
@@ -0,0 +1,190 @@
+"""Tests for incremental repack synchronisation"""
+
+import os
+
+import pytest
+
+from acb_core.pipeline import PipelineOperations
+from acb_core.sync import (SyncCancelled, SyncStats, break_hard_link, file_unchanged, manifest_filter,
+                           sync_file, sync_tree, tree_unchanged)
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def same_file(a, b):
+    return os.path.samefile(str(a), str(b))
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "src"
+    write(root / "worldserver.exe", b"w" * 5000)
+    write(root / "configs" / "worldserver.conf.dist", b"conf")
+    write(root / "lua_scripts" / "a.lua", b"print(1)")
+    write(root / "docs" / "manual.pdf", b"p" * 100)
+    return root
+
+
+def test_file_unchanged_by_size_and_mtime(tmp_path):
+    a = write(tmp_path / "a", b"same")
+    b = tmp_path / "b"
+    assert not file_unchanged(str(a), str(b))
+    sync_file(str(a), str(b))
+    assert file_unchanged(str(a), str(b))
+    write(b, b"diff")
+    os.utime(str(b), (0, 0))
+    assert not file_unchanged(str(a), str(b))
+
+
+def test_file_unchanged_with_checksum_ignores_mtime(tmp_path):
+    a = write(tmp_path / "a", b"same")
+    b = write(tmp_path / "b", b"same")
+    os.utime(str(b), (0, 0))
+    assert not file_unchanged(str(a), str(b))
+    assert file_unchanged(str(a), str(b), checksum=True)
+
+
+def test_sync_tree_copies_then_leaves_unchanged_files(source, tmp_path):
+    dest = tmp_path / "Repack"
+    stats = sync_tree(str(source), str(dest), workers=4)
+    assert stats.copied == 4
+    assert (dest / "lua_scripts" / "a.lua").read_bytes() == b"print(1)"
+
+    write(source / "lua_scripts" / "a.lua", b"print(22)")
+    stats = sync_tree(str(source), str(dest), workers=4)
+    assert (stats.copied, stats.unchanged) == (1, 3)
+    assert (dest / "lua_scripts" / "a.lua").read_bytes() == b"print(22)"
+
+
+def test_sync_tree_keeps_files_only_in_destination(source, tmp_path):
+    dest = tmp_path / "Repack"
+    edited = write(dest / "configs" / "worldserver.conf", b"edited")
+    sync_tree(str(source), str(dest))
+    assert edited.read_bytes() == b"edited"
+
+
+def test_sync_tree_skips_manifest_matches(source, tmp_path):
+    dest = tmp_path / "Repack"
+    stats = sync_tree(str(source), str(dest), skip=manifest_filter(["DOCS/*"]))
+    assert not (dest / "docs").exists()
+    assert (stats.skipped, stats.skipped_bytes) == (1, 100)
+
+
+def test_sync_tree_hard_links(source, tmp_path):
+    dest = tmp_path / "Repack"
+    stats = sync_tree(str(source), str(dest), link=True)
+    assert stats.linked == 4
+    assert same_file(source / "worldserver.exe", dest / "worldserver.exe")
+
+
+def test_sync_tree_progress_reaches_total(source, tmp_path):
+    calls = []
+    sync_tree(str(source), str(tmp_path / "Repack"), workers=2, progress=lambda *args: calls.append(args))
+    bytes_done, total_bytes, files_done, total_files = calls[-1]
+    assert (bytes_done, files_done) == (total_bytes, total_files)
+    assert max(call[0] for call in calls) == total_bytes
+
+
+def test_sync_tree_cancel(source, tmp_path):
+    with pytest.raises(SyncCancelled):
+        sync_tree(str(source), str(tmp_path / "Repack"), cancelled=lambda: True)
+
+
+def test_break_hard_link_keeps_the_other_link(tmp_path):
+    original = write(tmp_path / "my.ini", b"system")
+    linked = tmp_path / "repack.ini"
+    os.link(str(original), str(linked))
+    assert break_hard_link(str(linked))
+    linked.write_bytes(b"repack")
+    assert original.read_bytes() == b"system"
+    assert not break_hard_link(str(linked))
+
+
+class Builder(PipelineOperations):
+    def __init__(self, app_dir):
+        self.app_dir = app_dir
+        self._init_pipeline_state()
+
+    def log_to_console(self, message):
+        pass
+
+
+@pytest.fixture
+def mysql_install(tmp_path):
+    root = tmp_path / "MySQL Server 8.4"
+    write(root / "bin" / "mysqld.exe", b"mysqld")
+    write(root / "my.ini", b"[mysqld]\nport=3306\n")
+    write(root / "data" / "ibdata1", b"system tablespace")
+    return root
+
+
+def test_repack_mysql_never_takes_data_or_ini(mysql_install, tmp_path):
+    target = tmp_path / "Repack" / "mysql"
+    Builder(str(tmp_path))._copy_repack_mysql(str(mysql_install), str(target))
+    assert same_file(mysql_install / "bin" / "mysqld.exe", target / "bin" / "mysqld.exe")
+    assert not (target / "my.ini").exists()
+    assert not (target / "data").exists()
+
+
+def test_repack_mysql_unlinks_data_and_ini_from_earlier_repacks(mysql_install, tmp_path):
+    target = tmp_path / "Repack" / "mysql"
+    for relative in ("my.ini", os.path.join("data", "ibdata1")):
+        (target / relative).parent.mkdir(parents=True, exist_ok=True)
+        os.link(str(mysql_install / relative), str(target / relative))
+
+    builder = Builder(str(tmp_path))
+    builder._copy_repack_mysql(str(mysql_install), str(target))
+    assert not same_file(mysql_install / "data" / "ibdata1", target / "data" / "ibdata1")
+
+    builder._write_myini(str(target / "my.ini"))
+    assert (mysql_install / "my.ini").read_bytes() == b"[mysqld]\nport=3306\n"
+
+
+def test_write_myini_replaces_a_hard_linked_file(tmp_path):
+    system_ini = write(tmp_path / "system.ini", b"system")
+    myini = tmp_path / "my.ini"
+    os.link(str(system_ini), str(myini))
+    Builder(str(tmp_path))._write_myini(str(myini))
+    assert system_ini.read_bytes() == b"system"
+    assert myini.read_bytes() != b"system"
+
+
+def test_stats_summary():
+    stats = SyncStats()
+    stats.record("copied", 10)
+    stats.record("skipped", 5)
+    assert stats.summary() == "1 copied, 0 linked, 0 unchanged, 1 skipped by manifest"
+
+
+def test_failed_file_is_not_counted_twice(source, tmp_path, monkeypatch):
+    import acb_core.sync as sync
+    monkeypatch.setattr(sync, "_COPY_CHUNK_SIZE", 1000)
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        # The executable is locked after all its chunks were copied
+        if dst.endswith("worldserver.exe"):
+            raise PermissionError("locked")
+        return real_replace(src, dst)
+    monkeypatch.setattr(sync.os, "replace", failing_replace)
+
+    calls = []
+    stats = sync_tree(str(source), str(tmp_path / "Repack"), progress=lambda *args: calls.append(args))
+    assert [path for path, error in stats.failed] == ["worldserver.exe"]
+    total_bytes = calls[-1][1]
+    assert max(call[0] for call in calls) == total_bytes
+
+
+def test_tree_unchanged_walks_subdirectories(source, tmp_path):
+    dest = tmp_path / "dest"
+    sync_tree(str(source), str(dest), skip=manifest_filter(["docs/*"]))
+    assert tree_unchanged(str(source), str(dest), skip=manifest_filter(["docs/*"]))
+    assert not tree_unchanged(str(source), str(dest))
+    assert tree_unchanged(str(source / "worldserver.exe"), str(dest / "worldserver.exe"))
+
+    write(source / "lua_scripts" / "a.lua", b"print('changed')")
+    assert not tree_unchanged(str(source), str(dest), skip=manifest_filter(["docs/*"]))